@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+주간 리포트 벤치마크 (Oracle 없이 실행)
+
+가상 농장(모돈 500/5,000/20,000두)과 가상 DB 연결로
+FarmDataLoader.load()와 프로세서별 시간/최대 메모리를 측정하고 기준값과 비교
+
+실행 방법:
+    python run_benchmark.py                      # 전체 규모 측정 + 기준값 비교
+    python run_benchmark.py --save-baseline      # 측정 결과를 기준값으로 저장
+    python run_benchmark.py --sizes 500,5000 --repeat 5
+    python run_benchmark.py --stages load,mating,schedule
+    python run_benchmark.py --replay capture/farm_1387_20251215_20251221_20251222021503.pkl.gz
+
+종료 코드: 0 정상, 1 회귀 발생 (기준값 대비 허용 범위 초과 또는 단계 실패, 재생 시 저장 결과 다름)
+"""
+
+import argparse
+import logging
+import sys
+
+# 프로젝트 루트를 path에 추가
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.benchmark import HERD_SIZES, compare, replay_capture, run_benchmarks
+from src.benchmark.replay import format_replay
+from src.benchmark.runner import format_report, load_baseline, save_baseline
+
+
+def parse_args():
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description='InsightPig 주간 리포트 벤치마크',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python run_benchmark.py                        # 측정 + 기준값 비교 (회귀 시 종료 코드 1)
+  python run_benchmark.py --save-baseline        # 기준값 저장 (코드 변경 전 실행)
+  python run_benchmark.py --sizes 20000 --stages load
+  python run_benchmark.py --columnar             # FarmDataLoader columnar 모드 측정
+  python run_benchmark.py --replay capture/farm_1387_....pkl.gz --profile-out farm_1387.prof
+
+기준값은 같은 서버/Python 버전에서 저장한 값과 비교해야 합니다.
+        """
+    )
+    parser.add_argument(
+        '--sizes',
+        type=str,
+        default=','.join(str(s) for s in HERD_SIZES),
+        help='재적 모돈 수 (콤마 구분)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='시간 측정 반복 횟수 (최소값 사용)'
+    )
+    parser.add_argument(
+        '--stages',
+        type=str,
+        default=None,
+        help='측정 단계 (콤마 구분, 예: load,mating) - 기본 전체'
+    )
+    parser.add_argument(
+        '--columnar',
+        action='store_true',
+        help='FarmDataLoader columnar 모드'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=str,
+        default='./benchmark_baseline.json',
+        help='기준값 파일 경로'
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='측정 결과를 기준값으로 저장 (비교 안함)'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='시간 허용 비율 (0.25 = 기준값 대비 25%%)'
+    )
+    parser.add_argument(
+        '--memory-tolerance',
+        type=float,
+        default=0.25,
+        help='메모리 허용 비율'
+    )
+    parser.add_argument(
+        '--replay',
+        type=str,
+        default=None,
+        help='실행 기록 파일 재생 (capture = Y로 저장, 가상 농장 대신 실제 농장 처리 재실행)'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='재생 시 기록에 없는 SQL이 실행되면 실패 처리'
+    )
+    parser.add_argument(
+        '--processor-workers',
+        type=int,
+        default=None,
+        help='재생 시 농장 내 프로세서 동시 실행 수 (기본: 기록 시점 설정)'
+    )
+    parser.add_argument(
+        '--sql-latency',
+        type=float,
+        default=0.0,
+        help='재생 시 기록된 SQL 시간 재현 배율 (0: 대기 없음, 1.0: 기록 시간만큼 대기)'
+    )
+    parser.add_argument(
+        '--profile-out',
+        type=str,
+        default=None,
+        help='재생 cProfile 결과 저장 파일 (pstats 형식)'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=25,
+        help='재생 cProfile 누적 시간 상위 함수 출력 수 (0: 프로파일링 안함)'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='로그 출력 (가상 농장 행 수, 빈 결과 SELECT 등)'
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.ERROR,
+        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+    )
+    if args.verbose:
+        # 프로세서/로더 상세 로그 제외
+        logging.getLogger('src.weekly').setLevel(logging.WARNING)
+
+    if args.replay:
+        return replay(args)
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    stages = [s.strip() for s in args.stages.split(',')] if args.stages else None
+
+    report = run_benchmarks(sizes, repeat=args.repeat, columnar=args.columnar, stages=stages)
+
+    if args.save_baseline:
+        save_baseline(report, args.baseline)
+        print(format_report(report))
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    print(format_report(report, baseline))
+    if baseline is None:
+        print(f"\n기준값 없음: {args.baseline} (--save-baseline으로 먼저 저장)")
+        return 0
+
+    if baseline.get('meta', {}).get('columnar') != args.columnar:
+        print("\n[주의] 기준값과 columnar 옵션이 다릅니다.")
+
+    regressions = compare(report, baseline, args.tolerance, args.memory_tolerance)
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print("\n회귀 없음")
+    return 0
+
+
+def replay(args):
+    """실행 기록 재생 + 저장 결과 비교 (행이 다르면 종료 코드 1, 순서 차이만 있으면 0)"""
+    report = replay_capture(args.replay, repeat=args.repeat, strict=args.strict,
+                            profile_path=args.profile_out, profile_top=args.profile_top,
+                            processor_workers=args.processor_workers, latency=args.sql_latency)
+    print(format_replay(report))
+    if args.profile_out:
+        print(f"프로파일 저장: {args.profile_out}")
+    if report['status'] != report['header'].get('status', 'success') or not report['compare']['same_rows']:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -25,6 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.common import Config, setup_logger, Database, get_all_farm_nos
 from src.weekly import WeeklyReportOrchestrator
+from src.weekly.telemetry import read_records, summarize
 from src.collectors import WeatherCollector, ProductivityCollector
 
 
@@ -44,6 +45,7 @@ def parse_args():
   python run_etl.py --test --init-all  # 테스트 + 전체 데이터 삭제
   python run_etl.py --base-date 2024-12-15  # 특정 기준일
   python run_etl.py --dry-run          # 설정 확인만
+  python run_etl.py weekly --profile   # 성능 지표 저장 + 느린 농장/프로세서 순위 출력
   python run_etl.py --exclude 848      # 848 농장 제외하고 ETL 실행
   python run_etl.py --exclude "848,1234"  # 여러 농장 제외
 
@@ -97,6 +99,12 @@ def parse_args():
         help='실제 실행 없이 설정만 확인'
     )
 
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='농장별 성능 지표 저장 + 느린 농장/프로세서 순위 출력 (weekly, 날짜 범위 실행)'
+    )
+
     parser.add_argument(
         '--skip-weather',
         action='store_true',
@@ -192,6 +200,17 @@ def parse_args():
     return parser.parse_args()
 
 
+def print_profile(orchestrator: WeeklyReportOrchestrator) -> None:
+    """--profile: 이번 실행의 성능 지표 요약 출력"""
+    print()
+    print("=" * 60)
+    print("성능 지표 요약 (--profile)")
+    print("=" * 60)
+    for path in orchestrator.telemetry_files:
+        print(f"  {path}")
+    print(summarize(read_records(orchestrator.telemetry_files)))
+
+
 def main():
     """메인 함수"""
     args = parse_args()
@@ -320,7 +339,7 @@ def main():
                 print("DRY-RUN: 실제 실행 없이 설정만 확인")
                 sys.exit(0)
 
-            orchestrator = WeeklyReportOrchestrator(config)
+            orchestrator = WeeklyReportOrchestrator(config, profile=args.profile)
             results = []
 
             # farm_list: --test 모드에서만 사용
@@ -363,11 +382,13 @@ def main():
             for r in results:
                 status_icon = "✓" if r['status'] == 'success' else "✗"
                 print(f"  {status_icon} {r['date']} (Week {r['week_no']})")
+            if args.profile:
+                print_profile(orchestrator)
             sys.exit(0)
 
         if args.command == 'all' or args.command == 'weekly':
             # 주간 리포트 ETL (전체 또는 weekly)
-            orchestrator = WeeklyReportOrchestrator(config)
+            orchestrator = WeeklyReportOrchestrator(config, profile=args.profile)
 
             # farm_list: --test 모드에서만 사용
             farm_list = args.farm_list if args.test else None
@@ -385,6 +406,8 @@ def main():
                 schedule_group=args.schedule_group,  # 스케줄 그룹 (AM7, PM2)
             )
             print(f"결과: {result}")
+            if args.profile:
+                print_profile(orchestrator)
 
         elif args.command == 'weather':
             # 기상청 데이터만 수집
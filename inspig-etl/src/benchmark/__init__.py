@@ -0,0 +1,16 @@
+# Weekly Report Benchmark (가상 농장 + 가상 DB 연결, 실행 기록 재생)
+from .synthetic import SyntheticFarm, HERD_SIZES
+from .fake_db import FakeConnection, FakeDatabaseError
+from .runner import FarmBenchmark, run_benchmarks, compare
+from .replay import replay_capture
+
+__all__ = [
+    'SyntheticFarm',
+    'HERD_SIZES',
+    'FakeConnection',
+    'FakeDatabaseError',
+    'FarmBenchmark',
+    'run_benchmarks',
+    'compare',
+    'replay_capture',
+]
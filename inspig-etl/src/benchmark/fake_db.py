@@ -0,0 +1,328 @@
+"""
+가상 DB-API 연결 (벤치마크용)
+- SyntheticFarm 데이터를 FarmDataLoader/ScheduleEngine 조회 SQL 결과 형태로 반환
+- 프로세서 설정 조회(TC_FARM_CONFIG 코드값), 출하 산점도(TM_LPD_DATA) 조회도 응답
+- 그 외 SELECT(TS_INS_* 이전 결과, Oracle 집계 SQL 등)는 빈 결과 → 프로세서 기본값 경로
+- INSERT/UPDATE/DELETE/MERGE는 실행하지 않고 테이블별 건수만 기록
+
+cx_Oracle과 같이 SQL의 바인드 변수(:name)와 전달한 파라미터가 다르면 오류 발생
+(ORA-01036/ORA-01008 확인용)
+"""
+import re
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .synthetic import SyntheticFarm
+
+# 실행하지 않고 기록만 하는 SQL
+_WRITE_KEYWORDS = ('INSERT', 'UPDATE', 'DELETE', 'MERGE')
+
+_LITERAL_RE = re.compile(r"'[^']*'")
+_COMMENT_RE = re.compile(r"--[^\n]*")
+_BIND_RE = re.compile(r"(?<![\w:]):([A-Za-z_]\w*)")
+_TABLE_RE = re.compile(r"^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|DELETE|MERGE\s+INTO)\s+(\w+)", re.I)
+_CONFIG_CODE_RE = re.compile(r"'(14\d{4})'")
+
+# 농장 설정 코드명 (TC_CODE_SYS PCODE='14')
+CONFIG_CODE_NAMES = {
+    '140002': '평균임신기간',
+    '140003': '평균포유기간',
+    '140007': '후보돈초교배일령',
+    '140008': '평균재귀일',
+}
+
+
+def _starts(prefix: str) -> Callable[[str], bool]:
+    return lambda sql: sql.startswith(prefix)
+
+
+class FakeDatabaseError(Exception):
+    """바인드 변수 불일치 등 SQL 실행 오류 (cx_Oracle.DatabaseError 대응)"""
+
+
+def bind_names(sql: str) -> set:
+    """SQL 바인드 변수명 (문자열 리터럴/주석 제외, 소문자)"""
+    stripped = _LITERAL_RE.sub("''", _COMMENT_RE.sub('', sql))
+    return {name.lower() for name in _BIND_RE.findall(stripped)}
+
+
+def check_binds(sql: str, params: Optional[Dict[str, Any]]) -> None:
+    """바인드 변수와 파라미터 일치 확인
+
+    Raises:
+        FakeDatabaseError: 누락(ORA-01008) 또는 불필요한 파라미터(ORA-01036)
+    """
+    names = bind_names(sql)
+    given = {key.lower() for key in (params or {})}
+    missing = names - given
+    if missing:
+        raise FakeDatabaseError(f"ORA-01008: not all variables bound {sorted(missing)}")
+    extra = given - names
+    if extra:
+        raise FakeDatabaseError(f"ORA-01036: illegal variable name/number {sorted(extra)}")
+
+
+class FakeVar:
+    """cursor.var() 대응 (RETURNING INTO 값)"""
+
+    def __init__(self):
+        self.value = None
+
+    def getvalue(self):
+        return self.value
+
+
+class FakeCursor:
+    """가상 cursor (execute 시 결과 행 생성, fetch*는 메모리 행 반환)"""
+
+    def __init__(self, conn: 'FakeConnection'):
+        self._conn = conn
+        self._rows: List[tuple] = []
+        self._pos = 0
+        self.description: Optional[List[tuple]] = None
+        self.rowcount = 0
+        self.arraysize = 100
+
+    def execute(self, sql: str, params: Optional[Dict[str, Any]] = None, **kwargs):
+        params = {**(params or {}), **kwargs}
+        check_binds(sql, params)
+        self._conn.sql_count += 1
+        if sql.lstrip().upper().startswith(_WRITE_KEYWORDS):
+            self._set_result(None, [])
+            self.rowcount = self._conn.record_write(sql, [params])
+            for value in params.values():
+                if isinstance(value, FakeVar):
+                    value.value = [self._conn.next_seq()]
+            return None
+        columns, rows = self._conn.query(sql, params)
+        self._set_result(columns, rows)
+        return self
+
+    def executemany(self, sql: str, params_list: Sequence[Dict[str, Any]]):
+        if params_list:
+            check_binds(sql, params_list[0])
+        self._conn.sql_count += 1
+        self._set_result(None, [])
+        self.rowcount = self._conn.record_write(sql, list(params_list))
+
+    def callfunc(self, name: str, return_type=None, params=None):
+        self._conn.sql_count += 1
+        self._conn.calls[name] += 1
+        return None
+
+    def callproc(self, name: str, params=None):
+        self._conn.sql_count += 1
+        self._conn.calls[name] += 1
+        return list(params or [])
+
+    def var(self, *args, **kwargs) -> FakeVar:
+        return FakeVar()
+
+    def setinputsizes(self, *args, **kwargs) -> None:
+        pass
+
+    def _set_result(self, columns: Optional[Sequence[str]], rows: List[tuple]) -> None:
+        self.description = None if columns is None else [(col, None, None, None, None, None, None)
+                                                           for col in columns]
+        self._rows = rows
+        self._pos = 0
+        self.rowcount = len(rows)
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        row = self._rows[self._pos]
+        self._pos += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None):
+        size = size or self.arraysize
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return rows
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def close(self) -> None:
+        self._rows = []
+
+
+class FakeConnection:
+    """SyntheticFarm 1개를 제공하는 가상 연결
+
+    사용 예:
+        conn = FakeConnection(farm)
+        FarmDataLoader(conn, farm.farm_no, farm.dt_from, farm.dt_to).load()
+        conn.writes  # {'TS_INS_WEEK_SUB': 120, 'TS_INS_WEEK': 9, ...}
+    """
+
+    def __init__(self, farm: SyntheticFarm):
+        self.farm = farm
+        self.sql_count = 0
+        self.commit_count = 0
+        self.writes: Counter = Counter()       # 테이블별 DML 행 수
+        self.calls: Counter = Counter()        # callfunc/callproc 이름별 호출 수
+        self.unhandled: Counter = Counter()    # 빈 결과로 응답한 SELECT (첫 FROM 테이블별)
+        self._seq = 0
+        # (판별 함수, 응답 함수) - 판별 함수는 공백 정규화된 SQL을 받음
+        self._routes: List[Tuple[Callable[[str], bool], Callable]] = [
+            (lambda s: 'SYSDATE AS NOW_DT' in s, self._q_now),
+            (_starts('SELECT M.PIG_NO AS MODON_NO'), self._q_table('modon', 'OUT_DT')),
+            (_starts('SELECT A.SEQ, A.PIG_NO AS MODON_NO'), self._q_table('modon_wk', 'WK_DT')),
+            (_starts('SELECT B.PIG_NO AS MODON_NO'), self._q_table('bunman', 'BUN_DT')),
+            (_starts('SELECT E.PIG_NO AS MODON_NO'), self._q_table('eu', 'EU_DT')),
+            (_starts('SELECT S.PIG_NO AS MODON_NO'), self._q_table('sago', 'SAGO_DT')),
+            (_starts('SELECT T.SEQ, T.PIG_NO AS MODON_NO'), self._q_table('jadon_trans', 'TRANS_DT')),
+            (_starts('SELECT G.PIG_NO AS MODON_NO'), self._q_table('gb', 'GB_DT')),
+            (lambda s: s.startswith('WITH FARM_LIST') and 'TM_LPD_DATA' in s, self._q_lpd_daily),
+            (lambda s: 'NET_KG_GRP' in s, self._q_lpd_scatter),
+            (_starts('SELECT FARM_NO, COUNT(*) AS CNT, ROUND(AVG(NET_KG), 1) AS AVG_NET'), self._q_lpd_year),
+            (_starts('SELECT T.SEQ, T.FARM_NO'), self._q_etc_trade),
+            (_starts('SELECT F.FARM_NO, F.FARM_NM'), self._q_farm),
+            (_starts('SELECT C.FARM_NO, C.CODE, C.CVALUE'), self._q_settings),
+            (lambda s: 'FROM TC_CODE_SYS T1' in s, self._q_config_codes),
+            (_starts('SELECT CODE, TO_NUMBER(NVL(CVALUE'), self._q_setting_values),
+            (lambda s: 'FROM TB_PLAN_MODON' in s, self._q_plans),
+        ]
+
+    # ------------------------------------------------------------------
+    # DB-API
+    # ------------------------------------------------------------------
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commit_count += 1
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    # ------------------------------------------------------------------
+    # 실행 기록
+    # ------------------------------------------------------------------
+    def next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def record_write(self, sql: str, params_list: List[Dict[str, Any]]) -> int:
+        """DML 기록 (INSERT ... VALUES는 파라미터 행 수, 그 외는 0건으로 처리)"""
+        match = _TABLE_RE.match(sql)
+        table = match.group(1).upper() if match else 'UNKNOWN'
+        upper = sql.upper()
+        rows = len(params_list) if upper.lstrip().startswith('INSERT') and 'VALUES' in upper else 0
+        self.writes[table] += rows
+        return rows
+
+    def query(self, sql: str, params: Dict[str, Any]) -> Tuple[Sequence[str], List[tuple]]:
+        """SELECT 결과 (컬럼, 행) - 응답 대상이 아니면 빈 결과"""
+        normalized = ' '.join(sql.split())
+        for match, handler in self._routes:
+            if match(normalized):
+                return handler(normalized, params)
+        from_match = re.search(r"FROM\s+(\w+)", normalized, re.I)
+        self.unhandled[from_match.group(1).upper() if from_match else 'DUAL'] += 1
+        return (), []
+
+    # ------------------------------------------------------------------
+    # 조회 응답
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _q_now(sql: str, params: Dict[str, Any]):
+        return ('NOW_DT',), [(datetime.now(),)]
+
+    def _q_table(self, key: str, date_field: str):
+        """이력/모돈 테이블 (2년 이내 조건만 적용, 정렬은 생성 순서 = PIG_NO, 일자)"""
+        def handler(sql: str, params: Dict[str, Any]):
+            columns, rows = self.farm.rows(key)
+            since = params.get('two_years_ago')
+            if since is None:
+                return columns, list(rows)
+            idx = columns.index(date_field)
+            return columns, [row for row in rows if row[idx] is not None and row[idx] > since]
+        return handler
+
+    def _lpd_rows(self, dt_from_str: str, dt_to_str: str) -> List[tuple]:
+        _, rows = self.farm.rows('lpd')
+        return [row for row in rows if dt_from_str <= row[1] <= dt_to_str]
+
+    def _q_lpd_daily(self, sql: str, params: Dict[str, Any]):
+        """리포트 주간 일별 출하 요약 (농장당 7행)"""
+        from_day = datetime.strptime(params['dt_from'], '%Y%m%d').toordinal()
+        columns = ('FARM_NO', 'DAY_NO', 'DT_STR', 'DT_DISP', 'CNT', 'TOT_NET', 'AVG_NET', 'AVG_BACK',
+                   'Q_11', 'Q_1', 'Q_2', 'FEMALE', 'MALE', 'ETC')
+        by_day: Dict[str, List[tuple]] = defaultdict(list)
+        for row in self.farm.rows('lpd')[1]:
+            by_day[row[1]].append(row)
+        result = []
+        for day_no in range(1, 8):
+            day = date.fromordinal(from_day + day_no - 1)
+            ships = by_day.get(day.strftime('%Y-%m-%d'), [])
+            nets = [r[2] for r in ships if r[2] and r[2] > 0]
+            backs = [r[3] for r in ships if r[3] and r[3] > 0]
+            result.append((
+                self.farm.farm_no, day_no, day.strftime('%Y-%m-%d'), day.strftime('%m.%d'), len(ships),
+                round(sum(r[2] for r in ships), 1) if ships else None,
+                round(sum(nets) / len(nets), 1) if nets else None,
+                round(sum(backs) / len(backs), 1) if backs else None,
+                sum(1 for r in ships if r[4] == '1+'), sum(1 for r in ships if r[4] == '1'),
+                sum(1 for r in ships if r[4] == '2'),
+                sum(1 for r in ships if r[5] == '암'), sum(1 for r in ships if r[5] == '수'),
+                sum(1 for r in ships if r[5] not in ('암', '수')),
+            ))
+        return columns, result
+
+    def _q_lpd_year(self, sql: str, params: Dict[str, Any]):
+        stats = self.farm.lpd_year_stats
+        return ('FARM_NO', 'CNT', 'AVG_NET'), [(stats['FARM_NO'], stats['CNT'], stats['AVG_NET'])]
+
+    def _q_lpd_scatter(self, sql: str, params: Dict[str, Any]):
+        """출하 산점도 (ROUND(NET_KG), ROUND(BACK_DEPTH))별 두수"""
+        groups: Counter = Counter()
+        for row in self._lpd_rows(params['dt_from_str'], params['dt_to_str']):
+            if row[2] is not None and row[3] is not None:
+                groups[(round(row[2]), round(row[3]))] += 1
+        return ('NET_KG_GRP', 'BACK_GRP', 'CNT'), [(x, y, cnt) for (x, y), cnt in sorted(groups.items())]
+
+    def _q_etc_trade(self, sql: str, params: Dict[str, Any]):
+        columns, rows = self.farm.rows('etc_trade')
+        return columns, [row for row in rows if params['dt_from'] <= row[2] <= params['dt_to']]
+
+    def _q_farm(self, sql: str, params: Dict[str, Any]):
+        row = self.farm.farm_row
+        return tuple(row), [tuple(row.values())]
+
+    def _q_settings(self, sql: str, params: Dict[str, Any]):
+        return ('FARM_NO', 'CODE', 'CVALUE'), [(self.farm.farm_no, code, value)
+                                             for code, value in self.farm.settings]
+
+    def _q_config_codes(self, sql: str, params: Dict[str, Any]):
+        """ConfigProcessor 설정값 조회 (TC_CODE_SYS + TC_FARM_CONFIG)"""
+        codes = _CONFIG_CODE_RE.findall(sql)
+        settings = dict(self.farm.settings)
+        return ('CODE', 'CNAME', 'CVALUE', 'SORT_NO'), [
+            (code, CONFIG_CODE_NAMES.get(code, code), settings.get(code), sort_no)
+            for sort_no, code in enumerate(codes, start=1)
+        ]
+
+    def _q_setting_values(self, sql: str, params: Dict[str, Any]):
+        """프로세서 설정 조회: SELECT CODE, TO_NUMBER(NVL(CVALUE, ...)) ... CODE IN (...)"""
+        codes = set(_CONFIG_CODE_RE.findall(sql.split('WHERE', 1)[-1]))
+        return ('CODE', 'CVALUE'), [(code, int(value)) for code, value in self.farm.settings
+                                    if code in codes]
+
+    def _q_plans(self, sql: str, params: Dict[str, Any]):
+        return self.farm.rows('plan_modon')
@@ -0,0 +1,130 @@
+"""
+실행 기록 재생 (Oracle 없이 실제 농장 처리 재실행)
+- capture = Y로 저장한 기록 파일을 ReplayConnection으로 재생하여 AsyncFarmProcessor.process() 전체 실행
+- 시간: repeat회 실행 중 최소값 (ms), 선택 시 cProfile 결과 저장
+- 저장 결과(TS_INS_WEEK_SUB 등)를 기록 시점과 비교 → 최적화 후 결과가 바뀌지 않았는지 확인
+
+실행일 기준으로 계산하는 값(ConfigProcessor 기간 등)은 기록일과 다른 날 재생하면 달라질 수 있음
+"""
+import cProfile
+import io
+import logging
+import pstats
+import time
+from typing import Any, Dict, Optional
+
+from ..weekly.async_processor import AsyncFarmProcessor
+from ..weekly.capture import FarmCapture, ReplayConnection, compare_writes
+from ..weekly.schedule_engine import SCHEDULE_ENGINE_ORACLE
+
+logger = logging.getLogger(__name__)
+
+
+def _run_once(capture: FarmCapture, strict: bool, processor_workers: int, latency: float) -> tuple:
+    """기록 1회 재생
+
+    Returns:
+        (처리 결과, ReplayConnection)
+    """
+    h = capture.header
+    conn = ReplayConnection(capture, strict=strict, latency=latency)
+    processor = AsyncFarmProcessor(
+        conn,
+        h['master_seq'],
+        h['farm_no'],
+        h['locale'],
+        columnar=h['columnar'],
+        schedule_mode=h['schedule_mode'],
+        aggregate_mode=h.get('aggregate_mode', SCHEDULE_ENGINE_ORACLE),
+        sub_flush=h['sub_flush'],
+        processor_workers=processor_workers,
+    )
+    result = processor.process(h['dt_from'], h['dt_to'], national_price=h['national_price'])
+    return result, conn
+
+
+def replay_capture(path: str, repeat: int = 3, strict: bool = False,
+                   profile_path: Optional[str] = None, profile_top: int = 25,
+                   processor_workers: Optional[int] = None, latency: float = 0.0) -> Dict[str, Any]:
+    """기록 파일 재생 + 저장 결과 비교
+
+    Args:
+        path: 기록 파일 (capture_path/farm_*.pkl.gz)
+        repeat: 시간 측정 반복 횟수 (최소값 사용)
+        strict: 기록에 없는 SQL 실행 시 실패 처리
+        profile_path: cProfile 결과 저장 파일 (None이면 미저장, 상위 함수 목록만 반환)
+        profile_top: 반환할 누적 시간 상위 함수 수 (0이면 프로파일링 안함)
+        processor_workers: 프로세서 동시 실행 수 (None이면 기록 시점 설정)
+        latency: 기록된 SQL 시간 재현 배율 (0이면 Python 시간만, 1.0이면 운영 DB 대기 포함 추정)
+
+    Returns:
+        {'header', 'ms', 'status', 'replay': 재생 통계, 'compare': compare_writes() 결과, 'profile'?}
+    """
+    capture = FarmCapture.load(path)
+    if processor_workers is None:
+        processor_workers = capture.header.get('processor_workers', 1)
+    report: Dict[str, Any] = {'header': capture.header, 'summary': capture.summary(), 'ms': None}
+
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result, conn = _run_once(capture, strict, processor_workers, latency)
+        elapsed = (time.perf_counter() - start) * 1000
+        report['ms'] = round(elapsed if report['ms'] is None else min(report['ms'], elapsed), 2)
+
+    report['processor_workers'] = processor_workers
+    report['latency'] = latency
+    report['status'] = result.get('status')
+    if result.get('error'):
+        report['error'] = result['error']
+    report['processors'] = {p['processor_type']: p['elapsed_ms'] for p in result.get('processor_results', [])}
+    report['replay'] = conn.stats()
+    report['compare'] = compare_writes(capture, conn.writes)
+
+    if profile_top > 0:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        _run_once(capture, strict, processor_workers, latency)
+        profiler.disable()
+        if profile_path:
+            profiler.dump_stats(profile_path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(profile_top)
+        report['profile'] = out.getvalue()
+
+    if conn.misses:
+        logger.debug(f"기록 없는 SQL: {dict(conn.misses)}")
+    if conn.bind_mismatch:
+        logger.debug(f"바인드 불일치 SQL: {dict(conn.bind_mismatch)}")
+    return report
+
+
+def format_replay(report: Dict[str, Any]) -> str:
+    """재생 결과 요약"""
+    h = report['header']
+    cmp = report['compare']
+    stats = report['replay']
+    lines = [
+        f"[농장 {h['farm_no']}] {h['dt_from']}~{h['dt_to']} 기록 {h['captured_at']} "
+        f"(schedule={h['schedule_mode']}, aggregate={h.get('aggregate_mode', SCHEDULE_ENGINE_ORACLE)}, sub_flush={h['sub_flush']}, columnar={h['columnar']})",
+        f"기록 SQL {report['summary']['statements']:,}건, 기록 시점 SQL 시간 {h.get('sql_ms') or 0:,.0f}ms",
+        f"재생 시간 {report['ms']:,.1f}ms ({report['status']}, processor_workers={report['processor_workers']}, "
+        f"SQL 대기 배율={report['latency']})",
+        f"재생 SQL: 기록 없음 {stats['misses']}, 바인드 불일치 {stats['bind_mismatch']}, 재사용 {stats['repeats']}",
+    ]
+    for name, ms in report.get('processors', {}).items():
+        lines.append(f"  {name:<12} {ms:>10,.1f}ms")
+    lines.append(f"\n저장 행: 기록 {cmp['recorded']:,} / 재생 {cmp['replayed']:,}")
+    for table, (recorded, replayed) in sorted(cmp['tables'].items()):
+        mark = '' if recorded == replayed else '  ← 차이'
+        lines.append(f"  {table:<20} {recorded:>8,} {replayed:>8,}{mark}")
+    if cmp['identical']:
+        lines.append("저장 결과 동일")
+    elif cmp['same_rows']:
+        lines.append("저장 결과 동일 (저장 순서 다름)")
+    else:
+        lines.append(f"저장 결과 다름 ({len(cmp['diffs'])}건 표시)")
+        for i, recorded, replayed in cmp['diffs']:
+            lines.append(f"  #{i}\n    기록: {recorded}\n    재생: {replayed}")
+    if report.get('profile'):
+        lines.append(f"\n{report['profile']}")
+    return '\n'.join(lines)
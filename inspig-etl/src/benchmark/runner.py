@@ -0,0 +1,239 @@
+"""
+주간 리포트 벤치마크 실행/기준값 비교
+- 농장 규모별로 FarmDataLoader.load()와 프로세서(AsyncFarmProcessor.run_processors와 같은 순서)를 각각 측정
+- 시간: repeat회 실행 중 최소값 (ms), 메모리: tracemalloc 1회 실행의 단계별 최대 증가량 (KB)
+- 기준값(JSON)과 비교하여 허용 범위를 넘는 단계를 회귀로 보고
+
+측정은 같은 서버에서 만든 기준값과 비교해야 의미가 있음 (run_benchmark.py --save-baseline)
+"""
+import gc
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..weekly.async_processor import AsyncFarmProcessor
+from ..weekly.data_loader import FarmDataLoader
+from ..weekly.processor_graph import weekly_processor_nodes
+from ..weekly.schedule_engine import SCHEDULE_ENGINE_PYTHON
+from ..weekly.sub_writer import SUB_FLUSH_PROCESSOR, SubWriter
+from .fake_db import FakeConnection
+from .synthetic import SyntheticFarm
+
+logger = logging.getLogger(__name__)
+
+# 벤치마크 기본 기간 (월~일)
+DEFAULT_DT_FROM = '20251215'
+DEFAULT_DT_TO = '20251221'
+
+# 벤치마크 농장/마스터 번호 (실제 농장과 겹치지 않는 값)
+BENCH_FARM_NO = 900000
+BENCH_MASTER_SEQ = 1
+
+# 벤치마크 기준 전국 탕박 평균 단가
+BENCH_NATIONAL_PRICE = 5200
+
+# 회귀 판정에서 무시하는 절대 차이 (타이머/GC 잡음)
+MIN_REGRESSION_MS = 10.0
+MIN_REGRESSION_KB = 256.0
+
+
+def processor_stages(dt_from: str, dt_to: str) -> List[Tuple[str, type, Dict[str, Any]]]:
+    """측정 대상 프로세서 (이름, 클래스, process 인자) - run_processors와 동일 순서"""
+    return weekly_processor_nodes(dt_from, dt_to, BENCH_NATIONAL_PRICE)
+
+
+class FarmBenchmark:
+    """가상 농장 1개 벤치마크 (로드 + 프로세서별)
+
+    사용 예:
+        bench = FarmBenchmark(5000, repeat=3)
+        result = bench.run()   # {'load': {'ms', 'peak_kb', 'rows'}, 'mating': {...}, ...}
+    """
+
+    def __init__(self, sows: int, repeat: int = 3, columnar: bool = False,
+                 dt_from: str = DEFAULT_DT_FROM, dt_to: str = DEFAULT_DT_TO,
+                 stages: Optional[List[str]] = None):
+        """
+        Args:
+            sows: 재적 모돈 수
+            repeat: 시간 측정 반복 횟수 (최소값 사용)
+            columnar: FarmDataLoader columnar 옵션
+            dt_from: 리포트 시작일 (YYYYMMDD)
+            dt_to: 리포트 종료일 (YYYYMMDD)
+            stages: 측정 단계 제한 (None=전체, 'load' + 프로세서 이름)
+        """
+        self.sows = sows
+        self.repeat = max(1, repeat)
+        self.columnar = columnar
+        self.dt_from = dt_from
+        self.dt_to = dt_to
+        self.stages = set(stages) if stages else None
+        self.farm: Optional[SyntheticFarm] = None
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """측정 실행
+
+        Returns:
+            {단계: {'ms', 'peak_kb', 'rows'/'writes', 'status', 'error'?}}
+        """
+        gen_start = time.perf_counter()
+        self.farm = SyntheticFarm.generate(BENCH_FARM_NO + self.sows, self.sows, self.dt_from, self.dt_to)
+        logger.info(f"가상 농장 생성: 모돈 {self.sows} ({(time.perf_counter() - gen_start):.1f}s) "
+                    f"{self.farm.row_counts()}")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for _ in range(self.repeat):
+            self._run_round(results, trace_memory=False)
+        self._run_round(results, trace_memory=True)
+        return results
+
+    def _selected(self, stage: str) -> bool:
+        return self.stages is None or stage in self.stages
+
+    def _run_round(self, results: Dict[str, Dict[str, Any]], trace_memory: bool) -> None:
+        """로드 → 프로세서 순차 실행 1회 (프로세서는 로드 결과 필요하므로 로드는 항상 실행)"""
+        conn = FakeConnection(self.farm)
+        loader = FarmDataLoader(conn, self.farm.farm_no, self.dt_from, self.dt_to, columnar=self.columnar)
+        loader.set_schedule_mode(SCHEDULE_ENGINE_PYTHON)
+        loader.set_aggregate_mode(SCHEDULE_ENGINE_PYTHON)
+
+        self._measure(results, 'load', loader.load, trace_memory)
+        results['load']['rows'] = sum(stat['rows'] for stat in loader.load_stats.values())
+
+        sub_writer = SubWriter(conn, flush_mode=SUB_FLUSH_PROCESSOR)
+        for name, proc_class, kwargs in processor_stages(self.dt_from, self.dt_to):
+            if not self._selected(name):
+                continue
+            processor = proc_class(conn, BENCH_MASTER_SEQ, self.farm.farm_no, 'KOR',
+                                   data_loader=loader, sub_writer=sub_writer)
+            before = sum(conn.writes.values())
+            self._measure(results, name,
+                          lambda p=processor, kw=kwargs: AsyncFarmProcessor._process_and_flush(p, kw),
+                          trace_memory)
+            results[name]['writes'] = sum(conn.writes.values()) - before
+
+        if trace_memory and conn.unhandled:
+            logger.debug(f"빈 결과 응답 SELECT: {dict(conn.unhandled)}")
+
+    def _measure(self, results: Dict[str, Dict[str, Any]], stage: str, func: Callable,
+                 trace_memory: bool) -> None:
+        """단계 1회 실행 (시간 최소값 또는 메모리 최대 증가량 기록)"""
+        entry = results.setdefault(stage, {'ms': None, 'peak_kb': None, 'status': 'success'})
+        gc.collect()
+        if trace_memory:
+            tracemalloc.start()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            entry['status'] = 'error'
+            entry['error'] = f"{type(e).__name__}: {e}"
+            logger.warning(f"벤치마크 단계 실패: 모돈 {self.sows} {stage} - {e}")
+        elapsed = (time.perf_counter() - start) * 1000
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            entry['peak_kb'] = round((peak - base) / 1024, 1)
+        else:
+            entry['ms'] = round(elapsed if entry['ms'] is None else min(entry['ms'], elapsed), 2)
+
+
+def run_benchmarks(sizes: List[int], repeat: int = 3, columnar: bool = False,
+                   stages: Optional[List[str]] = None) -> Dict[str, Any]:
+    """규모별 벤치마크 실행
+
+    Returns:
+        {'meta': {...}, 'results': {'5000': {단계: {...}}}}
+    """
+    report = {
+        'meta': {
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'columnar': columnar,
+        },
+        'results': {},
+    }
+    for sows in sizes:
+        bench = FarmBenchmark(sows, repeat=repeat, columnar=columnar, stages=stages)
+        report['results'][str(sows)] = bench.run()
+    return report
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """기준값 파일 (없으면 None)"""
+    if not Path(path).exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(report: Dict[str, Any], path: str) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float = 0.25, memory_tolerance: float = 0.25) -> List[str]:
+    """기준값 대비 회귀 목록
+
+    회귀 조건 (둘 다 만족):
+    - 시간/메모리가 기준값 × (1 + 허용비율) 초과
+    - 절대 차이가 MIN_REGRESSION_MS / MIN_REGRESSION_KB 초과 (작은 단계의 잡음 제외)
+    기준값에서 성공한 단계가 실패해도 회귀로 보고
+
+    Args:
+        report: run_benchmarks() 결과
+        baseline: 기준값 (같은 형식)
+        tolerance: 시간 허용 비율 (0.25 = 25%)
+        memory_tolerance: 메모리 허용 비율
+    """
+    regressions = []
+    base_results = baseline.get('results', {})
+    for size, stages in report['results'].items():
+        for stage, now in stages.items():
+            base = base_results.get(size, {}).get(stage)
+            if not base:
+                continue
+            label = f"모돈 {size} {stage}"
+            if now.get('status') != 'success' and base.get('status') == 'success':
+                regressions.append(f"{label}: 실패 ({now.get('error', '')})")
+                continue
+            if now.get('ms') is not None and base.get('ms'):
+                if (now['ms'] > base['ms'] * (1 + tolerance)
+                        and now['ms'] - base['ms'] > MIN_REGRESSION_MS):
+                    regressions.append(f"{label}: 시간 {base['ms']:,.1f}ms → {now['ms']:,.1f}ms "
+                                       f"(+{(now['ms'] / base['ms'] - 1) * 100:.0f}%)")
+            if now.get('peak_kb') is not None and base.get('peak_kb'):
+                if (now['peak_kb'] > base['peak_kb'] * (1 + memory_tolerance)
+                        and now['peak_kb'] - base['peak_kb'] > MIN_REGRESSION_KB):
+                    regressions.append(f"{label}: 메모리 {base['peak_kb']:,.0f}KB → {now['peak_kb']:,.0f}KB "
+                                       f"(+{(now['peak_kb'] / base['peak_kb'] - 1) * 100:.0f}%)")
+    return regressions
+
+
+def format_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """결과 표 (기준값이 있으면 시간 비율 포함)"""
+    lines = []
+    base_results = (baseline or {}).get('results', {})
+    for size, stages in report['results'].items():
+        lines.append(f"\n[모돈 {int(size):,}]")
+        lines.append(f"{'단계':<12} {'시간ms':>10} {'기준ms':>10} {'비율':>7} {'메모리KB':>12} {'건수':>10}  상태")
+        for stage, now in stages.items():
+            base = base_results.get(size, {}).get(stage, {})
+            base_ms = base.get('ms')
+            ratio = f"{now['ms'] / base_ms:.2f}x" if base_ms and now.get('ms') is not None else '-'
+            count = now.get('rows', now.get('writes', 0))
+            lines.append(f"{stage:<12} {now.get('ms') or 0:>10,.1f} "
+                         f"{base_ms if base_ms is not None else '-':>10} {ratio:>7} "
+                         f"{now.get('peak_kb') or 0:>12,.0f} {count:>10,}  {now.get('status')}")
+    return '\n'.join(lines)
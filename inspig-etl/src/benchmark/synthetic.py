@@ -0,0 +1,286 @@
+"""
+가상 농장 데이터 생성 (벤치마크용)
+- 모돈 생애주기: 교배(G) → 분만(B) → 이유(E) → 재교배(G) 반복, 일부 교배는 사고(F) 후 재교배
+- TB_MODON_WK 작업이력과 TB_BUNMAN/TB_EU/TB_SAGO/TB_GYOBAE/TB_MODON_JADON_TRANS 상세를 같은 일정으로 생성
+- TM_LPD_DATA는 리포트 주간 출하 원본 + 연간 누계(집계값), TM_ETC_TRADE는 주간 매출
+- TB_PLAN_MODON 기본 예정작업 (Python 작업예정 엔진용)
+
+값은 FarmDataLoader 조회 SQL의 결과 컬럼(별칭) 형태로 저장하여 FakeConnection이 그대로 반환
+동일 seed → 동일 데이터 (벤치마크 기준값 비교 가능)
+"""
+import random
+from functools import lru_cache
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# 벤치마크 모돈 규모 (상시모돈 수)
+HERD_SIZES = (500, 5000, 20000)
+
+# 생애주기 기간 (일)
+GESTATION_DAYS = (112, 116)     # 임신기간
+LACTATION_DAYS = (21, 28)       # 포유기간
+RETURN_DAYS = (4, 8)            # 이유 후 재귀일
+SAGO_DAYS = (21, 45)            # 교배 후 사고 확인일
+CONCEPTION_RATE = 0.87          # 교배 후 분만 비율
+
+# 사고구분 (TB_SAGO.SAGO_GUBUN_CD) → 계산 상태코드
+SAGO_STATUS = {
+    '050008': '010006',  # 재발
+    '050009': '010006',  # 불임
+    '050007': '010006',  # 공태
+    '050002': '010007',  # 유산
+}
+
+# 마지막 작업구분 → 계산 상태코드 (SF_GET_MODONGB_STATUS 결과 대응)
+WK_STATUS = {'G': '010002', 'B': '010003', 'E': '010005'}
+
+# 도폐사 구분 (TB_MODON.OUT_GUBUN_CD)
+OUT_GUBUN_CODES = ('080001', '080002', '080003', '080004')
+
+# 자돈 이동 구분 (TB_MODON_JADON_TRANS.GUBUN_CD): 포유사고/양자전입/양자전출
+TRANS_GUBUN_CODES = ('160001', '160003', '160004')
+
+MODON_COLUMNS = (
+    'MODON_NO', 'MODON_NM', 'FARM_NO', 'SANCHA', 'IN_SANCHA', 'STATUS_CD', 'IN_DT', 'OUT_DT',
+    'OUT_GUBUN_CD', 'OUT_REASON_CD', 'BIRTH_DT', 'LAST_WK_DT', 'GB_SANCHA', 'LAST_GB_DT', 'LAST_BUN_DT',
+    'DONBANG_CD', 'NOW_DONGHO', 'NOW_BANGHO', 'IN_GYOBAE_CNT', 'DAERI_YN', 'USE_YN',
+    'WK_GUBUN', 'SAGO_GUBUN_CD', 'CALC_STATUS_CD',
+)
+MODON_WK_COLUMNS = (
+    'SEQ', 'MODON_NO', 'PIG_NO', 'FARM_NO', 'WK_DT', 'WK_GUBUN', 'SANCHA', 'GYOBAE_CNT',
+    'LOC_CD', 'SAGO_GUBUN_CD', 'DAERI_YN', 'USE_YN', 'WK_DATE',
+    'PREV_SEQ', 'PREV_WK_DT', 'PREV_WK_GUBUN', 'PREV_SANCHA', 'PREV_GYOBAE_CNT',
+    'NEXT_SEQ', 'NEXT_WK_DT', 'NEXT_WK_GUBUN', 'NEXT_SANCHA', 'NEXT_GYOBAE_CNT',
+)
+BUNMAN_COLUMNS = ('MODON_NO', 'FARM_NO', 'BUN_DT', 'SILSAN', 'SASAN', 'MUMMY', 'TOTAL_CNT',
+                  'SUM_WT', 'AVG_WT', 'USE_YN')
+EU_COLUMNS = ('MODON_NO', 'FARM_NO', 'EU_DT', 'EU_CNT', 'EU_WT', 'EU_AVG_WT', 'POYU_DAYS',
+              'DAERI_YN', 'USE_YN')
+SAGO_COLUMNS = ('MODON_NO', 'FARM_NO', 'SAGO_DT', 'SAGO_GUBUN_CD', 'MEMO', 'USE_YN')
+GB_COLUMNS = ('MODON_NO', 'FARM_NO', 'GB_DT', 'METHOD_1', 'UNGDON_PIG_NO_1', 'UNGDON_PIG_NO_2',
+              'UNGDON_PIG_NO_3', 'USE_YN')
+JADON_TRANS_COLUMNS = ('SEQ', 'MODON_NO', 'FARM_NO', 'TRANS_DT', 'SANCHA', 'BUN_DT',
+                       'TRANS_GUBUN_CD', 'TRANS_CNT', 'USE_YN')
+LPD_COLUMNS = ('FARM_NO', 'DOCHUK_DT', 'NET_KG', 'BACK_DEPTH', 'MEAT_QUALITY', 'SEX_GUBUN')
+ETC_TRADE_COLUMNS = ('SEQ', 'FARM_NO', 'WK_DT', 'ACCOUNT_CD', 'TOTAL_PRICE', 'TOTAL_KG', 'USE_YN')
+PLAN_MODON_COLUMNS = ('SEQ', 'JOB_GUBUN_CD', 'WK_NM', 'STD_CD', 'MODON_STATUS_CD', 'PASS_DAY',
+                      'BF_PASS_YN', 'S_SANCHA', 'E_SANCHA', 'HCODE')
+
+# TB_PLAN_MODON 기본 예정작업 (SEQ, 예정작업, 작업명, 기준작업, 모돈상태, 경과일, 이전경과포함, HCODE)
+DEFAULT_PLANS = (
+    (1, '150005', '이유돈 교배', '020005', '010005', 7, 'Y', None),
+    (2, '150005', '후보돈 교배', '020001', '010001', 240, 'Y', None),
+    (3, '150005', '재발돈 교배', '020007', '010006', 21, 'Y', None),
+    (4, '150002', '분만', '020003', '010002', 115, 'N', None),
+    (5, '150003', '이유', '020004', '010003', 21, 'Y', None),
+    (6, '150001', '임신감정', '020003', '010002', 28, 'N', None),
+    (7, '150004', '분만전 백신', '020003', '010002', 100, 'N', 'VC01'),
+)
+
+
+@lru_cache(maxsize=None)
+def _ymd(day: int) -> str:
+    return date.fromordinal(day).strftime('%Y%m%d')
+
+
+class SyntheticFarm:
+    """가상 농장 1개 (테이블별 컬럼/행 튜플)
+
+    사용 예:
+        farm = SyntheticFarm.generate(farm_no=900001, sows=5000, dt_from='20251215', dt_to='20251221')
+        conn = FakeConnection(farm)
+        loader = FarmDataLoader(conn, farm.farm_no, farm.dt_from, farm.dt_to)
+    """
+
+    def __init__(self, farm_no: int, sows: int, dt_from: str, dt_to: str):
+        self.farm_no = farm_no
+        self.sows = sows
+        self.dt_from = dt_from
+        self.dt_to = dt_to
+        # 테이블 키 → (컬럼, 행 튜플 리스트)
+        self.tables: Dict[str, Tuple[Tuple[str, ...], List[tuple]]] = {}
+        # 연간 출하 누계 (TM_LPD_DATA 1.1일 ~ dt_to 집계값)
+        self.lpd_year_stats: Dict[str, Any] = {}
+        self.farm_row: Dict[str, Any] = {}
+        self.settings: List[Tuple[str, str]] = []
+
+    def rows(self, key: str) -> Tuple[Tuple[str, ...], List[tuple]]:
+        return self.tables[key]
+
+    def row_counts(self) -> Dict[str, int]:
+        return {key: len(rows) for key, (_, rows) in self.tables.items()}
+
+    @classmethod
+    def generate(cls, farm_no: int, sows: int, dt_from: str, dt_to: str,
+                 seed: Optional[int] = None) -> 'SyntheticFarm':
+        """가상 농장 생성
+
+        Args:
+            farm_no: 농장 번호
+            sows: 재적 모돈 수 (도폐사 모돈은 약 10% 추가 생성)
+            dt_from: 리포트 시작일 (YYYYMMDD)
+            dt_to: 리포트 종료일 (YYYYMMDD) = 기준일
+            seed: 난수 seed (None이면 farm_no + sows)
+        """
+        farm = cls(farm_no, sows, dt_from, dt_to)
+        rnd = random.Random(seed if seed is not None else farm_no * 100003 + sows)
+        base_day = datetime.strptime(dt_to, '%Y%m%d').toordinal()
+
+        modon, modon_wk, bunman, eu, sago, gb, trans = [], [], [], [], [], [], []
+        trans_seq = 0
+        culled = sows // 10
+
+        for i in range(sows + culled):
+            pig_no = farm_no * 100000 + i + 1
+            in_day = base_day - rnd.randint(30, 1100)
+            birth_day = in_day - rnd.randint(180, 240)
+            out_day = None
+            if i >= sows:
+                out_day = base_day - rnd.randint(0, 700)
+                if out_day <= in_day:
+                    in_day = out_day - rnd.randint(60, 400)
+                    birth_day = in_day - rnd.randint(180, 240)
+            last_day = out_day if out_day is not None else base_day
+
+            # 작업이력: (일, 작업구분, 산차, 교배차수, 사고구분)
+            events: List[Tuple[int, str, int, int, Optional[str]]] = []
+            sancha = 0
+            gb_cnt = 0
+            day = max(birth_day + rnd.randint(225, 250), in_day + rnd.randint(7, 30))
+            while day <= last_day:
+                gb_cnt += 1
+                events.append((day, 'G', sancha, gb_cnt, None))
+                gb.append((pig_no, farm_no, _ymd(day), rnd.choice(('1', '2')),
+                           rnd.randint(1, 30), None, None, 'Y'))
+
+                if rnd.random() >= CONCEPTION_RATE:
+                    sago_day = day + rnd.randint(*SAGO_DAYS)
+                    if sago_day > last_day:
+                        break
+                    code = rnd.choice(tuple(SAGO_STATUS))
+                    events.append((sago_day, 'F', sancha, gb_cnt, code))
+                    sago.append((pig_no, farm_no, _ymd(sago_day), code, None, 'Y'))
+                    day = sago_day + rnd.randint(3, 10)
+                    continue
+
+                bun_day = day + rnd.randint(*GESTATION_DAYS)
+                if bun_day > last_day:
+                    break
+                sancha += 1
+                gb_cnt = 0
+                events.append((bun_day, 'B', sancha, gb_cnt, None))
+                silsan = rnd.randint(8, 16)
+                sasan = rnd.choice((0, 0, 0, 1, 1, 2))
+                mummy = rnd.choice((0, 0, 0, 0, 1))
+                sum_wt = round(silsan * rnd.uniform(1.2, 1.6), 1)
+                bun_dt = _ymd(bun_day)
+                bunman.append((pig_no, farm_no, bun_dt, silsan, sasan, mummy, silsan + sasan + mummy,
+                               sum_wt, round(sum_wt / silsan, 2), 'Y'))
+
+                eu_day = bun_day + rnd.randint(*LACTATION_DAYS)
+                eu_cnt = max(silsan - rnd.randint(0, 2), 1)
+                for _ in range(rnd.choice((0, 0, 1, 2))):
+                    trans_day = bun_day + rnd.randint(1, 7)
+                    if trans_day > last_day:
+                        break
+                    trans_seq += 1
+                    trans.append((trans_seq, pig_no, farm_no, _ymd(trans_day), sancha, bun_dt,
+                                  rnd.choice(TRANS_GUBUN_CODES), rnd.randint(1, 3), 'Y'))
+                if eu_day > last_day:
+                    break
+                events.append((eu_day, 'E', sancha, gb_cnt, None))
+                eu_wt = round(eu_cnt * rnd.uniform(6.0, 8.0), 1)
+                eu.append((pig_no, farm_no, _ymd(eu_day), eu_cnt, eu_wt, round(eu_wt / eu_cnt, 2),
+                           eu_day - bun_day, 'N', 'Y'))
+                day = eu_day + rnd.randint(*RETURN_DAYS)
+
+            modon_wk.extend(cls._wk_rows(farm_no, pig_no, events))
+
+            last = events[-1] if events else None
+            if last is None:
+                status = '010001'
+            elif last[1] == 'F':
+                status = SAGO_STATUS[last[4]]
+            else:
+                status = WK_STATUS[last[1]]
+            modon.append((
+                pig_no, f"S{i + 1:05d}", farm_no,
+                last[2] if last else 0, 0, status, _ymd(in_day),
+                _ymd(out_day) if out_day is not None else '99991231',
+                rnd.choice(OUT_GUBUN_CODES) if out_day is not None else None, None,
+                _ymd(birth_day), _ymd(last[0]) if last else None, last[3] if last else 0, None, None,
+                None, None, None, 0, 'N', 'Y',
+                last[1] if last else None, last[4] if last else None, status,
+            ))
+
+        farm.tables['modon'] = (MODON_COLUMNS, modon)
+        farm.tables['modon_wk'] = (MODON_WK_COLUMNS, modon_wk)
+        farm.tables['bunman'] = (BUNMAN_COLUMNS, bunman)
+        farm.tables['eu'] = (EU_COLUMNS, eu)
+        farm.tables['sago'] = (SAGO_COLUMNS, sago)
+        farm.tables['gb'] = (GB_COLUMNS, gb)
+        farm.tables['jadon_trans'] = (JADON_TRANS_COLUMNS, trans)
+        farm._generate_trade(rnd, base_day)
+        farm._generate_config()
+        return farm
+
+    @staticmethod
+    def _wk_rows(farm_no: int, pig_no: int, events: List[tuple]) -> List[tuple]:
+        """작업이력 행 (SEQ 순, 이전/다음 작업 연결 포함)"""
+        rows = []
+        for idx, (day, gubun, sancha, gb_cnt, sago_cd) in enumerate(events):
+            wk_dt = _ymd(day)
+            prev = events[idx - 1] if idx > 0 else None
+            nxt = events[idx + 1] if idx + 1 < len(events) else None
+            rows.append((
+                idx + 1, pig_no, pig_no, farm_no, wk_dt, gubun, sancha, gb_cnt,
+                None, sago_cd, 'N', 'Y', wk_dt,
+                idx if prev else None, _ymd(prev[0]) if prev else None, prev[1] if prev else None,
+                prev[2] if prev else None, prev[3] if prev else None,
+                idx + 2 if nxt else None, _ymd(nxt[0]) if nxt else None, nxt[1] if nxt else None,
+                nxt[2] if nxt else None, nxt[3] if nxt else None,
+            ))
+        return rows
+
+    def _generate_trade(self, rnd: random.Random, base_day: int) -> None:
+        """출하(TM_LPD_DATA: 리포트 주간) + 매출(TM_ETC_TRADE) + 연간 출하 누계"""
+        from_day = datetime.strptime(self.dt_from, '%Y%m%d').toordinal()
+        # 모돈당 연 23두 출하, 주 2회 출하
+        per_ship = max(int(self.sows * 23 / 52 / 2), 1)
+        lpd = []
+        trade = []
+        for seq, day in enumerate((from_day + 1, from_day + 4), start=1):
+            if day > base_day:
+                continue
+            dochuk_dt = date.fromordinal(day).strftime('%Y-%m-%d')
+            cnt = int(per_ship * rnd.uniform(0.8, 1.2))
+            total_kg = 0.0
+            for _ in range(cnt):
+                net_kg = round(rnd.gauss(88.0, 6.0), 1)
+                total_kg += net_kg
+                lpd.append((self.farm_no, dochuk_dt, net_kg, round(rnd.gauss(20.0, 3.0), 1),
+                            rnd.choice(('1+', '1+', '1', '1', '1', '2')),
+                            rnd.choice(('암', '수', '거세'))))
+            trade.append((seq, self.farm_no, _ymd(day), '511001',
+                          int(total_kg * rnd.uniform(5000, 5600)), round(total_kg, 1), 'Y'))
+        self.tables['lpd'] = (LPD_COLUMNS, lpd)
+        self.tables['etc_trade'] = (ETC_TRADE_COLUMNS, trade)
+
+        year_days = base_day - date(date.fromordinal(base_day).year, 1, 1).toordinal() + 1
+        self.lpd_year_stats = {
+            'FARM_NO': self.farm_no,
+            'CNT': int(self.sows * 23 * year_days / 365),
+            'AVG_NET': 88.0,
+        }
+
+    def _generate_config(self) -> None:
+        """농장 정보 / 기본 설정 / 예정작업"""
+        self.farm_row = {
+            'FARM_NO': self.farm_no, 'FARM_NM': f"벤치마크농장{self.sows}", 'PRINCIPAL_NM': '벤치마크',
+            'SIGUN_CD': '4113510300', 'LOCALE': 'KOR', 'USE_YN': 'Y',
+        }
+        self.settings = [('140002', '115'), ('140003', '21'), ('140007', '240'), ('140008', '7')]
+        self.tables['plan_modon'] = (PLAN_MODON_COLUMNS, [
+            (seq, job, nm, std, status, days, bf, None, None, hcode)
+            for seq, job, nm, std, status, days, bf, hcode in DEFAULT_PLANS
+        ])
@@ -0,0 +1,326 @@
+"""
+농장 좌표 일괄 변환 (격자/ASOS 관측소 매핑)
+- 위경도 → 기상청 격자 (Lambert Conformal Conic) 일괄 변환
+- 위경도 → 최근접 ASOS 관측소 (Haversine 거리 행렬) 일괄 계산
+- TA_FARM 좌표를 1회 조회하여 농장 → 격자 → 관측소 매핑 테이블 구성
+  (중기예보 격자/시군구, ASOS 수집 격자/관측소 매핑에서 재사용)
+
+NumPy 설치 시 배열 연산으로 처리하고, 미설치 시 동일 공식의 순수 Python으로 처리
+"""
+import logging
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# NumPy (선택): 미설치 환경에서도 동일 결과를 순수 Python으로 계산
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# 기상청 격자 변환 상수
+RE = 6371.00877    # 지구 반경(km)
+GRID = 5.0         # 격자 간격(km)
+SLAT1 = 30.0       # 투영 위도1(degree)
+SLAT2 = 60.0       # 투영 위도2(degree)
+OLON = 126.0       # 기준점 경도(degree)
+OLAT = 38.0        # 기준점 위도(degree)
+XO = 43            # 기준점 X좌표(GRID)
+YO = 136           # 기준점 Y좌표(GRID)
+
+DEGRAD = math.pi / 180.0
+EARTH_RADIUS_KM = 6371  # Haversine 지구 반경(km)
+
+# Haversine 거리 행렬 계산 시 한 번에 처리할 농장 수 (메모리 제한)
+DISTANCE_CHUNK = 4096
+
+
+def _lcc_params() -> Tuple[float, float, float, float]:
+    """LCC 투영 상수 (re, sn, sf, ro) - 좌표와 무관하므로 1회 계산"""
+    re = RE / GRID
+    slat1 = SLAT1 * DEGRAD
+    slat2 = SLAT2 * DEGRAD
+    olat = OLAT * DEGRAD
+
+    sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(math.pi * 0.25 + slat1 * 0.5)
+    sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
+    sf = math.tan(math.pi * 0.25 + slat1 * 0.5)
+    sf = math.pow(sf, sn) * math.cos(slat1) / sn
+    ro = math.tan(math.pi * 0.25 + olat * 0.5)
+    ro = re * sf / math.pow(ro, sn)
+    return re, sn, sf, ro
+
+
+_RE, _SN, _SF, _RO = _lcc_params()
+_OLON = OLON * DEGRAD
+
+
+def latlon_to_grid(lat: float, lon: float) -> Tuple[int, int]:
+    """위경도를 기상청 격자 좌표로 변환 (Lambert Conformal Conic)
+
+    Args:
+        lat: 위도 (MAP_Y)
+        lon: 경도 (MAP_X)
+
+    Returns:
+        (nx, ny) 격자 좌표 튜플
+    """
+    ra = math.tan(math.pi * 0.25 + lat * DEGRAD * 0.5)
+    ra = _RE * _SF / math.pow(ra, _SN)
+    theta = lon * DEGRAD - _OLON
+    if theta > math.pi:
+        theta -= 2.0 * math.pi
+    if theta < -math.pi:
+        theta += 2.0 * math.pi
+    theta *= _SN
+
+    nx = int(ra * math.sin(theta) + XO + 0.5)
+    ny = int(_RO - ra * math.cos(theta) + YO + 0.5)
+
+    return nx, ny
+
+
+def latlon_to_grid_batch(coords: Sequence[Tuple[float, float]]) -> List[Tuple[int, int]]:
+    """위경도 목록을 기상청 격자 좌표로 일괄 변환
+
+    Args:
+        coords: [(lat, lon), ...]
+
+    Returns:
+        [(nx, ny), ...] (입력 순서)
+    """
+    if not coords:
+        return []
+    if not HAS_NUMPY:
+        return [latlon_to_grid(lat, lon) for lat, lon in coords]
+
+    arr = np.asarray(coords, dtype=float)
+    lat = arr[:, 0]
+    lon = arr[:, 1]
+
+    ra = _RE * _SF / np.power(np.tan(math.pi * 0.25 + lat * DEGRAD * 0.5), _SN)
+    theta = lon * DEGRAD - _OLON
+    theta = np.where(theta > math.pi, theta - 2.0 * math.pi, theta)
+    theta = np.where(theta < -math.pi, theta + 2.0 * math.pi, theta)
+    theta = theta * _SN
+
+    # int() 와 동일한 0 방향 절사
+    nx = np.trunc(ra * np.sin(theta) + XO + 0.5).astype(int)
+    ny = np.trunc(_RO - ra * np.cos(theta) + YO + 0.5).astype(int)
+    return list(zip(nx.tolist(), ny.tolist()))
+
+
+def _nearest_python(coords: Sequence[Tuple[float, float]],
+                    stations: Sequence[Tuple[int, str, float, float]]) -> List[Tuple[int, str, float]]:
+    """최근접 관측소 (순수 Python, 관측소 좌표 라디안/코사인 1회 계산)"""
+    stn_rad = [(math.radians(s_lat), math.radians(s_lon), math.cos(math.radians(s_lat)))
+               for _, _, s_lat, s_lon in stations]
+    result = []
+    for lat, lon in coords:
+        lat_r = math.radians(lat)
+        lon_r = math.radians(lon)
+        cos_lat = math.cos(lat_r)
+        best_i = 0
+        best_a = float('inf')
+        for i, (s_lat_r, s_lon_r, s_cos) in enumerate(stn_rad):
+            a = math.sin((s_lat_r - lat_r) / 2) ** 2 + cos_lat * s_cos * math.sin((s_lon_r - lon_r) / 2) ** 2
+            if a < best_a:
+                best_a = a
+                best_i = i
+        dist = EARTH_RADIUS_KM * 2 * math.asin(math.sqrt(best_a))
+        result.append((stations[best_i][0], stations[best_i][1], dist))
+    return result
+
+
+def nearest_stations_batch(coords: Sequence[Tuple[float, float]],
+                           stations: Sequence[Tuple[int, str, float, float]]) -> List[Tuple[int, str, float]]:
+    """위경도 목록의 최근접 ASOS 관측소 일괄 계산 (Haversine 거리 행렬)
+
+    Args:
+        coords: [(lat, lon), ...]
+        stations: [(STN_ID, STN_NM, LAT, LON), ...]
+
+    Returns:
+        [(관측소번호, 관측소명, 거리km), ...] (입력 순서, 동일 거리면 앞 관측소)
+    """
+    if not coords:
+        return []
+    if not stations:
+        raise ValueError("ASOS 관측소 목록이 비어있습니다. load_asos_stations()를 먼저 호출하세요.")
+    if not HAS_NUMPY:
+        return _nearest_python(coords, stations)
+
+    stn = np.radians(np.asarray([(s[2], s[3]) for s in stations], dtype=float))
+    stn_lat = stn[:, 0][np.newaxis, :]
+    stn_lon = stn[:, 1][np.newaxis, :]
+    stn_cos = np.cos(stn_lat)
+
+    pts = np.radians(np.asarray(coords, dtype=float))
+    result = []
+    for start in range(0, len(pts), DISTANCE_CHUNK):
+        chunk = pts[start:start + DISTANCE_CHUNK]
+        lat = chunk[:, 0][:, np.newaxis]
+        lon = chunk[:, 1][:, np.newaxis]
+        # a 가 최소인 관측소 = 거리 최소 (asin/sqrt 단조 증가)
+        a = np.sin((stn_lat - lat) / 2) ** 2 + np.cos(lat) * stn_cos * np.sin((stn_lon - lon) / 2) ** 2
+        idx = np.argmin(a, axis=1)
+        best_a = a[np.arange(len(chunk)), idx]
+        dist = EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(best_a))
+        for i, d in zip(idx.tolist(), dist.tolist()):
+            result.append((stations[i][0], stations[i][1], d))
+    return result
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+class FarmGeoTable:
+    """농장 → 격자 → ASOS 관측소 매핑 테이블
+
+    TA_FARM 좌표를 1회 조회하고, 격자/관측소가 없는 농장은 일괄 계산하여 보관.
+    같은 수집기 인스턴스에서 ASOS 수집/중기예보 수집이 재사용.
+
+    사용 예:
+        table = FarmGeoTable.load(db)
+        table.grid_station_map(stations)    # {(nx, ny): (stn_id, stn_nm, dist_km)}
+        table.grids_with_sigun()            # [(nx, ny, sigun_cd), ...]
+    """
+
+    FARM_GEO_SQL = """
+        SELECT FARM_NO,
+               MAP_X_N AS LON,
+               MAP_Y_N AS LAT,
+               WEATHER_NX_N AS NX,
+               WEATHER_NY_N AS NY,
+               SIGUN_CD,
+               ASOS_STN_ID,
+               ASOS_STN_NM,
+               ASOS_DIST_KM
+        FROM TA_FARM
+        WHERE USE_YN = 'Y'
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        """
+        Args:
+            rows: FARM_GEO_SQL 조회 결과
+        """
+        self.farms: List[Dict[str, Any]] = []
+        for row in rows:
+            self.farms.append({
+                'FARM_NO': row.get('FARM_NO'),
+                'LAT': _to_float(row.get('LAT')),
+                'LON': _to_float(row.get('LON')),
+                'NX': _to_int(row.get('NX')),
+                'NY': _to_int(row.get('NY')),
+                'SIGUN_CD': str(row.get('SIGUN_CD') or ''),
+                'ASOS_STN_ID': _to_int(row.get('ASOS_STN_ID')),
+                'ASOS_STN_NM': row.get('ASOS_STN_NM') or '',
+                'ASOS_DIST_KM': _to_float(row.get('ASOS_DIST_KM')) or 0.0,
+                # 계산값 (TA_FARM 미저장)
+                'CALC_NX': None,
+                'CALC_NY': None,
+                'CALC_STN': None,
+            })
+        self._stations_assigned = False
+        self._assign_grids()
+
+    @classmethod
+    def load(cls, db) -> 'FarmGeoTable':
+        """TA_FARM 1회 조회로 매핑 테이블 생성"""
+        table = cls(db.fetch_dict(cls.FARM_GEO_SQL))
+        logger.info(f"농장 좌표 매핑 테이블: {len(table.farms)}개 농장 (numpy={HAS_NUMPY})")
+        return table
+
+    @staticmethod
+    def _has_coords(farm: Dict[str, Any]) -> bool:
+        return farm['LAT'] is not None and farm['LON'] is not None
+
+    def _assign_grids(self) -> None:
+        """격자 없는 농장 일괄 계산"""
+        need_grid = [f for f in self.farms
+                     if self._has_coords(f) and (f['NX'] is None or f['NY'] is None)]
+        for farm, (nx, ny) in zip(need_grid, latlon_to_grid_batch([(f['LAT'], f['LON']) for f in need_grid])):
+            farm['CALC_NX'] = nx
+            farm['CALC_NY'] = ny
+
+    def _assign_stations(self, stations: Sequence[Tuple[int, str, float, float]]) -> None:
+        """관측소 없는 농장 일괄 계산 (최초 1회)"""
+        if self._stations_assigned:
+            return
+        need_stn = [f for f in self.farms if self._has_coords(f) and f['ASOS_STN_ID'] is None]
+        nearest = nearest_stations_batch([(f['LAT'], f['LON']) for f in need_stn], stations)
+        for farm, stn in zip(need_stn, nearest):
+            farm['CALC_STN'] = stn
+        self._stations_assigned = True
+
+    def grid_station_map(self, stations: Sequence[Tuple[int, str, float, float]]) -> Dict[Tuple[int, int], Tuple[int, str, float]]:
+        """격자별 ASOS 관측소 매핑 (TA_FARM 저장값 우선, 없으면 계산값)
+
+        Args:
+            stations: ASOS 관측소 리스트
+
+        Returns:
+            {(nx, ny): (stn_id, stn_nm, dist_km), ...}
+        """
+        self._assign_stations(stations)
+        result: Dict[Tuple[int, int], Tuple[int, str, float]] = {}
+        # 1. TA_FARM.ASOS_STN_ID 저장된 농장
+        for farm in self.farms:
+            if farm['NX'] is None or farm['NY'] is None or farm['ASOS_STN_ID'] is None:
+                continue
+            result[(farm['NX'], farm['NY'])] = (farm['ASOS_STN_ID'], farm['ASOS_STN_NM'], farm['ASOS_DIST_KM'])
+        # 2. 미저장 농장은 계산값 (이미 매핑된 격자는 스킵)
+        for farm in self.farms:
+            if farm['NX'] is None or farm['NY'] is None or farm['CALC_STN'] is None:
+                continue
+            result.setdefault((farm['NX'], farm['NY']), farm['CALC_STN'])
+        return result
+
+    def grids_with_sigun(self) -> List[Tuple[int, int, str]]:
+        """격자 + 시군구코드 목록 (중복 제거, 중기예보용)
+
+        Returns:
+            [(nx, ny, sigun_cd), ...]
+        """
+        seen = set()
+        result = []
+        for farm in self.farms:
+            if farm['NX'] is None or farm['NY'] is None or not farm['SIGUN_CD']:
+                continue
+            key = (farm['NX'], farm['NY'], farm['SIGUN_CD'])
+            if key not in seen:
+                seen.add(key)
+                result.append(key)
+        return result
+
+    def mapxy_grids(self) -> List[Tuple[int, int, float, float]]:
+        """격자 미저장 농장의 계산 격자 (좌표 중복 제거)
+
+        Returns:
+            [(nx, ny, lon, lat), ...]
+        """
+        seen = set()
+        result = []
+        for farm in self.farms:
+            if farm['CALC_NX'] is None:
+                continue
+            key = (farm['LON'], farm['LAT'])
+            if key not in seen:
+                seen.add(key)
+                result.append((farm['CALC_NX'], farm['CALC_NY'], farm['LON'], farm['LAT']))
+        return result
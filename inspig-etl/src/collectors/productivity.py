@@ -47,10 +47,14 @@ GET http://10.4.35.10:11000/statistics/productivity/period/{farmNo}
     collector.save(data)
 """
 import logging
+import threading
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base import BaseCollector
 from ..common import Config, Database, today_kst, get_service_farm_nos
@@ -79,6 +83,10 @@ class ProductivityCollector(BaseCollector):
         self.base_url = self.api_config.get('productivity_base_url', 'http://10.4.35.10:11000')
         self.timeout = self.api_config.get('productivity_timeout', 60)
         self.max_workers = self.api_config.get('productivity_workers', 8)
+        self.retries = self.api_config.get('productivity_retries', 3)
+        self.backoff = self.api_config.get('productivity_backoff', 0.5)
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
 
     # 고정 파라미터 (statDate, memberId, period 외 모두 고정)
     FIXED_PARAMS = {
@@ -96,6 +104,52 @@ class ProductivityCollector(BaseCollector):
     # PCODE 목록
     VALID_PCODES = ('031', '032', '033', '034', '035')
 
+    # TS_PRODUCTIVITY 값 컬럼 (DDL: C001 ~ C043)
+    C_COLUMNS = tuple(f'C{i:03d}' for i in range(1, 44))
+
+    # MERGE 배열 바인드 1회 행 수 (FARM_NO IN 목록 1000개 제한 이내)
+    SAVE_BATCH_SIZE = 1000
+
+    # 재시도 대상 HTTP 상태 코드
+    RETRY_STATUS = (500, 502, 503, 504)
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP 세션 (keep-alive 연결 풀 + 재시도, 워커 스레드 공유)
+
+        - 연결 풀 크기 = productivity_workers (동시 호출 수만큼 연결 재사용)
+        - 5xx/연결 오류/읽기 타임아웃: productivity_retries 회 지수 백오프 재시도
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    retry = Retry(
+                        total=self.retries,
+                        connect=self.retries,
+                        read=self.retries,
+                        status=self.retries,
+                        backoff_factor=self.backoff,
+                        status_forcelist=self.RETRY_STATUS,
+                        allowed_methods=frozenset(['GET']),
+                        raise_on_status=False,
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=max(1, self.max_workers),
+                        max_retries=retry,
+                    )
+                    session = requests.Session()
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """HTTP 세션 종료"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _fetch_productivity(
         self,
         farm_no: int,
@@ -136,7 +190,7 @@ class ProductivityCollector(BaseCollector):
         }
 
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -188,6 +242,7 @@ class ProductivityCollector(BaseCollector):
         period: str = 'W',
         exclude_farms: Optional[str] = None,
         skip_existing: bool = False,
+        on_rows: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """생산성 데이터 수집
@@ -202,9 +257,11 @@ class ProductivityCollector(BaseCollector):
             exclude_farms: 제외할 농장 목록 (콤마 구분, 예: "848,1234")
             skip_existing: True면 이미 수집된 농장은 스킵 (중복 수집 방지)
                           productivity-all에서 서비스 농장 중복 수집 방지용
+            on_rows: 농장별 변환 결과를 받을 콜백 (지정 시 결과를 모으지 않고 즉시 전달)
+                     run()에서 수집과 저장을 겹쳐 처리하는 용도
 
         Returns:
-            수집된 데이터 리스트
+            수집된 데이터 리스트 (on_rows 지정 시 빈 리스트)
             [
                 {'FARM_NO': 1234, 'PCODE': '031', 'STAT_YEAR': 2024, 'PERIOD': 'W', 'PERIOD_NO': 52, ...},
                 {'FARM_NO': 1234, 'PCODE': '032', ...},
@@ -244,8 +301,15 @@ class ProductivityCollector(BaseCollector):
             f"skip_existing: {skip_existing}"
         )
 
+        # skip_existing: 이미 수집된 농장 1회 조회 (워커 스레드에서 농장별 조회하지 않음)
+        # 월간(M)은 12개월 롤링이므로 skip_existing 무시 (항상 MERGE)
+        existing_farms = set()
+        if skip_existing and period != 'M':
+            existing_farms = self._fetch_existing_farms(stat_year, period, period_no)
+
         # 결과 저장
         result = []
+        row_cnt = 0
         success_cnt = 0
         error_cnt = 0
         skip_cnt = 0
@@ -257,8 +321,7 @@ class ProductivityCollector(BaseCollector):
             farm_no = farm.get('FARM_NO')
             try:
                 # skip_existing 옵션: 이미 수집된 농장은 스킵
-                # 월간(M)은 12개월 롤링이므로 skip_existing 무시 (항상 MERGE)
-                if skip_existing and period != 'M' and self.exists(farm_no, stat_year, period, period_no):
+                if farm_no in existing_farms:
                     return ([], True)  # skipped
 
                 # API 호출 (Q는 API에서 지원하지 않으므로 M으로 호출)
@@ -271,7 +334,7 @@ class ProductivityCollector(BaseCollector):
                 self.logger.error(f"농장 {farm_no} 생산성 수집 실패: {e}")
                 return ([], False)
 
-        # 병렬 처리로 API 호출
+        # 병렬 처리로 API 호출 (동시 호출 수 = max_workers, keep-alive 세션 공유)
         total_farms = len(farm_list)
         processed_cnt = 0
 
@@ -290,23 +353,97 @@ class ProductivityCollector(BaseCollector):
 
                 try:
                     farm_data, skipped = future.result()
-                    if skipped:
-                        skip_cnt += 1
-                        self.logger.info(f"  [{processed_cnt}/{total_farms}] 농장 {farm_no}: SKIP (이미 수집됨)")
-                    elif farm_data:
-                        result.extend(farm_data)
-                        success_cnt += 1
-                        self.logger.info(f"  [{processed_cnt}/{total_farms}] 농장 {farm_no}: OK ({len(farm_data)}건)")
-                    else:
-                        error_cnt += 1
-                        self.logger.warning(f"  [{processed_cnt}/{total_farms}] 농장 {farm_no}: 데이터 없음")
                 except Exception as e:
                     error_cnt += 1
                     self.logger.error(f"  [{processed_cnt}/{total_farms}] 농장 {farm_no}: 실패 - {e}")
+                    continue
 
-        self.logger.info(f"수집 완료: 성공 {success_cnt}개, 스킵 {skip_cnt}개, 실패 {error_cnt}개, 총 레코드 {len(result)}건")
+                if skipped:
+                    skip_cnt += 1
+                    self.logger.info(f"  [{processed_cnt}/{total_farms}] 농장 {farm_no}: SKIP (이미 수집됨)")
+                elif farm_data:
+                    row_cnt += len(farm_data)
+                    success_cnt += 1
+                    self.logger.info(f"  [{processed_cnt}/{total_farms}] 농장 {farm_no}: OK ({len(farm_data)}건)")
+                    if on_rows is None:
+                        result.extend(farm_data)
+                        continue
+                    try:
+                        on_rows(farm_data)
+                    except Exception:
+                        # 저장 실패 시 대기 중인 API 호출 취소 후 전파
+                        for pending in future_to_farm:
+                            pending.cancel()
+                        raise
+                else:
+                    error_cnt += 1
+                    self.logger.warning(f"  [{processed_cnt}/{total_farms}] 농장 {farm_no}: 데이터 없음")
+
+        self.logger.info(f"수집 완료: 성공 {success_cnt}개, 스킵 {skip_cnt}개, 실패 {error_cnt}개, 총 레코드 {row_cnt}건")
         return result
 
+    def run(self, **kwargs) -> int:
+        """수집 및 저장 실행 (스트리밍 저장)
+
+        API 응답을 모두 모은 뒤 저장하지 않고, 변환된 행이 SAVE_BATCH_SIZE 만큼
+        쌓일 때마다 저장 → 워커 스레드의 API 호출과 DB 저장이 겹쳐 진행
+
+        Returns:
+            처리된 레코드 수
+        """
+        self.logger.info(f"=== {self.__class__.__name__} 시작 ===")
+
+        pending: List[Dict[str, Any]] = []
+        saved_count = 0
+
+        def flush() -> None:
+            nonlocal saved_count
+            if not pending:
+                return
+            saved_count += self.save(pending)
+            pending.clear()
+
+        def on_rows(rows: List[Dict[str, Any]]) -> None:
+            pending.extend(rows)
+            if len(pending) >= self.SAVE_BATCH_SIZE:
+                flush()
+
+        try:
+            self.collect(on_rows=on_rows, **kwargs)
+            flush()
+
+            if saved_count:
+                self.logger.info(f"저장 완료: {saved_count}건")
+            else:
+                self.logger.info("수집된 데이터 없음")
+            return saved_count
+
+        except Exception as e:
+            self.logger.error(f"처리 실패: {e}", exc_info=True)
+            raise
+        finally:
+            self.logger.info(f"=== {self.__class__.__name__} 종료 ===")
+
+    def _fetch_existing_farms(self, stat_year: int, period: str, period_no: int) -> set:
+        """이미 수집된 농장 번호 조회 (skip_existing 용, 1회 조회)"""
+        sql = """
+            SELECT DISTINCT FARM_NO
+            FROM TS_PRODUCTIVITY
+            WHERE STAT_YEAR = :stat_year
+              AND PERIOD = :period
+              AND PERIOD_NO = :period_no
+        """
+        try:
+            rows = self.db.fetch_all(sql, {
+                'stat_year': stat_year,
+                'period': period,
+                'period_no': period_no,
+            })
+            return {int(row[0]) for row in rows}
+        except Exception as e:
+            self.logger.error(f"TS_PRODUCTIVITY 수집 농장 조회 실패: {e}")
+            return set()
+
     def _get_farm_list(self, exclude_farms: Optional[str] = None) -> List[Dict]:
         """DB에서 대상 농장 목록 조회
 
@@ -409,13 +546,12 @@ class ProductivityCollector(BaseCollector):
                     # 컬럼명: C + 뒤 3자리 (예: 031001 -> C001)
                     col_name = f"C{col_suffix}"
 
-                    # 값 변환
+                    # 값 변환 (빈 값/숫자 아님 → NULL, C 컬럼은 NUMBER 배열 바인드)
                     stat_val = item.get('__VAL__')
-                    if stat_val is not None and str(stat_val).strip():
-                        try:
-                            stat_val = float(stat_val)
-                        except (ValueError, TypeError):
-                            stat_val = None
+                    try:
+                        stat_val = float(stat_val) if stat_val is not None and str(stat_val).strip() else None
+                    except (ValueError, TypeError):
+                        stat_val = None
 
                     rows[pcode][col_name] = stat_val
 
@@ -432,10 +568,13 @@ class ProductivityCollector(BaseCollector):
         return result
 
     def save(self, data: List[Dict[str, Any]]) -> int:
-        """생산성 데이터 저장 (DELETE 후 INSERT)
+        """생산성 데이터 저장 (MERGE 일괄 upsert)
 
-        기존 데이터가 존재하면 삭제 후 새로 생성합니다.
-        UK: FARM_NO + PCODE + STAT_YEAR + PERIOD + PERIOD_NO
+        UK(FARM_NO + PCODE + STAT_YEAR + PERIOD + PERIOD_NO) 기준으로
+        기존 데이터가 있으면 UPDATE, 없으면 INSERT 합니다.
+        - SAVE_BATCH_SIZE 행 단위 배열 바인드 MERGE (executemany 1회)
+        - 응답에 없는 C 컬럼은 NULL로 갱신 (기존 DELETE 후 INSERT 와 동일한 결과)
+        - 기존 행은 SEQ/INS_DT 유지, UPD_DT 갱신
 
         Args:
             data: 수집된 데이터 리스트
@@ -446,69 +585,59 @@ class ProductivityCollector(BaseCollector):
         if not data:
             return 0
 
-        # 모든 row의 C 컬럼을 합집합으로 수집
-        all_c_columns = set()
+        # 테이블 C 컬럼 + 응답 C 컬럼 (테이블에 없는 컬럼은 기존과 동일하게 오류)
+        all_c_columns = set(self.C_COLUMNS)
         for row in data:
-            c_cols = [col for col in row.keys() if col.startswith('C')]
-            all_c_columns.update(c_cols)
-
+            all_c_columns.update(col for col in row.keys() if col.startswith('C'))
         c_columns = sorted(all_c_columns)
 
-        # INSERT 컬럼/값 생성
-        base_cols = ['SEQ', 'FARM_NO', 'PCODE', 'STAT_YEAR', 'PERIOD', 'PERIOD_NO', 'STAT_DATE']
-        insert_cols = base_cols + c_columns + ['INS_DT']
-
-        insert_vals = ['SEQ_TS_PRODUCTIVITY.NEXTVAL', ':FARM_NO', ':PCODE', ':STAT_YEAR', ':PERIOD', ':PERIOD_NO', ':STAT_DATE']
-        insert_vals += [f':{col}' for col in c_columns]
-        insert_vals += ['SYSDATE']
-
-        insert_sql = f"""
-            INSERT INTO TS_PRODUCTIVITY ({', '.join(insert_cols)})
-            VALUES ({', '.join(insert_vals)})
-        """
-
-        delete_sql = """
-            DELETE FROM TS_PRODUCTIVITY
-            WHERE FARM_NO = :FARM_NO
-              AND PCODE = :PCODE
-              AND STAT_YEAR = :STAT_YEAR
-              AND PERIOD = :PERIOD
-              AND PERIOD_NO = :PERIOD_NO
-        """
-
         # 모든 row에 누락된 C 컬럼을 None으로 채움
         for row in data:
             for col in c_columns:
                 if col not in row:
                     row[col] = None
 
-        try:
-            # 1. 기존 데이터 삭제
-            delete_count = 0
-            for row in data:
-                delete_params = {
-                    'FARM_NO': row['FARM_NO'],
-                    'PCODE': row['PCODE'],
-                    'STAT_YEAR': row['STAT_YEAR'],
-                    'PERIOD': row['PERIOD'],
-                    'PERIOD_NO': row['PERIOD_NO'],
-                }
-                result = self.db.execute(delete_sql, delete_params)
-                if result:
-                    delete_count += result
+        merge_sql = self._build_merge_sql(c_columns)
+        # 첫 행이 None인 C 컬럼의 바인드 타입 고정 (NUMBER)
+        input_sizes = {col: float for col in c_columns}
 
-            if delete_count > 0:
-                self.logger.info(f"TS_PRODUCTIVITY 기존 데이터 삭제: {delete_count}건")
+        try:
+            # 전체 배치를 하나의 트랜잭션으로 처리 (persistent 연결: 종료 시 1회 커밋)
+            with self.db.transaction():
+                for start in range(0, len(data), self.SAVE_BATCH_SIZE):
+                    batch = data[start:start + self.SAVE_BATCH_SIZE]
+                    self.db.execute_many(merge_sql, batch, input_sizes=input_sizes)
 
-            # 2. 새 데이터 INSERT
-            self.db.execute_many(insert_sql, data)
-            self.logger.info(f"TS_PRODUCTIVITY 저장 완료: {len(data)}건")
+            self.logger.info(f"TS_PRODUCTIVITY 저장 완료: {len(data)}건 (MERGE)")
             return len(data)
 
         except Exception as e:
             self.logger.error(f"TS_PRODUCTIVITY 저장 실패: {e}")
             raise
 
+    @staticmethod
+    def _build_merge_sql(c_columns: List[str]) -> str:
+        """배열 바인드용 MERGE SQL 생성"""
+        key_cols = ['FARM_NO', 'PCODE', 'STAT_YEAR', 'PERIOD', 'PERIOD_NO']
+        src_cols = key_cols + ['STAT_DATE'] + c_columns
+
+        using = ', '.join(f':{col} AS {col}' for col in src_cols)
+        on = ' AND '.join(f'T.{col} = S.{col}' for col in key_cols)
+        update_set = ', '.join(f'T.{col} = S.{col}' for col in ['STAT_DATE'] + c_columns)
+        insert_cols = ['SEQ'] + src_cols + ['INS_DT']
+        insert_vals = ['SEQ_TS_PRODUCTIVITY.NEXTVAL'] + [f'S.{col}' for col in src_cols] + ['SYSDATE']
+
+        return f"""
+            MERGE INTO TS_PRODUCTIVITY T
+            USING (SELECT {using} FROM DUAL) S
+            ON ({on})
+            WHEN MATCHED THEN
+                UPDATE SET {update_set}, T.UPD_DT = SYSDATE
+            WHEN NOT MATCHED THEN
+                INSERT ({', '.join(insert_cols)})
+                VALUES ({', '.join(insert_vals)})
+        """
+
     def update_ins_week_sangsi(self, stat_year: int, period: str, period_no: int) -> int:
         """TS_PRODUCTIVITY의 상시모돈수를 TS_INS_WEEK에 업데이트
 
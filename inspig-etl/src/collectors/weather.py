@@ -23,11 +23,17 @@ import logging
 import math
 import requests
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from requests.adapters import HTTPAdapter
+
 from .base import BaseCollector
-from ..common import Config, Database, now_kst, ApiKeyManager
+from .geo import FarmGeoTable, latlon_to_grid_batch, nearest_stations_batch
+# 단건 격자 변환: 기존 공개 함수 weather.latlon_to_grid 호환 재노출 (구현은 geo 모듈)
+from .geo import latlon_to_grid  # noqa: F401
+from ..common import Config, Database, now_kst, ApiKeyManager, ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -251,23 +257,26 @@ def update_farm_asos_mapping(db: Database) -> int:
         WHERE FARM_NO = :FARM_NO
     """
 
-    updates = []
+    farms = []
+    coords = []
     for row in rows:
         try:
-            lat = float(row['LAT'])
-            lon = float(row['LON'])
-            stn_id, stn_nm, dist = find_nearest_asos_station(lat, lon, stations)
-
-            updates.append({
-                'FARM_NO': row['FARM_NO'],
-                'ASOS_STN_ID': stn_id,
-                'ASOS_STN_NM': stn_nm,
-                'ASOS_DIST_KM': round(dist, 2),
-            })
-            logger.debug(f"농장 {row['FARM_NO']}: ASOS {stn_id} ({stn_nm}), {dist:.1f}km")
+            coords.append((float(row['LAT']), float(row['LON'])))
+            farms.append(row['FARM_NO'])
         except (ValueError, TypeError) as e:
             logger.warning(f"농장 {row['FARM_NO']} ASOS 매핑 실패: {e}")
 
+    # 전체 농장 최근접 관측소 일괄 계산
+    updates = []
+    for farm_no, (stn_id, stn_nm, dist) in zip(farms, nearest_stations_batch(coords, stations)):
+        updates.append({
+            'FARM_NO': farm_no,
+            'ASOS_STN_ID': stn_id,
+            'ASOS_STN_NM': stn_nm,
+            'ASOS_DIST_KM': round(dist, 2),
+        })
+        logger.debug(f"농장 {farm_no}: ASOS {stn_id} ({stn_nm}), {dist:.1f}km")
+
     if updates:
         db.execute_many(update_sql, updates)
         db.commit()
@@ -276,56 +285,6 @@ def update_farm_asos_mapping(db: Database) -> int:
     return len(updates)
 
 
-def latlon_to_grid(lat: float, lon: float) -> Tuple[int, int]:
-    """위경도를 기상청 격자 좌표로 변환 (Lambert Conformal Conic)
-
-    Args:
-        lat: 위도 (MAP_Y)
-        lon: 경도 (MAP_X)
-
-    Returns:
-        (nx, ny) 격자 좌표 튜플
-    """
-    # 기상청 격자 변환 상수
-    RE = 6371.00877    # 지구 반경(km)
-    GRID = 5.0         # 격자 간격(km)
-    SLAT1 = 30.0       # 투영 위도1(degree)
-    SLAT2 = 60.0       # 투영 위도2(degree)
-    OLON = 126.0       # 기준점 경도(degree)
-    OLAT = 38.0        # 기준점 위도(degree)
-    XO = 43            # 기준점 X좌표(GRID)
-    YO = 136           # 기준점 Y좌표(GRID)
-
-    DEGRAD = math.pi / 180.0
-
-    re = RE / GRID
-    slat1 = SLAT1 * DEGRAD
-    slat2 = SLAT2 * DEGRAD
-    olon = OLON * DEGRAD
-    olat = OLAT * DEGRAD
-
-    sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(math.pi * 0.25 + slat1 * 0.5)
-    sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
-    sf = math.tan(math.pi * 0.25 + slat1 * 0.5)
-    sf = math.pow(sf, sn) * math.cos(slat1) / sn
-    ro = math.tan(math.pi * 0.25 + olat * 0.5)
-    ro = re * sf / math.pow(ro, sn)
-
-    ra = math.tan(math.pi * 0.25 + lat * DEGRAD * 0.5)
-    ra = re * sf / math.pow(ra, sn)
-    theta = lon * DEGRAD - olon
-    if theta > math.pi:
-        theta -= 2.0 * math.pi
-    if theta < -math.pi:
-        theta += 2.0 * math.pi
-    theta *= sn
-
-    nx = int(ra * math.sin(theta) + XO + 0.5)
-    ny = int(ro - ra * math.cos(theta) + YO + 0.5)
-
-    return nx, ny
-
-
 class WeatherCollector(BaseCollector):
     """기상청 날씨 데이터 수집기
 
@@ -401,8 +360,74 @@ class WeatherCollector(BaseCollector):
         # 중기예보 API URL
         self.mid_fcst_url = 'https://apis.data.go.kr/1360000/MidFcstInfoService'
 
-        # API 키 관리자
-        self.key_manager = ApiKeyManager(self.db)
+        # 격자 병렬 수집 워커 수, API 키별 초당 호출 수 제한
+        self.grid_workers = max(1, self.weather_config.get('grid_workers', 4))
+        self.key_rate = self.weather_config.get('key_rate', 10)
+
+        # API 키 관리자 (워커 스레드 공유)
+        self.key_manager = ApiKeyManager(
+            self.db,
+            rate_per_key=self.key_rate,
+            flush_interval=self.weather_config.get('key_flush_interval', 60),
+        )
+
+        # HTTP 세션 (keep-alive 연결 풀, 워커 스레드 공유)
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.grid_workers)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+
+        # API 응답 디스크 캐시 (발표시각 단위, 재수집 시 API 호출 생략)
+        self.api_cache: Optional[ResponseCache] = None
+        if self.weather_config.get('api_cache', 'Y') == 'Y':
+            try:
+                self.api_cache = ResponseCache(
+                    self.weather_config.get('api_cache_path', './cache/weather_api.sqlite'),
+                    ttl_seconds=self.weather_config.get('api_cache_ttl_hours', 24) * 3600,
+                    max_bytes=self.weather_config.get('api_cache_max_mb', 200) * 1024 * 1024,
+                )
+            except Exception as e:
+                self.logger.warning(f"API 캐시 사용 불가, 캐시 없이 수집: {e}")
+
+        # 농장 → 격자 → 관측소 매핑 테이블 (run() 1회당 1회 조회, 단기/중기/ASOS 공유)
+        self._geo_table: Optional[FarmGeoTable] = None
+
+    def _get_farm_geo(self) -> FarmGeoTable:
+        """농장 좌표 매핑 테이블 (최초 호출 시 TA_FARM 1회 조회 + 일괄 계산)"""
+        if self._geo_table is None:
+            self._geo_table = FarmGeoTable.load(self.db)
+        return self._geo_table
+
+    def _cache_get(self, endpoint: str, target: Any, base: str) -> Tuple[Optional[str], Any]:
+        """API 응답 캐시 조회
+
+        Returns:
+            (캐시 키, 캐시 값) - 캐시 미사용이면 (None, None), 없으면 (키, None)
+        """
+        if self.api_cache is None:
+            return None, None
+        key = ResponseCache.make_key(endpoint, target, base)
+        return key, self.api_cache.get(key)
+
+    def _cache_put(self, key: Optional[str], value: Any) -> None:
+        """API 응답 캐시 저장 (빈 응답은 저장하지 않음)"""
+        if self.api_cache is None or key is None or not value:
+            return
+        try:
+            self.api_cache.put(key, value)
+        except Exception as e:
+            self.logger.warning(f"API 캐시 저장 실패: {e}")
+
+    def _api_get(self, url: str, params: Dict[str, Any], api_key: str) -> requests.Response:
+        """공공데이터포털 API GET 호출 (키별 속도 제한 대기 후 세션 재사용)
+
+        Args:
+            url: API URL
+            params: 요청 파라미터
+            api_key: 사용 API 키 (디코딩된 키, 속도 제한 버킷 선택용)
+        """
+        self.key_manager.acquire(api_key)
+        return self.http.get(url, params=params, timeout=30)
 
     def _get_ncst_base_datetime(self) -> Tuple[str, str]:
         """초단기실황 API 호출용 기준 날짜/시간 계산
@@ -434,6 +459,10 @@ class WeatherCollector(BaseCollector):
         """
         url = f"{self.base_url}/getUltraSrtNcst"
 
+        cache_key, cached = self._cache_get('getUltraSrtNcst', f'{nx},{ny}', f'{base_date}{base_time}')
+        if cached is not None:
+            return cached
+
         while self.key_manager.has_available_key():
             api_key = self.key_manager.get_current_key()
             if not api_key:
@@ -452,7 +481,7 @@ class WeatherCollector(BaseCollector):
 
             try:
                 self.logger.debug(f"초단기실황 API 호출: NX={nx}, NY={ny}, base={base_date} {base_time}")
-                response = requests.get(url, params=params, timeout=30)
+                response = self._api_get(url, params, api_key)
 
                 # HTTP 에러 (401, 403, 429 등) - 다음 키로 재시도
                 if response.status_code in (401, 403, 429):
@@ -469,6 +498,7 @@ class WeatherCollector(BaseCollector):
                 if result_code == '00':
                     self.key_manager.increment_count(api_key)
                     items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
+                    self._cache_put(cache_key, items)
                     return items
 
                 elif result_code in ApiKeyManager.LIMIT_ERROR_CODES:
@@ -525,7 +555,7 @@ class WeatherCollector(BaseCollector):
 
             try:
                 self.logger.debug(f"ASOS 시간자료 API 호출: stnId={stn_id}, {start_dt} {start_hh}시 ~ {end_dt} {end_hh}시")
-                response = requests.get(self.asos_hourly_url, params=params, timeout=30)
+                response = self._api_get(self.asos_hourly_url, params, api_key)
 
                 # HTTP 에러 (401, 403, 429 등) - 다음 키로 재시도
                 if response.status_code in (401, 403, 429):
@@ -574,6 +604,10 @@ class WeatherCollector(BaseCollector):
         Returns:
             일별 관측 데이터 리스트
         """
+        cache_key, cached = self._cache_get('AsosDaly', stn_id, f'{start_dt}-{end_dt}')
+        if cached is not None:
+            return cached
+
         while self.key_manager.has_available_key():
             api_key = self.key_manager.get_current_key()
             if not api_key:
@@ -593,7 +627,7 @@ class WeatherCollector(BaseCollector):
 
             try:
                 self.logger.debug(f"ASOS 일자료 API 호출: stnId={stn_id}, {start_dt} ~ {end_dt}")
-                response = requests.get(self.asos_daily_url, params=params, timeout=30)
+                response = self._api_get(self.asos_daily_url, params, api_key)
 
                 # HTTP 에러 (401, 403, 429 등) - 다음 키로 재시도
                 if response.status_code in (401, 403, 429):
@@ -610,7 +644,12 @@ class WeatherCollector(BaseCollector):
                 if result_code == '00':
                     self.key_manager.increment_count(api_key)
                     items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
-                    return items if isinstance(items, list) else [items] if items else []
+                    items = items if isinstance(items, list) else [items] if items else []
+                    # 기간 전체 일자가 관측된 경우만 캐시 (전일 자료 미발표 상태 캐시 방지)
+                    days = (datetime.strptime(end_dt, '%Y%m%d') - datetime.strptime(start_dt, '%Y%m%d')).days + 1
+                    if len(items) >= days:
+                        self._cache_put(cache_key, items)
+                    return items
 
                 elif result_code in ApiKeyManager.LIMIT_ERROR_CODES:
                     self.logger.warning(f"ASOS 일자료 API 호출 제한: {result_code} - {result_msg}")
@@ -677,6 +716,10 @@ class WeatherCollector(BaseCollector):
         """
         url = f"{self.base_url}/getVilageFcst"
 
+        cache_key, cached = self._cache_get('getVilageFcst', f'{nx},{ny}', f'{base_date}{base_time}')
+        if cached is not None:
+            return cached
+
         while self.key_manager.has_available_key():
             api_key = self.key_manager.get_current_key()
             if not api_key:
@@ -695,7 +738,7 @@ class WeatherCollector(BaseCollector):
 
             try:
                 self.logger.debug(f"API 호출: NX={nx}, NY={ny}, base={base_date} {base_time}")
-                response = requests.get(url, params=params, timeout=30)
+                response = self._api_get(url, params, api_key)
 
                 # HTTP 에러 (401, 403, 429 등) - 다음 키로 재시도
                 if response.status_code in (401, 403, 429):
@@ -715,6 +758,7 @@ class WeatherCollector(BaseCollector):
                     # 성공 - REQ_CNT 증가
                     self.key_manager.increment_count(api_key)
                     items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
+                    self._cache_put(cache_key, items)
                     return items
 
                 elif result_code in ApiKeyManager.LIMIT_ERROR_CODES:
@@ -1259,27 +1303,7 @@ class WeatherCollector(BaseCollector):
         Returns:
             [(nx, ny, map_x, map_y), ...]
         """
-        sql = """
-            SELECT DISTINCT MAP_X_N, MAP_Y_N
-            FROM TA_FARM
-            WHERE USE_YN = 'Y'
-              AND MAP_X_N IS NOT NULL
-              AND MAP_Y_N IS NOT NULL
-              AND WEATHER_NX_N IS NULL
-        """
-        rows = self.db.fetch_dict(sql)
-
-        result = []
-        for row in rows:
-            try:
-                lon = float(row['MAP_X_N'])  # 경도 (읍면동 대표)
-                lat = float(row['MAP_Y_N'])  # 위도 (읍면동 대표)
-                nx, ny = latlon_to_grid(lat, lon)
-                result.append((nx, ny, lon, lat))
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"좌표 변환 실패: MAP_X_N={row['MAP_X_N']}, MAP_Y_N={row['MAP_Y_N']}: {e}")
-
-        return result
+        return self._get_farm_geo().mapxy_grids()
 
     def _get_grids_with_latlon(self) -> List[Tuple[int, int, float, float]]:
         """격자와 위경도 정보를 함께 조회 (ASOS 관측소 매핑용)
@@ -1377,85 +1401,49 @@ class WeatherCollector(BaseCollector):
         total_grids = len(unique_grids)
         collected_count = 0
 
-        for nx, ny in unique_grids:
-            # 모든 키가 limit 상태면 중단 (무결성 보장을 위해 저장하지 않음)
+        def collect_grid(grid: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+            """단일 격자 수집 (워커 스레드). 모든 키가 limit 상태면 None"""
+            # 모든 키가 limit 상태면 호출하지 않음 (무결성 보장을 위해 저장하지 않음)
             if not self.key_manager.has_available_key():
-                self.logger.error("모든 API 키가 limit 상태입니다. 수집 중단.")
-                api_limit_reached = True
-                # 남은 격자들을 실패 목록에 추가
-                remaining_idx = unique_grids.index((nx, ny))
-                failed_grids.extend(unique_grids[remaining_idx:])
-                break
-
-            try:
-                # [1] 단기예보 수집 (IS_FORECAST='Y')
-                items = self._fetch_forecast(nx, ny, fcst_base_date, fcst_base_time)
-
-                # TMN/TMX 확보용 05:00 발표 데이터 조회
-                tmn_tmx_map = {}  # {날짜: {'TMN': val, 'TMX': val}}
-                if need_tmn_tmx and items:
-                    tmn_items = self._fetch_forecast(nx, ny, fcst_base_date, tmn_tmx_base_time)
-                    if tmn_items:
-                        for item in tmn_items:
-                            fcst_date = item.get('fcstDate')
-                            category = item.get('category')
-                            value = item.get('fcstValue')
-                            if fcst_date and category in ('TMN', 'TMX'):
-                                if fcst_date not in tmn_tmx_map:
-                                    tmn_tmx_map[fcst_date] = {}
-                                try:
-                                    tmn_tmx_map[fcst_date][category] = float(value)
-                                except (ValueError, TypeError):
-                                    pass
-
-                if items:
-                    daily_data, hourly_data = self._parse_forecast_items(items, nx, ny)
-
-                    # TMN/TMX 병합 (05:00 발표 데이터에서 가져온 값)
-                    for wk_date, day in daily_data.items():
-                        if wk_date in tmn_tmx_map:
-                            if day.get('TMN') is None and 'TMN' in tmn_tmx_map[wk_date]:
-                                day['TMN'] = tmn_tmx_map[wk_date]['TMN']
-                            if day.get('TMX') is None and 'TMX' in tmn_tmx_map[wk_date]:
-                                day['TMX'] = tmn_tmx_map[wk_date]['TMX']
-
-                    daily_records = self._finalize_daily_data(daily_data)
-                    hourly_records = self._finalize_hourly_data(hourly_data)
-
-                    # BASE_DATE, BASE_TIME, IS_FORECAST 추가
-                    for rec in daily_records:
-                        rec['BASE_DATE'] = fcst_base_date
-                        rec['BASE_TIME'] = fcst_base_time
-                        rec['IS_FORECAST'] = 'Y'
-                    for rec in hourly_records:
-                        rec['BASE_DATE'] = fcst_base_date
-                        rec['BASE_TIME'] = fcst_base_time
-                        rec['IS_FORECAST'] = 'Y'
-
-                    all_daily.extend(daily_records)
-                    all_hourly.extend(hourly_records)
-
-                    self.logger.debug(f"격자 ({nx}, {ny}) 예보: 일별 {len(daily_records)}건, 시간별 {len(hourly_records)}건")
-                else:
-                    self.logger.warning(f"격자 ({nx}, {ny}): 예보 데이터 없음")
+                return None
+            return self._collect_grid(
+                grid[0], grid[1], fcst_base_date, fcst_base_time,
+                need_tmn_tmx, tmn_tmx_base_time, ncst_base_date, ncst_base_time,
+            )
+
+        # 격자 병렬 수집 (grid_workers, API 키별 속도 제한은 key_manager 공유)
+        self.logger.info(f"격자 병렬 수집: workers={self.grid_workers}, key_rate={self.key_rate}/s")
+        with ThreadPoolExecutor(max_workers=self.grid_workers) as executor:
+            futures = [(grid, executor.submit(collect_grid, grid)) for grid in unique_grids]
+
+            # 격자 순서대로 결과 병합 (실행 순서와 무관하게 동일한 결과)
+            for (nx, ny), future in futures:
+                try:
+                    grid_result = future.result()
+                except Exception as e:
+                    self.logger.error(f"격자 ({nx}, {ny}) 수집 실패: {e}")
+                    failed_grids.append((nx, ny))
+                    continue
 
-                # [2] 초단기실황 수집 (IS_FORECAST='N')
-                ncst_items = self._fetch_ultra_srt_ncst(nx, ny, ncst_base_date, ncst_base_time)
+                if grid_result is None:
+                    if not api_limit_reached:
+                        self.logger.error("모든 API 키가 limit 상태입니다. 수집 중단.")
+                        api_limit_reached = True
+                    failed_grids.append((nx, ny))
+                    continue
 
-                if ncst_items:
-                    ncst_record = self._parse_ncst_items(ncst_items, nx, ny, ncst_base_date, ncst_base_time)
-                    ncst_record['BASE_DATE'] = ncst_base_date
-                    ncst_record['BASE_TIME'] = ncst_base_time
-                    all_ncst.append(ncst_record)
-                    self.logger.debug(f"격자 ({nx}, {ny}) 실황: 1건")
+                all_daily.extend(grid_result['daily'])
+                all_hourly.extend(grid_result['hourly'])
+                if grid_result['ncst'] is not None:
+                    all_ncst.append(grid_result['ncst'])
 
                 # 이 격자 수집 완료
                 collected_count += 1
 
-            except Exception as e:
-                self.logger.error(f"격자 ({nx}, {ny}) 수집 실패: {e}")
-                failed_grids.append((nx, ny))
-                continue
+        # 수집 도중 키가 모두 소진되면 빈 응답으로 끝난 격자가 있을 수 있음
+        if not api_limit_reached and not self.key_manager.has_available_key():
+            self.logger.error("수집 중 모든 API 키가 limit 상태가 되었습니다.")
+            api_limit_reached = True
 
         # 수집 완료 여부 판단
         is_complete = (collected_count == total_grids) and not api_limit_reached
@@ -1463,6 +1451,9 @@ class WeatherCollector(BaseCollector):
         self.logger.info(f"수집 완료: 예보 일별 {len(all_daily)}건, 시간별 {len(all_hourly)}건, 실황 {len(all_ncst)}건")
         self.logger.info(f"수집 현황: {collected_count}/{total_grids} 격자 완료, 실패 {len(failed_grids)}개")
 
+        # API 키 호출 수 일괄 반영
+        self.key_manager.flush()
+
         if not is_complete:
             self.logger.warning(f"⚠️ 수집 미완료 (is_complete=False): API limit 또는 오류로 인해 일부 격자 누락")
             self.logger.warning(f"  → 데이터 무결성 보장을 위해 저장하지 않습니다. 기존 데이터 유지.")
@@ -1477,6 +1468,79 @@ class WeatherCollector(BaseCollector):
             'failed_grids': failed_grids,
         }
 
+    def _collect_grid(self, nx: int, ny: int, fcst_base_date: str, fcst_base_time: str,
+                      need_tmn_tmx: bool, tmn_tmx_base_time: str,
+                      ncst_base_date: str, ncst_base_time: str) -> Dict[str, Any]:
+        """단일 격자 예보 + 실황 수집
+
+        Returns:
+            {'daily': [...], 'hourly': [...], 'ncst': 실황 레코드 또는 None}
+        """
+        result: Dict[str, Any] = {'daily': [], 'hourly': [], 'ncst': None}
+
+        # [1] 단기예보 수집 (IS_FORECAST='Y')
+        items = self._fetch_forecast(nx, ny, fcst_base_date, fcst_base_time)
+
+        # TMN/TMX 확보용 05:00 발표 데이터 조회
+        tmn_tmx_map = {}  # {날짜: {'TMN': val, 'TMX': val}}
+        if need_tmn_tmx and items:
+            tmn_items = self._fetch_forecast(nx, ny, fcst_base_date, tmn_tmx_base_time)
+            if tmn_items:
+                for item in tmn_items:
+                    fcst_date = item.get('fcstDate')
+                    category = item.get('category')
+                    value = item.get('fcstValue')
+                    if fcst_date and category in ('TMN', 'TMX'):
+                        if fcst_date not in tmn_tmx_map:
+                            tmn_tmx_map[fcst_date] = {}
+                        try:
+                            tmn_tmx_map[fcst_date][category] = float(value)
+                        except (ValueError, TypeError):
+                            pass
+
+        if items:
+            daily_data, hourly_data = self._parse_forecast_items(items, nx, ny)
+
+            # TMN/TMX 병합 (05:00 발표 데이터에서 가져온 값)
+            for wk_date, day in daily_data.items():
+                if wk_date in tmn_tmx_map:
+                    if day.get('TMN') is None and 'TMN' in tmn_tmx_map[wk_date]:
+                        day['TMN'] = tmn_tmx_map[wk_date]['TMN']
+                    if day.get('TMX') is None and 'TMX' in tmn_tmx_map[wk_date]:
+                        day['TMX'] = tmn_tmx_map[wk_date]['TMX']
+
+            daily_records = self._finalize_daily_data(daily_data)
+            hourly_records = self._finalize_hourly_data(hourly_data)
+
+            # BASE_DATE, BASE_TIME, IS_FORECAST 추가
+            for rec in daily_records:
+                rec['BASE_DATE'] = fcst_base_date
+                rec['BASE_TIME'] = fcst_base_time
+                rec['IS_FORECAST'] = 'Y'
+            for rec in hourly_records:
+                rec['BASE_DATE'] = fcst_base_date
+                rec['BASE_TIME'] = fcst_base_time
+                rec['IS_FORECAST'] = 'Y'
+
+            result['daily'] = daily_records
+            result['hourly'] = hourly_records
+
+            self.logger.debug(f"격자 ({nx}, {ny}) 예보: 일별 {len(daily_records)}건, 시간별 {len(hourly_records)}건")
+        else:
+            self.logger.warning(f"격자 ({nx}, {ny}): 예보 데이터 없음")
+
+        # [2] 초단기실황 수집 (IS_FORECAST='N')
+        ncst_items = self._fetch_ultra_srt_ncst(nx, ny, ncst_base_date, ncst_base_time)
+
+        if ncst_items:
+            ncst_record = self._parse_ncst_items(ncst_items, nx, ny, ncst_base_date, ncst_base_time)
+            ncst_record['BASE_DATE'] = ncst_base_date
+            ncst_record['BASE_TIME'] = ncst_base_time
+            result['ncst'] = ncst_record
+            self.logger.debug(f"격자 ({nx}, {ny}) 실황: 1건")
+
+        return result
+
     def collect_asos_daily(self, days_back: int = 7,
                             start_dt: Optional[str] = None,
                             end_dt: Optional[str] = None) -> List[Dict]:
@@ -1548,6 +1612,7 @@ class WeatherCollector(BaseCollector):
                 continue
 
         self.logger.info(f"ASOS 일자료 수집 완료: {len(all_asos_daily)}건")
+        self.key_manager.flush()
         return all_asos_daily
 
     def _get_grid_asos_mapping(self, stations: List[Tuple[int, str, float, float]]) -> Dict[Tuple[int, int], Tuple[int, str, float]]:
@@ -1562,71 +1627,8 @@ class WeatherCollector(BaseCollector):
         Returns:
             {(nx, ny): (stn_id, stn_nm, dist_km), ...}
         """
-        # 1. ASOS_STN_ID가 캐싱된 농장 조회 (격자별 중복 제거)
-        sql_cached = """
-            SELECT DISTINCT
-                WEATHER_NX_N AS NX,
-                WEATHER_NY_N AS NY,
-                ASOS_STN_ID,
-                ASOS_STN_NM,
-                ASOS_DIST_KM
-            FROM TA_FARM
-            WHERE USE_YN = 'Y'
-              AND WEATHER_NX_N IS NOT NULL
-              AND WEATHER_NY_N IS NOT NULL
-              AND ASOS_STN_ID IS NOT NULL
-        """
-        cached_rows = self.db.fetch_dict(sql_cached)
-
-        result = {}
-        for row in cached_rows:
-            try:
-                nx = int(row['NX'])
-                ny = int(row['NY'])
-                stn_id = int(row['ASOS_STN_ID'])
-                stn_nm = row['ASOS_STN_NM'] or ''
-                dist = float(row['ASOS_DIST_KM']) if row['ASOS_DIST_KM'] else 0.0
-                result[(nx, ny)] = (stn_id, stn_nm, dist)
-            except (ValueError, TypeError):
-                pass
-
-        self.logger.debug(f"ASOS 캐싱된 격자: {len(result)}개")
-
-        # 2. ASOS_STN_ID가 없는 농장은 Haversine 계산
-        sql_uncached = """
-            SELECT DISTINCT
-                WEATHER_NX_N AS NX,
-                WEATHER_NY_N AS NY,
-                MAP_Y_N AS LAT,
-                MAP_X_N AS LON
-            FROM TA_FARM
-            WHERE USE_YN = 'Y'
-              AND WEATHER_NX_N IS NOT NULL
-              AND WEATHER_NY_N IS NOT NULL
-              AND MAP_X_N IS NOT NULL
-              AND MAP_Y_N IS NOT NULL
-              AND ASOS_STN_ID IS NULL
-        """
-        uncached_rows = self.db.fetch_dict(sql_uncached)
-
-        for row in uncached_rows:
-            try:
-                nx = int(row['NX'])
-                ny = int(row['NY'])
-
-                # 이미 매핑된 격자는 스킵
-                if (nx, ny) in result:
-                    continue
-
-                lat = float(row['LAT'])
-                lon = float(row['LON'])
-                stn_id, stn_nm, dist = find_nearest_asos_station(lat, lon, stations)
-                result[(nx, ny)] = (stn_id, stn_nm, dist)
-            except (ValueError, TypeError):
-                pass
-
-        self.logger.debug(f"ASOS 미캐싱 격자 계산: {len(uncached_rows)}개")
-
+        result = self._get_farm_geo().grid_station_map(stations)
+        self.logger.debug(f"ASOS 매핑 격자: {len(result)}개")
         return result
 
     def save(self, data: Dict[str, List[Dict]]) -> Dict[str, int]:
@@ -1770,35 +1772,42 @@ class WeatherCollector(BaseCollector):
     def _save_daily_today_aggregated(self, data: List[Dict]) -> int:
         """오늘 날짜 일별 저장 - TM_WEATHER_HOURLY 집계 기반
 
-        TM_WEATHER_HOURLY에서 해당 격자의 전체 시간대 데이터를 집계하여
+        TM_WEATHER_HOURLY에서 오늘 전체 시간대 데이터를 격자별로 집계하여
         정확한 TEMP_LOW, TEMP_HIGH, TEMP_AVG를 계산합니다.
+        격자 수와 무관하게 GROUP BY 집계 쿼리 1회 (IDX_TM_WEATHER_HOURLY_01: WK_DATE)
         """
         if not data:
             return 0
 
         today_str = now_kst().strftime('%Y%m%d')
-        updated_data = []
 
+        # DB에서 오늘 전체 시간대 격자별 집계
+        agg_sql = """
+            SELECT NX, NY,
+                   MIN(TEMP) AS TEMP_LOW,
+                   MAX(TEMP) AS TEMP_HIGH,
+                   ROUND(AVG(TEMP), 1) AS TEMP_AVG
+            FROM TM_WEATHER_HOURLY
+            WHERE WK_DATE = :WK_DATE
+              AND TEMP IS NOT NULL
+            GROUP BY NX, NY
+        """
+        agg_map = {
+            (agg['NX'], agg['NY']): agg
+            for agg in self.db.fetch_dict(agg_sql, {'WK_DATE': today_str})
+        }
+
+        updated_data = []
         for row in data:
             nx = row.get('NX')
             ny = row.get('NY')
+            agg = agg_map.get((nx, ny))
 
-            # DB에서 오늘 전체 시간대 집계
-            agg_sql = """
-                SELECT MIN(TEMP) AS TEMP_LOW,
-                       MAX(TEMP) AS TEMP_HIGH,
-                       ROUND(AVG(TEMP), 1) AS TEMP_AVG
-                FROM TM_WEATHER_HOURLY
-                WHERE NX = :NX AND NY = :NY AND WK_DATE = :WK_DATE
-                  AND TEMP IS NOT NULL
-            """
-            agg_result = self.db.fetch_dict(agg_sql, {'NX': nx, 'NY': ny, 'WK_DATE': today_str})
-
-            if agg_result and agg_result[0].get('TEMP_LOW') is not None:
+            if agg and agg.get('TEMP_LOW') is not None:
                 # DB 집계 결과로 덮어쓰기
-                row['TEMP_LOW'] = agg_result[0]['TEMP_LOW']
-                row['TEMP_HIGH'] = agg_result[0]['TEMP_HIGH']
-                row['TEMP_AVG'] = agg_result[0]['TEMP_AVG']
+                row['TEMP_LOW'] = agg['TEMP_LOW']
+                row['TEMP_HIGH'] = agg['TEMP_HIGH']
+                row['TEMP_AVG'] = agg['TEMP_AVG']
                 self.logger.debug(
                     f"오늘 {today_str} ({nx},{ny}): DB 집계 {row['TEMP_LOW']}~{row['TEMP_HIGH']}도"
                 )
@@ -1945,6 +1954,8 @@ class WeatherCollector(BaseCollector):
             {'daily': 건수, 'hourly': 건수, 'ncst': 건수, 'asos': 건수, 'mid': 건수}
         """
         self.logger.info("=== 기상청 날씨 데이터 수집 시작 ===")
+        # 이전 실행 이후 TA_FARM 격자/관측소 갱신분 반영
+        self._geo_table = None
 
         try:
             # [1] 단기예보 + 초단기실황 수집
@@ -1991,6 +2002,9 @@ class WeatherCollector(BaseCollector):
         except Exception as e:
             self.logger.error(f"날씨 수집 실패: {e}")
             raise
+        finally:
+            # 오류로 중단된 경우에도 집계된 호출 수 반영
+            self.key_manager.flush()
 
     # ============================================================================
     # 중기예보 수집 (getMidTa, getMidLandFcst)
@@ -2035,6 +2049,10 @@ class WeatherCollector(BaseCollector):
         """
         url = f"{self.mid_fcst_url}/getMidTa"
 
+        cache_key, cached = self._cache_get('getMidTa', reg_id, tm_fc)
+        if cached is not None:
+            return cached
+
         while self.key_manager.has_available_key():
             api_key = self.key_manager.get_current_key()
             if not api_key:
@@ -2051,7 +2069,7 @@ class WeatherCollector(BaseCollector):
 
             try:
                 self.logger.debug(f"중기기온 API 호출: regId={reg_id}, tmFc={tm_fc}")
-                response = requests.get(url, params=params, timeout=30)
+                response = self._api_get(url, params, api_key)
 
                 if response.status_code in (401, 403, 429):
                     self.logger.warning(f"중기기온 API 키 인증/제한 오류 ({response.status_code})")
@@ -2068,8 +2086,10 @@ class WeatherCollector(BaseCollector):
                     self.key_manager.increment_count(api_key)
                     items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
                     if isinstance(items, list) and len(items) > 0:
+                        self._cache_put(cache_key, items[0])
                         return items[0]
                     elif isinstance(items, dict):
+                        self._cache_put(cache_key, items)
                         return items
                     return None
 
@@ -2120,7 +2140,7 @@ class WeatherCollector(BaseCollector):
 
             try:
                 self.logger.debug(f"중기육상 API 호출: regId={reg_id}, tmFc={tm_fc}")
-                response = requests.get(url, params=params, timeout=30)
+                response = self._api_get(url, params, api_key)
 
                 if response.status_code in (401, 403, 429):
                     self.logger.warning(f"중기육상 API 키 인증/제한 오류 ({response.status_code})")
@@ -2167,28 +2187,7 @@ class WeatherCollector(BaseCollector):
         Returns:
             [(nx, ny, sigun_cd), ...] 형태
         """
-        sql = """
-            SELECT DISTINCT
-                WEATHER_NX_N AS NX,
-                WEATHER_NY_N AS NY,
-                SIGUN_CD
-            FROM TA_FARM
-            WHERE USE_YN = 'Y'
-              AND WEATHER_NX_N IS NOT NULL
-              AND WEATHER_NY_N IS NOT NULL
-              AND SIGUN_CD IS NOT NULL
-        """
-        rows = self.db.fetch_dict(sql)
-        result = []
-        for row in rows:
-            try:
-                nx = int(row['NX'])
-                ny = int(row['NY'])
-                sigun_cd = str(row['SIGUN_CD'] or '')
-                result.append((nx, ny, sigun_cd))
-            except (ValueError, TypeError):
-                pass
-        return result
+        return self._get_farm_geo().grids_with_sigun()
 
     def collect_mid_forecast(self) -> Dict[str, List[Dict]]:
         """중기예보 수집 (+3일 ~ +10일)
@@ -2321,6 +2320,7 @@ class WeatherCollector(BaseCollector):
         is_complete = len(failed_reg_ids) == 0 and not api_limit_reached
 
         self.logger.info(f"중기예보 수집 완료: 일별 {len(all_daily)}건")
+        self.key_manager.flush()
         if not is_complete:
             self.logger.warning(f"⚠️ 중기예보 수집 미완료: 실패 {len(failed_reg_ids)}개 지역")
 
@@ -2472,21 +2472,25 @@ def update_farm_weather_grid(db: Database):
         WHERE FARM_NO = :FARM_NO
     """
 
-    updates = []
+    farms = []
+    coords = []
     for row in rows:
         try:
-            lon = float(row['MAP_X_N'])
-            lat = float(row['MAP_Y_N'])
-            nx, ny = latlon_to_grid(lat, lon)
-            updates.append({
-                'FARM_NO': row['FARM_NO'],
-                'NX': nx,
-                'NY': ny,
-            })
-            logger.debug(f"농장 {row['FARM_NO']}: ({lon}, {lat}) -> 격자 ({nx}, {ny})")
+            coords.append((float(row['MAP_Y_N']), float(row['MAP_X_N'])))
+            farms.append(row['FARM_NO'])
         except (ValueError, TypeError) as e:
             logger.warning(f"농장 {row['FARM_NO']} 좌표 변환 실패: {e}")
 
+    # 전체 농장 격자 일괄 변환
+    updates = []
+    for farm_no, (lat, lon), (nx, ny) in zip(farms, coords, latlon_to_grid_batch(coords)):
+        updates.append({
+            'FARM_NO': farm_no,
+            'NX': nx,
+            'NY': ny,
+        })
+        logger.debug(f"농장 {farm_no}: ({lon}, {lat}) -> 격자 ({nx}, {ny})")
+
     if updates:
         db.execute_many(update_sql, updates)
         db.commit()
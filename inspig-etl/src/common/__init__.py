@@ -5,10 +5,12 @@ from .logger import setup_logger
 from .timezone import now_kst, today_kst, KST
 from .farm_service import get_service_farms, get_service_farm_nos, get_all_farm_nos
 from .api_key_manager import ApiKeyManager
+from .rate_limiter import TokenBucket
+from .response_cache import ResponseCache
 
 __all__ = [
     'Config', 'Database', 'setup_logger',
     'now_kst', 'today_kst', 'KST',
     'get_service_farms', 'get_service_farm_nos', 'get_all_farm_nos',
-    'ApiKeyManager',
+    'ApiKeyManager', 'TokenBucket', 'ResponseCache',
 ]
@@ -3,12 +3,17 @@ API 키 관리자
 - TS_API_KEY_INFO 테이블 기반 API 키 로드밸런싱
 - REQ_CNT가 가장 적은 키 우선 사용
 - limit 발생 시 다음 키로 자동 전환
+- 여러 워커 스레드 공유 가능 (키 선택/소진 처리 잠금, 키별 호출 속도 제한)
+- 호출 횟수는 메모리에서 집계 후 flush() 시 일괄 UPDATE (flush_interval 초마다 자동)
 """
 import logging
+import threading
+import time
 from typing import Dict, List, Optional
 from urllib.parse import unquote
 
 from .database import Database
+from .rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -30,15 +35,30 @@ class ApiKeyManager:
             elif result.is_limit_error:
                 manager.mark_key_exhausted(api_key)
                 continue
+
+        manager.flush()  # 수집 종료 시 REQ_CNT 일괄 반영
     """
 
     # API 호출 제한 에러 코드 (공공데이터포털)
     LIMIT_ERROR_CODES = ['22', '99']  # 22: 서비스 요청제한횟수 초과
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, rate_per_key: float = 0, flush_interval: float = 60):
+        """
+        Args:
+            db: Database 인스턴스
+            rate_per_key: 키별 초당 최대 호출 수 (0이면 제한 없음)
+            flush_interval: REQ_CNT 자동 반영 주기 (초, 0이면 flush() 호출 시에만 반영)
+        """
         self.db = db
+        self.rate_per_key = rate_per_key
+        self.flush_interval = flush_interval
         self._api_keys: List[Dict] = []
         self._exhausted_keys: set = set()  # limit 발생한 키 인덱스
+        self._key_index: Dict[str, int] = {}  # 디코딩 키 → 인덱스
+        self._buckets: Dict[str, TokenBucket] = {}  # 디코딩 키 → 속도 제한 버킷
+        self._pending: Dict[str, int] = {}  # 인코딩 키 → 미반영 호출 수
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
 
     def load_keys(self):
         """DB에서 API 키 목록 조회 (REQ_CNT 오름차순)
@@ -51,8 +71,18 @@ class ApiKeyManager:
             FROM TS_API_KEY_INFO
             ORDER BY REQ_CNT ASC
         """
-        self._api_keys = self.db.fetch_dict(sql)
-        self._exhausted_keys = set()
+        # 미반영 호출 수가 있으면 먼저 반영 (다시 조회한 REQ_CNT에 포함)
+        self.flush()
+
+        api_keys = self.db.fetch_dict(sql)
+        with self._lock:
+            self._api_keys = api_keys
+            self._exhausted_keys = set()
+            self._key_index = {unquote(key['API_KEY']): i for i, key in enumerate(api_keys)}
+            self._buckets = {
+                unquote(key['API_KEY']): TokenBucket(self.rate_per_key)
+                for key in api_keys
+            }
 
         if self._api_keys:
             logger.info(f"API 키 {len(self._api_keys)}개 로드 완료")
@@ -65,22 +95,25 @@ class ApiKeyManager:
         """현재 사용할 API 키 반환
 
         사용 가능한 키 중 REQ_CNT가 가장 적은 키를 반환합니다.
+        REQ_CNT는 메모리 집계값(로드 시점 값 + 이후 호출 수) 기준입니다.
         DB에 URL 인코딩된 상태로 저장되어 있으므로 디코딩하여 반환합니다.
 
         Returns:
             디코딩된 API 키 문자열, 없으면 None
         """
-        available_keys = [
-            (i, k) for i, k in enumerate(self._api_keys)
-            if i not in self._exhausted_keys
-        ]
+        with self._lock:
+            available_keys = [
+                (i, k) for i, k in enumerate(self._api_keys)
+                if i not in self._exhausted_keys
+            ]
+            # 가장 REQ_CNT가 적은 키 사용 (동률이면 로드 순서)
+            if available_keys:
+                idx, key_info = min(available_keys, key=lambda item: (item[1]['REQ_CNT'] or 0, item[0]))
 
         if not available_keys:
             logger.error("사용 가능한 API 키가 없습니다.")
             return None
 
-        # 가장 REQ_CNT가 적은 키 사용 (이미 정렬됨)
-        idx, key_info = available_keys[0]
         api_key = key_info['API_KEY']
 
         # URL 인코딩된 키 디코딩
@@ -98,10 +131,10 @@ class ApiKeyManager:
         Returns:
             CREATE_USER 값
         """
-        for key_info in self._api_keys:
-            if unquote(key_info['API_KEY']) == api_key:
-                return key_info['CREATE_USER']
-        return None
+        idx = self._key_index.get(api_key)
+        if idx is None:
+            return None
+        return self._api_keys[idx]['CREATE_USER']
 
     def mark_key_exhausted(self, api_key: str):
         """현재 키를 limit 상태로 표시
@@ -112,33 +145,76 @@ class ApiKeyManager:
         Args:
             api_key: 디코딩된 API 키
         """
-        for i, key_info in enumerate(self._api_keys):
-            if unquote(key_info['API_KEY']) == api_key:
+        with self._lock:
+            i = self._key_index.get(api_key)
+            # 여러 워커가 같은 키로 limit 응답을 받아도 1회만 처리
+            if i is not None and i not in self._exhausted_keys:
                 self._exhausted_keys.add(i)
-                logger.warning(f"API 키 limit 도달: {key_info['CREATE_USER']}")
-                break
+                logger.warning(f"API 키 limit 도달: {self._api_keys[i]['CREATE_USER']}")
+
+    def acquire(self, api_key: str) -> None:
+        """API 호출 전 키별 속도 제한 대기 (rate_per_key 초과 시 sleep)
+
+        Args:
+            api_key: 디코딩된 API 키
+        """
+        bucket = self._buckets.get(api_key)
+        if bucket is not None:
+            bucket.acquire()
 
     def increment_count(self, api_key: str):
-        """API 호출 성공 시 REQ_CNT 증가
+        """API 호출 성공 시 REQ_CNT 증가 (메모리 집계)
+
+        DB 반영은 flush() 시 일괄 처리 (flush_interval 경과 시 자동 flush)
 
         Args:
             api_key: 디코딩된 API 키
         """
-        # 원본 인코딩 키 찾기
-        encoded_key = None
-        for key_info in self._api_keys:
-            if unquote(key_info['API_KEY']) == api_key:
-                encoded_key = key_info['API_KEY']
-                break
+        with self._lock:
+            idx = self._key_index.get(api_key)
+            if idx is None:
+                return
+            key_info = self._api_keys[idx]
+            key_info['REQ_CNT'] = (key_info['REQ_CNT'] or 0) + 1
+            encoded_key = key_info['API_KEY']
+            self._pending[encoded_key] = self._pending.get(encoded_key, 0) + 1
+            due = self.flush_interval > 0 and time.monotonic() - self._last_flush >= self.flush_interval
+
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """미반영 호출 수를 TS_API_KEY_INFO.REQ_CNT에 일괄 반영 (배열 UPDATE 1회)
+
+        Returns:
+            반영한 호출 수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
 
-        if encoded_key:
-            sql = """
-                UPDATE TS_API_KEY_INFO
-                SET REQ_CNT = REQ_CNT + 1
-                WHERE API_KEY = :API_KEY
-            """
-            self.db.execute(sql, {'API_KEY': encoded_key})
-            # 커밋은 상위에서 일괄 처리
+        sql = """
+            UPDATE TS_API_KEY_INFO
+            SET REQ_CNT = REQ_CNT + :CNT
+            WHERE API_KEY = :API_KEY
+        """
+        params = [{'API_KEY': key, 'CNT': cnt} for key, cnt in pending.items()]
+        try:
+            self.db.execute_many(sql, params)
+        except Exception as e:
+            # 반영 실패 시 다음 flush에서 재시도
+            with self._lock:
+                for key, cnt in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + cnt
+            logger.error(f"API 키 호출 수 반영 실패: {e}")
+            return 0
+
+        total = sum(pending.values())
+        logger.debug(f"API 키 호출 수 반영: {len(pending)}개 키, {total}회")
+        return total
 
     def has_available_key(self) -> bool:
         """사용 가능한 키가 있는지 확인
@@ -146,7 +222,8 @@ class ApiKeyManager:
         Returns:
             True if 사용 가능한 키 존재
         """
-        return len(self._exhausted_keys) < len(self._api_keys)
+        with self._lock:
+            return len(self._exhausted_keys) < len(self._api_keys)
 
     def get_stats(self) -> Dict:
         """API 키 사용 현황 조회
@@ -180,7 +257,8 @@ class ApiKeyManager:
         모든 키를 다시 사용 가능 상태로 변경합니다.
         (REQ_CNT는 매일 자정에 DB에서 초기화됨)
         """
-        self._exhausted_keys = set()
+        with self._lock:
+            self._exhausted_keys = set()
         logger.info("API 키 exhausted 상태 초기화")
 
     @staticmethod
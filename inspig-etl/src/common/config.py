@@ -44,6 +44,7 @@ class Config:
             'user': self._config.get('database', 'user'),
             'password': self._config.get('database', 'password'),
             'dsn': self._config.get('database', 'dsn'),
+            'persistent': self._config.get('database', 'persistent', fallback='Y'),
         }
 
     @property
@@ -52,6 +53,32 @@ class Config:
         return {
             'parallel': self._config.getint('processing', 'parallel', fallback=4),
             'test_mode': self._config.get('processing', 'test_mode', fallback='N'),
+            'max_farm_workers': self._config.getint('processing', 'max_farm_workers', fallback=4),
+            'max_processor_workers': self._config.getint('processing', 'max_processor_workers', fallback=1),
+            'worker_mode': self._config.get('processing', 'worker_mode', fallback='thread'),
+            'pipeline': self._config.get('processing', 'pipeline', fallback='N'),
+            'pipeline_loaders': self._config.getint('processing', 'pipeline_loaders', fallback=2),
+            'pipeline_writers': self._config.getint('processing', 'pipeline_writers', fallback=2),
+            'pipeline_queue': self._config.getint('processing', 'pipeline_queue', fallback=4),
+            'snapshot': self._config.get('processing', 'snapshot', fallback='N'),
+            'snapshot_path': self._config.get('processing', 'snapshot_path', fallback='./cache/farm_snapshot.sqlite'),
+            'snapshot_full_days': self._config.getint('processing', 'snapshot_full_days', fallback=28),
+            'rerun_cache': self._config.get('processing', 'rerun_cache', fallback='N'),
+            'rerun_cache_path': self._config.get('processing', 'rerun_cache_path', fallback='./cache/farm_rerun.sqlite'),
+            'rerun_cache_ttl_minutes': self._config.getint('processing', 'rerun_cache_ttl_minutes', fallback=120),
+            'rerun_cache_max_mb': self._config.getint('processing', 'rerun_cache_max_mb', fallback=500),
+            'telemetry': self._config.get('processing', 'telemetry', fallback='N'),
+            'telemetry_path': self._config.get('processing', 'telemetry_path', fallback='./logs/telemetry'),
+            'capture': self._config.get('processing', 'capture', fallback='N'),
+            'capture_path': self._config.get('processing', 'capture_path', fallback='./capture'),
+            'capture_farms': self._config.get('processing', 'capture_farms', fallback=''),
+            'bulk_load_size': self._config.getint('processing', 'bulk_load_size', fallback=0),
+            'columnar_load': self._config.get('processing', 'columnar_load', fallback='N'),
+            'schedule_engine': self._config.get('processing', 'schedule_engine', fallback='oracle'),
+            'schedule_verify_sample': self._config.getint('processing', 'schedule_verify_sample', fallback=100),
+            'aggregate_engine': self._config.get('processing', 'aggregate_engine', fallback='oracle'),
+            'aggregate_verify_sample': self._config.getint('processing', 'aggregate_verify_sample', fallback=100),
+            'sub_flush': self._config.get('processing', 'sub_flush', fallback='processor'),
         }
 
     @property
@@ -68,6 +95,8 @@ class Config:
             'productivity_base_url': self._config.get('api', 'productivity_base_url', fallback='http://10.4.35.10:11000'),
             'productivity_timeout': self._config.getint('api', 'productivity_timeout', fallback=60),
             'productivity_workers': self._config.getint('api', 'productivity_workers', fallback=4),
+            'productivity_retries': self._config.getint('api', 'productivity_retries', fallback=3),
+            'productivity_backoff': self._config.getfloat('api', 'productivity_backoff', fallback=0.5),
         }
 
     @property
@@ -76,6 +105,13 @@ class Config:
         return {
             'api_key': self._config.get('weather', 'api_key', fallback=''),
             'base_url': self._config.get('weather', 'base_url', fallback='https://apis.data.go.kr/1360000/VilageFcstInfoService_2.0'),
+            'grid_workers': self._config.getint('weather', 'grid_workers', fallback=4),
+            'key_rate': self._config.getfloat('weather', 'key_rate', fallback=10),
+            'key_flush_interval': self._config.getint('weather', 'key_flush_interval', fallback=60),
+            'api_cache': self._config.get('weather', 'api_cache', fallback='Y'),
+            'api_cache_path': self._config.get('weather', 'api_cache_path', fallback='./cache/weather_api.sqlite'),
+            'api_cache_ttl_hours': self._config.getint('weather', 'api_cache_ttl_hours', fallback=24),
+            'api_cache_max_mb': self._config.getint('weather', 'api_cache_max_mb', fallback=200),
         }
 
     def get(self, section: str, key: str, fallback=None):
@@ -10,10 +10,26 @@ Connection Pool 설정 (Stale Connection 방지):
 - ping_interval: 연결 유효성 검사 주기 (초)
   → DB 서버 재시작 시 끊어진 연결 자동 감지/제거
 - timeout: 유휴 연결 타임아웃 (초)
+
+지속 연결(persistent) 모드 (config.ini [database] persistent = Y, 기본값):
+- use_pool=False 일 때 호출마다 로그인/종료하지 않고 연결을 유지
+- 프로세스/스레드별 연결 캐시: 같은 스레드의 Database 인스턴스가 연결 공유
+  (수집기, ApiKeyManager, farm_service 등 → Oracle 로그인 1회)
+- 스레드 종료 시 해당 스레드의 연결 종료 (ThreadPoolExecutor/API 워커 스레드 세션 누수 방지)
+  → 열린 세션 수는 살아 있는 스레드 수 이하
+- close(): 해당 인스턴스만 연결 사용 종료, 연결을 쓰는 인스턴스가 없으면 연결 종료
+- fork 후 자식 프로세스는 상속된 연결을 사용하지 않고 새로 연결
+- 연결 끊김 오류 시 캐시 연결 폐기 후 재연결 (트랜잭션 밖 단건 호출은 1회 재시도)
+- transaction(): 명시적 트랜잭션 범위 (블록 내 execute 는 커밋하지 않고 종료 시 1회 커밋)
+- get_connection(): 가장 바깥 블록 종료 시 미커밋 변경 롤백 (연결 종료 시와 동일, 커밋은 호출측 책임)
 """
+import atexit
 import logging
+import os
+import threading
+import weakref
 from contextlib import contextmanager
-from typing import Any, Generator, List, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 # cx_Oracle (운영 서버) 또는 oracledb (로컬 개발) 지원
 try:
@@ -27,6 +43,99 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# 연결 끊김으로 판단하는 Oracle 오류 코드 (재연결 대상)
+# ORA-00028: 세션 종료, ORA-01012: 미로그온, ORA-03113/03114/03135: 통신 단절,
+# ORA-12537/12541/12543/12570/12571: 리스너/네트워크 오류, ORA-02396: 유휴 시간 초과
+DISCONNECT_ERROR_CODES = {28, 1012, 2396, 3113, 3114, 3135, 12537, 12541, 12543, 12570, 12571}
+# 드라이버 오류 (DPI-1010: not connected, DPI-1080: connection was closed)
+DISCONNECT_ERROR_MESSAGES = ('DPI-1010', 'DPI-1080', 'DPY-1001', 'DPY-4011')
+
+# 지속 연결 캐시 (프로세스/스레드별)
+# - 스레드 로컬: _ThreadConnections {(dsn, user): {'conn': 연결, 'tx': 트랜잭션 깊이,
+#                'depth': get_connection 중첩 깊이, 'owners': 사용 중인 Database 인스턴스}}
+# - 레지스트리: 프로세스 종료 시 정리용 (약한 참조, 스레드 종료 후 남지 않음)
+_conn_local = threading.local()
+_conn_registry: 'weakref.WeakSet[_ThreadConnections]' = weakref.WeakSet()
+_conn_registry_lock = threading.Lock()
+
+
+class _ThreadConnections:
+    """스레드 1개의 지속 연결 묶음
+
+    스레드 종료 시 threading.local 데이터와 함께 해제되면서 연결 종료
+    fork 로 상속된 묶음은 부모 세션이므로 닫지 않음
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.entries: Dict[Tuple[str, str], dict] = {}
+        with _conn_registry_lock:
+            _conn_registry.add(self)
+
+    def close_all(self) -> int:
+        """묶음의 연결 전체 종료
+
+        Returns:
+            종료한 연결 수
+        """
+        if self.pid != os.getpid():
+            return 0
+        entries, self.entries = self.entries, {}
+        for entry in entries.values():
+            try:
+                entry['conn'].close()
+            except Exception:
+                pass
+        return len(entries)
+
+    def __del__(self):
+        try:
+            self.close_all()
+        except Exception:
+            pass
+
+
+def _connection_cache() -> Dict[Tuple[str, str], dict]:
+    """현재 프로세스/스레드의 지속 연결 캐시
+
+    fork 로 상속된 캐시는 부모 세션이므로 닫지 않고 버림
+    """
+    holder = getattr(_conn_local, 'holder', None)
+    if holder is None or holder.pid != os.getpid():
+        holder = _ThreadConnections()
+        _conn_local.holder = holder
+    return holder.entries
+
+
+def is_disconnect_error(error: BaseException) -> bool:
+    """연결 끊김 오류 여부"""
+    if not isinstance(error, (oracledb.DatabaseError, oracledb.InterfaceError)):
+        return False
+    args = getattr(error, 'args', None)
+    err = args[0] if args else None
+    code = getattr(err, 'code', None)
+    if code in DISCONNECT_ERROR_CODES:
+        return True
+    message = str(getattr(err, 'message', err) or '')
+    return any(tag in message for tag in DISCONNECT_ERROR_MESSAGES)
+
+
+def close_cached_connections() -> int:
+    """현재 프로세스의 지속 연결 전체 종료 (프로세스 종료 시 자동 호출)
+
+    Returns:
+        종료한 연결 수
+    """
+    with _conn_registry_lock:
+        holders = list(_conn_registry)
+    count = sum(holder.close_all() for holder in holders)
+    if count:
+        logger.info(f"Oracle 지속 연결 종료: {count}개")
+    return count
+
+
+atexit.register(close_cached_connections)
+
 
 class Database:
     """Oracle 데이터베이스 연결 관리 클래스
@@ -34,17 +143,72 @@ class Database:
     병렬 처리를 위해 연결 풀(Pool)을 사용:
     - use_pool=True: 연결 풀 사용 (병렬 처리용)
     - use_pool=False: 단일 연결 사용 (기본, 순차 처리용)
+      - persistent=True: 프로세스/스레드별 캐시 연결 유지 (기본, config 설정)
+      - persistent=False: 호출마다 연결/종료 (기존 방식)
+
+    사용 예 (명시적 트랜잭션):
+        with db.transaction():
+            db.execute_many(delete_sql, keys)
+            db.execute_many(insert_sql, rows)
     """
 
     def __init__(self, config: Optional[Config] = None, use_pool: bool = False,
-                 pool_min: int = 2, pool_max: int = 10):
+                 pool_min: int = 2, pool_max: int = 10, persistent: Optional[bool] = None):
         self.config = config or Config()
         self._connection = None
         self._pool = None
         self.use_pool = use_pool
         self.pool_min = pool_min
         self.pool_max = pool_max
-        logger.info(f"Oracle library: {ORACLE_LIB}, use_pool: {use_pool}")
+        if persistent is None:
+            persistent = self.config.database.get('persistent', 'Y') == 'Y'
+        self.persistent = persistent and not use_pool
+        logger.info(f"Oracle library: {ORACLE_LIB}, use_pool: {use_pool}, persistent: {self.persistent}")
+
+    def _cache_key(self) -> Tuple[str, str]:
+        db_config = self.config.database
+        return (db_config['dsn'], db_config['user'])
+
+    def _open(self):
+        """새 Oracle 연결 생성"""
+        db_config = self.config.database
+        return oracledb.connect(
+            user=db_config['user'],
+            password=db_config['password'],
+            dsn=db_config['dsn']
+        )
+
+    def _entry(self, create: bool = True) -> Optional[dict]:
+        """지속 연결 캐시 항목 (없으면 생성)"""
+        cache = _connection_cache()
+        key = self._cache_key()
+        entry = cache.get(key)
+        if entry is None and create:
+            entry = {'conn': self._open(), 'tx': 0, 'depth': 0, 'owners': weakref.WeakSet()}
+            cache[key] = entry
+            logger.info("Oracle DB 지속 연결 생성")
+        if entry is not None and create:
+            entry['owners'].add(self)
+        return entry
+
+    def _drop(self, close: bool = True) -> None:
+        """현재 스레드의 지속 연결 폐기 (다음 호출 시 재연결)"""
+        entry = _connection_cache().pop(self._cache_key(), None)
+        if entry is None:
+            return
+        if close:
+            try:
+                entry['conn'].close()
+            except Exception:
+                pass
+
+    @property
+    def in_transaction(self) -> bool:
+        """transaction() 블록 내부 여부"""
+        if not self.persistent:
+            return False
+        entry = self._entry(create=False)
+        return bool(entry and entry['tx'])
 
     def _create_pool(self):
         """연결 풀 생성
@@ -71,19 +235,30 @@ class Database:
         return self._pool
 
     def connect(self):
-        """데이터베이스 연결 (단일 연결 모드)"""
+        """데이터베이스 연결 (단일 연결 모드)
+
+        persistent 모드는 현재 프로세스/스레드의 캐시 연결 반환
+        """
+        if self.persistent:
+            return self._entry()['conn']
         if self._connection is None:
-            db_config = self.config.database
-            self._connection = oracledb.connect(
-                user=db_config['user'],
-                password=db_config['password'],
-                dsn=db_config['dsn']
-            )
+            self._connection = self._open()
             logger.info("Oracle DB 연결 성공")
         return self._connection
 
     def close(self):
-        """연결/풀 종료"""
+        """연결/풀 종료
+
+        persistent 모드는 이 인스턴스의 연결 사용만 종료하고,
+        현재 스레드에서 연결을 쓰는 다른 인스턴스가 없으면 캐시 연결 종료 (다음 호출 시 재연결)
+        """
+        if self.persistent:
+            entry = _connection_cache().get(self._cache_key())
+            if entry:
+                entry['owners'].discard(self)
+                if not entry['owners']:
+                    self._drop()
+                    logger.info("Oracle DB 지속 연결 종료")
         if self._connection:
             self._connection.close()
             self._connection = None
@@ -93,21 +268,39 @@ class Database:
             self._pool = None
             logger.info("Oracle 연결 풀 종료")
 
+    def acquire(self):
+        """연결 풀에서 연결 획득 (use_pool=True, release()로 반환)
+
+        get_connection()과 달리 획득/반환 스레드가 달라도 됨
+        (파이프라인 단계 간 농장 연결 전달용)
+        """
+        return self._create_pool().acquire()
+
+    def release(self, conn) -> None:
+        """acquire()로 획득한 연결 반환"""
+        self._create_pool().release(conn)
+
     @contextmanager
     def get_connection(self) -> Generator:
         """컨텍스트 매니저로 연결 관리
 
         use_pool=True: 풀에서 연결 획득 후 반환 (스레드별 독립 연결)
+        use_pool=False, persistent: 캐시 연결 사용 (종료하지 않음)
+          - 오류 시 트랜잭션 밖이면 롤백, 연결 끊김이면 캐시 연결 폐기
+          - 커밋은 호출측 책임 (conn.commit()), 가장 바깥 블록 정상 종료 시
+            transaction() 밖이면 미커밋 변경 롤백 (연결 종료 시와 동일)
         use_pool=False: 단일 연결 사용 (기존 방식)
         """
-        if self.use_pool:
+        if self.persistent:
+            with self._persistent_connection(rollback_on_exit=True) as conn:
+                yield conn
+        elif self.use_pool:
             # 연결 풀에서 새 연결 획득
-            pool = self._create_pool()
-            conn = pool.acquire()
+            conn = self.acquire()
             try:
                 yield conn
             finally:
-                pool.release(conn)
+                self.release(conn)
         else:
             # 단일 연결 사용 (기존 방식)
             try:
@@ -116,6 +309,38 @@ class Database:
             finally:
                 self.close()
 
+    @contextmanager
+    def _persistent_connection(self, rollback_on_exit: bool) -> Generator:
+        """지속 연결 사용 범위 (get_connection/_run 공용)
+
+        Args:
+            rollback_on_exit: 가장 바깥 범위 정상 종료 시 미커밋 변경 롤백
+                              (_run은 쓰기 작업을 직접 커밋하므로 False)
+        """
+        entry = self._entry()
+        conn = entry['conn']
+        entry['depth'] += 1
+        try:
+            yield conn
+        except BaseException as e:
+            if is_disconnect_error(e):
+                logger.warning(f"Oracle 연결 끊김 감지, 재연결 예정: {e}")
+                self._drop()
+            elif not entry['tx']:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            raise
+        else:
+            if rollback_on_exit and entry['depth'] == 1 and not entry['tx']:
+                # oracledb는 트랜잭션 진행 여부 확인 가능 (cx_Oracle은 항상 롤백)
+                if getattr(conn, 'transaction_in_progress', True):
+                    conn.rollback()
+                    logger.debug("get_connection 종료: 미커밋 변경 롤백")
+        finally:
+            entry['depth'] -= 1
+
     @contextmanager
     def get_cursor(self) -> Generator:
         """커서 컨텍스트 매니저"""
@@ -126,61 +351,147 @@ class Database:
             finally:
                 cursor.close()
 
-    def execute(self, sql: str, params: Optional[dict] = None) -> None:
-        """SQL 실행 (INSERT, UPDATE, DELETE)"""
-        with self.get_cursor() as cursor:
+    @contextmanager
+    def transaction(self) -> Generator:
+        """명시적 트랜잭션 범위
+
+        블록 내 execute/execute_many/call_* 는 커밋하지 않고,
+        블록 정상 종료 시 1회 커밋, 예외 시 롤백 (중첩 시 가장 바깥 블록 기준)
+        persistent 모드가 아니면 호출마다 연결이 달라 범위 보장이 불가하므로
+        기존처럼 호출 단위 커밋으로 동작
+        """
+        if not self.persistent:
+            yield None
+            return
+        entry = self._entry()
+        entry['tx'] += 1
+        try:
+            yield entry['conn']
+        except BaseException as e:
+            entry['tx'] -= 1
+            if entry['tx'] == 0:
+                if is_disconnect_error(e):
+                    self._drop()
+                else:
+                    entry['conn'].rollback()
+                    logger.debug("트랜잭션 롤백 완료")
+            raise
+        else:
+            entry['tx'] -= 1
+            if entry['tx'] == 0:
+                entry['conn'].commit()
+
+    def _run(self, work: Callable[[Any], Any], commit: bool = False) -> Any:
+        """커서 작업 실행 (persistent 모드: 연결 끊김 시 1회 재연결 후 재시도)
+
+        트랜잭션 블록 내부는 이전 작업이 유실되므로 재시도하지 않음
+        """
+        retry = self.persistent and not self.in_transaction
+        while True:
+            try:
+                scope = (self._persistent_connection(rollback_on_exit=False) if self.persistent
+                         else self.get_connection())
+                with scope as conn:
+                    cursor = conn.cursor()
+                    try:
+                        result = work(cursor)
+                    finally:
+                        cursor.close()
+                    if commit and not self.in_transaction:
+                        conn.commit()
+                    return result
+            except Exception as e:
+                if not (retry and is_disconnect_error(e)):
+                    raise
+                retry = False
+                logger.warning(f"Oracle 재연결 후 재시도: {e}")
+
+    def execute(self, sql: str, params: Optional[dict] = None) -> int:
+        """SQL 실행 (INSERT, UPDATE, DELETE)
+
+        Returns:
+            처리된 행 수
+        """
+        def work(cursor):
             cursor.execute(sql, params or {})
-            self._connection.commit()
+            return cursor.rowcount
+        return self._run(work, commit=True)
 
-    def execute_many(self, sql: str, params_list: List[dict]) -> None:
-        """배치 SQL 실행"""
-        with self.get_cursor() as cursor:
+    def execute_many(self, sql: str, params_list: List[dict],
+                     input_sizes: Optional[dict] = None) -> int:
+        """배치 SQL 실행
+
+        Args:
+            sql: SQL 문
+            params_list: 바인드 변수 목록
+            input_sizes: 바인드 타입 지정 (cursor.setinputsizes, 첫 행이 None인 컬럼용)
+
+        Returns:
+            처리된 행 수
+        """
+        if not params_list:
+            return 0
+
+        def work(cursor):
+            if input_sizes:
+                cursor.setinputsizes(**input_sizes)
             cursor.executemany(sql, params_list)
-            self._connection.commit()
+            return cursor.rowcount
+        return self._run(work, commit=True)
 
     def fetch_all(self, sql: str, params: Optional[dict] = None) -> List[tuple]:
         """전체 결과 조회"""
-        with self.get_cursor() as cursor:
+        def work(cursor):
             cursor.execute(sql, params or {})
             return cursor.fetchall()
+        return self._run(work)
 
     def fetch_one(self, sql: str, params: Optional[dict] = None) -> Optional[tuple]:
         """단일 결과 조회"""
-        with self.get_cursor() as cursor:
+        def work(cursor):
             cursor.execute(sql, params or {})
             return cursor.fetchone()
+        return self._run(work)
 
     def fetch_dict(self, sql: str, params: Optional[dict] = None) -> List[dict]:
         """딕셔너리 형태로 결과 조회"""
-        with self.get_cursor() as cursor:
+        def work(cursor):
             cursor.execute(sql, params or {})
             columns = [col[0] for col in cursor.description]
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return self._run(work)
 
     def call_procedure(self, proc_name: str, params: Optional[list] = None) -> None:
         """프로시저 호출"""
         logger.info(f"프로시저 호출: {proc_name}, params={params}")
-        with self.get_cursor() as cursor:
-            cursor.callproc(proc_name, params or [])
-            self._connection.commit()
+        self._run(lambda cursor: cursor.callproc(proc_name, params or []), commit=True)
         logger.info(f"프로시저 완료: {proc_name}")
 
     def call_function(self, func_name: str, return_type: Any, params: Optional[list] = None) -> Any:
         """함수 호출"""
         logger.info(f"함수 호출: {func_name}, params={params}")
-        with self.get_cursor() as cursor:
-            result = cursor.callfunc(func_name, return_type, params or [])
-            self._connection.commit()
+        result = self._run(lambda cursor: cursor.callfunc(func_name, return_type, params or []), commit=True)
         logger.info(f"함수 완료: {func_name}, result={result}")
         return result
 
+    def _current_connection(self):
+        """commit/rollback 대상 연결 (없으면 None)"""
+        if self.persistent:
+            entry = self._entry(create=False)
+            return entry['conn'] if entry else None
+        return self._connection
+
     def commit(self) -> None:
-        """트랜잭션 커밋"""
-        if self._connection:
-            self._connection.commit()
+        """트랜잭션 커밋 (transaction() 블록 내부는 블록 종료 시 커밋)"""
+        if self.in_transaction:
+            return
+        conn = self._current_connection()
+        if conn:
+            conn.commit()
 
     def rollback(self) -> None:
         """트랜잭션 롤백"""
-        if self._connection:
-            self._connection.rollback()
+        conn = self._current_connection()
+        if conn:
+            conn.rollback()
             logger.debug("트랜잭션 롤백 완료")
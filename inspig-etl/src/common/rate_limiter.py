@@ -0,0 +1,56 @@
+"""
+호출 속도 제한 (Token Bucket)
+- 공공데이터포털 API 키별 초당 호출 수 제한
+- 여러 워커 스레드가 같은 버킷을 공유 (thread-safe)
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기
+
+    사용 예:
+        bucket = TokenBucket(rate=10)   # 초당 10회
+        bucket.acquire()                # 토큰이 생길 때까지 대기
+        call_api()
+    """
+
+    def __init__(self, rate: float, capacity: float = 0):
+        """
+        Args:
+            rate: 초당 토큰 보충 수 (0 이하면 제한 없음)
+            capacity: 최대 토큰 수 (순간 허용 호출 수, 0이면 rate와 동일)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """토큰 획득 (부족하면 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,141 @@
+"""
+API 응답 디스크 캐시 (SQLite)
+- 기상청 단기예보/초단기실황/ASOS/중기예보 응답을 발표시각 단위로 저장
+- 같은 발표시각 재수집(재실행, --asos 재수집, TMN/TMX 05:00 재조회) 시 API 호출 생략
+  → 응답 지연 + 키별 일일 호출 한도 절약
+- TTL 경과 항목은 조회되지 않으며, 전체 크기가 max_bytes를 넘으면 오래된 항목부터 삭제
+- 여러 워커 스레드 공유 가능 (단일 연결 + 잠금)
+
+키 형식: {엔드포인트}|{격자/지점/지역}|{발표시각} (API 키는 포함하지 않음)
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """SQLite 기반 API 응답 캐시
+
+    사용 예:
+        cache = ResponseCache('./cache/weather_api.sqlite', ttl_seconds=86400)
+        key = ResponseCache.make_key('getVilageFcst', '60,127', '202501200500')
+        items = cache.get(key)
+        if items is None:
+            items = call_api()
+            cache.put(key, items)
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 86400, max_bytes: int = 200 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite 파일 경로 (디렉토리 없으면 생성)
+            ttl_seconds: 항목 유효 시간 (초)
+            max_bytes: 캐시 최대 크기 (압축 후 값 기준)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS API_CACHE (
+                CACHE_KEY  TEXT PRIMARY KEY,
+                VALUE      BLOB NOT NULL,
+                SIZE       INTEGER NOT NULL,
+                CREATED    REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS IX_API_CACHE_CREATED ON API_CACHE (CREATED)")
+        self._purge_expired()
+        row = self._conn.execute("SELECT COALESCE(SUM(SIZE), 0) FROM API_CACHE").fetchone()
+        self._total_bytes = int(row[0])
+
+    @staticmethod
+    def make_key(endpoint: str, target: Any, base: str) -> str:
+        """캐시 키 생성
+
+        Args:
+            endpoint: API 엔드포인트명 (예: getVilageFcst)
+            target: 격자 'nx,ny' / 관측소 번호 / 예보구역코드
+            base: 발표시각 또는 조회 기간
+        """
+        return f"{endpoint}|{target}|{base}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 TTL 경과 시 None)"""
+        min_created = time.time() - self.ttl_seconds
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT VALUE FROM API_CACHE WHERE CACHE_KEY = ? AND CREATED >= ?",
+                (key, min_created),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            return self._decode(row[0])
+        except Exception as e:
+            logger.warning(f"캐시 항목 손상, 무시: {key} ({e})")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """캐시 저장 (크기 초과 시 오래된 항목부터 삭제)"""
+        blob = self._encode(value)
+        size = len(blob)
+        with self._lock:
+            old = self._conn.execute("SELECT SIZE FROM API_CACHE WHERE CACHE_KEY = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO API_CACHE (CACHE_KEY, VALUE, SIZE, CREATED) VALUES (?, ?, ?, ?)",
+                (key, blob, size, time.time()),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _encode(self, value: Any) -> bytes:
+        """값 직렬화 (JSON + zlib)"""
+        return zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+    def _decode(self, blob: bytes) -> Any:
+        """값 역직렬화"""
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def _purge_expired(self) -> None:
+        """TTL 경과 항목 삭제"""
+        self._conn.execute("DELETE FROM API_CACHE WHERE CREATED < ?", (time.time() - self.ttl_seconds,))
+
+    def _evict(self) -> None:
+        """크기 초과 시 만료 항목 → 오래된 항목 순으로 삭제 (max_bytes의 90%까지)"""
+        self._purge_expired()
+        target = int(self.max_bytes * 0.9)
+        total = int(self._conn.execute("SELECT COALESCE(SUM(SIZE), 0) FROM API_CACHE").fetchone()[0])
+        if total > target:
+            removed = 0
+            victims = []
+            for cache_key, size in self._conn.execute("SELECT CACHE_KEY, SIZE FROM API_CACHE ORDER BY CREATED"):
+                if total - removed <= target:
+                    break
+                victims.append((cache_key,))
+                removed += size
+            self._conn.executemany("DELETE FROM API_CACHE WHERE CACHE_KEY = ?", victims)
+            total -= removed
+            logger.debug(f"API 캐시 정리: {len(victims)}건 삭제")
+        self._total_bytes = total
+
+    def close(self) -> None:
+        """캐시 연결 종료"""
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,19 @@
 # Weekly Report ETL
 from .orchestrator import WeeklyReportOrchestrator
 from .farm_processor import FarmProcessor
-from .data_loader import FarmDataLoader
+from .data_loader import FarmDataLoader, FarmDataBulkLoader
+from .columnar import ColumnarTable
+from .schedule_engine import ScheduleEngine
+from .sub_writer import SubWriter
 from .async_processor import AsyncFarmProcessor
 
 __all__ = [
     'WeeklyReportOrchestrator',
     'FarmProcessor',
     'FarmDataLoader',
+    'FarmDataBulkLoader',
+    'ColumnarTable',
+    'ScheduleEngine',
+    'SubWriter',
     'AsyncFarmProcessor',
 ]
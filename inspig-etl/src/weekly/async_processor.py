@@ -6,10 +6,12 @@
 1. 농장별 병렬 처리: ThreadPoolExecutor로 여러 농장 동시 처리
 2. 각 농장은 연결 풀에서 독립 연결 획득 → thread-safe 보장
 3. 프로세서는 순차 실행 (동일 연결 내에서 안전)
+   processor_workers > 1 이면 READS/WRITES 선언 기반 그래프로 독립 프로세서 동시 실행 (processor_graph)
 
 수정 이력:
 - 2025-12-23: 연결 풀(SessionPool) 도입으로 농장별 독립 연결 사용
 - 프로세서 내부 병렬 처리 제거 (DB 작업 충돌 방지)
+- 프로세서 실행 그래프: 선행 관계 선언 + 같은 연결 db_lock 직렬화로 동시 실행 재도입 (기본값은 순차)
 """
 import logging
 import hashlib
@@ -21,6 +23,10 @@ from dataclasses import dataclass
 from enum import Enum
 
 from ..common import now_kst
+from .processor_graph import ProcessorGraph, prepare_shared, weekly_processor_nodes
+from .schedule_engine import SCHEDULE_ENGINE_ORACLE
+from .sub_writer import SUB_FLUSH_FARM, SUB_FLUSH_PROCESSOR, SubWriter
+from .telemetry import FarmTelemetry
 
 logger = logging.getLogger(__name__)
 
@@ -86,18 +92,43 @@ class AsyncFarmProcessor:
     프로세서는 순차 실행 (동일 연결 내에서 안전)
     """
 
-    def __init__(self, conn, master_seq: int, farm_no: int, locale: str = 'KOR'):
+    def __init__(self, conn, master_seq: int, farm_no: int, locale: str = 'KOR',
+                 data_loader=None, columnar: bool = False,
+                 schedule_mode: str = SCHEDULE_ENGINE_ORACLE,
+                 sub_flush: str = SUB_FLUSH_PROCESSOR, snapshot=None, rerun_cache=None,
+                 telemetry: Optional[FarmTelemetry] = None, processor_workers: int = 1,
+                 aggregate_mode: str = SCHEDULE_ENGINE_ORACLE):
         """
         Args:
             conn: Oracle DB 연결 객체 (농장별 독립 연결)
             master_seq: 마스터 시퀀스
             farm_no: 농장 번호
             locale: 로케일
+            data_loader: 사전 로드된 FarmDataLoader (FarmDataBulkLoader 결과, None이면 직접 로드)
+            columnar: 직접 로드 시 컬럼형 저장 사용
+            schedule_mode: 작업예정 계산 모드 (oracle/python/verify)
+            sub_flush: TS_INS_WEEK_SUB 일괄 저장 시점 (processor/farm, off=건별 즉시 INSERT)
+            snapshot: SnapshotStore (직접 로드 시 이력 테이블 증분 로드)
+            rerun_cache: RerunCache (직접 로드 시 변경 없는 재실행은 로드 생략)
+            telemetry: FarmTelemetry (성능 지표 수집, 연결을 SQL 시간 집계 래퍼로 교체)
+            processor_workers: 프로세서 동시 실행 수 (1이면 순차, 2 이상이면 실행 그래프로 동시 실행)
+            aggregate_mode: 프로세서 SQL 집계 계산 모드 (oracle/python/verify)
         """
+        self.telemetry = telemetry
+        if telemetry is not None:
+            conn = telemetry.wrap(conn)
         self.conn = conn
         self.master_seq = master_seq
         self.farm_no = farm_no
         self.locale = locale
+        self.data_loader = data_loader
+        self.columnar = columnar
+        self.schedule_mode = schedule_mode
+        self.sub_flush = sub_flush
+        self.snapshot = snapshot
+        self.rerun_cache = rerun_cache
+        self.processor_workers = max(1, processor_workers)
+        self.aggregate_mode = aggregate_mode
         self.logger = logging.getLogger(f"{__name__}.Farm{farm_no}")
 
     def process(self, dt_from: str, dt_to: str, national_price: int = 0) -> Dict[str, Any]:
@@ -111,29 +142,48 @@ class AsyncFarmProcessor:
         Returns:
             처리 결과 딕셔너리
         """
-        from .data_loader import FarmDataLoader
-        from .processors import (
-            ConfigProcessor, ModonProcessor, AlertProcessor,
-            MatingProcessor, FarrowingProcessor, WeaningProcessor,
-            AccidentProcessor, CullingProcessor, ShipmentProcessor,
-            ScheduleProcessor,
-        )
-
         start_time = datetime.now()
         self.logger.info(f"농장 처리 시작: {self.farm_no}")
 
         processor_results = []
+        sub_writer = None
 
         try:
-            # 1. 기존 데이터 삭제
-            self._delete_existing_data()
+            # 1. 기존 데이터 삭제 + 상태 업데이트 (RUNNING)
+            self.begin()
+
+            # 2. 데이터 1회 로드
+            data_loader = self.load_data(dt_from, dt_to)
+
+            # 3. 프로세서 실행
+            sub_writer = self.create_sub_writer()
+            self.run_processors(data_loader, sub_writer, dt_from, dt_to, national_price, processor_results)
+
+            # 4. 미저장 SUB 저장 + 완료
+            self.complete(sub_writer)
+            return self.build_result('success', processor_results, start_time)
+
+        except Exception as e:
+            self.logger.error(f"농장 처리 실패: {self.farm_no} - {e}", exc_info=True)
+            self.fail(e, sub_writer)
+            return self.build_result('error', processor_results, start_time, error=str(e))
+
+    def begin(self) -> None:
+        """기존 데이터 삭제 + 상태 업데이트 (RUNNING)"""
+        self._delete_existing_data()
+        self._update_status('RUNNING')
 
-            # 2. 상태 업데이트 (RUNNING)
-            self._update_status('RUNNING')
+    def load_data(self, dt_from: str, dt_to: str):
+        """농장 데이터 1회 로드 (사전 로드 데이터가 있으면 사용)
 
-            # ========================================
-            # 3. 데이터 1회 로드
-            # ========================================
+        Returns:
+            FarmDataLoader
+        """
+        from .data_loader import FarmDataLoader
+        from .rerun_cache import load_with_cache
+
+        data_loader = self.data_loader
+        if data_loader is None:
             load_start = datetime.now()
             data_loader = FarmDataLoader(
                 conn=self.conn,
@@ -141,87 +191,172 @@ class AsyncFarmProcessor:
                 dt_from=dt_from,
                 dt_to=dt_to,
                 locale=self.locale,
+                columnar=self.columnar,
+                snapshot=self.snapshot,
             )
-            data_loader.load()
+            load_with_cache(self.rerun_cache, data_loader)
             load_elapsed = (datetime.now() - load_start).total_seconds() * 1000
             self.logger.info(f"데이터 로드 완료: {self.farm_no} ({load_elapsed:.0f}ms)")
+            source = 'direct' if data_loader.load_stats else 'rerun_cache'  # 캐시 복원 시 load_stats 없음
+        else:
+            self.logger.info(f"사전 로드 데이터 사용 (일괄 로드): {self.farm_no}")
+            # 파이프라인 적재 단계 로드는 load_stats 보유, 다농장 일괄 로드는 농장별 지표 없음
+            load_elapsed = sum(stat['ms'] for stat in data_loader.load_stats.values())
+            source = 'preloaded'
+        if self.telemetry is not None:
+            self.telemetry.record_load(load_elapsed, data_loader.load_stats, source)
+        data_loader.set_schedule_mode(self.schedule_mode)
+        data_loader.set_aggregate_mode(self.aggregate_mode)
+        return data_loader
+
+    def create_sub_writer(self) -> Optional[SubWriter]:
+        """TS_INS_WEEK_SUB 일괄 저장 버퍼 (농장 단위, sub_flush=off면 None)"""
+        if self.sub_flush in (SUB_FLUSH_PROCESSOR, SUB_FLUSH_FARM):
+            return SubWriter(self.conn, flush_mode=self.sub_flush)
+        return None
+
+    def run_processors(self, data_loader, sub_writer: Optional[SubWriter],
+                       dt_from: str, dt_to: str, national_price: int,
+                       processor_results: List[ProcessorResult]) -> None:
+        """Config(선행) → 2차 프로세서 실행 (processor_workers=1이면 순차, 아니면 실행 그래프)
 
-            # ========================================
-            # 4. 1차 프로세서: Config (선행 필수)
-            # ========================================
-            config_proc = ConfigProcessor(
+        Args:
+            data_loader: load_data() 결과
+            sub_writer: create_sub_writer() 결과
+            dt_from: 시작일
+            dt_to: 종료일
+            national_price: 전국 탕박 평균 단가
+            processor_results: 프로세서 결과 누적 리스트 (오류 시에도 실행된 결과 유지)
+        """
+        graph = ProcessorGraph(weekly_processor_nodes(dt_from, dt_to, national_price))
+
+        if self.processor_workers > 1:
+            self._run_graph(graph, data_loader, sub_writer, processor_results)
+            return
+
+        # 순차 실행 (동일 연결, 공용 SUB 버퍼)
+        for node in graph.nodes:
+            processor = node.proc_class(
                 self.conn, self.master_seq, self.farm_no, self.locale,
-                data_loader=data_loader,
+                data_loader=data_loader, sub_writer=sub_writer,
             )
-            config_result = self._run_processor(
-                ProcessorType.CONFIG,
-                lambda: config_proc.process(dt_from, dt_to)
+            result = self._run_processor(
+                ProcessorType(node.name),
+                lambda p=processor, kw=node.kwargs: self._process_and_flush(p, kw)
             )
-            processor_results.append(config_result)
-
-            # ========================================
-            # 5. 2차 프로세서들: 순차 실행 (동일 연결 사용)
-            # ========================================
-            # 금주 예정 날짜 계산
-            this_dt_from = (datetime.strptime(dt_to, '%Y%m%d') + timedelta(days=1)).strftime('%Y%m%d')
-            this_dt_to = (datetime.strptime(dt_to, '%Y%m%d') + timedelta(days=7)).strftime('%Y%m%d')
-
-            # 프로세서 정의 (타입, 프로세서 클래스, 추가 인자)
-            processors = [
-                (ProcessorType.ALERT, AlertProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                (ProcessorType.MODON, ModonProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                (ProcessorType.MATING, MatingProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                (ProcessorType.FARROWING, FarrowingProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                (ProcessorType.WEANING, WeaningProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                (ProcessorType.ACCIDENT, AccidentProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                (ProcessorType.CULLING, CullingProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                (ProcessorType.SHIPMENT, ShipmentProcessor, {'dt_from': dt_from, 'dt_to': dt_to, 'national_price': national_price}),
-                (ProcessorType.SCHEDULE, ScheduleProcessor, {'dt_from': this_dt_from, 'dt_to': this_dt_to}),
-            ]
-
-            # 순차 실행 (동일 연결에서 안전)
-            for proc_type, proc_class, kwargs in processors:
-                processor = proc_class(
-                    self.conn, self.master_seq, self.farm_no, self.locale,
-                    data_loader=data_loader,
-                )
-                result = self._run_processor(
-                    proc_type,
-                    lambda p=processor, kw=kwargs: p.process(**kw)
-                )
-                processor_results.append(result)
+            processor_results.append(result)
 
-            # 6. 상태 업데이트 (COMPLETE) + 공유 토큰 생성
-            self._update_complete()
-            self.conn.commit()
+    def _run_graph(self, graph: ProcessorGraph, data_loader, sub_writer: Optional[SubWriter],
+                   processor_results: List[ProcessorResult]) -> None:
+        """실행 그래프 동시 실행 (같은 연결 + db_lock, 프로세서별 SUB 버퍼)
 
-            total_elapsed = (datetime.now() - start_time).total_seconds() * 1000
-            self.logger.info(f"농장 처리 완료: {self.farm_no} ({total_elapsed:.0f}ms)")
-
-            return {
-                'farm_no': self.farm_no,
-                'status': 'success',
-                'processor_results': [r.to_dict() for r in processor_results],
-                'total_elapsed_ms': total_elapsed,
-            }
+        - 후행 프로세서가 조회하는 결과(Config 등)는 프로세서 종료 시 저장
+        - 나머지 SUB 행은 그래프 종료 후 선언 순서대로 저장 (sub_flush=farm이면 농장 버퍼에 병합)
+          → 저장 순서가 실행(완료) 순서와 무관하게 순차 실행과 동일
+        - 결과는 선언 순서로 누적
+        """
+        db_lock = prepare_shared(data_loader, self.conn)
+        writers: Dict[str, SubWriter] = {}
+
+        def run_node(node) -> ProcessorResult:
+            writer = None
+            if sub_writer is not None:
+                flush_mode = SUB_FLUSH_PROCESSOR if graph.dependents(node.name) else SUB_FLUSH_FARM
+                writer = SubWriter(self.conn, flush_mode=flush_mode, batch_size=sub_writer.batch_size)
+                writers[node.name] = writer
+            processor = node.proc_class(
+                self.conn, self.master_seq, self.farm_no, self.locale,
+                data_loader=data_loader, db_lock=db_lock, sub_writer=writer,
+            )
+            return self._run_processor(
+                ProcessorType(node.name),
+                lambda: self._process_and_flush(processor, node.kwargs)
+            )
 
+        results = graph.run(run_node, workers=self.processor_workers)
+        for name, result in results.items():
+            writer = writers.get(name)
+            if writer is not None:
+                if sub_writer.flush_mode == SUB_FLUSH_PROCESSOR and writer.pending:
+                    result = self._flush_deferred(result, writer)
+                sub_writer.absorb(writer)
+            processor_results.append(result)
+
+    def _flush_deferred(self, result: ProcessorResult, writer: SubWriter) -> ProcessorResult:
+        """동시 실행 후 프로세서 SUB 버퍼 저장 (sub_flush=processor, 저장 오류는 해당 프로세서 오류)"""
+        try:
+            writer.flush()
+            return result
         except Exception as e:
-            self.logger.error(f"농장 처리 실패: {self.farm_no} - {e}", exc_info=True)
+            self.logger.error(f"프로세서 실패: {result.processor_type.value} SUB 저장 - {e}")
+            writer.discard()
+            return ProcessorResult(
+                processor_type=result.processor_type,
+                status='error',
+                data={},
+                elapsed_ms=result.elapsed_ms,
+                error=str(e)
+            )
 
-            # 상태 업데이트 (ERROR)
-            self._update_status('ERROR')
-            self._log_error(str(e))
-            self.conn.commit()
+    def complete(self, sub_writer: Optional[SubWriter]) -> None:
+        """미저장 SUB 저장 (sub_flush=farm) + 상태 업데이트 (COMPLETE) + 공유 토큰 생성 + 커밋"""
+        complete_start = datetime.now()
+        if sub_writer is not None:
+            sub_writer.flush()
+            self.logger.debug(f"SUB 일괄 저장: {sub_writer.row_count}건 / executemany {sub_writer.call_count}회")
+        self._update_complete()
+        self.conn.commit()
+        if self.telemetry is not None:
+            self.telemetry.complete_ms = (datetime.now() - complete_start).total_seconds() * 1000
+
+    def fail(self, error: Exception, sub_writer: Optional[SubWriter] = None) -> None:
+        """오류 처리: 미저장 SUB 폐기 + 롤백 + 상태 업데이트 (ERROR) + 오류 로그 + 커밋
+
+        농장 처리는 complete()에서 1회 커밋하므로 롤백으로 이번 처리의 SUB 저장/TS_INS_WEEK 갱신을 모두 취소
+        (sub_flush=farm 일괄 저장 도중 오류 시 앞선 executemany만 반영된 일부 SUB가 커밋되지 않음).
+        기존 데이터 삭제는 롤백되므로 다시 실행 (오류 농장에 이전 SUB가 남지 않도록)
+        """
+        # 미저장 SUB 폐기 (오류 농장은 재처리 대상)
+        if sub_writer is not None:
+            sub_writer.discard()
+
+        self.conn.rollback()
+        self._delete_existing_data()
+        self._update_status('ERROR')
+        self._log_error(str(error))
+        self.conn.commit()
+
+    def build_result(self, status: str, processor_results: List[ProcessorResult],
+                     start_time: datetime, error: Optional[str] = None) -> Dict[str, Any]:
+        """농장 처리 결과 딕셔너리"""
+        total_elapsed = (datetime.now() - start_time).total_seconds() * 1000
+        if status == 'success':
+            self.logger.info(f"농장 처리 완료: {self.farm_no} ({total_elapsed:.0f}ms)")
 
-            total_elapsed = (datetime.now() - start_time).total_seconds() * 1000
+        result = {
+            'farm_no': self.farm_no,
+            'status': status,
+            'processor_results': [r.to_dict() for r in processor_results],
+            'total_elapsed_ms': total_elapsed,
+        }
+        if error is not None:
+            result['error'] = error
+        if self.telemetry is not None:
+            result['telemetry'] = self.telemetry.to_dict(total_elapsed)
+        return result
 
-            return {
-                'farm_no': self.farm_no,
-                'status': 'error',
-                'processor_results': [r.to_dict() for r in processor_results],
-                'total_elapsed_ms': total_elapsed,
-                'error': str(e),
-            }
+    @staticmethod
+    def _process_and_flush(processor, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """프로세서 실행 후 SUB 버퍼 저장 (sub_flush=processor)
+
+        프로세서 오류 시에도 오류 전까지 저장 요청된 행은 저장 (건별 INSERT와 동일)
+        """
+        try:
+            return processor.process(**kwargs)
+        finally:
+            writer = processor.sub_writer
+            if writer is not None and writer.flush_mode == SUB_FLUSH_PROCESSOR:
+                processor.flush_subs()
 
     def _run_processor(self, proc_type: ProcessorType,
                         run_func: Callable) -> ProcessorResult:
@@ -235,10 +370,13 @@ class AsyncFarmProcessor:
             ProcessorResult 객체
         """
         start = datetime.now()
+        mark = self.telemetry.mark() if self.telemetry is not None else None
         try:
             result = run_func()
             elapsed = (datetime.now() - start).total_seconds() * 1000
             self.logger.debug(f"프로세서 완료: {proc_type.value} ({elapsed:.0f}ms)")
+            if mark is not None:
+                self.telemetry.add_processor(proc_type.value, elapsed, mark)
             return ProcessorResult(
                 processor_type=proc_type,
                 status='success',
@@ -248,6 +386,8 @@ class AsyncFarmProcessor:
         except Exception as e:
             elapsed = (datetime.now() - start).total_seconds() * 1000
             self.logger.error(f"프로세서 실패: {proc_type.value} - {e}")
+            if mark is not None:
+                self.telemetry.add_processor(proc_type.value, elapsed, mark, status='error')
             return ProcessorResult(
                 processor_type=proc_type,
                 status='error',
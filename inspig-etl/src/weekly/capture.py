@@ -0,0 +1,582 @@
+"""
+농장 처리 실행 기록/재생 (capture / replay)
+- RecordingConnection: 농장 연결을 감싸 모든 SQL(문장, 바인드, 결과 행, 처리 행 수)을 기록
+- FarmCapture: 기록 1건 (농장/기간/처리 옵션 헤더 + SQL 목록), gzip pickle 파일로 저장/로드
+- ReplayConnection: 기록 파일의 결과를 그대로 반환하는 오프라인 연결 (Oracle 불필요)
+  → AsyncFarmProcessor.process() 전체를 DB 없이 재실행하여 프로파일링
+- compare_writes(): 기록 시점과 재생 시점의 저장 SQL(TS_INS_WEEK_SUB 등)을 행 단위 문자열로 비교
+
+재생 조회 순서:
+- (SQL, 바인드)가 같은 미사용 기록을 순서대로 반환
+- 바인드가 다르면 같은 SQL의 다음 미사용 기록 반환 (실행일 기준 날짜 바인드 등, bind_mismatch 집계)
+- 같은 SQL이 기록보다 많이 실행되면 마지막 기록 재사용 (repeat 집계)
+
+config.ini [processing] capture = Y 시 농장별 기록 (capture_farms로 대상 농장 제한)
+"""
+import gzip
+import json
+import logging
+import os
+import pickle
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기록 파일 형식 버전
+CAPTURE_VERSION = 1
+
+# 조회 SQL 시작 키워드
+_QUERY_KEYWORDS = ('SELECT', 'WITH')
+
+# 비교에서 제외하는 바인드 (실행 시마다 달라지는 값: 공유 토큰, 만료일)
+VOLATILE_BINDS = ('share_token', 'expire_dt')
+
+# 기록 파일의 cursor.var() 바인드 표시
+_VAR = '<var>'
+
+_RETURNING_RE = re.compile(r'\s+RETURNING\s+.+?\s+INTO\s+:\w+(\s*,\s*:\w+)*\s*$', re.IGNORECASE)
+_TABLE_RE = re.compile(r'^(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|DELETE|MERGE\s+INTO)\s+(\w+)', re.IGNORECASE)
+
+
+class ReplayMissError(Exception):
+    """재생 연결에 기록이 없는 SQL (strict 모드)"""
+
+
+def normalize_sql(sql: str) -> str:
+    """공백 정규화 (들여쓰기/줄바꿈 차이 무시)"""
+    return ' '.join(sql.split())
+
+
+def _is_query(sql: str) -> bool:
+    return sql.upper().startswith(_QUERY_KEYWORDS)
+
+
+def _is_var(value: Any) -> bool:
+    """cursor.var() 객체 여부"""
+    return hasattr(value, 'getvalue') and not isinstance(value, (str, bytes))
+
+
+def _read_lob(value: Any) -> Any:
+    """LOB은 문자열/바이트로 읽음 (연결 종료 후에도 사용 가능하도록)"""
+    if hasattr(value, 'read') and not isinstance(value, (str, bytes)):
+        return value.read()
+    return value
+
+
+def _merge_params(args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """execute(sql, params, **kwargs) 바인드 통합"""
+    params = args[0] if args else None
+    if kwargs:
+        return {**(params or {}), **kwargs}
+    return params
+
+
+def _plain_params(params: Any) -> Any:
+    """기록용 바인드 (var 객체는 표시 문자열로 대체)"""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {k: _VAR if _is_var(v) else v for k, v in params.items()}
+    return [_VAR if _is_var(v) else v for v in params]
+
+
+def _out_values(params: Any) -> Dict[Any, Any]:
+    """실행 후 var 바인드 값 (RETURNING INTO)"""
+    if isinstance(params, dict):
+        items = params.items()
+    elif params:
+        items = enumerate(params)
+    else:
+        return {}
+    return {k: v.getvalue() for k, v in items if _is_var(v)}
+
+
+def _bind_key(params: Any) -> str:
+    """바인드 비교 키 (dict는 이름순)"""
+    if isinstance(params, dict):
+        return repr(sorted(params.items()))
+    return repr(params)
+
+
+def _description(desc) -> List[tuple]:
+    """cursor.description 기록 (컬럼명만 보존, 타입 객체는 pickle 불가할 수 있어 제외)"""
+    return [(col[0], None, None, None, None, None, None) for col in desc]
+
+
+# ============================================================================
+# 기록 데이터
+# ============================================================================
+
+class FarmCapture:
+    """농장 1개 실행 기록
+
+    header: farm_no, master_seq, locale, dt_from, dt_to, national_price,
+            columnar, schedule_mode, aggregate_mode, sub_flush, processor_workers, captured_at, status, sql_ms
+    statements: [{'op', 'sql', 'params', 'key', 'columns', 'rows', 'rowcount', 'out', 'result', 'ms'}]
+    """
+
+    def __init__(self, header: Dict[str, Any], statements: Optional[List[Dict[str, Any]]] = None):
+        self.header = header
+        self.statements = statements if statements is not None else []
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.statements.append(entry)
+
+    def file_name(self) -> str:
+        h = self.header
+        return f"farm_{h['farm_no']}_{h['dt_from']}_{h['dt_to']}_{h['captured_at']}.pkl.gz"
+
+    def save(self, capture_path: str) -> str:
+        """기록 파일 저장
+
+        Returns:
+            저장 파일 경로
+        """
+        self.header['sql_ms'] = round(sum(entry.get('ms', 0) for entry in self.statements), 1)
+        path = Path(capture_path) / self.file_name()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f'.{os.getpid()}.tmp')
+        payload = {'version': CAPTURE_VERSION, 'header': self.header, 'statements': self.statements}
+        with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        logger.info(f"실행 기록 저장: {path} (SQL {len(self.statements)}건)")
+        return str(path)
+
+    @classmethod
+    def load(cls, path: str) -> 'FarmCapture':
+        with gzip.open(path, 'rb') as f:
+            payload = pickle.load(f)
+        if payload.get('version') != CAPTURE_VERSION:
+            raise ValueError(f"지원하지 않는 기록 파일 버전: {payload.get('version')} ({path})")
+        return cls(payload['header'], payload['statements'])
+
+    def summary(self) -> Dict[str, Any]:
+        """SQL 유형별 건수"""
+        ops = Counter(entry['op'] for entry in self.statements)
+        return {'statements': len(self.statements), 'ops': dict(ops), 'sql_ms': self.header.get('sql_ms')}
+
+
+def new_capture(farm_no: int, master_seq: int, locale: str, dt_from: str, dt_to: str,
+                national_price: int, columnar: bool, schedule_mode: str, sub_flush: str,
+                processor_workers: int = 1, aggregate_mode: str = 'oracle') -> FarmCapture:
+    """기록 생성 (재생 시 같은 옵션으로 AsyncFarmProcessor 생성)"""
+    return FarmCapture({
+        'farm_no': farm_no,
+        'master_seq': master_seq,
+        'locale': locale,
+        'dt_from': dt_from,
+        'dt_to': dt_to,
+        'national_price': national_price,
+        'columnar': columnar,
+        'schedule_mode': schedule_mode,
+        'aggregate_mode': aggregate_mode,
+        'sub_flush': sub_flush,
+        'processor_workers': processor_workers,
+        'captured_at': datetime.now().strftime('%Y%m%d%H%M%S'),
+    })
+
+
+# ============================================================================
+# 기록 연결
+# ============================================================================
+
+class RecordingCursor:
+    """cursor 래퍼 (실행 SQL/바인드/결과 기록)
+
+    조회 결과는 실행 직후 전체를 읽어 기록하고, fetch*는 읽어둔 행에서 반환
+    """
+
+    def __init__(self, cursor, capture: FarmCapture):
+        self._cursor = cursor
+        self._capture = capture
+        self._rows: Optional[List[tuple]] = None
+        self._pos = 0
+        self.description = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self) -> Iterator[tuple]:
+        if self._rows is None:
+            return iter(self._cursor)
+        return iter(self.fetchall())
+
+    def execute(self, sql, *args, **kwargs):
+        params = _merge_params(args, kwargs)
+        start = time.perf_counter()
+        result = self._cursor.execute(sql, *args, **kwargs)
+        entry = {
+            'op': 'execute',
+            'sql': normalize_sql(sql),
+            'params': _plain_params(params),
+            'key': _bind_key(_plain_params(params)),
+        }
+        desc = self._cursor.description
+        if desc is not None:
+            self._rows = [tuple(_read_lob(v) for v in row) for row in self._cursor.fetchall()]
+            self._pos = 0
+            self.description = _description(desc)
+            entry['columns'] = self.description
+            entry['rows'] = self._rows
+            result = self  # execute().fetchall() 호출 시에도 기록된 행 반환
+        else:
+            self._rows = None
+            self.description = None
+            entry['rowcount'] = self._cursor.rowcount
+            entry['out'] = _out_values(params)
+        entry['ms'] = (time.perf_counter() - start) * 1000
+        self._capture.add(entry)
+        return result
+
+    def executemany(self, sql, params_list, *args, **kwargs):
+        start = time.perf_counter()
+        result = self._cursor.executemany(sql, params_list, *args, **kwargs)
+        self._rows = None
+        self.description = None
+        self._capture.add({
+            'op': 'executemany',
+            'sql': normalize_sql(sql),
+            'params': [_plain_params(p) for p in params_list],
+            'rowcount': self._cursor.rowcount,
+            'ms': (time.perf_counter() - start) * 1000,
+        })
+        return result
+
+    def callfunc(self, name, return_type, *args, **kwargs):
+        start = time.perf_counter()
+        result = self._cursor.callfunc(name, return_type, *args, **kwargs)
+        params = _merge_params(args, kwargs)
+        self._capture.add({
+            'op': 'callfunc',
+            'sql': name,
+            'params': _plain_params(params),
+            'key': _bind_key(_plain_params(params)),
+            'result': _read_lob(result),
+            'ms': (time.perf_counter() - start) * 1000,
+        })
+        return result
+
+    def callproc(self, name, *args, **kwargs):
+        start = time.perf_counter()
+        result = self._cursor.callproc(name, *args, **kwargs)
+        params = _merge_params(args, kwargs)
+        self._capture.add({
+            'op': 'callproc',
+            'sql': name,
+            'params': _plain_params(params),
+            'key': _bind_key(_plain_params(params)),
+            'result': [_read_lob(v) for v in result] if isinstance(result, list) else result,
+            'ms': (time.perf_counter() - start) * 1000,
+        })
+        return result
+
+    def fetchone(self):
+        if self._rows is None:
+            return self._cursor.fetchone()
+        if self._pos >= len(self._rows):
+            return None
+        row = self._rows[self._pos]
+        self._pos += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None):
+        if self._rows is None:
+            return self._cursor.fetchmany(*(() if size is None else (size,)))
+        size = size or self._cursor.arraysize
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return rows
+
+    def fetchall(self):
+        if self._rows is None:
+            return self._cursor.fetchall()
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return rows
+
+
+class RecordingConnection:
+    """연결 래퍼 (cursor를 RecordingCursor로 반환, commit/rollback 기록)"""
+
+    def __init__(self, conn, capture: FarmCapture):
+        self._conn = conn
+        self.capture = capture
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return RecordingCursor(self._conn.cursor(*args, **kwargs), self.capture)
+
+    def commit(self):
+        self.capture.add({'op': 'commit', 'sql': 'COMMIT'})
+        return self._conn.commit()
+
+    def rollback(self):
+        self.capture.add({'op': 'rollback', 'sql': 'ROLLBACK'})
+        return self._conn.rollback()
+
+
+# ============================================================================
+# 재생 연결
+# ============================================================================
+
+class ReplayVar:
+    """cursor.var() 대응 (기록된 RETURNING INTO 값)"""
+
+    def __init__(self, value: Any = None):
+        self.value = value
+
+    def getvalue(self, pos: int = 0):
+        return self.value
+
+    def setvalue(self, pos: int, value: Any) -> None:
+        self.value = value
+
+
+class ReplayCursor:
+    """기록 결과를 반환하는 cursor"""
+
+    def __init__(self, conn: 'ReplayConnection'):
+        self._conn = conn
+        self._rows: List[tuple] = []
+        self._pos = 0
+        self.description: Optional[List[tuple]] = None
+        self.rowcount = 0
+        self.arraysize = 100
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.fetchall())
+
+    def var(self, *args, **kwargs) -> ReplayVar:
+        return ReplayVar()
+
+    def setinputsizes(self, *args, **kwargs) -> None:
+        pass
+
+    def execute(self, sql, *args, **kwargs):
+        params = _merge_params(args, kwargs)
+        sql = normalize_sql(sql)
+        entry = self._conn.lookup('execute', sql, _bind_key(_plain_params(params)))
+        self._pos = 0
+        if _is_query(sql):
+            self._rows = list(entry['rows']) if entry else []
+            self.description = entry['columns'] if entry else []
+            self.rowcount = len(self._rows)
+            return self
+        self._rows = []
+        self.description = None
+        self.rowcount = entry.get('rowcount', 0) if entry else 0
+        if entry:
+            for name, value in entry.get('out', {}).items():
+                target = params[name] if params is not None else None
+                if _is_var(target) and hasattr(target, 'setvalue'):
+                    target.setvalue(0, value)
+        self._conn.add_write(sql, params)
+        return None
+
+    def executemany(self, sql, params_list, *args, **kwargs):
+        sql = normalize_sql(sql)
+        entry = self._conn.lookup('executemany', sql, None)
+        self._rows = []
+        self.description = None
+        self.rowcount = entry.get('rowcount', len(params_list)) if entry else len(params_list)
+        for params in params_list:
+            self._conn.add_write(sql, params)
+
+    def callfunc(self, name, return_type, *args, **kwargs):
+        params = _merge_params(args, kwargs)
+        entry = self._conn.lookup('callfunc', name, _bind_key(_plain_params(params)))
+        return entry['result'] if entry else None
+
+    def callproc(self, name, *args, **kwargs):
+        params = _merge_params(args, kwargs)
+        entry = self._conn.lookup('callproc', name, _bind_key(_plain_params(params)))
+        return entry['result'] if entry else list(params or [])
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        row = self._rows[self._pos]
+        self._pos += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None):
+        size = size or self.arraysize
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return rows
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayConnection:
+    """기록 파일 기반 오프라인 연결
+
+    사용 예:
+        capture = FarmCapture.load('capture/farm_1387_....pkl.gz')
+        conn = ReplayConnection(capture)
+        AsyncFarmProcessor(conn, ...).process(dt_from, dt_to, national_price)
+        diff = compare_writes(capture, conn.writes)
+    """
+
+    def __init__(self, capture: FarmCapture, strict: bool = False, latency: float = 0.0):
+        """
+        Args:
+            capture: 실행 기록
+            strict: 기록에 없는 SQL 실행 시 ReplayMissError (False면 빈 결과)
+            latency: 기록된 SQL 시간 재현 배율 (0: 즉시 반환, 1.0: 기록 시간만큼 대기)
+                     대기는 연결 단위로 직렬화 (Oracle 연결 1개는 SQL을 1개씩 처리)
+        """
+        self.capture = capture
+        self.strict = strict
+        self.latency = latency
+        self._index: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        for entry in capture.statements:
+            if entry['op'] not in ('commit', 'rollback'):
+                self._index[(entry['op'], entry['sql'])].append(entry)
+        self._used = set()
+        self.writes: List[Tuple[str, Any]] = []
+        self.commit_count = 0
+        self.misses: Counter = Counter()
+        self.bind_mismatch: Counter = Counter()
+        self.repeats: Counter = Counter()
+        self._lock = threading.Lock()  # 프로세서 동시 실행 (processor_workers > 1)
+        self._call_lock = threading.Lock()
+
+    def cursor(self, *args, **kwargs) -> ReplayCursor:
+        return ReplayCursor(self)
+
+    def commit(self) -> None:
+        self.commit_count += 1
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def lookup(self, op: str, sql: str, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """기록 조회 (같은 바인드 → 같은 SQL 다음 기록 → 마지막 기록 재사용)"""
+        with self._lock:
+            entry = self._lookup(op, sql, key)
+        if entry is not None and self.latency > 0:
+            with self._call_lock:
+                time.sleep(entry.get('ms', 0) * self.latency / 1000)
+        return entry
+
+    def _lookup(self, op: str, sql: str, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        entries = self._index.get((op, sql))
+        if not entries:
+            self.misses[sql[:80]] += 1
+            if self.strict:
+                raise ReplayMissError(f"기록 없음: {op} {sql[:200]}")
+            return None
+        fallback = None
+        for entry in entries:
+            if id(entry) in self._used:
+                continue
+            if key is None or entry.get('key') == key:
+                self._used.add(id(entry))
+                return entry
+            if fallback is None:
+                fallback = entry
+        if fallback is not None:
+            self.bind_mismatch[sql[:80]] += 1
+            self._used.add(id(fallback))
+            return fallback
+        self.repeats[sql[:80]] += 1
+        return entries[-1]
+
+    def add_write(self, sql: str, params: Any) -> None:
+        with self._lock:
+            self.writes.append((sql, _plain_params(params)))
+
+    def stats(self) -> Dict[str, Any]:
+        """재생 통계 (기록 없음/바인드 불일치/재사용 SQL 수)"""
+        return {
+            'writes': len(self.writes),
+            'misses': sum(self.misses.values()),
+            'bind_mismatch': sum(self.bind_mismatch.values()),
+            'repeats': sum(self.repeats.values()),
+        }
+
+
+# ============================================================================
+# 저장 결과 비교
+# ============================================================================
+
+def recorded_writes(capture: FarmCapture) -> List[Tuple[str, Any]]:
+    """기록의 저장 SQL 행 목록 (executemany는 행 단위로 펼침)"""
+    writes = []
+    for entry in capture.statements:
+        if entry['op'] == 'executemany':
+            writes.extend((entry['sql'], params) for params in entry['params'])
+        elif entry['op'] == 'execute' and not _is_query(entry['sql']):
+            writes.append((entry['sql'], entry['params']))
+    return writes
+
+
+def _write_line(sql: str, params: Any, ignore: Tuple[str, ...]) -> str:
+    """저장 1행 비교 문자열 (RETURNING INTO, var/변동 바인드 제외)"""
+    sql = _RETURNING_RE.sub('', sql)
+    if isinstance(params, dict):
+        params = {k: v for k, v in params.items() if k not in ignore and v != _VAR}
+    return json.dumps([sql, params], ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _table_name(sql: str) -> str:
+    match = _TABLE_RE.match(sql)
+    return match.group(1).upper() if match else sql.split(' ', 1)[0].upper()
+
+
+def compare_writes(capture: FarmCapture, writes: List[Tuple[str, Any]],
+                   ignore: Tuple[str, ...] = VOLATILE_BINDS, max_diffs: int = 20) -> Dict[str, Any]:
+    """기록 시점과 재생 시점의 저장 결과 비교
+
+    sub_flush 모드 차이(건별 INSERT ... RETURNING / executemany)는 같은 행으로 취급
+
+    Returns:
+        {'identical': 순서까지 동일, 'same_rows': 순서 무관 동일,
+         'tables': {테이블: [기록 행 수, 재생 행 수]}, 'diffs': [(위치, 기록, 재생)]}
+    """
+    recorded = recorded_writes(capture)
+    expected = [_write_line(sql, params, ignore) for sql, params in recorded]
+    actual = [_write_line(sql, params, ignore) for sql, params in writes]
+
+    tables: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    for sql, _ in recorded:
+        tables[_table_name(sql)][0] += 1
+    for sql, _ in writes:
+        tables[_table_name(sql)][1] += 1
+
+    diffs = []
+    for i in range(max(len(expected), len(actual))):
+        exp = expected[i] if i < len(expected) else None
+        act = actual[i] if i < len(actual) else None
+        if exp != act:
+            diffs.append((i, exp, act))
+            if len(diffs) >= max_diffs:
+                break
+
+    return {
+        'identical': expected == actual,
+        'same_rows': Counter(expected) == Counter(actual),
+        'recorded': len(expected),
+        'replayed': len(actual),
+        'tables': dict(tables),
+        'diffs': diffs,
+    }
@@ -0,0 +1,413 @@
+"""
+컬럼형 테이블 (로드 데이터 메모리 절감)
+- FarmDataLoader의 행 리스트(List[Dict])를 컬럼 배열로 저장
+- 행마다 컬럼명 문자열/딕셔너리를 반복 보관하지 않음
+
+컬럼 저장 방식:
+- 날짜 (YYYYMMDD 문자열): array('i') 일련번호(date.toordinal)
+- 코드/문자열 (WK_GUBUN, STATUS_CD 등): 사전 인코딩 (고유값 목록 + array('B'/'H') 인덱스)
+- 정수: array('q')
+- 실수: array('d')
+- 그 외: 일반 리스트
+
+행 뷰(ColumnarRow)는 dict와 동일한 조회 API(get, [], in, keys, items)를 제공하므로
+기존 프로세서 코드(for row in data: row.get(...))를 수정 없이 사용 가능
+"""
+import math
+from array import array
+from collections.abc import MutableMapping, Sequence
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+
+# 정수 컬럼 NULL 표시값
+_NULL_INT = -(2 ** 63)
+# 날짜 컬럼 NULL 표시값 (date.toordinal()은 1 이상)
+_NULL_DAY = 0
+# 사전 인코딩 최대 고유값 수 (초과 시 일반 리스트)
+_CODE_MAX = 65535
+# from_cursor fetchmany 행 수
+FETCH_BATCH_ROWS = 5000
+
+
+def yyyymmdd_to_day(value: Any) -> Optional[int]:
+    """YYYYMMDD 문자열 → 일련번호 (변환 불가 시 None)
+
+    문자열 왕복(일련번호 → YYYYMMDD)이 원본과 동일한 경우만 변환
+    """
+    if not isinstance(value, str) or len(value) != 8 or not value.isdigit():
+        return None
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:8])).toordinal()
+    except ValueError:
+        return None
+
+
+def day_to_yyyymmdd(day: int) -> str:
+    """일련번호 → YYYYMMDD 문자열"""
+    return date.fromordinal(day).strftime('%Y%m%d')
+
+
+class _ObjectColumn:
+    """일반 리스트 컬럼"""
+
+    kind = 'object'
+
+    def __init__(self, values: List[Any]):
+        self.values = values
+
+    def get(self, i: int) -> Any:
+        return self.values[i]
+
+    def decode(self) -> List[Any]:
+        return list(self.values)
+
+    def take(self, indices: List[int]) -> '_ObjectColumn':
+        return _ObjectColumn(list(map(self.values.__getitem__, indices)))
+
+    def nbytes(self) -> int:
+        return len(self.values) * 8
+
+
+class _CodeColumn:
+    """사전 인코딩 컬럼 (고유값 목록 + 인덱스 배열)"""
+
+    kind = 'code'
+
+    def __init__(self, values: List[Any]):
+        # 최초 등장 순서로 고유값 코드 부여 (dict.fromkeys/map으로 행 단위 Python 반복 없음)
+        index: Dict[Any, int] = dict.fromkeys(values)
+        for code, v in enumerate(index):
+            index[v] = code
+        self.dictionary: List[Any] = list(index)
+        self.index = index
+        self.codes = array('B' if len(self.dictionary) <= 255 else 'H', map(index.__getitem__, values))
+
+    def get(self, i: int) -> Any:
+        return self.dictionary[self.codes[i]]
+
+    def code_of(self, value: Any) -> Optional[int]:
+        """값의 코드 (없으면 None) - 코드 단위 비교용"""
+        return self.index.get(value)
+
+    def decode(self) -> List[Any]:
+        d = self.dictionary
+        return [d[c] for c in self.codes]
+
+    def take(self, indices: List[int]) -> '_CodeColumn':
+        # 고유값 목록은 원본과 공유
+        col = _CodeColumn.__new__(_CodeColumn)
+        col.dictionary = self.dictionary
+        col.index = self.index
+        col.codes = array(self.codes.typecode, map(self.codes.__getitem__, indices))
+        return col
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes) + len(self.dictionary) * 8
+
+
+class _DateColumn:
+    """날짜 컬럼 (YYYYMMDD → 일련번호)"""
+
+    kind = 'date'
+
+    def __init__(self, days: List[int], strings: Optional[Dict[int, Optional[str]]] = None):
+        self.days = array('i', days)
+        # 일련번호 → YYYYMMDD (고유 날짜 수만큼만 보관, 행 조회 시 변환 없음)
+        if strings is None:
+            strings = {day: day_to_yyyymmdd(day) for day in set(self.days) if day != _NULL_DAY}
+        strings[_NULL_DAY] = None
+        self._strings = strings
+
+    def get(self, i: int) -> Optional[str]:
+        return self._strings[self.days[i]]
+
+    def decode(self) -> List[Optional[str]]:
+        return list(map(self._strings.__getitem__, self.days))
+
+    def take(self, indices: List[int]) -> '_DateColumn':
+        return _DateColumn(list(map(self.days.__getitem__, indices)), self._strings)
+
+    def nbytes(self) -> int:
+        return self.days.itemsize * len(self.days)
+
+
+class _IntColumn:
+    """정수 컬럼"""
+
+    kind = 'int'
+
+    def __init__(self, values: List[Optional[int]]):
+        self.data = array('q', [_NULL_INT if v is None else v for v in values])
+
+    def get(self, i: int) -> Optional[int]:
+        v = self.data[i]
+        return None if v == _NULL_INT else v
+
+    def decode(self) -> List[Optional[int]]:
+        return [None if v == _NULL_INT else v for v in self.data]
+
+    def take(self, indices: List[int]) -> '_IntColumn':
+        col = _IntColumn.__new__(_IntColumn)
+        col.data = array('q', map(self.data.__getitem__, indices))
+        return col
+
+    def nbytes(self) -> int:
+        return self.data.itemsize * len(self.data)
+
+
+class _FloatColumn:
+    """실수 컬럼 (NULL은 NaN)"""
+
+    kind = 'float'
+
+    def __init__(self, values: List[Optional[float]]):
+        self.data = array('d', [math.nan if v is None else v for v in values])
+
+    def get(self, i: int) -> Optional[float]:
+        v = self.data[i]
+        return None if v != v else v
+
+    def decode(self) -> List[Optional[float]]:
+        return [None if v != v else v for v in self.data]
+
+    def take(self, indices: List[int]) -> '_FloatColumn':
+        col = _FloatColumn.__new__(_FloatColumn)
+        col.data = array('d', map(self.data.__getitem__, indices))
+        return col
+
+    def nbytes(self) -> int:
+        return self.data.itemsize * len(self.data)
+
+
+def _build_column(name: str, values: List[Any]):
+    """값 목록을 보고 컬럼 저장 방식 결정
+
+    원본 값과 행 뷰 조회 값이 타입까지 동일한 경우만 압축 저장
+    """
+    # 타입은 전체 값, 범위/고유값 수는 고유값 기준 (행 단위 Python 반복 없음)
+    # 1/1.0/True는 set에서 같은 값이므로 타입은 고유값이 아닌 전체 값으로 판단
+    types = set(map(type, values))
+    types.discard(type(None))
+    if not types:
+        return _CodeColumn(values)
+
+    distinct = set(values)
+    distinct.discard(None)
+
+    if types == {str}:
+        # 날짜 컬럼: *_DT, *_DATE 이면서 모든 값이 YYYYMMDD
+        if name.endswith('_DT') or name.endswith('_DATE'):
+            # 고유 날짜 문자열만 변환 (행 수가 아닌 고유값 수만큼 date 생성)
+            day_of: Dict[Any, int] = dict.fromkeys(values)
+            for v in day_of:
+                day = _NULL_DAY if v is None else yyyymmdd_to_day(v)
+                if day is None:
+                    break
+                day_of[v] = day
+            else:
+                strings = {day: v for v, day in day_of.items() if v is not None}
+                return _DateColumn(list(map(day_of.__getitem__, values)), strings)
+
+        if len(distinct) <= _CODE_MAX:
+            return _CodeColumn(values)
+        return _ObjectColumn(list(values))
+
+    if types == {int}:
+        if -(2 ** 63) < min(distinct) and max(distinct) < 2 ** 63:
+            # 고유값이 적은 정수(SANCHA, GYOBAE_CNT 등)는 사전 인코딩이 더 작음
+            if len(distinct) <= 255:
+                return _CodeColumn(values)
+            return _IntColumn(values)
+        return _ObjectColumn(list(values))
+
+    if types == {float} and not any(v != v for v in distinct):
+        return _FloatColumn(values)
+
+    return _ObjectColumn(list(values))
+
+
+class ColumnarRow(MutableMapping):
+    """컬럼형 테이블의 행 뷰 (dict 호환)
+
+    조회는 테이블 컬럼에서 직접 수행, 쓰기(row['X'] = v)는 행별 추가값으로 보관
+    """
+
+    __slots__ = ('_table', '_idx')
+
+    def __init__(self, table: 'ColumnarTable', idx: int):
+        self._table = table
+        self._idx = idx
+
+    def __getitem__(self, key: str) -> Any:
+        table = self._table
+        if table._extra:
+            extra = table._extra.get(self._idx)
+            if extra is not None and key in extra:
+                return extra[key]
+        col = table._columns.get(key)
+        if col is None:
+            raise KeyError(key)
+        return col.get(self._idx)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        table = self._table
+        if table._extra:
+            extra = table._extra.get(self._idx)
+            if extra is not None and key in extra:
+                return extra[key]
+        col = table._columns.get(key)
+        if col is None:
+            return default
+        return col.get(self._idx)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._table._extra.setdefault(self._idx, {})[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("ColumnarRow는 컬럼 삭제를 지원하지 않습니다")
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._table._columns:
+            return True
+        extra = self._table._extra.get(self._idx)
+        return extra is not None and key in extra
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._table.columns
+        extra = self._table._extra.get(self._idx)
+        if extra:
+            for key in extra:
+                if key not in self._table._columns:
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> Dict[str, Any]:
+        """일반 dict 사본"""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"ColumnarRow({self.copy()!r})"
+
+
+class ColumnarTable(Sequence):
+    """컬럼형 테이블 (List[Dict] 대체)
+
+    len(), 인덱스/슬라이스, for 반복을 지원하며 각 행은 ColumnarRow(dict 호환)로 반환.
+    프로세서는 기존 행 API를 그대로 사용하고, 필요한 경우 raw_column()으로
+    인코딩된 배열에 직접 접근하여 점진적으로 전환 가능.
+    """
+
+    def __init__(self, columns: List[str], column_data: Dict[str, Any], length: int):
+        self.columns = columns
+        self._columns = column_data
+        self._length = length
+        self._extra: Dict[int, Dict[str, Any]] = {}
+        self._rows: Optional[List[ColumnarRow]] = None
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size: int = FETCH_BATCH_ROWS) -> 'ColumnarTable':
+        """실행된 커서에서 직접 생성 (행 튜플/딕셔너리 전체 목록을 만들지 않음)
+
+        fetchmany 묶음마다 컬럼별 값 목록에 누적 후 컬럼 단위로 인코딩.
+        조회 중 최대 메모리는 컬럼 값 목록 + 1개 묶음 (행 딕셔너리/튜플 전체 보관 없음)
+
+        Args:
+            cursor: execute 완료된 커서 (description 필요)
+            batch_size: fetchmany 행 수
+        """
+        columns = [col[0] for col in cursor.description]
+        values: List[Optional[List[Any]]] = [[] for _ in columns]
+        length = 0
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            length += len(rows)
+            for col_values, batch in zip(values, zip(*rows)):
+                col_values.extend(batch)
+        column_data = {}
+        for i, name in enumerate(columns):
+            column_data[name] = _build_column(name, values[i])
+            values[i] = None  # 인코딩 끝난 값 목록 즉시 해제
+        return cls(columns, column_data, length)
+
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> 'ColumnarTable':
+        """딕셔너리 리스트로 생성 (컬럼은 첫 행 기준, 누락 키는 None)"""
+        if not rows:
+            return cls([], {}, 0)
+        columns = list(rows[0].keys())
+        column_data = {}
+        for name in columns:
+            column_data[name] = _build_column(name, [row.get(name) for row in rows])
+        return cls(columns, column_data, len(rows))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self._row_views()[idx]
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError('ColumnarTable index out of range')
+        return self._row_views()[idx]
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        return iter(self._row_views())
+
+    def _row_views(self) -> List[ColumnarRow]:
+        """행 뷰 목록 (최초 접근 시 1회 생성)
+
+        반복/인덱스 조회/모돈 인덱스가 같은 뷰 객체를 공유 (반복마다 행 뷰를 새로 만들지 않음,
+        dict 행과 동일하게 같은 행은 같은 객체)
+        """
+        rows = self._rows
+        if rows is None:
+            rows = self._rows = [ColumnarRow(self, i) for i in range(self._length)]
+        return rows
+
+    def __repr__(self) -> str:
+        return f"ColumnarTable(rows={self._length}, columns={self.columns})"
+
+    def column(self, name: str) -> List[Any]:
+        """컬럼 값 리스트 (디코딩된 원본 값)"""
+        col = self._columns.get(name)
+        if col is None:
+            return [None] * self._length
+        return col.decode()
+
+    def take(self, indices: List[int]) -> 'ColumnarTable':
+        """지정 행만 담은 새 테이블 (다농장 일괄 로드의 농장별 분할용, 인코딩 유지)
+
+        Args:
+            indices: 행 번호 리스트 (순서 유지)
+        """
+        column_data = {name: col.take(indices) for name, col in self._columns.items()}
+        table = ColumnarTable(list(self.columns), column_data, len(indices))
+        if self._extra:
+            for new_idx, idx in enumerate(indices):
+                extra = self._extra.get(idx)
+                if extra:
+                    table._extra[new_idx] = dict(extra)
+        return table
+
+    def raw_column(self, name: str):
+        """인코딩된 컬럼 객체 (kind: date/code/int/float/object)
+
+        - date: .days (array('i'), NULL=0)
+        - code: .codes + .dictionary
+        - int/float: .data
+        """
+        return self._columns.get(name)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """List[Dict]로 복원"""
+        return [row.copy() for row in self]
+
+    def nbytes(self) -> int:
+        """컬럼 배열 추정 메모리 (bytes)"""
+        return sum(col.nbytes() for col in self._columns.values())
@@ -14,9 +14,24 @@ v3 아키텍처:
 - MAX(SEQ) 기반 마지막 작업 정보 계산
 - 기준일(base_date) 기반 시점 데이터 계산
 """
+import bisect
+import copy
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .columnar import ColumnarTable, day_to_yyyymmdd, yyyymmdd_to_day
+from .schedule_engine import SCHEDULE_ENGINE_ORACLE, ScheduleEngine
+from .snapshot_store import merge_snapshot
+
+# NumPy (선택): 예정 정보 계산(_build_schedule) 날짜 배열 연산, 미설치 시 일련번호 정수 연산
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +60,116 @@ WK_SAGO = 'F'       # 사고 (재발/유산)
 SAGO_JAEBAL = '020001'  # 재발
 SAGO_YUSAN = '020002'   # 유산
 
+# 다농장 일괄 로드: 농장 묶음 크기 (Oracle IN 목록 최대 1000개)
+BULK_CHUNK_SIZE = 200
+BULK_CHUNK_MAX = 1000
+
+# 날짜 정렬 인덱스 생성 최소 건수 (미만은 전체 스캔)
+DATE_INDEX_MIN_ROWS = 64
+
+# 컬럼형 저장 대상 (columnar=True) - 모돈별 이력성 대용량 테이블
+# modon은 가공 단계에서 행 값을 추가하므로 dict 유지
+COLUMNAR_KEYS = ('modon_wk', 'bunman', 'eu', 'sago', 'jadon_trans', 'gb')
+
+# 로드/가공 결과 속성 (재실행 캐시 export_state/restore_state 대상)
+LOADER_STATE_ATTRS = (
+    '_data', '_modon_last_wk', '_modon_calc_status', '_modon_last_gb_dt',
+    '_modon_index', '_modon_wk_index', '_modon_gb_dates', '_modon_last_eu', '_modon_last_bun_dt',
+)
+
+
+def _schedule_days(dates: List[str]) -> Any:
+    """기준일 문자열 리스트 → 날짜 배열 (_schedule_window 입력)
+
+    앞 8자리(YYYYMMDD)만 사용하며 숫자 8자리가 아니거나 없는 날짜(0230 등)는 제외(NaT/None).
+    NumPy 설치 시 datetime64[D] 배열, 미설치 시 일련번호 리스트 (고유 날짜당 1회 변환)
+    """
+    if HAS_NUMPY:
+        # 고유 날짜만 변환 후 원래 순서로 전개 (농장 내 같은 날짜 반복이 많음)
+        arr, inverse = np.unique(np.array(dates, dtype='U8'), return_inverse=True)  # 9자리 이상은 앞 8자리로 잘림
+        valid = (np.char.str_len(arr) == 8) & np.char.isdigit(arr)
+        ymd = np.zeros(len(arr), dtype=np.int64)
+        ymd[valid] = arr[valid].astype(np.int64)
+        year, month, day = ymd // 10000, ymd // 100 % 100, ymd % 100
+        valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+        month_start = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+        days = month_start.astype('datetime64[D]') + (day - 1)
+        # 월 일수 초과(20250230 등): 더한 결과가 다음 달로 넘어감
+        valid &= days.astype('datetime64[M]') == month_start
+        return np.where(valid, days, np.datetime64('NaT', 'D'))[inverse.reshape(-1)]
+
+    day_cache: Dict[str, Optional[int]] = {}
+    result = []
+    for dt_str in dates:
+        key = dt_str[:8] if dt_str and len(dt_str) >= 8 else ''
+        if key not in day_cache:
+            day_cache[key] = yyyymmdd_to_day(key)
+        result.append(day_cache[key])
+    return result
+
+
+def _schedule_window(days: Any, offset: int, sdt, edt) -> List[Tuple[int, str]]:
+    """기준일 + offset일이 금주 범위(sdt~edt)에 포함되는 행
+
+    Args:
+        days: _schedule_days 결과
+        offset: 기준일 이후 일수
+        sdt: 금주 시작일 (date)
+        edt: 금주 종료일 (date)
+
+    Returns:
+        [(행 번호, 예정일 YYYYMMDD), ...] 행 번호 순
+    """
+    if HAS_NUMPY:
+        expect = days + np.timedelta64(offset, 'D')
+        idx = np.flatnonzero((expect >= np.datetime64(sdt, 'D')) & (expect <= np.datetime64(edt, 'D')))
+        expect_dts = np.datetime_as_string(expect[idx], unit='D')
+        return [(int(i), dt.replace('-', '')) for i, dt in zip(idx, expect_dts)]
+
+    # 금주 범위를 기준일 범위로 역산하여 정수 비교만 수행
+    lo, hi = sdt.toordinal() - offset, edt.toordinal() - offset
+    return [(i, day_to_yyyymmdd(day + offset)) for i, day in enumerate(days)
+            if day is not None and lo <= day <= hi]
+
+
+class DateRangeIndex:
+    """날짜 정렬 인덱스 (bisect 기간 조회)
+
+    행 리스트의 날짜 필드를 YYYYMMDD 키로 1회 정규화/정렬해 두고
+    기간 조회를 O(log n + k)로 처리. 결과는 원본 리스트 순서를 유지.
+
+    exact: 모든 날짜 값이 8자리 문자열(정규화 무손실)인지 여부
+           False면 BaseProcessor.filter_by_period(전체 문자열 비교)는 전체 스캔 사용
+    """
+
+    def __init__(self, data: List[Dict], date_field: str):
+        self.data = data
+        self.size = len(data)
+        self.exact = True
+
+        pairs = []
+        for pos, row in enumerate(data):
+            value = row.get(date_field)
+            if not value:
+                continue
+            key = str(value)
+            if len(key) != 8:
+                self.exact = False
+            pairs.append((key[:8], pos))
+        pairs.sort()
+
+        self.keys = [k for k, _ in pairs]
+        self.positions = [p for _, p in pairs]
+
+    def range(self, dt_from: str, dt_to: str) -> List[Dict]:
+        """dt_from <= 날짜 <= dt_to 행 조회 (원본 순서)"""
+        lo = bisect.bisect_left(self.keys, dt_from)
+        hi = bisect.bisect_right(self.keys, dt_to)
+        if lo >= hi:
+            return []
+        data = self.data
+        return [data[p] for p in sorted(self.positions[lo:hi])]
+
 
 class FarmDataLoader:
     """농장별 원시 데이터 로더 (v3 - Oracle 함수 직접 호출)
@@ -72,7 +197,8 @@ class FarmDataLoader:
     """
 
     def __init__(self, conn, farm_no: int, dt_from: str, dt_to: str,
-                 locale: str = 'KOR', base_date: str = None):
+                 locale: str = 'KOR', base_date: str = None, columnar: bool = False,
+                 snapshot=None):
         """
         Args:
             conn: Oracle DB 연결 객체
@@ -81,6 +207,8 @@ class FarmDataLoader:
             dt_to: 종료일 (YYYYMMDD)
             locale: 로케일 (KOR, VNM 등)
             base_date: 기준일 (YYYYMMDD) - None이면 dt_to 사용
+            columnar: COLUMNAR_KEYS 테이블을 ColumnarTable로 저장 (메모리 절감)
+            snapshot: SnapshotStore (이력 테이블 증분 로드, None이면 전체 조회)
         """
         self.conn = conn
         self.farm_no = farm_no
@@ -88,17 +216,40 @@ class FarmDataLoader:
         self.dt_to = dt_to
         self.locale = locale
         self.base_date = base_date or dt_to  # 기준일 (기본: 종료일)
+        self.columnar = columnar
+        self.snapshot = snapshot
+        self._delta_since: Optional[datetime] = None  # 증분 조회 기준 시각 (이력 테이블 조회 시에만 설정)
         self.logger = logging.getLogger(f"{__name__}.Farm{farm_no}")
 
         # 캐시된 데이터
         self._data: Dict[str, Any] = {}
         self._loaded = False
 
+        # 로드 지표 {테이블/단계: {'ms', 'rows'}} (성능 지표 수집용)
+        self.load_stats: Dict[str, Dict[str, Any]] = {}
+
         # 가공된 데이터 캐시
         self._modon_last_wk: Dict[str, Dict] = {}  # MAX(SEQ) 기준 마지막 작업
         self._modon_calc_status: Dict[str, str] = {}  # 계산된 상태코드
         self._modon_last_gb_dt: Dict[str, str] = {}  # 마지막 교배일
 
+        # 모돈별 인덱스 (load 시 1회 생성, MODON_NO 문자열 키)
+        self._modon_index: Dict[str, Dict] = {}  # 모돈 정보
+        self._modon_wk_index: Dict[str, List[Dict]] = {}  # 작업이력 (SEQ 순)
+        self._modon_gb_dates: Dict[str, List[str]] = {}  # 교배일 목록 (정렬)
+        self._modon_last_eu: Dict[str, Tuple[str, Dict]] = {}  # 최근 이유 (이유일, 이유 행)
+        self._modon_last_bun_dt: Dict[str, str] = {}  # 최근 분만일 (TB_BUNMAN)
+
+        # 날짜 정렬 인덱스 캐시 {(self._data 키, date_field): DateRangeIndex} - 로드 테이블만 대상
+        self._date_indexes: Dict[Tuple[str, str], DateRangeIndex] = {}
+
+        # 작업예정 계산 엔진 (oracle/python/verify, get_schedule_engine에서 생성)
+        self.schedule_mode = SCHEDULE_ENGINE_ORACLE
+        self._schedule_engine: Optional[ScheduleEngine] = None
+
+        # 프로세서 SQL 집계 계산 모드 (oracle/python/verify, config.ini aggregate_engine)
+        self.aggregate_mode = SCHEDULE_ENGINE_ORACLE
+
     def load(self) -> Dict[str, Any]:
         """모든 원시 데이터 로드 및 Python 가공
 
@@ -127,6 +278,43 @@ class FarmDataLoader:
 
         self.logger.info(f"데이터 로드 시작: 농장={self.farm_no}, 기간={self.dt_from}~{self.dt_to}, 기준일={self.base_date}")
 
+        self._build_meta()
+
+        # ========================================
+        # 1단계: 원시 데이터 조회 (SQL - 1회만)
+        # ========================================
+        self._load_raw()
+
+        # ========================================
+        # 2단계: Python 가공 (Oracle 함수 결과 캐싱)
+        # ========================================
+        post_start = time.perf_counter()
+        self._post_process()
+        self.load_stats['post_process'] = {'ms': round((time.perf_counter() - post_start) * 1000, 1), 'rows': 0}
+
+        self._loaded = True
+        self.logger.info(f"데이터 로드 완료: 농장={self.farm_no}")
+
+        return self._data
+
+    def export_state(self) -> Dict[str, Any]:
+        """로드/가공 결과 (재실행 캐시 저장용)
+
+        원시 데이터와 가공 인덱스는 같은 행 객체를 공유하므로 한 번에 직렬화해야 공유가 유지됨
+        """
+        if not self._loaded:
+            self.load()
+        return {attr: getattr(self, attr) for attr in LOADER_STATE_ATTRS}
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """export_state() 결과로 로드 완료 상태 복원 (Oracle 조회 없음)"""
+        for attr in LOADER_STATE_ATTRS:
+            setattr(self, attr, state[attr])
+        self._date_indexes = {}
+        self._loaded = True
+
+    def _build_meta(self) -> None:
+        """메타 정보 (기간, 농장 등) 구성"""
         # 날짜 형식 변환 (YYYYMMDD → YYYY-MM-DD)
         sdt = f"{self.dt_from[:4]}-{self.dt_from[4:6]}-{self.dt_from[6:8]}"
         edt = f"{self.dt_to[:4]}-{self.dt_to[4:6]}-{self.dt_to[6:8]}"
@@ -154,23 +342,37 @@ class FarmDataLoader:
             'locale': self.locale,
         }
 
-        # ========================================
-        # 1단계: 원시 데이터 조회 (SQL - 1회만)
-        # ========================================
-        self._load_modon_raw()       # 모돈 기본 정보 (Oracle 함수 호출 없이)
-        self._load_modon_wk()        # 모돈 작업 이력 (전체)
-        self._load_bunman()
-        self._load_eu()
-        self._load_sago()
-        self._load_jadon_trans()
-        self._load_gb()
-        self._load_lpd()
-        self._load_etc_trade()       # TM_ETC_TRADE (내농장 단가 계산용)
-        self._load_farm_config()
+    def _load_raw(self) -> None:
+        """원시 데이터 조회 (SQL - 테이블당 1회)
 
-        # ========================================
-        # 2단계: Python 가공 (Oracle 함수 결과 캐싱)
-        # ========================================
+        FarmDataBulkLoader는 동일한 함수를 농장 묶음 조건으로 호출
+        """
+        self._run_loader('modon', self._load_modon_raw)       # 모돈 기본 정보 (Oracle 함수 호출 없이)
+        if self.snapshot is not None:
+            self._load_history_incremental()  # 이력 테이블 (스냅샷 + 변경분)
+        else:
+            for key, load_func in self._history_loaders().items():
+                self._run_loader(key, load_func)
+        self._run_loader('lpd', self._load_lpd)
+        self._run_loader('etc_trade', self._load_etc_trade)   # TM_ETC_TRADE (내농장 단가 계산용)
+        self._run_loader('farm_config', self._load_farm_config)
+
+    def _run_loader(self, name: str, load_func) -> None:
+        """테이블 로드 함수 실행 + 소요 시간/조회 건수 기록 (load_stats)"""
+        before = {key: id(value) for key, value in self._data.items()}
+        start = time.perf_counter()
+        load_func()
+        elapsed = (time.perf_counter() - start) * 1000
+        rows = sum(len(value) for key, value in self._data.items()
+                   if before.get(key) != id(value) and isinstance(value, (list, ColumnarTable)))
+        self.load_stats[name] = {'ms': round(elapsed, 1), 'rows': rows}
+
+    def _post_process(self) -> None:
+        """Python 가공 (원시 데이터 로드 후 실행)"""
+        if self.columnar:
+            self._to_columnar()
+
+        self._build_modon_index()           # 모돈별 인덱스 (이후 가공/조회 공용)
         self._calculate_last_wk()           # MAX(SEQ) 기반 마지막 작업
         self._calculate_modon_status()      # Oracle 함수 결과 캐시 저장
         self._calculate_last_gb_dt()        # 마지막 교배일 계산
@@ -181,10 +383,17 @@ class FarmDataLoader:
         self._data['modon_calc_status'] = self._modon_calc_status
         self._data['modon_last_gb_dt'] = self._modon_last_gb_dt
 
-        self._loaded = True
-        self.logger.info(f"데이터 로드 완료: 농장={self.farm_no}")
+    def _to_columnar(self) -> None:
+        """COLUMNAR_KEYS 테이블을 ColumnarTable로 변환
 
-        return self._data
+        행 뷰는 dict 조회 API를 그대로 제공하므로 프로세서 수정 불필요.
+        일반 조회는 _fetch_table에서 이미 ColumnarTable로 생성되므로
+        행 리스트로 남은 테이블(스냅샷 증분 병합 결과)만 변환
+        """
+        for key in COLUMNAR_KEYS:
+            rows = self._data.get(key)
+            if isinstance(rows, list):
+                self._data[key] = ColumnarTable.from_dicts(rows)
 
     def get_data(self) -> Dict[str, Any]:
         """로드된 데이터 반환 (로드 안됐으면 자동 로드)"""
@@ -202,6 +411,107 @@ class FarmDataLoader:
         finally:
             cursor.close()
 
+    def _fetch_table(self, key: str, sql: str, params: Optional[Dict] = None) -> Any:
+        """이력 테이블(COLUMNAR_KEYS) 조회
+
+        columnar 모드는 커서 튜플에서 ColumnarTable을 직접 생성 (행 딕셔너리를 만들지 않아
+        조회 중 최대 메모리도 절감). 스냅샷 증분 로드는 행 단위 병합/저장이 필요하므로 행 리스트로 조회
+        """
+        if not self.columnar or self.snapshot is not None or key not in COLUMNAR_KEYS:
+            return self._fetch_all(sql, params)
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(sql, params or {})
+            return ColumnarTable.from_cursor(cursor)
+        finally:
+            cursor.close()
+
+    def _farm_cond(self, column: str) -> str:
+        """농장 조건절 (단일 농장)
+
+        Args:
+            column: 농장번호 컬럼 (예: 'M.FARM_NO')
+        """
+        return f"{column} = :farm_no"
+
+    def _farm_params(self) -> Dict[str, Any]:
+        """농장 조건 바인드 변수"""
+        return {'farm_no': self.farm_no}
+
+    def _farm_list_sql(self) -> str:
+        """농장 목록 인라인 뷰 (FARM_NO 1컬럼)"""
+        return "SELECT :farm_no AS FARM_NO FROM DUAL"
+
+    def _use_cond(self, alias: str) -> str:
+        """이력 테이블 사용 행 조건
+
+        증분 조회 시에는 USE_YN 대신 변경 시각 조건 (USE_YN='N'으로 바뀐 행도 조회하여 스냅샷에서 제거)
+        """
+        if self._delta_since is None:
+            return f"{alias}.USE_YN = 'Y'"
+        return f"({alias}.LOG_INS_DT >= :delta_since OR {alias}.LOG_UPT_DT >= :delta_since)"
+
+    def _delta_params(self) -> Dict[str, Any]:
+        """증분 조회 바인드 변수"""
+        if self._delta_since is None:
+            return {}
+        return {'delta_since': self._delta_since}
+
+    def _history_loaders(self) -> Dict[str, Any]:
+        """2년치 이력 테이블 로드 함수 (스냅샷 증분 로드 대상, SNAPSHOT_TABLES 키)"""
+        return {
+            'modon_wk': self._load_modon_wk,        # 모돈 작업 이력 (전체)
+            'bunman': self._load_bunman,
+            'eu': self._load_eu,
+            'sago': self._load_sago,
+            'jadon_trans': self._load_jadon_trans,
+            'gb': self._load_gb,
+        }
+
+    def _load_history_incremental(self) -> None:
+        """이력 테이블 증분 로드 (SnapshotStore)
+
+        스냅샷이 유효하면 워터마크 이후 변경 행만 조회하여 병합, 아니면 전체 조회.
+        스냅샷 저장소 오류 시 해당 테이블은 전체 조회 결과 사용 (리포트 처리는 계속)
+        """
+        base_dt = datetime.strptime(self.base_date, '%Y%m%d')
+        two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')
+        db_now = self._fetch_all("SELECT SYSDATE AS NOW_DT FROM DUAL")[0]['NOW_DT']
+
+        delta_cnt = 0
+        full_keys = []
+        for key, load_func in self._history_loaders().items():
+            try:
+                state = self.snapshot.get(self.farm_no, key)
+                since = self.snapshot.delta_since(state, two_years_ago, db_now)
+            except Exception as e:
+                self.logger.warning(f"스냅샷 조회 실패, 전체 조회: {key} ({e})")
+                state, since = None, None
+
+            if since is None:
+                self._run_loader(key, load_func)
+                rows = self._data[key]
+                full_at = db_now
+                full_keys.append(key)
+            else:
+                self._delta_since = since
+                try:
+                    self._run_loader(key, load_func)
+                finally:
+                    self._delta_since = None
+                delta = self._data[key]
+                delta_cnt += len(delta)
+                rows = merge_snapshot(key, state['rows'], delta, two_years_ago)
+                self._data[key] = rows
+                full_at = state['full_at']
+
+            try:
+                self.snapshot.put(self.farm_no, key, rows, db_now, full_at, two_years_ago)
+            except Exception as e:
+                self.logger.warning(f"스냅샷 저장 실패: {key} ({e})")
+
+        self.logger.debug(f"이력 증분 로드: 변경 {delta_cnt}건, 전체 조회 {full_keys or '없음'}")
+
     # ========================================================================
     # 원시 데이터 로드 (SQL - 1회만 조회)
     # ========================================================================
@@ -229,12 +539,13 @@ class FarmDataLoader:
         base_dt = datetime.strptime(self.base_date, '%Y%m%d')
         two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')  # 약 2년
 
-        sql = """
+        sql = f"""
         SELECT M.PIG_NO AS MODON_NO, M.FARM_PIG_NO AS MODON_NM, M.FARM_NO,
                NVL(W.SANCHA, M.IN_SANCHA) AS SANCHA, M.IN_SANCHA,
                M.STATUS_CD, TO_CHAR(M.IN_DT, 'YYYYMMDD') AS IN_DT,
                TO_CHAR(M.OUT_DT, 'YYYYMMDD') AS OUT_DT, M.OUT_GUBUN_CD, M.OUT_REASON_CD,
                TO_CHAR(M.BIRTH_DT, 'YYYYMMDD') AS BIRTH_DT,
+               TO_CHAR(M.LAST_WK_DT, 'YYYYMMDD') AS LAST_WK_DT,
                NVL(W.GYOBAE_CNT, M.IN_GYOBAE_CNT) AS GB_SANCHA,
                NULL AS LAST_GB_DT, NULL AS LAST_BUN_DT,
                W.LOC_CD AS DONBANG_CD, NULL AS NOW_DONGHO, NULL AS NOW_BANGHO,
@@ -264,13 +575,13 @@ class FarmDataLoader:
               AND WK_DATE <= TO_DATE(:base_date, 'YYYYMMDD')
               AND WK_GUBUN <> 'Z'
         ) W ON M.FARM_NO = W.FARM_NO AND M.PIG_NO = W.PIG_NO AND W.RN = 1
-        WHERE M.FARM_NO = :farm_no
+        WHERE {self._farm_cond('M.FARM_NO')}
           AND M.USE_YN = 'Y'
           AND M.IN_DT <= TO_DATE(:base_date, 'YYYYMMDD')
           AND M.OUT_DT > TO_DATE(:two_years_ago, 'YYYYMMDD')
         """
         self._data['modon'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+            **self._farm_params(),
             'base_date': self.base_date,
             'two_years_ago': two_years_ago,
         })
@@ -296,7 +607,7 @@ class FarmDataLoader:
         base_dt = datetime.strptime(self.base_date, '%Y%m%d')
         two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')
 
-        sql = """
+        sql = f"""
         SELECT A.SEQ, A.PIG_NO AS MODON_NO, A.PIG_NO, A.FARM_NO, A.WK_DT,
                A.WK_GUBUN, A.SANCHA, A.GYOBAE_CNT,
                A.LOC_CD, A.SAGO_GUBUN_CD, A.DAERI_YN, A.USE_YN,
@@ -320,13 +631,14 @@ class FarmDataLoader:
         LEFT OUTER JOIN TB_MODON_WK C
             ON C.FARM_NO = A.FARM_NO AND C.PIG_NO = A.PIG_NO
            AND C.SEQ = A.SEQ + 1 AND C.USE_YN = 'Y'
-        WHERE A.FARM_NO = :farm_no
-          AND A.USE_YN = 'Y'
+        WHERE {self._farm_cond('A.FARM_NO')}
+          AND {self._use_cond('A')}
           AND A.WK_DT > :two_years_ago
         ORDER BY A.PIG_NO, A.SEQ
         """
-        self._data['modon_wk'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+        self._data['modon_wk'] = self._fetch_table('modon_wk', sql, {
+            **self._farm_params(),
+            **self._delta_params(),
             'two_years_ago': two_years_ago,
         })
         self.logger.debug(f"모돈 작업 이력 로드: {len(self._data['modon_wk'])}건 (2년전: {two_years_ago})")
@@ -343,7 +655,7 @@ class FarmDataLoader:
         base_dt = datetime.strptime(self.base_date, '%Y%m%d')
         two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')
 
-        sql = """
+        sql = f"""
         SELECT B.PIG_NO AS MODON_NO, B.FARM_NO, B.WK_DT AS BUN_DT,
                B.SILSAN, B.SASAN, B.MILA AS MUMMY,
                (B.SILSAN + B.SASAN + NVL(B.MILA, 0)) AS TOTAL_CNT,
@@ -351,13 +663,14 @@ class FarmDataLoader:
                CASE WHEN B.SILSAN > 0 THEN ROUND(B.SAENGSI_KG / B.SILSAN, 2) ELSE 0 END AS AVG_WT,
                B.USE_YN
         FROM TB_BUNMAN B
-        WHERE B.FARM_NO = :farm_no
-          AND B.USE_YN = 'Y'
+        WHERE {self._farm_cond('B.FARM_NO')}
+          AND {self._use_cond('B')}
           AND B.WK_DT > :two_years_ago
         ORDER BY B.PIG_NO, B.WK_DT
         """
-        self._data['bunman'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+        self._data['bunman'] = self._fetch_table('bunman', sql, {
+            **self._farm_params(),
+            **self._delta_params(),
             'two_years_ago': two_years_ago,
         })
         self.logger.debug(f"분만 로드: {len(self._data['bunman'])}건 (2년전: {two_years_ago})")
@@ -374,7 +687,7 @@ class FarmDataLoader:
         base_dt = datetime.strptime(self.base_date, '%Y%m%d')
         two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')
 
-        sql = """
+        sql = f"""
         SELECT E.PIG_NO AS MODON_NO, E.FARM_NO, E.WK_DT AS EU_DT,
                (NVL(E.DUSU, 0) + NVL(E.DUSU_SU, 0)) AS EU_CNT,
                E.TOTAL_KG AS EU_WT,
@@ -384,13 +697,14 @@ class FarmDataLoader:
                E.ILRYUNG AS POYU_DAYS,
                E.DAERI_YN, E.USE_YN
         FROM TB_EU E
-        WHERE E.FARM_NO = :farm_no
-          AND E.USE_YN = 'Y'
+        WHERE {self._farm_cond('E.FARM_NO')}
+          AND {self._use_cond('E')}
           AND E.WK_DT > :two_years_ago
         ORDER BY E.PIG_NO, E.WK_DT
         """
-        self._data['eu'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+        self._data['eu'] = self._fetch_table('eu', sql, {
+            **self._farm_params(),
+            **self._delta_params(),
             'two_years_ago': two_years_ago,
         })
         self.logger.debug(f"이유 로드: {len(self._data['eu'])}건 (2년전: {two_years_ago})")
@@ -406,17 +720,18 @@ class FarmDataLoader:
         base_dt = datetime.strptime(self.base_date, '%Y%m%d')
         two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')
 
-        sql = """
+        sql = f"""
         SELECT S.PIG_NO AS MODON_NO, S.FARM_NO, S.WK_DT AS SAGO_DT,
                S.SAGO_GUBUN_CD, S.BIGO AS MEMO, S.USE_YN
         FROM TB_SAGO S
-        WHERE S.FARM_NO = :farm_no
-          AND S.USE_YN = 'Y'
+        WHERE {self._farm_cond('S.FARM_NO')}
+          AND {self._use_cond('S')}
           AND S.WK_DT > :two_years_ago
         ORDER BY S.PIG_NO, S.WK_DT
         """
-        self._data['sago'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+        self._data['sago'] = self._fetch_table('sago', sql, {
+            **self._farm_params(),
+            **self._delta_params(),
             'two_years_ago': two_years_ago,
         })
         self.logger.debug(f"사고 로드: {len(self._data['sago'])}건 (2년전: {two_years_ago})")
@@ -435,19 +750,20 @@ class FarmDataLoader:
         base_dt = datetime.strptime(self.base_date, '%Y%m%d')
         two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')
 
-        sql = """
+        sql = f"""
         SELECT T.SEQ, T.PIG_NO AS MODON_NO, T.FARM_NO, TO_CHAR(T.WK_DT, 'YYYYMMDD') AS TRANS_DT,
                T.SANCHA, TO_CHAR(T.BUN_DT, 'YYYYMMDD') AS BUN_DT, T.GUBUN_CD AS TRANS_GUBUN_CD,
                (NVL(T.DUSU, 0) + NVL(T.DUSU_SU, 0)) AS TRANS_CNT,
                T.USE_YN
         FROM TB_MODON_JADON_TRANS T
-        WHERE T.FARM_NO = :farm_no
-          AND T.USE_YN = 'Y'
+        WHERE {self._farm_cond('T.FARM_NO')}
+          AND {self._use_cond('T')}
           AND T.WK_DT > TO_DATE(:two_years_ago, 'YYYYMMDD')
         ORDER BY T.PIG_NO, T.WK_DT, T.SEQ
         """
-        self._data['jadon_trans'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+        self._data['jadon_trans'] = self._fetch_table('jadon_trans', sql, {
+            **self._farm_params(),
+            **self._delta_params(),
             'two_years_ago': two_years_ago,
         })
         self.logger.debug(f"자돈 이동 로드: {len(self._data['jadon_trans'])}건 (2년전: {two_years_ago})")
@@ -464,18 +780,19 @@ class FarmDataLoader:
         base_dt = datetime.strptime(self.base_date, '%Y%m%d')
         two_years_ago = (base_dt - timedelta(days=730)).strftime('%Y%m%d')
 
-        sql = """
+        sql = f"""
         SELECT G.PIG_NO AS MODON_NO, G.FARM_NO, G.WK_DT AS GB_DT,
                G.METHOD_1, G.UNGDON_PIG_NO_1, G.UNGDON_PIG_NO_2, G.UNGDON_PIG_NO_3,
                G.USE_YN
         FROM TB_GYOBAE G
-        WHERE G.FARM_NO = :farm_no
-          AND G.USE_YN = 'Y'
+        WHERE {self._farm_cond('G.FARM_NO')}
+          AND {self._use_cond('G')}
           AND G.WK_DT > :two_years_ago
         ORDER BY G.PIG_NO, G.WK_DT
         """
-        self._data['gb'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+        self._data['gb'] = self._fetch_table('gb', sql, {
+            **self._farm_params(),
+            **self._delta_params(),
             'two_years_ago': two_years_ago,
         })
         self.logger.debug(f"교배 로드: {len(self._data['gb'])}건 (2년전: {two_years_ago})")
@@ -497,28 +814,33 @@ class FarmDataLoader:
         year_start = f"{self.dt_to[:4]}-01-01"
 
         # 1. 일별 요약 (지난주 7일) - Oracle SP DAILY CTE와 동일
-        sql_daily = """
-        WITH DATE_LIST AS (
+        # FARM_LIST x DATE_LIST: 다농장 일괄 조회 시에도 농장별 7행 보장
+        sql_daily = f"""
+        WITH FARM_LIST AS (
+            {self._farm_list_sql()}
+        ),
+        DATE_LIST AS (
             SELECT TO_DATE(:dt_from, 'YYYYMMDD') + LEVEL - 1 AS DT,
                    TO_CHAR(TO_DATE(:dt_from, 'YYYYMMDD') + LEVEL - 1, 'YYYY-MM-DD') AS DT_STR,
                    LEVEL AS DAY_NO
             FROM DUAL CONNECT BY LEVEL <= 7
         ),
         SHIP_DATA AS (
-            SELECT D.DAY_NO, D.DT, L.NET_KG, L.BACK_DEPTH,
+            SELECT L.FARM_NO, D.DAY_NO, D.DT, L.NET_KG, L.BACK_DEPTH,
                    L.MEAT_QUALITY, L.SEX_GUBUN
             FROM TM_LPD_DATA L
             JOIN DATE_LIST D ON L.DOCHUK_DT = D.DT_STR
-            WHERE L.FARM_NO = :farm_no AND L.USE_YN = 'Y'
+            WHERE {self._farm_cond('L.FARM_NO')} AND L.USE_YN = 'Y'
         )
-        SELECT D.DAY_NO, TO_CHAR(D.DT, 'YYYY-MM-DD') AS DT_STR, TO_CHAR(D.DT, 'MM.DD') AS DT_DISP,
+        SELECT F.FARM_NO, D.DAY_NO, TO_CHAR(D.DT, 'YYYY-MM-DD') AS DT_STR, TO_CHAR(D.DT, 'MM.DD') AS DT_DISP,
                NVL(S.CNT, 0) AS CNT,
                S.TOT_NET, S.AVG_NET, S.AVG_BACK,
                NVL(S.Q_11, 0) AS Q_11, NVL(S.Q_1, 0) AS Q_1, NVL(S.Q_2, 0) AS Q_2,
                NVL(S.FEMALE, 0) AS FEMALE, NVL(S.MALE, 0) AS MALE, NVL(S.ETC, 0) AS ETC
-        FROM DATE_LIST D
+        FROM FARM_LIST F
+        CROSS JOIN DATE_LIST D
         LEFT JOIN (
-            SELECT DAY_NO,
+            SELECT FARM_NO, DAY_NO,
                    COUNT(*) AS CNT,
                    SUM(NET_KG) AS TOT_NET,
                    ROUND(AVG(CASE WHEN NET_KG > 0 THEN NET_KG END), 1) AS AVG_NET,
@@ -530,28 +852,29 @@ class FarmDataLoader:
                    SUM(CASE WHEN SEX_GUBUN = '수' THEN 1 ELSE 0 END) AS MALE,
                    SUM(CASE WHEN SEX_GUBUN = '거세' OR SEX_GUBUN NOT IN ('암', '수') OR SEX_GUBUN IS NULL THEN 1 ELSE 0 END) AS ETC
             FROM SHIP_DATA
-            GROUP BY DAY_NO
-        ) S ON S.DAY_NO = D.DAY_NO
-        ORDER BY D.DAY_NO
+            GROUP BY FARM_NO, DAY_NO
+        ) S ON S.FARM_NO = F.FARM_NO AND S.DAY_NO = D.DAY_NO
+        ORDER BY F.FARM_NO, D.DAY_NO
         """
         self._data['lpd_daily'] = self._fetch_all(sql_daily, {
-            'farm_no': self.farm_no,
+            **self._farm_params(),
             'dt_from': self.dt_from,
         })
 
         # 2. 연간 누계 (1.1일 ~ dt_to)
-        sql_year = """
-        SELECT COUNT(*) AS CNT, ROUND(AVG(NET_KG), 1) AS AVG_NET
+        sql_year = f"""
+        SELECT FARM_NO, COUNT(*) AS CNT, ROUND(AVG(NET_KG), 1) AS AVG_NET
         FROM TM_LPD_DATA
-        WHERE FARM_NO = :farm_no AND USE_YN = 'Y'
+        WHERE {self._farm_cond('FARM_NO')} AND USE_YN = 'Y'
           AND DOCHUK_DT >= :year_start AND DOCHUK_DT <= :dt_to_str
+        GROUP BY FARM_NO
         """
         year_rows = self._fetch_all(sql_year, {
-            'farm_no': self.farm_no,
+            **self._farm_params(),
             'year_start': year_start,
             'dt_to_str': dt_to_str,
         })
-        self._data['lpd_year_stats'] = year_rows[0] if year_rows else {'CNT': 0, 'AVG_NET': 0}
+        self._data['lpd_year_stats'] = self._rows_to_data('lpd_year_stats', year_rows)
 
         # 호환성 유지
         self._data['lpd'] = []
@@ -560,7 +883,7 @@ class FarmDataLoader:
 
         self.logger.debug(
             f"LPD 로드: daily={len(self._data['lpd_daily'])}건, "
-            f"year_cnt={self._data['lpd_year_stats'].get('CNT', 0)}"
+            f"year={len(year_rows)}건"
         )
 
     def _load_etc_trade(self) -> None:
@@ -574,11 +897,11 @@ class FarmDataLoader:
 
         컬럼: FARM_NO, WK_DT, ACCOUNT_CD, TOTAL_PRICE, TOTAL_KG, USE_YN
         """
-        sql = """
+        sql = f"""
         SELECT T.SEQ, T.FARM_NO, TO_CHAR(T.WK_DT, 'YYYYMMDD') AS WK_DT,
                T.ACCOUNT_CD, T.TOTAL_PRICE, T.TOTAL_KG, T.USE_YN
         FROM TM_ETC_TRADE T
-        WHERE T.FARM_NO = :farm_no
+        WHERE {self._farm_cond('T.FARM_NO')}
           AND T.USE_YN = 'Y'
           AND T.WK_DT >= TO_DATE(:dt_from, 'YYYYMMDD')
           AND T.WK_DT < TO_DATE(:dt_to, 'YYYYMMDD') + 1
@@ -588,7 +911,7 @@ class FarmDataLoader:
         ORDER BY T.WK_DT
         """
         self._data['etc_trade'] = self._fetch_all(sql, {
-            'farm_no': self.farm_no,
+            **self._farm_params(),
             'dt_from': self.dt_from,
             'dt_to': self.dt_to
         })
@@ -596,32 +919,115 @@ class FarmDataLoader:
 
     def _load_farm_config(self) -> None:
         """농장 정보 로드"""
-        sql = """
+        sql = f"""
         SELECT F.FARM_NO, F.FARM_NM, F.PRINCIPAL_NM, F.SIGUN_CD,
                NVL(F.COUNTRY_CODE, 'KOR') AS LOCALE,
                F.USE_YN
         FROM TA_FARM F
-        WHERE F.FARM_NO = :farm_no
+        WHERE {self._farm_cond('F.FARM_NO')}
         """
-        farms = self._fetch_all(sql, {'farm_no': self.farm_no})
-        self._data['farm_config'] = farms[0] if farms else {}
+        farms = self._fetch_all(sql, self._farm_params())
+        self._data['farm_config'] = self._rows_to_data('farm_config', farms)
 
         # 농장 기본 설정값 로드 (TC_FARM_CONFIG)
-        sql = """
-        SELECT C.CODE, C.CVALUE
+        sql = f"""
+        SELECT C.FARM_NO, C.CODE, C.CVALUE
         FROM TC_FARM_CONFIG C
-        WHERE C.FARM_NO = :farm_no
+        WHERE {self._farm_cond('C.FARM_NO')}
           AND C.USE_YN = 'Y'
         """
-        settings = self._fetch_all(sql, {'farm_no': self.farm_no})
-        self._data['farm_settings'] = {s['CODE']: s['CVALUE'] for s in settings}
+        settings = self._fetch_all(sql, self._farm_params())
+        self._data['farm_settings'] = self._rows_to_data('farm_settings', settings)
 
         self.logger.debug(f"농장 설정 로드: {len(self._data['farm_settings'])}건")
 
+    def _rows_to_data(self, key: str, rows: List[Dict]) -> Any:
+        """조회 행을 _data 저장 형태로 변환
+
+        단건/매핑 형태로 저장하는 테이블만 변환하고 나머지는 행 리스트 그대로 반환.
+        다농장 일괄 로드(FarmDataBulkLoader)는 농장별 분할 후 이 함수로 동일하게 변환.
+
+        Args:
+            key: _data 키 (예: 'farm_config', 'farm_settings')
+            rows: 조회 행 리스트
+
+        Returns:
+            _data에 저장할 값
+        """
+        if key == 'farm_config':
+            return rows[0] if rows else {}
+        if key == 'farm_settings':
+            return {s['CODE']: s['CVALUE'] for s in rows}
+        if key == 'lpd_year_stats':
+            return rows[0] if rows else {'CNT': 0, 'AVG_NET': 0}
+        return rows
+
     # ========================================================================
     # Python 가공 함수 (Oracle View/Function 로직 대체)
     # ========================================================================
 
+    @staticmethod
+    def _column(rows: Any, name: str, default: Any = None) -> List[Any]:
+        """행 리스트/ColumnarTable의 컬럼 값 목록 (행 순서)
+
+        ColumnarTable은 행 뷰 조회 없이 컬럼 배열을 한 번에 디코딩 (전체 행 가공 루프용)
+        """
+        if isinstance(rows, ColumnarTable):
+            if rows.raw_column(name) is None:
+                return [default] * len(rows)
+            return rows.column(name)
+        return [row.get(name, default) for row in rows]
+
+    def _build_modon_index(self) -> None:
+        """모돈별 인덱스 생성 (MODON_NO 기준 해시 인덱스)
+
+        작업이력/이유/분만/교배일을 모돈 단위로 1회 묶어 두어
+        get_wk_by_modon, calculate_days_elapsed 등 모돈별 조회를 O(1)/O(log n)으로 처리.
+        프로세서(AccidentProcessor 등)도 동일 인덱스를 재사용
+        """
+        self._modon_index = {str(m.get('MODON_NO', '')): m for m in self._data.get('modon', [])}
+
+        # 작업이력: SQL이 PIG_NO, SEQ 순으로 정렬되어 있으므로 순서 유지
+        wk_index: Dict[str, List[Dict]] = {}
+        gb_dates: Dict[str, List[str]] = {}
+        modon_wk = self._data.get('modon_wk', [])
+        for wk, modon_no, wk_gubun, wk_dt in zip(
+                modon_wk,
+                map(str, self._column(modon_wk, 'MODON_NO', '')),
+                self._column(modon_wk, 'WK_GUBUN'),
+                self._column(modon_wk, 'WK_DT', '')):
+            wk_index.setdefault(modon_no, []).append(wk)
+            if wk_gubun == WK_GYOBAE:
+                wk_dt = str(wk_dt)
+                if modon_no and wk_dt:
+                    gb_dates.setdefault(modon_no, []).append(wk_dt)
+        for dates in gb_dates.values():
+            dates.sort()
+        self._modon_wk_index = wk_index
+        self._modon_gb_dates = gb_dates
+
+        # 최근 이유일
+        last_eu: Dict[str, Tuple[str, Dict]] = {}
+        eu_rows = self._data.get('eu', [])
+        for eu, modon_no, eu_dt in zip(eu_rows,
+                                       map(str, self._column(eu_rows, 'MODON_NO', '')),
+                                       map(str, self._column(eu_rows, 'EU_DT', ''))):
+            if modon_no and eu_dt:
+                if modon_no not in last_eu or eu_dt > last_eu[modon_no][0]:
+                    last_eu[modon_no] = (eu_dt, eu)
+        self._modon_last_eu = last_eu
+
+        # 최근 분만일
+        last_bun: Dict[str, str] = {}
+        bunman = self._data.get('bunman', [])
+        for modon_no, bun_dt in zip(map(str, self._column(bunman, 'MODON_NO', '')),
+                                    map(str, self._column(bunman, 'BUN_DT', ''))):
+            if modon_no and bun_dt and bun_dt > last_bun.get(modon_no, ''):
+                last_bun[modon_no] = bun_dt
+        self._modon_last_bun_dt = last_bun
+
+        self.logger.debug(f"모돈 인덱스 생성: 모돈={len(self._modon_index)}, 작업이력={len(wk_index)}")
+
     def _calculate_last_wk(self) -> None:
         """MAX(SEQ) 기반 모돈별 마지막 작업 계산
 
@@ -630,21 +1036,20 @@ class FarmDataLoader:
         - WK_DT <= base_date 조건
         """
         modon_wk = self._data.get('modon_wk', [])
+        last_seq: Dict[str, Any] = {}
 
-        for wk in modon_wk:
-            modon_no = str(wk.get('MODON_NO', ''))
-            wk_dt = str(wk.get('WK_DT', ''))
-            seq = wk.get('SEQ', 0)
-
+        for wk, modon_no, wk_dt, seq in zip(modon_wk,
+                                            map(str, self._column(modon_wk, 'MODON_NO', '')),
+                                            map(str, self._column(modon_wk, 'WK_DT', '')),
+                                            self._column(modon_wk, 'SEQ', 0)):
             # 기준일 이전 작업만
             if wk_dt > self.base_date:
                 continue
 
             # MAX(SEQ) 갱신
-            if modon_no not in self._modon_last_wk:
-                self._modon_last_wk[modon_no] = wk
-            elif seq > self._modon_last_wk[modon_no].get('SEQ', 0):
+            if modon_no not in last_seq or seq > last_seq[modon_no]:
                 self._modon_last_wk[modon_no] = wk
+                last_seq[modon_no] = seq
 
         self.logger.debug(f"마지막 작업 계산: {len(self._modon_last_wk)}건")
 
@@ -673,26 +1078,11 @@ class FarmDataLoader:
         - 각 작업일 기준 그 이전의 마지막 교배일(WK_GUBUN='G')
         - 경과일 계산에 사용
         """
-        modon_wk = self._data.get('modon_wk', [])
-
-        # 모돈별 교배 작업 수집
-        modon_gb_list: Dict[str, List[Tuple[str, str]]] = {}  # {modon_no: [(wk_dt, seq), ...]}
-
-        for wk in modon_wk:
-            if wk.get('WK_GUBUN') == WK_GYOBAE:
-                modon_no = str(wk.get('MODON_NO', ''))
-                wk_dt = str(wk.get('WK_DT', ''))
-                if modon_no and wk_dt and wk_dt <= self.base_date:
-                    if modon_no not in modon_gb_list:
-                        modon_gb_list[modon_no] = []
-                    modon_gb_list[modon_no].append((wk_dt, wk.get('SEQ', 0)))
-
-        # 모돈별 마지막 교배일 (기준일 이전)
-        for modon_no, gb_list in modon_gb_list.items():
-            if gb_list:
-                # 날짜순 정렬 후 마지막
-                gb_list.sort(key=lambda x: (x[0], x[1]))
-                self._modon_last_gb_dt[modon_no] = gb_list[-1][0]
+        # 모돈별 교배일 인덱스(정렬됨)에서 기준일 이전 마지막 교배일
+        for modon_no, gb_dates in self._modon_gb_dates.items():
+            pos = bisect.bisect_right(gb_dates, self.base_date)
+            if pos > 0:
+                self._modon_last_gb_dt[modon_no] = gb_dates[pos - 1]
 
         # modon 데이터에 마지막 교배일 추가
         for modon in self._data.get('modon', []):
@@ -710,6 +1100,115 @@ class FarmDataLoader:
         - 분만 예정: 교배 후 110-118일 경과한 임신돈
         - 이유 예정: 분만 후 21-28일 경과한 포유돈
         """
+        schedule = self._build_schedule()
+        self._data['schedule'] = schedule
+
+        total = sum(len(schedule[k]) for k in ('mating', 'farrowing', 'weaning', 'check'))
+        self.logger.debug(f"예정 정보 계산: {total}건")
+
+    def _build_schedule(self) -> Dict[str, Any]:
+        """예정 정보 계산 - 기준일 배열 일괄 연산
+
+        상태별 대상 모돈의 기준일(이유일/교배일/분만일)을 1회 순회로 모은 뒤
+        예정일(기준일 + 오프셋)과 금주 범위 판정을 배열 단위로 처리 (_schedule_window).
+        행 딕셔너리/예정일 문자열은 금주 범위에 포함된 모돈만 생성
+
+        Returns:
+            _build_schedule_loop()과 동일한 schedule 딕셔너리
+        """
+        # 금주 기간 계산 (리포트 기간 다음 주 월~일)
+        dt_to_obj = datetime.strptime(self.dt_to, '%Y%m%d')
+        this_monday = dt_to_obj + timedelta(days=1)
+        this_sunday = this_monday + timedelta(days=6)
+
+        modon_list = self._data.get('modon', [])
+        modon_eu_dict = self._modon_last_eu  # {modon_no: (eu_dt, eu_record)}
+
+        # 상태별 대상 모돈 + 기준일 문자열
+        eumo, eu_dts = [], []       # 이유모돈(010005): 최근 이유일
+        imsin, gb_dts = [], []      # 임신돈(010002): 마지막 교배일
+        poyu, bun_dts = [], []      # 포유돈(010003): 마지막 분만일
+        for modon in modon_list:
+            calc_status = modon.get('CALC_STATUS_CD', '')
+            if calc_status == STATUS_EUMO:
+                eu_info = modon_eu_dict.get(str(modon.get('MODON_NO', '')))
+                if eu_info:
+                    eumo.append(modon)
+                    eu_dts.append(eu_info[0])
+            elif calc_status == STATUS_IMSIN:
+                last_gb_dt = modon.get('CALC_LAST_GB_DT', '') or str(modon.get('LAST_GB_DT', '') or '')
+                if last_gb_dt:
+                    imsin.append(modon)
+                    gb_dts.append(last_gb_dt)
+            elif calc_status == STATUS_POYU:
+                poyu.append(modon)
+                bun_dts.append(str(modon.get('LAST_BUN_DT', '') or ''))
+
+        sdt, edt = this_monday.date(), this_sunday.date()
+        gb_days = _schedule_days(gb_dts)
+
+        # 교배 예정: 이유 후 5일 (4-7일 중간값)
+        mating_schedule = [
+            {**eumo[i], 'EU_DT': eu_dts[i], 'EXPECT_DT': expect_dt, 'SCHEDULE_CD': '150005'}
+            for i, expect_dt in _schedule_window(_schedule_days(eu_dts), 5, sdt, edt)
+        ]
+        # 임신검사 예정: 교배 후 25일 (21-28일)
+        check_schedule = [
+            {**imsin[i], 'EXPECT_DT': expect_dt, 'SCHEDULE_CD': '150004'}
+            for i, expect_dt in _schedule_window(gb_days, 25, sdt, edt)
+        ]
+        # 분만 예정: 교배 후 114일 (110-118일)
+        farrowing_schedule = [
+            {**imsin[i], 'EXPECT_DT': expect_dt, 'SCHEDULE_CD': '150001'}
+            for i, expect_dt in _schedule_window(gb_days, 114, sdt, edt)
+        ]
+        # 이유 예정: 분만 후 25일 (21-28일)
+        weaning_schedule = [
+            {**poyu[i], 'EXPECT_DT': expect_dt, 'SCHEDULE_CD': '150002'}
+            for i, expect_dt in _schedule_window(_schedule_days(bun_dts), 25, sdt, edt)
+        ]
+
+        return {
+            'this_sdt': this_monday.strftime('%Y-%m-%d'),
+            'this_edt': this_sunday.strftime('%Y-%m-%d'),
+            'mating': mating_schedule,
+            'farrowing': farrowing_schedule,
+            'weaning': weaning_schedule,
+            'check': check_schedule,
+        }
+
+    def verify_schedule_parity(self) -> List[str]:
+        """예정 정보 계산 검증 (_build_schedule vs _build_schedule_loop)
+
+        운영 데이터로 두 구현 결과를 비교할 때 사용
+
+        Returns:
+            불일치 내역 리스트 (빈 리스트면 일치)
+        """
+        if not self._loaded:
+            self.load()
+
+        fast = self._build_schedule()
+        loop = self._build_schedule_loop()
+
+        diffs = []
+        for key in ('this_sdt', 'this_edt'):
+            if fast[key] != loop[key]:
+                diffs.append(f"{key}: {fast[key]} != {loop[key]}")
+        for key in ('mating', 'farrowing', 'weaning', 'check'):
+            if fast[key] != loop[key]:
+                diffs.append(f"{key}: {len(fast[key])}건 != {len(loop[key])}건 (또는 내용 불일치)")
+
+        if diffs:
+            self.logger.warning(f"예정 정보 검증 불일치: 농장={self.farm_no}, {diffs}")
+        return diffs
+
+    def _build_schedule_loop(self) -> Dict[str, Any]:
+        """예정 정보 계산 - 기존 행 단위 구현 (검증 기준)
+
+        모돈마다 _add_days_to_date(strptime/strftime)를 호출하는 원래 방식.
+        verify_schedule_parity()에서 _build_schedule()과 결과 비교용으로 유지
+        """
         # 금주 기간 계산 (리포트 기간 다음 주 월~일)
         dt_to_obj = datetime.strptime(self.dt_to, '%Y%m%d')
         this_monday = dt_to_obj + timedelta(days=1)
@@ -719,16 +1218,9 @@ class FarmDataLoader:
         this_edt = this_sunday.strftime('%Y%m%d')
 
         modon_list = self._data.get('modon', [])
-        eu_list = self._data.get('eu', [])
 
-        # 모돈별 최근 이유일 조회
-        modon_eu_dict: Dict[str, Tuple[str, Dict]] = {}  # {modon_no: (eu_dt, eu_record)}
-        for eu in eu_list:
-            modon_no = str(eu.get('MODON_NO', ''))
-            eu_dt = str(eu.get('EU_DT', ''))
-            if modon_no and eu_dt:
-                if modon_no not in modon_eu_dict or eu_dt > modon_eu_dict[modon_no][0]:
-                    modon_eu_dict[modon_no] = (eu_dt, eu)
+        # 모돈별 최근 이유일 (인덱스)
+        modon_eu_dict = self._modon_last_eu  # {modon_no: (eu_dt, eu_record)}
 
         mating_schedule = []
         farrowing_schedule = []
@@ -785,7 +1277,7 @@ class FarmDataLoader:
                         'SCHEDULE_CD': '150002',
                     })
 
-        self._data['schedule'] = {
+        return {
             'this_sdt': this_monday.strftime('%Y-%m-%d'),
             'this_edt': this_sunday.strftime('%Y-%m-%d'),
             'mating': mating_schedule,
@@ -794,9 +1286,6 @@ class FarmDataLoader:
             'check': check_schedule,
         }
 
-        total = len(mating_schedule) + len(farrowing_schedule) + len(weaning_schedule) + len(check_schedule)
-        self.logger.debug(f"예정 정보 계산: {total}건")
-
     def _add_days_to_date(self, dt_str: str, days: int) -> str:
         """날짜에 일수 추가"""
         if not dt_str or len(dt_str) < 8:
@@ -816,7 +1305,7 @@ class FarmDataLoader:
         """모돈 정보를 MODON_NO 키로 딕셔너리 변환"""
         if 'modon' not in self._data:
             self.load()
-        return {str(m['MODON_NO']): m for m in self._data['modon']}
+        return dict(self._modon_index)
 
     def get_modon_by_status(self, status_cd: str) -> List[Dict]:
         """계산된 상태코드로 모돈 필터링
@@ -888,6 +1377,45 @@ class FarmDataLoader:
             self.load()
         return self._modon_last_gb_dt.get(str(modon_no), '')
 
+    def get_last_gb_dt_before(self, modon_no: str, dt: str) -> str:
+        """특정일 이전(미포함) 가장 최근 교배일 조회 (교배일 인덱스 이분 탐색)
+
+        Args:
+            modon_no: 모돈 번호
+            dt: 기준 날짜 (YYYYMMDD)
+
+        Returns:
+            교배일 (YYYYMMDD) 또는 빈 문자열
+        """
+        if not self._loaded:
+            self.load()
+        gb_dates = self._modon_gb_dates.get(str(modon_no))
+        if not gb_dates:
+            return ''
+        pos = bisect.bisect_left(gb_dates, dt)
+        return gb_dates[pos - 1] if pos > 0 else ''
+
+    def get_last_eu_dt(self, modon_no: str) -> str:
+        """모돈의 최근 이유일 조회
+
+        Returns:
+            이유일 (YYYYMMDD) 또는 빈 문자열
+        """
+        if not self._loaded:
+            self.load()
+        eu_info = self._modon_last_eu.get(str(modon_no))
+        return eu_info[0] if eu_info else ''
+
+    def get_last_bun_dt(self, modon_no: str) -> str:
+        """모돈의 최근 분만일 조회 (TB_BUNMAN 기준)
+
+        Returns:
+            분만일 (YYYYMMDD) 또는 빈 문자열
+        """
+        if not self._loaded:
+            self.load()
+        return self._modon_last_bun_dt.get(str(modon_no), '')
+
     def calculate_days_elapsed(self, modon_no: str, from_field: str = 'LAST_GB') -> int:
         """경과일 계산
 
@@ -906,19 +1434,13 @@ class FarmDataLoader:
 
         if from_field == 'LAST_GB':
             from_dt_str = self._modon_last_gb_dt.get(modon_no, '')
-        else:
-            modon = self.get_modon_dict().get(modon_no, {})
-            if from_field == 'LAST_BUN':
-                from_dt_str = str(modon.get('LAST_BUN_DT', '') or '')
-            else:  # EU
-                # 최근 이유일 조회
-                eu_list = [e for e in self._data.get('eu', [])
-                          if str(e.get('MODON_NO', '')) == modon_no]
-                if eu_list:
-                    eu_list.sort(key=lambda x: str(x.get('EU_DT', '')), reverse=True)
-                    from_dt_str = str(eu_list[0].get('EU_DT', ''))
-                else:
-                    from_dt_str = ''
+        elif from_field == 'LAST_BUN':
+            modon = self._modon_index.get(modon_no, {})
+            from_dt_str = str(modon.get('LAST_BUN_DT', '') or '')
+        else:  # EU
+            # 최근 이유일 (인덱스)
+            eu_info = self._modon_last_eu.get(modon_no)
+            from_dt_str = eu_info[0] if eu_info else ''
 
         if not from_dt_str or len(from_dt_str) < 8:
             return 0
@@ -945,11 +1467,43 @@ class FarmDataLoader:
         dt_from = dt_from or self.dt_from
         dt_to = dt_to or self.dt_to
 
+        index = self.date_index(data, date_field)
+        if index is not None:
+            return index.range(dt_from, dt_to)
+
         return [
             row for row in data
             if row.get(date_field) and dt_from <= str(row[date_field])[:8] <= dt_to
         ]
 
+    def date_index(self, data: List[Dict], date_field: str) -> Optional[DateRangeIndex]:
+        """날짜 정렬 인덱스 조회 (로드 테이블/필드별 1회 생성 후 캐시)
+
+        로드 테이블(self._data 값)의 주간/월간/연간 반복 기간 조회 시 정규화/정렬을 재사용.
+        프로세서 가공 리스트 등 다른 리스트는 캐시하지 않음 (임시 리스트 참조 유지/id 재사용 방지).
+        테이블 객체가 바뀌거나 건수가 달라지면 재생성
+
+        Args:
+            data: 행 리스트
+            date_field: 날짜 필드명
+
+        Returns:
+            DateRangeIndex, 로드 테이블이 아니거나 소량 데이터(DATE_INDEX_MIN_ROWS 미만)는 None (전체 스캔)
+        """
+        if len(data) < DATE_INDEX_MIN_ROWS:
+            return None
+
+        table_key = next((key for key, table in self._data.items() if table is data), None)
+        if table_key is None:
+            return None
+
+        cache_key = (table_key, date_field)
+        index = self._date_indexes.get(cache_key)
+        if index is None or index.data is not data or index.size != len(data):
+            index = DateRangeIndex(data, date_field)
+            self._date_indexes[cache_key] = index
+        return index
+
     def filter_by_wk_gubun(self, wk_gubun: str, dt_from: str = None,
                             dt_to: str = None) -> List[Dict]:
         """작업구분으로 modon_wk 필터링
@@ -1020,14 +1574,8 @@ class FarmDataLoader:
         if 'etc_trade' not in self._data:
             self.load()
 
-        dt_from = dt_from or self.dt_from
-        dt_to = dt_to or self.dt_to
-
         # 기간 필터링
-        filtered = [
-            row for row in self._data.get('etc_trade', [])
-            if row.get('WK_DT') and dt_from <= str(row['WK_DT'])[:8] <= dt_to
-        ]
+        filtered = self.filter_by_period(self._data.get('etc_trade', []), 'WK_DT', dt_from, dt_to)
 
         if not filtered:
             return 0
@@ -1071,6 +1619,26 @@ class FarmDataLoader:
         else:
             raise ValueError(f"Unknown agg_type: {agg_type}")
 
+    def set_schedule_mode(self, mode: str) -> None:
+        """작업예정 계산 모드 설정 (oracle/python/verify)"""
+        self.schedule_mode = mode
+
+    def set_aggregate_mode(self, mode: str) -> None:
+        """프로세서 SQL 집계 계산 모드 설정 (oracle/python/verify)"""
+        self.aggregate_mode = mode
+
+    def get_schedule_engine(self, conn) -> ScheduleEngine:
+        """작업예정 계산 엔진 (농장당 1회 생성, TB_PLAN_MODON 1회 조회)
+
+        Args:
+            conn: Oracle DB 연결 객체 (일괄 로드된 로더는 conn이 없으므로 프로세서 연결 사용)
+        """
+        if self._schedule_engine is None:
+            if not self._loaded:
+                self.load()
+            self._schedule_engine = ScheduleEngine.from_db(conn or self.conn, self)
+        return self._schedule_engine
+
     def get_wk_by_modon(self, modon_no: str, wk_gubun: str = None,
                          dt_from: str = None, dt_to: str = None) -> List[Dict]:
         """모돈별 작업이력 조회
@@ -1087,8 +1655,7 @@ class FarmDataLoader:
         if 'modon_wk' not in self._data:
             self.load()
 
-        data = [wk for wk in self._data['modon_wk']
-                if str(wk.get('MODON_NO', '')) == str(modon_no)]
+        data = self._modon_wk_index.get(str(modon_no), [])
 
         if wk_gubun:
             data = [wk for wk in data if wk.get('WK_GUBUN') == wk_gubun]
@@ -1097,3 +1664,155 @@ class FarmDataLoader:
             data = self.filter_by_period(data, 'WK_DT', dt_from, dt_to)
 
         return data
+
+
+class _FarmChunkLoader(FarmDataLoader):
+    """농장 묶음 원시 데이터 조회용 로더
+
+    FarmDataLoader의 _load_* SQL을 그대로 사용하되 농장 조건만
+    FARM_NO IN (:f0, :f1, ...)로 바꿔 테이블당 1회 조회.
+    조회 결과는 변환 없이 행 리스트로 보관 (농장별 분할은 FarmDataBulkLoader에서 수행)
+    """
+
+    def __init__(self, conn, farm_nos: List[int], dt_from: str, dt_to: str,
+                 base_date: str = None, columnar: bool = False):
+        super().__init__(conn, 0, dt_from, dt_to, base_date=base_date, columnar=columnar)
+        self.farm_nos = farm_nos
+        self.logger = logging.getLogger(f"{__name__}.Chunk")
+
+    def _farm_cond(self, column: str) -> str:
+        placeholders = ', '.join([f':f{i}' for i in range(len(self.farm_nos))])
+        return f"{column} IN ({placeholders})"
+
+    def _farm_params(self) -> Dict[str, Any]:
+        return {f'f{i}': f for i, f in enumerate(self.farm_nos)}
+
+    def _farm_list_sql(self) -> str:
+        return '\n            UNION ALL '.join(
+            [f"SELECT :f{i} AS FARM_NO FROM DUAL" for i in range(len(self.farm_nos))]
+        )
+
+    def _rows_to_data(self, key: str, rows: List[Dict]) -> Any:
+        return rows
+
+
+class FarmDataBulkLoader:
+    """다농장 일괄 데이터 로더
+
+    농장별 FarmDataLoader.load()는 농장당 SQL 약 13회를 실행하므로
+    전체 서비스 농장 처리 시 DB 왕복이 농장 수에 비례하여 증가.
+    농장 묶음(chunk) 단위로 테이블당 SQL 1회 조회 후 FARM_NO로 분할하여
+    농장별 FarmDataLoader(로드 완료 상태)를 생성. 프로세서는 기존과 동일하게 사용.
+
+    사용 예:
+        bulk = FarmDataBulkLoader(conn, farms, dt_from, dt_to)
+        for loaders in bulk.iter_chunks():
+            for farm_no, data_loader in loaders.items():
+                ...
+    """
+
+    def __init__(self, conn, farms: List[Dict], dt_from: str, dt_to: str,
+                 base_date: str = None, chunk_size: int = BULK_CHUNK_SIZE,
+                 columnar: bool = False):
+        """
+        Args:
+            conn: Oracle DB 연결 객체
+            farms: 대상 농장 리스트 (_get_target_farms 결과, FARM_NO/LOCALE)
+            dt_from: 시작일 (YYYYMMDD)
+            dt_to: 종료일 (YYYYMMDD)
+            base_date: 기준일 (YYYYMMDD) - None이면 dt_to 사용
+            chunk_size: 1회 조회 농장 수 (최대 1000)
+            columnar: 농장별 로더를 컬럼형 저장으로 생성
+        """
+        self.conn = conn
+        self.farms = farms
+        self.dt_from = dt_from
+        self.dt_to = dt_to
+        self.base_date = base_date
+        self.chunk_size = max(1, min(chunk_size, BULK_CHUNK_MAX))
+        self.columnar = columnar
+        self.logger = logging.getLogger(f"{__name__}.Bulk")
+
+    def iter_chunks(self) -> Iterator[Dict[int, FarmDataLoader]]:
+        """농장 묶음 단위로 로드하여 반환 (메모리 사용량 제한)
+
+        Yields:
+            {farm_no: FarmDataLoader} 딕셔너리 (묶음 단위)
+        """
+        for i in range(0, len(self.farms), self.chunk_size):
+            yield self.load_chunk(self.farms[i:i + self.chunk_size])
+
+    def load(self) -> Dict[int, FarmDataLoader]:
+        """전체 농장 로드
+
+        Returns:
+            {farm_no: FarmDataLoader} 딕셔너리
+        """
+        loaders: Dict[int, FarmDataLoader] = {}
+        for chunk_loaders in self.iter_chunks():
+            loaders.update(chunk_loaders)
+        return loaders
+
+    def load_chunk(self, farms: List[Dict]) -> Dict[int, FarmDataLoader]:
+        """농장 묶음 1개 로드
+
+        Args:
+            farms: 농장 리스트 (chunk_size 이하)
+
+        Returns:
+            {farm_no: FarmDataLoader} 딕셔너리
+        """
+        if not farms:
+            return {}
+
+        start_time = datetime.now()
+        farm_nos = [int(f['FARM_NO']) for f in farms]
+
+        # 1. 테이블당 1회 조회 (FARM_NO IN 조건)
+        chunk = _FarmChunkLoader(self.conn, farm_nos, self.dt_from, self.dt_to, self.base_date,
+                                 columnar=self.columnar)
+        chunk._load_raw()
+
+        # 2. 행 리스트(ColumnarTable)를 FARM_NO로 분할
+        grouped: Dict[str, Dict[int, Any]] = {}
+        for key, value in chunk._data.items():
+            if isinstance(value, ColumnarTable):
+                by_idx: Dict[int, List[int]] = {}
+                for i, farm_no in enumerate(value.column('FARM_NO')):
+                    by_idx.setdefault(int(farm_no), []).append(i)
+                grouped[key] = {farm_no: value.take(idx) for farm_no, idx in by_idx.items()}
+                continue
+            if not isinstance(value, list):
+                continue
+            by_farm: Dict[int, List[Dict]] = {}
+            for row in value:
+                by_farm.setdefault(int(row['FARM_NO']), []).append(row)
+            grouped[key] = by_farm
+
+        # 3. 농장별 FarmDataLoader 생성 + Python 가공 (load()와 동일한 2단계)
+        loaders: Dict[int, FarmDataLoader] = {}
+        for farm, farm_no in zip(farms, farm_nos):
+            loader = FarmDataLoader(
+                conn=None,  # 로드 완료 상태로 생성하므로 추가 조회 없음
+                farm_no=farm_no,
+                dt_from=self.dt_from,
+                dt_to=self.dt_to,
+                locale=farm.get('LOCALE') or 'KOR',
+                base_date=self.base_date,
+                columnar=self.columnar,
+            )
+            loader._build_meta()
+            for key, value in chunk._data.items():
+                if key in grouped:
+                    loader._data[key] = loader._rows_to_data(key, grouped[key].get(farm_no, []))
+                else:
+                    loader._data[key] = copy.deepcopy(value)
+            loader._post_process()
+            loader._loaded = True
+            loaders[farm_no] = loader
+
+        elapsed = (datetime.now() - start_time).total_seconds() * 1000
+        self.logger.info(f"다농장 일괄 로드 완료: {len(farm_nos)}개 농장 ({elapsed:.0f}ms)")
+
+        return loaders
+
@@ -16,23 +16,13 @@ import logging
 import hashlib
 import secrets
 import time
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any, Dict, Optional
 
 from ..common import now_kst
 from .data_loader import FarmDataLoader
-from .processors import (
-    ConfigProcessor,
-    ModonProcessor,
-    AlertProcessor,
-    MatingProcessor,
-    FarrowingProcessor,
-    WeaningProcessor,
-    AccidentProcessor,
-    CullingProcessor,
-    ShipmentProcessor,
-    ScheduleProcessor,
-)
+from .processor_graph import ProcessorGraph, prepare_shared, weekly_processor_nodes
+from .rerun_cache import load_with_cache
 
 logger = logging.getLogger(__name__)
 
@@ -43,18 +33,24 @@ class FarmProcessor:
     SP_INS_WEEK_FARM_PROCESS 프로시저의 Python 버전
     """
 
-    def __init__(self, conn, master_seq: int, farm_no: int, locale: str = 'KOR'):
+    def __init__(self, conn, master_seq: int, farm_no: int, locale: str = 'KOR', rerun_cache=None,
+                 processor_workers: int = 1):
         """
         Args:
             conn: Oracle DB 연결 객체
             master_seq: 마스터 시퀀스
             farm_no: 농장 번호
             locale: 로케일 (KOR, VNM 등)
+            rerun_cache: RerunCache (변경 없는 재실행은 데이터 로드 생략)
+            processor_workers: 프로세서 동시 실행 수 (1이면 순차, 같은 연결 + db_lock)
+                               2 이상은 스레드 간 공유 가능한 연결(연결 풀 threaded 연결)에서만 사용
         """
         self.conn = conn
         self.master_seq = master_seq
         self.farm_no = farm_no
         self.locale = locale
+        self.rerun_cache = rerun_cache
+        self.processor_workers = max(1, processor_workers)
         self.logger = logging.getLogger(f"{__name__}.Farm{farm_no}")
 
     def process(
@@ -93,57 +89,44 @@ class FarmProcessor:
                 dt_to=dt_to,
                 locale=self.locale,
             )
-            data_loader.load()
+            load_with_cache(self.rerun_cache, data_loader)
             self.logger.info(f"데이터 로드 완료: {self.farm_no}")
 
-            # 3. 각 프로세서 순차 실행 (data_loader 전달)
-            results = {}
-            farm_start_time = time.time()
-
-            # 프로세서 목록 정의
-            processors = [
-                ('ConfigProcessor', ConfigProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('AlertProcessor', AlertProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('ModonProcessor', ModonProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('MatingProcessor', MatingProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('FarrowingProcessor', FarrowingProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('WeaningProcessor', WeaningProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('AccidentProcessor', AccidentProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('CullingProcessor', CullingProcessor, {'dt_from': dt_from, 'dt_to': dt_to}),
-                ('ShipmentProcessor', ShipmentProcessor, {'dt_from': dt_from, 'dt_to': dt_to, 'national_price': national_price}),
-            ]
-
-            # 금주 예정용 날짜 범위
-            this_dt_from = (datetime.strptime(dt_to, '%Y%m%d') + timedelta(days=1)).strftime('%Y%m%d')
-            this_dt_to = (datetime.strptime(dt_to, '%Y%m%d') + timedelta(days=7)).strftime('%Y%m%d')
-            processors.append(
-                ('ScheduleProcessor', ScheduleProcessor, {'dt_from': this_dt_from, 'dt_to': this_dt_to})
-            )
+            # 3. 각 프로세서 실행 (data_loader 전달, processor_workers > 1 이면 실행 그래프로 동시 실행)
+            graph = ProcessorGraph(weekly_processor_nodes(dt_from, dt_to, national_price))
+            db_lock = prepare_shared(data_loader, self.conn) if self.processor_workers > 1 else None
+
+            def with_db_lock(func, *args) -> Any:
+                # 작업 로그 INSERT도 프로세서 스레드에서 실행되므로 같은 db_lock으로 직렬화
+                if db_lock is None:
+                    return func(*args)
+                with db_lock:
+                    return func(*args)
 
-            # 각 프로세서 실행 및 시간 측정
-            for proc_name, proc_class, proc_kwargs in processors:
+            def run_node(node) -> Dict[str, Any]:
+                proc_name = node.proc_class.PROC_NAME
                 proc_start = time.time()
                 try:
-                    proc = proc_class(
+                    proc = node.proc_class(
                         self.conn, self.master_seq, self.farm_no, self.locale,
-                        data_loader=data_loader
+                        data_loader=data_loader, db_lock=db_lock,
                     )
-                    result = proc.process(**proc_kwargs)
+                    result = proc.process(**node.kwargs)
                     elapsed_ms = int((time.time() - proc_start) * 1000)
 
-                    # 결과 저장
-                    result_key = proc_name.replace('Processor', '').lower()
-                    results[result_key] = result
-
                     # 정상 처리 로그 기록
-                    self._log_success(proc_name, elapsed_ms)
+                    with_db_lock(self._log_success, proc_name, elapsed_ms)
                     self.logger.debug(f"{proc_name} 완료: {elapsed_ms}ms")
+                    return result
 
                 except Exception as proc_error:
                     elapsed_ms = int((time.time() - proc_start) * 1000)
-                    self._log_processor_error(proc_name, str(proc_error), elapsed_ms)
+                    with_db_lock(self._log_processor_error, proc_name, str(proc_error), elapsed_ms)
                     raise  # 상위로 전파
 
+            # 결과 키: 노드 이름 (config, alert, ...)
+            results = graph.run(run_node, workers=self.processor_workers, stop_on_error=True)
+
             # 4. 상태 업데이트 (COMPLETE) + 공유 토큰 생성
             self._update_complete()
 
@@ -6,7 +6,7 @@
 - 3. 주간 리포트 생성
 
 v2 아키텍처:
-- 농장별 병렬 처리 (ThreadPoolExecutor)
+- 농장별 병렬 처리 (ThreadPoolExecutor, worker_mode=process 시 ProcessPoolExecutor)
 - 프로세서별 병렬 처리 (AsyncFarmProcessor)
 """
 import logging
@@ -17,6 +17,14 @@ from typing import List, Optional
 from ..common import Config, Database, setup_logger, now_kst
 from ..common.farm_service import SERVICE_FARM_SQL
 from ..collectors import WeatherCollector, ProductivityCollector
+from .pipeline import FarmPipeline
+from .schedule_engine import SCHEDULE_ENGINE_ORACLE
+from .telemetry import TelemetryWriter
+from .worker_pool import (
+    WORKER_MODE_PROCESS, WORKER_MODE_THREAD, WORKER_MODES,
+    bulk_load_farms, create_process_pool, farm_options, process_farm,
+    rerun_cache, resolve_farm_workers, split_farm_batches, submit_farm_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,10 +58,17 @@ class WeeklyReportOrchestrator:
     3. 주간 리포트 생성 (DB 집계)
     """
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Optional[Config] = None, profile: bool = False):
+        """
+        Args:
+            config: 설정 (None이면 config.ini 로드)
+            profile: 농장별 성능 지표 수집 (run_etl.py --profile, 설정 telemetry=N이어도 수집)
+        """
         self.config = config or Config()
         self.db = Database(self.config)
         self.logger = setup_logger("weekly_orchestrator", self.config.logging.get('log_path'))
+        self.profile = profile
+        self.telemetry_files: List[str] = []  # 이번 실행에서 저장한 성능 지표 파일
 
     def _check_schedule_enabled(self) -> bool:
         """시스템 스케줄 실행 여부 확인
@@ -428,6 +443,8 @@ class WeeklyReportOrchestrator:
         from .farm_processor import FarmProcessor
 
         self.logger.info(f"Python ETL 실행: {year}년 {week_no}주, 기간={dt_from}~{dt_to}")
+        # 재실행 캐시: --test --init-week 재실행만 적용
+        cache = self._rerun_cache() if test_mode and init_week else None
         if exclude_farms:
             self.logger.info(f"제외 농장: {exclude_farms}")
 
@@ -471,7 +488,7 @@ class WeeklyReportOrchestrator:
 
                     self.logger.info(f"[{i}/{target_cnt}] 농장 {farm_no} 처리 중...")
 
-                    processor = FarmProcessor(conn, master_seq, farm_no, locale)
+                    processor = FarmProcessor(conn, master_seq, farm_no, locale, rerun_cache=cache)
                     result = processor.process(dt_from, dt_to, national_price=national_price)
 
                     if result['status'] == 'success':
@@ -534,27 +551,64 @@ class WeeklyReportOrchestrator:
         Returns:
             처리 결과 딕셔너리
         """
-        from .async_processor import AsyncFarmProcessor
-
         self.logger.info(f"Python ETL (비동기) 실행: {year}년 {week_no}주, 기간={dt_from}~{dt_to}")
         if exclude_farms:
             self.logger.info(f"제외 농장: {exclude_farms}")
 
         # 설정에서 병렬 처리 설정 가져오기
-        max_farm_workers = self.config.processing.get('max_farm_workers', 4)
-
-        self.logger.info(f"  농장 병렬 처리: {max_farm_workers}개")
+        options = farm_options(self.config.processing)
+        # 재실행 캐시: --test --init-week 재실행만 적용
+        options['rerun_cache'] = options['rerun_cache'] and test_mode and init_week
+        options['telemetry'] = options['telemetry'] or self.profile
+        worker_mode = self.config.processing.get('worker_mode', WORKER_MODE_THREAD)
+        if worker_mode not in WORKER_MODES:
+            self.logger.warning(f"알 수 없는 worker_mode 설정: {worker_mode}, thread 사용")
+            worker_mode = WORKER_MODE_THREAD
+        max_farm_workers = resolve_farm_workers(worker_mode, self.config.processing.get('max_farm_workers', 4))
+        bulk_load_size = options['bulk_load_size']
+        pipeline = self.config.processing.get('pipeline', 'N') == 'Y'
+        if pipeline and worker_mode != WORKER_MODE_THREAD:
+            self.logger.warning("pipeline은 worker_mode=thread에서만 사용, 미사용으로 진행")
+            pipeline = False
+        pipeline_loaders = self.config.processing.get('pipeline_loaders', 2)
+        pipeline_writers = self.config.processing.get('pipeline_writers', 2)
+        pipeline_queue = self.config.processing.get('pipeline_queue', 4)
+
+        self.logger.info(f"  농장 병렬 처리: {max_farm_workers}개 ({worker_mode})")
+        if pipeline:
+            self.logger.info(f"  파이프라인: 적재 {pipeline_loaders} / 계산 {max_farm_workers} / 저장 {pipeline_writers}, 큐 {pipeline_queue}")
+        if bulk_load_size > 0:
+            self.logger.info(f"  다농장 일괄 로드: {bulk_load_size}개 단위")
+        if options['columnar']:
+            self.logger.info("  컬럼형 데이터 저장: 사용")
+        if options['schedule_engine'] != SCHEDULE_ENGINE_ORACLE:
+            self.logger.info(f"  작업예정 계산: {options['schedule_engine']} (verify 비율 {options['schedule_verify_sample']}%)")
+        if options['aggregate_engine'] != SCHEDULE_ENGINE_ORACLE:
+            self.logger.info(f"  SQL 집계 계산: {options['aggregate_engine']} (verify 비율 {options['aggregate_verify_sample']}%)")
+        self.logger.info(f"  SUB 일괄 저장: {options['sub_flush']}")
+        if options['rerun_cache']:
+            self.logger.info("  재실행 캐시: 사용")
+        if options['telemetry']:
+            self.logger.info(f"  성능 지표: {self.config.processing.get('telemetry_path', './logs/telemetry')}")
 
         # 연결 풀 생성 (농장별 독립 연결 제공)
         # pool_max는 max_farm_workers + 2로 설정 → 동시 사용 연결 수 제한
         # 농장 수가 많아도 동시에 사용하는 연결은 max_farm_workers개로 제한됨
-        pool_db = Database(self.config, use_pool=True, pool_min=2, pool_max=max_farm_workers + 2)
+        # process 모드: 워커 프로세스별 연결 풀 사용 (부모 풀 미생성)
+        pool_db = None
+        # pipeline: 적재/계산/저장 단계 연결 + 저장 대기 농장 연결
+        if pipeline:
+            budget = FarmPipeline.connection_budget(pipeline_loaders, max_farm_workers, pipeline_writers, pipeline_queue)
+            pool_db = Database(self.config, use_pool=True, pool_min=2, pool_max=budget + 2)
+        elif worker_mode == WORKER_MODE_THREAD:
+            pool_db = Database(self.config, use_pool=True, pool_min=2, pool_max=max_farm_workers + 2)
 
         target_cnt = 0
         complete_cnt = 0
         error_cnt = 0
         farm_results = []
         master_seq = None
+        telemetry_writer = None
 
         try:
             with self.db.get_connection() as conn:
@@ -588,66 +642,95 @@ class WeeklyReportOrchestrator:
                 finally:
                     cursor.close()
 
-            # 6. 농장별 병렬 처리 (각 농장은 연결 풀에서 독립 연결 획득)
-            def process_single_farm(farm: dict) -> dict:
-                """단일 농장 처리 (풀에서 독립 연결 획득)"""
-                farm_no = farm['FARM_NO']
-                locale = farm.get('LOCALE', 'KOR')
+            if options['telemetry']:
+                telemetry_writer = self._open_telemetry(f"weekly_{year}W{week_no:02d}_{master_seq}")
 
-                try:
-                    # 연결 풀에서 독립 연결 획득 (thread-safe)
-                    with pool_db.get_connection() as farm_conn:
-                        processor = AsyncFarmProcessor(
-                            farm_conn,
-                            master_seq,
-                            farm_no,
-                            locale,
-                        )
-                        result = processor.process(dt_from, dt_to, national_price=national_price)
-                        farm_conn.commit()
-                        return result
-                except Exception as e:
-                    self.logger.error(f"농장 {farm_no} 처리 오류: {e}", exc_info=True)
-                    return {
-                        'farm_no': farm_no,
-                        'status': 'error',
-                        'error': str(e),
-                    }
-
-            # ThreadPoolExecutor로 농장별 병렬 처리
-            self.logger.info(f"농장별 병렬 처리 시작 (workers={max_farm_workers})")
-
-            with ThreadPoolExecutor(max_workers=max_farm_workers) as executor:
-                # 모든 농장에 대해 비동기 작업 제출
-                future_to_farm = {
-                    executor.submit(process_single_farm, farm): farm
-                    for farm in farms
-                }
-
-                # 완료된 작업 수집
-                for future in as_completed(future_to_farm):
-                    farm = future_to_farm[future]
-                    farm_no = farm['FARM_NO']
+            # 6. 농장별 병렬 처리 (각 농장은 연결 풀에서 독립 연결 획득)
+            def record_result(farm_no, result: dict) -> None:
+                """농장 결과 집계"""
+                nonlocal complete_cnt, error_cnt
+                if telemetry_writer is not None:
+                    self._write_telemetry(telemetry_writer, result, master_seq, year, week_no)
+                    result.pop('telemetry', None)
+                farm_results.append(result)
+                if result.get('status') == 'success':
+                    complete_cnt += 1
+                    self.logger.info(f"농장 {farm_no} 완료")
+                else:
+                    error_cnt += 1
+                    self.logger.warning(f"농장 {farm_no} 오류: {result.get('error', 'unknown')}")
+
+            def record_exception(farm_no, e: Exception) -> None:
+                """농장 처리 예외 집계"""
+                nonlocal error_cnt
+                error_cnt += 1
+                self.logger.error(f"농장 {farm_no} 처리 예외: {e}")
+                farm_results.append({
+                    'farm_no': farm_no,
+                    'status': 'error',
+                    'error': str(e),
+                })
 
-                    try:
-                        result = future.result()
-                        farm_results.append(result)
+            self.logger.info(f"농장별 병렬 처리 시작 (workers={max_farm_workers}, mode={worker_mode})")
 
-                        if result.get('status') == 'success':
-                            complete_cnt += 1
-                            self.logger.info(f"농장 {farm_no} 완료")
-                        else:
-                            error_cnt += 1
-                            self.logger.warning(f"농장 {farm_no} 오류: {result.get('error', 'unknown')}")
+            if worker_mode == WORKER_MODE_PROCESS:
+                # ProcessPoolExecutor: 워커 프로세스별 연결 풀, 농장 묶음 단위 제출
+                batches = split_farm_batches(farms, max_farm_workers, bulk_load_size)
+                with create_process_pool(max_farm_workers, options) as executor:
+                    future_to_batch = {
+                        submit_farm_batch(executor, master_seq, batch, dt_from, dt_to, national_price): batch
+                        for batch in batches
+                    }
+                    for future in as_completed(future_to_batch):
+                        batch = future_to_batch[future]
+                        try:
+                            for result in future.result():
+                                record_result(result.get('farm_no'), result)
+                        except Exception as e:
+                            # 워커 프로세스 비정상 종료 등 → 묶음 전체 오류 처리
+                            for farm in batch:
+                                record_exception(farm['FARM_NO'], e)
+
+                worker_pids = {r['worker_pid'] for r in farm_results if 'worker_pid' in r}
+                self.logger.info(f"워커 프로세스 {len(worker_pids)}개 사용, 작업 묶음 {len(batches)}개")
+            elif pipeline:
+                # 적재 → 계산 → 저장 단계별 스레드 (단계 사이 크기 제한 큐)
+                FarmPipeline(
+                    pool_db, master_seq, dt_from, dt_to, national_price, options,
+                    loaders=pipeline_loaders,
+                    computes=max_farm_workers,
+                    writers=pipeline_writers,
+                    queue_size=pipeline_queue,
+                ).run(farms, record_result)
+            else:
+                # ThreadPoolExecutor: 부모 연결 풀 공유
+                # 일괄 로드 사용 시 묶음 단위로 사전 로드 → 농장 처리 시 DB 조회 생략
+                preloaded = {}
+
+                if bulk_load_size > 0:
+                    farm_chunks = [farms[i:i + bulk_load_size] for i in range(0, len(farms), bulk_load_size)]
+                else:
+                    farm_chunks = [farms]
+
+                with ThreadPoolExecutor(max_workers=max_farm_workers) as executor:
+                    for chunk_farms in farm_chunks:
+                        if bulk_load_size > 0:
+                            preloaded.update(bulk_load_farms(pool_db, chunk_farms, dt_from, dt_to, options['columnar']))
+
+                        # 농장별 비동기 작업 제출
+                        future_to_farm = {
+                            executor.submit(process_farm, pool_db, master_seq, farm, dt_from, dt_to,
+                                            national_price, options, preloaded.pop(farm['FARM_NO'], None)): farm
+                            for farm in chunk_farms
+                        }
 
-                    except Exception as e:
-                        error_cnt += 1
-                        self.logger.error(f"농장 {farm_no} 처리 예외: {e}")
-                        farm_results.append({
-                            'farm_no': farm_no,
-                            'status': 'error',
-                            'error': str(e),
-                        })
+                        # 완료된 작업 수집
+                        for future in as_completed(future_to_farm):
+                            farm_no = future_to_farm[future]['FARM_NO']
+                            try:
+                                record_result(farm_no, future.result())
+                            except Exception as e:
+                                record_exception(farm_no, e)
 
             # 7. 마스터 상태 업데이트
             with self.db.get_connection() as conn:
@@ -671,9 +754,35 @@ class WeeklyReportOrchestrator:
             }
 
         finally:
+            if telemetry_writer is not None:
+                telemetry_writer.close()
+                self.logger.info(f"성능 지표 저장: {telemetry_writer.path} ({telemetry_writer.count}건)")
             # 장애 발생 시에도 연결 풀 반드시 종료
-            pool_db.close()
-            self.logger.info("연결 풀 종료")
+            if pool_db is not None:
+                pool_db.close()
+                self.logger.info("연결 풀 종료")
+
+    def _open_telemetry(self, run_name: str) -> Optional[TelemetryWriter]:
+        """성능 지표 파일 생성 (실패 시 None → 지표 저장 없이 진행)"""
+        try:
+            writer = TelemetryWriter(self.config.processing.get('telemetry_path', './logs/telemetry'), run_name)
+        except OSError as e:
+            self.logger.warning(f"성능 지표 파일 생성 실패: {e}")
+            return None
+        self.telemetry_files.append(writer.path)
+        return writer
+
+    def _write_telemetry(self, writer: TelemetryWriter, result: dict,
+                         master_seq: int, year: int, week_no: int) -> None:
+        """농장 성능 지표 1건 저장 (저장 실패는 리포트 처리에 영향 없음)"""
+        try:
+            writer.write(result, master_seq=master_seq, year=year, week_no=week_no)
+        except Exception as e:
+            self.logger.warning(f"성능 지표 저장 실패: 농장={result.get('farm_no')} ({e})")
+
+    def _rerun_cache(self):
+        """농장 데이터 재실행 캐시 (rerun_cache=N이면 None)"""
+        return rerun_cache(farm_options(self.config.processing))
 
     def _get_national_price(self, cursor, dt_from: str, dt_to: str) -> int:
         """전국 탕박 평균 단가 계산"""
@@ -1348,6 +1457,7 @@ class WeeklyReportOrchestrator:
                     cursor.close()
 
             # 6. FarmProcessor로 처리
+            # self.db 단일 연결은 threaded 연결이 아니므로 프로세서는 순차 실행 (max_processor_workers 미적용)
             from .farm_processor import FarmProcessor
 
             with self.db.get_connection() as conn:
@@ -1356,6 +1466,7 @@ class WeeklyReportOrchestrator:
                     master_seq=master_seq,
                     farm_no=farm_no,
                     locale=farm_info['LOCALE'],
+                    rerun_cache=self._rerun_cache(),
                 )
                 result = processor.process(
                     dt_from=dt_from,
@@ -0,0 +1,261 @@
+"""
+농장 처리 파이프라인 (적재 → 계산 → 저장)
+- 농장 처리를 3단계로 나누어 단계별 스레드 수를 따로 두고, 단계 사이는 크기 제한 큐로 연결
+- 적재(load): FarmDataLoader로 다음 농장들의 원시 데이터 선조회 (Oracle 조회)
+- 계산(compute): 기존 데이터 삭제 → 프로세서 실행 (Python 집계, SUB 행은 버퍼에 보관)
+- 저장(write): SUB 일괄 저장 + COMPLETE/ERROR 상태 갱신 + 커밋 후 연결 반환
+  → 계산 스레드가 집계하는 동안 적재/저장 스레드가 Oracle 작업을 진행
+
+큐가 가득 차면 앞 단계가 대기 (선조회 농장 수/대기 연결 수 제한)
+농장 연결은 계산 단계에서 획득하여 저장 단계에서 반환 (같은 트랜잭션 유지)
+"""
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from ..common import Database
+from .schedule_engine import resolve_engine_mode
+from .sub_writer import SUB_FLUSH_FARM, SUB_FLUSH_PROCESSOR
+from .telemetry import FarmTelemetry
+from .rerun_cache import load_with_cache
+from .worker_pool import bulk_load_farms, rerun_cache, snapshot_store
+
+logger = logging.getLogger(__name__)
+
+
+class FarmPipeline:
+    """농장 처리 파이프라인
+
+    사용 예:
+        pipeline = FarmPipeline(pool_db, master_seq, dt_from, dt_to, national_price, options,
+                                loaders=2, computes=4, writers=2, queue_size=4)
+        pipeline.run(farms, on_result=lambda farm_no, result: ...)
+    """
+
+    def __init__(self, pool_db: Database, master_seq: int, dt_from: str, dt_to: str,
+                 national_price: int, options: Dict[str, Any],
+                 loaders: int = 2, computes: int = 4, writers: int = 2, queue_size: int = 4):
+        """
+        Args:
+            pool_db: 연결 풀 Database (pool_max >= connection_budget())
+            master_seq: 마스터 시퀀스
+            dt_from: 시작일
+            dt_to: 종료일
+            national_price: 전국 탕박 평균 단가
+            options: worker_pool.farm_options() 결과
+            loaders: 적재 스레드 수
+            computes: 계산 스레드 수
+            writers: 저장 스레드 수
+            queue_size: 단계 사이 큐 크기 (선조회/저장 대기 농장 수)
+        """
+        self.pool_db = pool_db
+        self.master_seq = master_seq
+        self.dt_from = dt_from
+        self.dt_to = dt_to
+        self.national_price = national_price
+        self.options = options
+        self.loaders = max(1, loaders)
+        self.computes = max(1, computes)
+        self.writers = max(1, writers)
+        self.queue_size = max(1, queue_size)
+
+        # SUB 저장은 저장 단계에서 수행 (processor → farm, off는 건별 INSERT 유지)
+        self.sub_flush = SUB_FLUSH_FARM if options['sub_flush'] == SUB_FLUSH_PROCESSOR else options['sub_flush']
+
+        self.snapshot = snapshot_store(options)
+        self.rerun_cache = rerun_cache(options)
+
+        self._result_lock = threading.Lock()
+
+    @staticmethod
+    def connection_budget(loaders: int, computes: int, writers: int, queue_size: int) -> int:
+        """동시 사용 최대 연결 수 (적재 + 계산 + 저장 대기 + 저장)"""
+        return loaders + computes + queue_size + writers
+
+    def run(self, farms: List[Dict[str, Any]], on_result: Callable[[int, Dict[str, Any]], None]) -> None:
+        """파이프라인 실행 (모든 농장 저장 완료 시 반환)
+
+        Args:
+            farms: 농장 정보 리스트
+            on_result: 농장 결과 콜백 (farm_no, result) - 저장 스레드에서 잠금 후 호출
+        """
+        bulk_load_size = self.options['bulk_load_size']
+        units = queue.Queue()
+        if bulk_load_size > 0:
+            for i in range(0, len(farms), bulk_load_size):
+                units.put(farms[i:i + bulk_load_size])
+        else:
+            for farm in farms:
+                units.put([farm])
+
+        load_q = queue.Queue(maxsize=self.queue_size)
+        write_q = queue.Queue(maxsize=self.queue_size)
+
+        loader_threads = self._start(self.loaders, 'load', self._load_stage, units, load_q)
+        compute_threads = self._start(self.computes, 'compute', self._compute_stage, load_q, write_q)
+        writer_threads = self._start(self.writers, 'write', self._write_stage, write_q, on_result)
+
+        # 앞 단계 종료 후 다음 단계에 종료 신호 전달
+        for _ in loader_threads:
+            units.put(None)
+        self._join(loader_threads)
+        for _ in compute_threads:
+            load_q.put(None)
+        self._join(compute_threads)
+        for _ in writer_threads:
+            write_q.put(None)
+        self._join(writer_threads)
+
+    @staticmethod
+    def _start(count: int, name: str, target: Callable, *args) -> List[threading.Thread]:
+        threads = []
+        for i in range(count):
+            t = threading.Thread(target=target, args=args, name=f"farm-{name}-{i}", daemon=True)
+            t.start()
+            threads.append(t)
+        return threads
+
+    @staticmethod
+    def _join(threads: List[threading.Thread]) -> None:
+        for t in threads:
+            t.join()
+
+    def _load_farm(self, farm: Dict[str, Any]):
+        """농장 1개 데이터 적재 (독립 연결)"""
+        from .data_loader import FarmDataLoader
+
+        with self.pool_db.get_connection() as conn:
+            data_loader = FarmDataLoader(
+                conn=conn,
+                farm_no=farm['FARM_NO'],
+                dt_from=self.dt_from,
+                dt_to=self.dt_to,
+                locale=farm.get('LOCALE', 'KOR'),
+                columnar=self.options['columnar'],
+                snapshot=self.snapshot,
+            )
+            return load_with_cache(self.rerun_cache, data_loader)
+
+    def _load_stage(self, units: queue.Queue, load_q: queue.Queue) -> None:
+        """적재 단계: 농장(묶음) 데이터 선조회 → 계산 큐"""
+        while True:
+            unit = units.get()
+            if unit is None:
+                return
+
+            preloaded = {}
+            if len(unit) > 1:
+                preloaded = bulk_load_farms(self.pool_db, unit, self.dt_from, self.dt_to, self.options['columnar'])
+
+            for farm in unit:
+                data_loader = preloaded.pop(farm['FARM_NO'], None)
+                error = None
+                if data_loader is None:
+                    try:
+                        data_loader = self._load_farm(farm)
+                    except Exception as e:
+                        error = e
+                load_q.put((farm, data_loader, error))
+
+    def _compute_stage(self, load_q: queue.Queue, write_q: queue.Queue) -> None:
+        """계산 단계: 연결 획득 → 기존 데이터 삭제 → 프로세서 실행 → 저장 큐"""
+        from .async_processor import AsyncFarmProcessor
+
+        while True:
+            item = load_q.get()
+            if item is None:
+                return
+            farm, data_loader, error = item
+            farm_no = farm['FARM_NO']
+            start_time = datetime.now()
+            processor_results = []
+            processor = None
+            sub_writer = None
+
+            try:
+                wait_start = time.perf_counter()
+                conn = self.pool_db.acquire()
+                conn_wait_ms = (time.perf_counter() - wait_start) * 1000
+            except Exception as e:
+                logger.error(f"농장 {farm_no} 연결 획득 실패: {e}")
+                write_q.put((farm, None, None, processor_results, start_time, e, None))
+                continue
+
+            try:
+                processor = AsyncFarmProcessor(
+                    conn,
+                    self.master_seq,
+                    farm_no,
+                    farm.get('LOCALE', 'KOR'),
+                    data_loader=data_loader,
+                    columnar=self.options['columnar'],
+                    schedule_mode=resolve_engine_mode(
+                        self.options['schedule_engine'], farm_no, self.options['schedule_verify_sample']),
+                    sub_flush=self.sub_flush,
+                    snapshot=self.snapshot,
+                    telemetry=FarmTelemetry(farm_no, conn_wait_ms) if self.options.get('telemetry') else None,
+                    processor_workers=self.options.get('processor_workers', 1),
+                    aggregate_mode=resolve_engine_mode(
+                        self.options['aggregate_engine'], farm_no, self.options['aggregate_verify_sample'],
+                        setting='aggregate_engine'),
+                )
+                processor.logger.info(f"농장 처리 시작: {farm_no}")
+                processor.begin()
+                if error is not None:
+                    raise error
+                data_loader = processor.load_data(self.dt_from, self.dt_to)
+                sub_writer = processor.create_sub_writer()
+                processor.run_processors(data_loader, sub_writer, self.dt_from, self.dt_to,
+                                         self.national_price, processor_results)
+            except Exception as e:
+                error = e
+
+            write_q.put((farm, processor, sub_writer, processor_results, start_time, error, conn))
+
+    def _write_stage(self, write_q: queue.Queue, on_result: Callable[[int, Dict[str, Any]], None]) -> None:
+        """저장 단계: SUB 일괄 저장 + 상태 갱신 + 커밋 → 연결 반환 → 결과 콜백"""
+        while True:
+            item = write_q.get()
+            if item is None:
+                return
+            farm, processor, sub_writer, processor_results, start_time, error, conn = item
+            farm_no = farm['FARM_NO']
+
+            try:
+                result = self._finish(farm_no, processor, sub_writer, processor_results, start_time, error)
+            finally:
+                if conn is not None:
+                    try:
+                        self.pool_db.release(conn)
+                    except Exception as e:
+                        logger.warning(f"농장 {farm_no} 연결 반환 실패: {e}")
+
+            with self._result_lock:
+                try:
+                    on_result(farm_no, result)
+                except Exception as e:
+                    logger.error(f"농장 {farm_no} 결과 처리 오류: {e}", exc_info=True)
+
+    @staticmethod
+    def _finish(farm_no: int, processor, sub_writer, processor_results: List,
+                start_time: datetime, error: Optional[Exception]) -> Dict[str, Any]:
+        """농장 완료/오류 처리 (AsyncFarmProcessor.process와 동일한 결과 형식)"""
+        if processor is None:
+            return {'farm_no': farm_no, 'status': 'error', 'error': str(error)}
+
+        if error is None:
+            try:
+                processor.complete(sub_writer)
+                return processor.build_result('success', processor_results, start_time)
+            except Exception as e:
+                error = e
+
+        processor.logger.error(f"농장 처리 실패: {farm_no} - {error}", exc_info=error)
+        try:
+            processor.fail(error, sub_writer)
+        except Exception as e:
+            logger.error(f"농장 {farm_no} 오류 상태 기록 실패: {e}")
+        return processor.build_result('error', processor_results, start_time, error=str(error))
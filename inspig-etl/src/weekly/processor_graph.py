@@ -0,0 +1,183 @@
+"""
+농장 내 프로세서 실행 그래프
+- 프로세서 클래스의 READS/WRITES 선언으로 선행 관계 계산
+  (B가 앞선 A의 WRITES를 읽거나, 같은 대상을 쓰거나, A가 읽는 대상을 쓰면 A → B)
+- 선행 프로세서가 모두 끝난 프로세서부터 스레드 풀에서 동시 실행
+- workers=1 이면 선언 순서대로 순차 실행 (기존 동작)
+
+동시 실행 시:
+- 농장 연결 1개를 공유 (threaded 연결, DB 작업은 db_lock으로 직렬화) → 농장 단위 커밋 유지
+  SQL 대기 중 다른 프로세서의 Python 가공이 진행되어 농장 처리 시간이 가장 느린 프로세서 쪽으로 단축
+- FarmDataLoader 데이터는 읽기 전용 공유 (프로세서는 로드 행을 수정하지 않음)
+
+config.ini [processing] max_processor_workers (1: 순차, 2 이상: 동시 실행 스레드 수)
+"""
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from .schedule_engine import SCHEDULE_ENGINE_ORACLE
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessorNode:
+    """그래프 노드 (프로세서 1개)"""
+
+    def __init__(self, name: str, proc_class: type, kwargs: Dict[str, Any]):
+        """
+        Args:
+            name: 노드 이름 (결과 키)
+            proc_class: BaseProcessor 서브클래스 (READS/WRITES 선언)
+            kwargs: process() 인자
+        """
+        self.name = name
+        self.proc_class = proc_class
+        self.kwargs = kwargs
+        self.reads = frozenset(getattr(proc_class, 'READS', ()))
+        self.writes = frozenset(getattr(proc_class, 'WRITES', ()))
+        self.depends: Set[str] = set()
+
+    def conflicts_with(self, earlier: 'ProcessorNode') -> bool:
+        """앞선 노드와 선행 관계 여부 (읽기-쓰기, 쓰기-쓰기, 쓰기-읽기)"""
+        return bool(earlier.writes & self.reads
+                    or earlier.writes & self.writes
+                    or earlier.reads & self.writes)
+
+
+class ProcessorGraph:
+    """프로세서 실행 그래프
+
+    사용 예:
+        graph = ProcessorGraph([('config', ConfigProcessor, kw), ('alert', AlertProcessor, kw), ...])
+        results = graph.run(lambda node: run(node), workers=4)   # {name: run() 결과}
+    """
+
+    def __init__(self, nodes: Sequence[Tuple[str, type, Dict[str, Any]]]):
+        """
+        Args:
+            nodes: (이름, 프로세서 클래스, process 인자) 리스트 - 순차 실행 시 순서
+        """
+        self.nodes: List[ProcessorNode] = []
+        for name, proc_class, kwargs in nodes:
+            node = ProcessorNode(name, proc_class, kwargs)
+            node.depends = {prev.name for prev in self.nodes if node.conflicts_with(prev)}
+            self.nodes.append(node)
+
+    def dependents(self, name: str) -> List[str]:
+        """name을 선행으로 갖는 노드 목록"""
+        return [node.name for node in self.nodes if name in node.depends]
+
+    def levels(self) -> List[List[str]]:
+        """선행 깊이별 노드 목록 (로그/문서용)"""
+        depth: Dict[str, int] = {}
+        for node in self.nodes:
+            depth[node.name] = max((depth[d] + 1 for d in node.depends), default=0)
+        levels: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for node in self.nodes:
+            levels[depth[node.name]].append(node.name)
+        return levels
+
+    def run(self, run_node: Callable[[ProcessorNode], Any], workers: int = 1,
+            stop_on_error: bool = False) -> Dict[str, Any]:
+        """그래프 실행
+
+        Args:
+            run_node: 노드 실행 함수 (반환값은 결과로 수집)
+            workers: 동시 실행 스레드 수 (1 이하면 순차)
+            stop_on_error: run_node 예외 시 새 노드 시작 중단 후 예외 전파 (실행 중 노드는 종료 대기)
+                           False면 예외를 결과로 기록하고 나머지 노드 계속 실행
+
+        Returns:
+            {노드 이름: run_node 결과 또는 예외} (선언 순서)
+        """
+        if workers <= 1:
+            results = {}
+            for node in self.nodes:
+                results[node.name] = self._call(run_node, node, stop_on_error)
+            return results
+
+        results: Dict[str, Any] = {}
+        done: Set[str] = set()
+        pending = list(self.nodes)
+        first_error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='proc') as executor:
+            running = {}
+            while pending or running:
+                if first_error is None:
+                    ready = [node for node in pending if node.depends <= done]
+                    for node in ready:
+                        pending.remove(node)
+                        running[executor.submit(self._call, run_node, node, stop_on_error)] = node
+                elif not running:
+                    break
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    try:
+                        results[node.name] = future.result()
+                    except BaseException as e:
+                        if first_error is None:
+                            first_error = e
+                    done.add(node.name)
+
+        if first_error is not None:
+            raise first_error
+        return {node.name: results[node.name] for node in self.nodes if node.name in results}
+
+    @staticmethod
+    def _call(run_node: Callable[[ProcessorNode], Any], node: ProcessorNode, stop_on_error: bool) -> Any:
+        if stop_on_error:
+            return run_node(node)
+        try:
+            return run_node(node)
+        except Exception as e:
+            logger.error(f"프로세서 노드 실패: {node.name} - {e}")
+            return e
+
+
+def weekly_processor_nodes(dt_from: str, dt_to: str,
+                           national_price: int) -> List[Tuple[str, type, Dict[str, Any]]]:
+    """주간 리포트 프로세서 노드 (순차 실행 순서, 이름 = ProcessorType 값)
+
+    ScheduleProcessor는 금주(dt_to 다음날 ~ +7일) 기간으로 실행
+    """
+    from .processors import (
+        ConfigProcessor, ModonProcessor, AlertProcessor,
+        MatingProcessor, FarrowingProcessor, WeaningProcessor,
+        AccidentProcessor, CullingProcessor, ShipmentProcessor,
+        ScheduleProcessor,
+    )
+
+    this_dt_from = (datetime.strptime(dt_to, '%Y%m%d') + timedelta(days=1)).strftime('%Y%m%d')
+    this_dt_to = (datetime.strptime(dt_to, '%Y%m%d') + timedelta(days=7)).strftime('%Y%m%d')
+    period = {'dt_from': dt_from, 'dt_to': dt_to}
+    return [
+        ('config', ConfigProcessor, period),
+        ('alert', AlertProcessor, period),
+        ('modon', ModonProcessor, period),
+        ('mating', MatingProcessor, period),
+        ('farrowing', FarrowingProcessor, period),
+        ('weaning', WeaningProcessor, period),
+        ('accident', AccidentProcessor, period),
+        ('culling', CullingProcessor, period),
+        ('shipment', ShipmentProcessor, {**period, 'national_price': national_price}),
+        ('schedule', ScheduleProcessor, {'dt_from': this_dt_from, 'dt_to': this_dt_to}),
+    ]
+
+
+def prepare_shared(data_loader, conn) -> threading.Lock:
+    """동시 실행 전 공유 상태 준비
+
+    - 작업예정 엔진을 미리 생성 (프로세서별 지연 생성 경합/중복 조회 방지)
+
+    Returns:
+        프로세서 공용 db_lock
+    """
+    mode = getattr(data_loader, 'schedule_mode', SCHEDULE_ENGINE_ORACLE)
+    if data_loader is not None and mode != SCHEDULE_ENGINE_ORACLE:
+        data_loader.get_schedule_engine(conn)
+    return threading.Lock()
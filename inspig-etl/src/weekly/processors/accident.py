@@ -51,6 +51,7 @@ class AccidentProcessor(BaseProcessor):
     """임신사고 팝업 프로세서 (v2 - Python 가공)"""
 
     PROC_NAME = 'AccidentProcessor'
+    WRITES = ('SUB.SG', 'WEEK.SG')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """임신사고 데이터 추출
@@ -116,6 +117,7 @@ class AccidentProcessor(BaseProcessor):
 
         FarmDataLoader에서 계산된 마지막 교배일을 활용하여 경과일 계산
         사고별로 그 시점의 마지막 교배일 기준으로 경과일 계산
+        (모돈별 교배일 목록은 FarmDataLoader 인덱스 재사용)
 
         Args:
             sago_data: 사고 데이터 리스트
@@ -124,37 +126,16 @@ class AccidentProcessor(BaseProcessor):
             전처리된 사고 데이터 리스트
         """
         loaded_data = self.get_loaded_data()
-        modon_wk = loaded_data.get('modon_wk', [])
         modon_last_gb = loaded_data.get('modon_last_gb_dt', {})
 
-        # 모돈별 교배 작업 리스트 생성 (교배 작업: WK_GUBUN='G')
-        modon_gb_dates: Dict[str, List[str]] = {}
-        for wk in modon_wk:
-            if wk.get('WK_GUBUN') == 'G':
-                modon_no = str(wk.get('MODON_NO', ''))
-                wk_dt = str(wk.get('WK_DT', ''))
-                if modon_no and wk_dt:
-                    if modon_no not in modon_gb_dates:
-                        modon_gb_dates[modon_no] = []
-                    modon_gb_dates[modon_no].append(wk_dt)
-
-        # 각 모돈의 교배일 정렬
-        for modon_no in modon_gb_dates:
-            modon_gb_dates[modon_no].sort()
-
         result = []
         for sago in sago_data:
             sago_copy = dict(sago)
             modon_no = str(sago.get('MODON_NO', ''))
             sago_dt = str(sago.get('SAGO_DT', ''))
 
-            # 마지막 교배일 찾기 (사고일 이전의 가장 최근 교배일)
-            last_gb_dt = None
-            if modon_no in modon_gb_dates:
-                for gb_dt in reversed(modon_gb_dates[modon_no]):
-                    if gb_dt < sago_dt:
-                        last_gb_dt = gb_dt
-                        break
+            # 마지막 교배일 찾기 (사고일 이전의 가장 최근 교배일, FarmDataLoader 교배일 인덱스)
+            last_gb_dt = self.data_loader.get_last_gb_dt_before(modon_no, sago_dt)
 
             # 마지막 교배일이 없으면 FarmDataLoader에서 계산된 값 사용
             if not last_gb_dt:
@@ -212,7 +193,7 @@ class AccidentProcessor(BaseProcessor):
             :val_1, :val_2, :val_3, :val_4, :val_5, :val_6, :val_7, :val_8, :avg_gyungil
         )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'sort_no': sort_no,
@@ -270,7 +251,7 @@ class AccidentProcessor(BaseProcessor):
             :val_1, :val_2, :val_3, :val_4, :val_5, :val_6, :val_7, :val_8, :avg_gyungil
         )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'cnt_1': month_counts[0], 'cnt_2': month_counts[1],
@@ -361,7 +342,7 @@ class AccidentProcessor(BaseProcessor):
             :cnt_1, :cnt_2, :cnt_3, :cnt_4, :cnt_5, :cnt_6, :cnt_7, :cnt_8
         )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'cnt_1': counts[0], 'cnt_2': counts[1], 'cnt_3': counts[2], 'cnt_4': counts[3],
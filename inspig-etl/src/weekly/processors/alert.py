@@ -10,19 +10,44 @@ SP_INS_WEEK_ALERT_POPUP 프로시저 Python 전환
   4. 분만지연 (BM_DELAY)
   5. 이유지연 (EU_DELAY)
 - TS_INS_WEEK_SUB (GUBUN='ALERT') 저장
+
+계산 모드 (config.ini [processing] aggregate_engine, FarmDataLoader.aggregate_mode):
+- oracle: INSERT ... SELECT (TB_MODON/TB_MODON_WK 전체 이력 서버 집계, 기본값)
+- python: FarmDataLoader 모돈/작업이력으로 지연일 계산 후 5×4 결과 INSERT (DB 조회 없음, 계산 실패 시 SQL 집계)
+- verify: SQL 집계 결과 저장 + Python 계산과 비교 (차이는 WARNING 로그)
 """
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+from ..columnar import yyyymmdd_to_day
+from ..data_loader import STATUS_EUMO, STATUS_HUBO, STATUS_IMSIN, STATUS_JAEBAL, STATUS_YUSAN
+from ..schedule_engine import SCHEDULE_ENGINE_ORACLE, SCHEDULE_ENGINE_PYTHON, SCHEDULE_ENGINE_VERIFY
 from .base import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+# 관리대상 유형 (CNT_1 ~ CNT_5 순서)
+ALERT_TYPES = ('HUBO', 'EU_MI', 'SG_MI', 'BM_DELAY', 'EU_DELAY')
+HUBO, EU_MI, SG_MI, BM_DELAY, EU_DELAY = range(len(ALERT_TYPES))
+
+# 지연일 구간 (SORT_NO, CODE_1, 최소일, 최대일)
+ALERT_PERIODS = (
+    (1, '~3', 0, 3),
+    (2, '4~7', 4, 7),
+    (3, '8~14', 8, 14),
+    (4, '14~', 15, 9999),
+)
+
+# 재적 모돈 OUT_DT
+OUT_DT_ALIVE = '99991231'
+
 
 class AlertProcessor(BaseProcessor):
     """관리대상 모돈 추출 프로세서"""
 
     PROC_NAME = 'AlertProcessor'
+    READS = ('SUB.CONFIG',)
+    WRITES = ('SUB.ALERT', 'WEEK.ALERT')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """관리대상 모돈 데이터 추출
@@ -42,18 +67,36 @@ class AlertProcessor(BaseProcessor):
         # 2. 기존 데이터 삭제
         self._delete_existing()
 
-        # 3. 통합 쿼리로 데이터 INSERT
-        proc_cnt = self._insert_alert_data(dt_to, config)
+        mode = self.data_loader.aggregate_mode if self.data_loader else SCHEDULE_ENGINE_ORACLE
+        result: Dict[str, Any] = {'status': 'success'}
 
-        # 4. TS_INS_WEEK 요약 업데이트
-        self._update_week_summary()
+        if mode == SCHEDULE_ENGINE_ORACLE:
+            # 3. 통합 쿼리로 데이터 INSERT
+            proc_cnt = self._insert_alert_data(dt_to, config)
 
-        self.logger.info(f"관리대상 모돈 추출 완료: 농장={self.farm_no}, 처리={proc_cnt}건")
+            # 4. TS_INS_WEEK 요약 업데이트
+            self._update_week_summary()
+        else:
+            # 3. 구간별 건수 계산 (python: 로드 데이터, 실패 시 SQL 결과 / verify: SQL 결과 + Python 비교)
+            counts = None
+            if mode == SCHEDULE_ENGINE_PYTHON:
+                try:
+                    counts = self._calculate_alert_python(dt_to, config)
+                except Exception as e:
+                    self.logger.warning(f"관리대상 Python 계산 실패, SQL 집계 사용: 농장={self.farm_no} - {e}")
+            if counts is None:
+                counts = self._select_alert_data(dt_to, config)
+                if mode == SCHEDULE_ENGINE_VERIFY:
+                    result['verify_diffs'] = len(self._verify_alert(counts, dt_to, config))
 
-        return {
-            'status': 'success',
-            'proc_cnt': proc_cnt,
-        }
+            # 4. INSERT + TS_INS_WEEK 요약 업데이트 (계산 결과로 직접)
+            proc_cnt = self._insert_alert_rows(counts)
+            self._update_week_totals(counts)
+
+        self.logger.info(f"관리대상 모돈 추출 완료: 농장={self.farm_no}, 처리={proc_cnt}건 ({mode})")
+
+        result['proc_cnt'] = proc_cnt
+        return result
 
     def _get_config(self) -> Dict[str, int]:
         """농장 설정값 조회 (CONFIG에서 저장한 값)"""
@@ -91,127 +134,280 @@ class AlertProcessor(BaseProcessor):
         """
         self.execute(sql, {'master_seq': self.master_seq, 'farm_no': self.farm_no})
 
+    # 5개 유형 × 4개 구간 집계 (MASTER_SEQ, FARM_NO, GUBUN, SORT_NO, CODE_1, CNT_1 ~ CNT_5)
+    ALERT_SELECT_SQL = """
+    WITH
+    LAST_WK AS (
+        SELECT FARM_NO, PIG_NO, MAX(SEQ) AS MSEQ
+        FROM TB_MODON_WK
+        WHERE FARM_NO = :farm_no AND USE_YN = 'Y'
+        GROUP BY FARM_NO, PIG_NO
+    ),
+    NO_WK_MODON AS (
+        SELECT MD.FARM_NO, MD.PIG_NO
+        FROM TB_MODON MD
+        LEFT OUTER JOIN (
+            SELECT DISTINCT FARM_NO, PIG_NO FROM TB_MODON_WK WHERE FARM_NO = :farm_no AND USE_YN = 'Y'
+        ) WK ON WK.FARM_NO = MD.FARM_NO AND WK.PIG_NO = MD.PIG_NO
+        WHERE MD.FARM_NO = :farm_no
+          AND MD.USE_YN = 'Y'
+          AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD')
+          AND WK.PIG_NO IS NULL
+    ),
+    HUBO AS (
+        SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - MD.BIRTH_DT) - :first_gb_day AS DELAY_DAYS
+        FROM TB_MODON MD
+        INNER JOIN NO_WK_MODON NW ON NW.FARM_NO = MD.FARM_NO AND NW.PIG_NO = MD.PIG_NO
+        WHERE MD.IN_DT < TO_DATE(:base_dt, 'YYYYMMDD') + 1
+          AND (TO_DATE(:base_dt, 'YYYYMMDD') - MD.BIRTH_DT) - :first_gb_day >= 0
+          AND (MD.STATUS_CD = '010001' OR (MD.STATUS_CD = '010002' AND MD.IN_SANCHA = 0 AND MD.IN_GYOBAE_CNT = 1))
+    ),
+    EU_MI AS (
+        SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :avg_return + 1 AS DELAY_DAYS
+        FROM TB_MODON MD
+        JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
+        JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
+        WHERE MD.FARM_NO = :farm_no
+          AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
+          AND WK.WK_GUBUN = 'E' AND WK.DAERI_YN = 'N'
+          AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) + 1 >= :avg_return
+        UNION ALL
+        SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) - :avg_return AS DELAY_DAYS
+        FROM TB_MODON MD
+        INNER JOIN NO_WK_MODON NW ON NW.FARM_NO = MD.FARM_NO AND NW.PIG_NO = MD.PIG_NO
+        WHERE MD.STATUS_CD = '010005'
+          AND MD.IN_DT < TO_DATE(:base_dt, 'YYYYMMDD') + 1
+          AND (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) - :avg_return >= 0
+    ),
+    SG_MI AS (
+        SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) AS DELAY_DAYS
+        FROM TB_MODON MD
+        JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
+        JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
+        WHERE MD.FARM_NO = :farm_no
+          AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
+          AND WK.WK_GUBUN = 'F'
+          AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) >= 0
+        UNION ALL
+        SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) AS DELAY_DAYS
+        FROM TB_MODON MD
+        INNER JOIN NO_WK_MODON NW ON NW.FARM_NO = MD.FARM_NO AND NW.PIG_NO = MD.PIG_NO
+        WHERE MD.STATUS_CD IN ('010006', '010007')
+          AND MD.IN_DT < TO_DATE(:base_dt, 'YYYYMMDD') + 1
+          AND (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) >= 0
+    ),
+    BM_DELAY AS (
+        SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :preg_period AS DELAY_DAYS
+        FROM TB_MODON MD
+        JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
+        JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
+        WHERE MD.FARM_NO = :farm_no
+          AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
+          AND WK.WK_GUBUN = 'G'
+          AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :preg_period >= 0
+    ),
+    EU_DELAY AS (
+        SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :wean_period AS DELAY_DAYS
+        FROM TB_MODON MD
+        JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
+        JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
+        WHERE MD.FARM_NO = :farm_no
+          AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
+          AND WK.WK_GUBUN = 'B'
+          AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :wean_period >= 0
+    ),
+    ALL_DELAYS AS (
+        SELECT 'HUBO' AS TYPE_CD, DELAY_DAYS FROM HUBO
+        UNION ALL SELECT 'EU_MI', DELAY_DAYS FROM EU_MI
+        UNION ALL SELECT 'SG_MI', DELAY_DAYS FROM SG_MI
+        UNION ALL SELECT 'BM_DELAY', DELAY_DAYS FROM BM_DELAY
+        UNION ALL SELECT 'EU_DELAY', DELAY_DAYS FROM EU_DELAY
+    ),
+    PERIODS AS (
+        SELECT 1 AS SORT_NO, '~3' AS PERIOD, 0 AS MIN_DAY, 3 AS MAX_DAY FROM DUAL UNION ALL
+        SELECT 2, '4~7', 4, 7 FROM DUAL UNION ALL
+        SELECT 3, '8~14', 8, 14 FROM DUAL UNION ALL
+        SELECT 4, '14~', 15, 9999 FROM DUAL
+    )
+    SELECT
+        :master_seq, :farm_no, 'ALERT', P.SORT_NO, P.PERIOD,
+        NVL(SUM(CASE WHEN AD.TYPE_CD = 'HUBO' THEN 1 END), 0),
+        NVL(SUM(CASE WHEN AD.TYPE_CD = 'EU_MI' THEN 1 END), 0),
+        NVL(SUM(CASE WHEN AD.TYPE_CD = 'SG_MI' THEN 1 END), 0),
+        NVL(SUM(CASE WHEN AD.TYPE_CD = 'BM_DELAY' THEN 1 END), 0),
+        NVL(SUM(CASE WHEN AD.TYPE_CD = 'EU_DELAY' THEN 1 END), 0)
+    FROM PERIODS P
+    LEFT OUTER JOIN ALL_DELAYS AD ON AD.DELAY_DAYS >= P.MIN_DAY AND AD.DELAY_DAYS <= P.MAX_DAY
+    GROUP BY P.SORT_NO, P.PERIOD
+    ORDER BY P.SORT_NO
+    """
+
+    def _alert_params(self, dt_to: str, config: Dict[str, int]) -> Dict[str, Any]:
+        """ALERT_SELECT_SQL 바인드 변수"""
+        return {
+            'master_seq': self.master_seq,
+            'farm_no': self.farm_no,
+            'base_dt': dt_to,
+            'first_gb_day': config['first_gb_day'],
+            'avg_return': config['avg_return'],
+            'preg_period': config['preg_period'],
+            'wean_period': config['wean_period'],
+        }
+
     def _insert_alert_data(self, dt_to: str, config: Dict[str, int]) -> int:
-        """5개 유형 × 4개 구간 데이터 INSERT"""
+        """5개 유형 × 4개 구간 데이터 INSERT (서버 집계)"""
         sql = """
         INSERT INTO TS_INS_WEEK_SUB (
             MASTER_SEQ, FARM_NO, GUBUN, SORT_NO, CODE_1,
             CNT_1, CNT_2, CNT_3, CNT_4, CNT_5
         )
-        WITH
-        LAST_WK AS (
-            SELECT FARM_NO, PIG_NO, MAX(SEQ) AS MSEQ
-            FROM TB_MODON_WK
-            WHERE FARM_NO = :farm_no AND USE_YN = 'Y'
-            GROUP BY FARM_NO, PIG_NO
-        ),
-        NO_WK_MODON AS (
-            SELECT MD.FARM_NO, MD.PIG_NO
-            FROM TB_MODON MD
-            LEFT OUTER JOIN (
-                SELECT DISTINCT FARM_NO, PIG_NO FROM TB_MODON_WK WHERE FARM_NO = :farm_no AND USE_YN = 'Y'
-            ) WK ON WK.FARM_NO = MD.FARM_NO AND WK.PIG_NO = MD.PIG_NO
-            WHERE MD.FARM_NO = :farm_no
-              AND MD.USE_YN = 'Y'
-              AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD')
-              AND WK.PIG_NO IS NULL
-        ),
-        HUBO AS (
-            SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - MD.BIRTH_DT) - :first_gb_day AS DELAY_DAYS
-            FROM TB_MODON MD
-            INNER JOIN NO_WK_MODON NW ON NW.FARM_NO = MD.FARM_NO AND NW.PIG_NO = MD.PIG_NO
-            WHERE MD.IN_DT < TO_DATE(:base_dt, 'YYYYMMDD') + 1
-              AND (TO_DATE(:base_dt, 'YYYYMMDD') - MD.BIRTH_DT) - :first_gb_day >= 0
-              AND (MD.STATUS_CD = '010001' OR (MD.STATUS_CD = '010002' AND MD.IN_SANCHA = 0 AND MD.IN_GYOBAE_CNT = 1))
-        ),
-        EU_MI AS (
-            SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :avg_return + 1 AS DELAY_DAYS
-            FROM TB_MODON MD
-            JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
-            JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
-            WHERE MD.FARM_NO = :farm_no
-              AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
-              AND WK.WK_GUBUN = 'E' AND WK.DAERI_YN = 'N'
-              AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) + 1 >= :avg_return
-            UNION ALL
-            SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) - :avg_return AS DELAY_DAYS
-            FROM TB_MODON MD
-            INNER JOIN NO_WK_MODON NW ON NW.FARM_NO = MD.FARM_NO AND NW.PIG_NO = MD.PIG_NO
-            WHERE MD.STATUS_CD = '010005'
-              AND MD.IN_DT < TO_DATE(:base_dt, 'YYYYMMDD') + 1
-              AND (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) - :avg_return >= 0
-        ),
-        SG_MI AS (
-            SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) AS DELAY_DAYS
-            FROM TB_MODON MD
-            JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
-            JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
-            WHERE MD.FARM_NO = :farm_no
-              AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
-              AND WK.WK_GUBUN = 'F'
-              AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) >= 0
-            UNION ALL
-            SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) AS DELAY_DAYS
-            FROM TB_MODON MD
-            INNER JOIN NO_WK_MODON NW ON NW.FARM_NO = MD.FARM_NO AND NW.PIG_NO = MD.PIG_NO
-            WHERE MD.STATUS_CD IN ('010006', '010007')
-              AND MD.IN_DT < TO_DATE(:base_dt, 'YYYYMMDD') + 1
-              AND (TO_DATE(:base_dt, 'YYYYMMDD') - MD.LAST_WK_DT) >= 0
-        ),
-        BM_DELAY AS (
-            SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :preg_period AS DELAY_DAYS
-            FROM TB_MODON MD
-            JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
-            JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
-            WHERE MD.FARM_NO = :farm_no
-              AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
-              AND WK.WK_GUBUN = 'G'
-              AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :preg_period >= 0
-        ),
-        EU_DELAY AS (
-            SELECT (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :wean_period AS DELAY_DAYS
-            FROM TB_MODON MD
-            JOIN LAST_WK LW ON LW.FARM_NO = MD.FARM_NO AND LW.PIG_NO = MD.PIG_NO
-            JOIN TB_MODON_WK WK ON WK.FARM_NO = LW.FARM_NO AND WK.PIG_NO = LW.PIG_NO AND WK.SEQ = LW.MSEQ
-            WHERE MD.FARM_NO = :farm_no
-              AND MD.OUT_DT = TO_DATE('9999-12-31', 'YYYY-MM-DD') AND MD.USE_YN = 'Y'
-              AND WK.WK_GUBUN = 'B'
-              AND (TO_DATE(:base_dt, 'YYYYMMDD') - WK.WK_DATE) - :wean_period >= 0
-        ),
-        ALL_DELAYS AS (
-            SELECT 'HUBO' AS TYPE_CD, DELAY_DAYS FROM HUBO
-            UNION ALL SELECT 'EU_MI', DELAY_DAYS FROM EU_MI
-            UNION ALL SELECT 'SG_MI', DELAY_DAYS FROM SG_MI
-            UNION ALL SELECT 'BM_DELAY', DELAY_DAYS FROM BM_DELAY
-            UNION ALL SELECT 'EU_DELAY', DELAY_DAYS FROM EU_DELAY
-        ),
-        PERIODS AS (
-            SELECT 1 AS SORT_NO, '~3' AS PERIOD, 0 AS MIN_DAY, 3 AS MAX_DAY FROM DUAL UNION ALL
-            SELECT 2, '4~7', 4, 7 FROM DUAL UNION ALL
-            SELECT 3, '8~14', 8, 14 FROM DUAL UNION ALL
-            SELECT 4, '14~', 15, 9999 FROM DUAL
+        """ + self.ALERT_SELECT_SQL
+
+        return self.execute(sql, self._alert_params(dt_to, config))
+
+    def _select_alert_data(self, dt_to: str, config: Dict[str, int]) -> List[List[int]]:
+        """SQL 집계 결과 조회
+
+        Returns:
+            구간별(ALERT_PERIODS 순) 유형별(ALERT_TYPES 순) 건수
+        """
+        rows = self.fetch_all(self.ALERT_SELECT_SQL, self._alert_params(dt_to, config))
+        by_sort = {row[3]: [int(cnt or 0) for cnt in row[5:10]] for row in rows}
+        return [by_sort.get(sort_no, [0] * len(ALERT_TYPES)) for sort_no, _, _, _ in ALERT_PERIODS]
+
+    def _calculate_alert_python(self, dt_to: str, config: Dict[str, int]) -> List[List[int]]:
+        """FarmDataLoader 데이터로 ALERT_SELECT_SQL과 같은 집계 계산
+
+        - LAST_WK: 모돈 전체 작업이력 MAX(SEQ) (기준일 이후 작업 포함, modon_last_wk는 기준일까지라 사용 안함)
+        - 2년 이내 작업이력이 없지만 TB_MODON_WK 작업이 있는 모돈: 모돈 행의 마지막 작업구분으로
+          판정 (2년 이상 경과하여 지연일은 마지막 구간)
+        - 작업이력이 없는 모돈(NO_WK_MODON): TB_MODON STATUS_CD/BIRTH_DT/LAST_WK_DT 기준
+
+        SQL과 다를 수 있는 경우: 기준일 이후 전입 모돈의 작업 (로드 대상 아님)
+
+        Returns:
+            구간별(ALERT_PERIODS 순) 유형별(ALERT_TYPES 순) 건수
+        """
+        counts = [[0] * len(ALERT_TYPES) for _ in ALERT_PERIODS]
+        if not self.data_loader:
+            return counts
+
+        def add(type_idx: int, delay: Optional[float]) -> None:
+            if delay is None:
+                return
+            for i, (_, _, min_day, max_day) in enumerate(ALERT_PERIODS):
+                if min_day <= delay <= max_day:
+                    counts[i][type_idx] += 1
+                    return
+
+        def days_since(value: Any) -> Optional[int]:
+            day = yyyymmdd_to_day(value)
+            return None if day is None else base_day - day
+
+        base_day = yyyymmdd_to_day(dt_to)
+        first_gb_day = config['first_gb_day']
+        avg_return = config['avg_return']
+        preg_period = config['preg_period']
+        wean_period = config['wean_period']
+
+        data = self.get_loaded_data()
+        for modon in data.get('modon', []):
+            if modon.get('OUT_DT') != OUT_DT_ALIVE:
+                continue
+            wks = self.data_loader.get_wk_by_modon(modon.get('MODON_NO'))
+
+            if wks or modon.get('WK_GUBUN'):
+                if wks:
+                    last = max(wks, key=lambda wk: wk.get('SEQ') or 0)
+                    gubun = last.get('WK_GUBUN')
+                    daeri_yn = last.get('DAERI_YN')
+                    elapsed = days_since(last.get('WK_DATE'))
+                else:
+                    gubun = modon.get('WK_GUBUN')
+                    daeri_yn = modon.get('DAERI_YN')
+                    elapsed = ALERT_PERIODS[-1][2] + max(avg_return, preg_period, wean_period)
+                if elapsed is None:
+                    continue
+                if gubun == 'E' and daeri_yn == 'N':
+                    add(EU_MI, elapsed - avg_return + 1)
+                elif gubun == 'F':
+                    add(SG_MI, elapsed)
+                elif gubun == 'G':
+                    add(BM_DELAY, elapsed - preg_period)
+                elif gubun == 'B':
+                    add(EU_DELAY, elapsed - wean_period)
+                continue
+
+            # NO_WK_MODON (기준일까지 전입한 모돈)
+            in_day = yyyymmdd_to_day(modon.get('IN_DT'))
+            if in_day is None or in_day > base_day:
+                continue
+            status = modon.get('STATUS_CD')
+            if status == STATUS_HUBO or (status == STATUS_IMSIN and modon.get('IN_SANCHA') == 0
+                                         and modon.get('IN_GYOBAE_CNT') == 1):
+                age = days_since(modon.get('BIRTH_DT'))
+                add(HUBO, None if age is None else age - first_gb_day)
+            elif status == STATUS_EUMO:
+                elapsed = days_since(modon.get('LAST_WK_DT'))
+                add(EU_MI, None if elapsed is None else elapsed - avg_return)
+            elif status in (STATUS_JAEBAL, STATUS_YUSAN):
+                add(SG_MI, days_since(modon.get('LAST_WK_DT')))
+
+        return counts
+
+    def _verify_alert(self, sql_counts: List[List[int]], dt_to: str, config: Dict[str, int]) -> List[str]:
+        """SQL 집계 결과와 Python 계산 비교
+
+        Returns:
+            불일치 내역 리스트 (빈 리스트면 일치)
+        """
+        try:
+            py_counts = self._calculate_alert_python(dt_to, config)
+        except Exception as e:
+            self.logger.warning(f"관리대상 모돈 계산 비교 실패: 농장={self.farm_no} - {e}")
+            return [str(e)]
+
+        diffs = []
+        for (_, period, _, _), sql_row, py_row in zip(ALERT_PERIODS, sql_counts, py_counts):
+            for type_cd, sql_cnt, py_cnt in zip(ALERT_TYPES, sql_row, py_row):
+                if sql_cnt != py_cnt:
+                    diffs.append(f"{period} {type_cd}: SQL {sql_cnt} != Python {py_cnt}")
+
+        if diffs:
+            self.logger.warning(f"관리대상 모돈 계산 불일치: 농장={self.farm_no}, {diffs}")
+        else:
+            self.logger.debug(f"관리대상 모돈 계산 일치: 농장={self.farm_no}")
+        return diffs
+
+    def _insert_alert_rows(self, counts: List[List[int]]) -> int:
+        """구간별 건수 INSERT (4행)"""
+        sql = """
+        INSERT INTO TS_INS_WEEK_SUB (
+            MASTER_SEQ, FARM_NO, GUBUN, SORT_NO, CODE_1,
+            CNT_1, CNT_2, CNT_3, CNT_4, CNT_5
+        ) VALUES (
+            :master_seq, :farm_no, 'ALERT', :sort_no, :code_1,
+            :cnt_1, :cnt_2, :cnt_3, :cnt_4, :cnt_5
         )
-        SELECT
-            :master_seq, :farm_no, 'ALERT', P.SORT_NO, P.PERIOD,
-            NVL(SUM(CASE WHEN AD.TYPE_CD = 'HUBO' THEN 1 END), 0),
-            NVL(SUM(CASE WHEN AD.TYPE_CD = 'EU_MI' THEN 1 END), 0),
-            NVL(SUM(CASE WHEN AD.TYPE_CD = 'SG_MI' THEN 1 END), 0),
-            NVL(SUM(CASE WHEN AD.TYPE_CD = 'BM_DELAY' THEN 1 END), 0),
-            NVL(SUM(CASE WHEN AD.TYPE_CD = 'EU_DELAY' THEN 1 END), 0)
-        FROM PERIODS P
-        LEFT OUTER JOIN ALL_DELAYS AD ON AD.DELAY_DAYS >= P.MIN_DAY AND AD.DELAY_DAYS <= P.MAX_DAY
-        GROUP BY P.SORT_NO, P.PERIOD
-        ORDER BY P.SORT_NO
         """
+        insert_count = 0
+        for (sort_no, period, _, _), row in zip(ALERT_PERIODS, counts):
+            params = {'master_seq': self.master_seq, 'farm_no': self.farm_no,
+                      'sort_no': sort_no, 'code_1': period}
+            params.update({f'cnt_{i + 1}': cnt for i, cnt in enumerate(row)})
+            insert_count += self.insert_sub(sql, params)
+        return insert_count
 
-        return self.execute(sql, {
-            'master_seq': self.master_seq,
-            'farm_no': self.farm_no,
-            'base_dt': dt_to,
-            'first_gb_day': config['first_gb_day'],
-            'avg_return': config['avg_return'],
-            'preg_period': config['preg_period'],
-            'wean_period': config['wean_period'],
+    def _update_week_totals(self, counts: List[List[int]]) -> None:
+        """TS_INS_WEEK 요약 업데이트 (계산 결과 합계, _update_week_summary와 같은 값)"""
+        totals = [sum(row[i] for row in counts) for i in range(len(ALERT_TYPES))]
+        self.update_week({
+            'ALERT_TOTAL': sum(totals),
+            'ALERT_HUBO': totals[HUBO],
+            'ALERT_EU_MI': totals[EU_MI],
+            'ALERT_SG_MI': totals[SG_MI],
+            'ALERT_BM_DELAY': totals[BM_DELAY],
+            'ALERT_EU_DELAY': totals[EU_DELAY],
         })
 
     def _update_week_summary(self) -> None:
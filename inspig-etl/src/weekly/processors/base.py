@@ -9,16 +9,25 @@
 
 Thread-safety:
 - db_lock: 병렬 실행 시 DB 작업 동기화용
-- 동일 connection을 여러 프로세서가 공유할 때 사용
+- 동일 connection을 여러 프로세서가 공유할 때 사용 (processor_graph 동시 실행)
+- 프로세서의 DB 작업은 fetch_*/execute/update_week/get_schedule_engine 등 헬퍼로만 수행
+  (self.conn.cursor() 직접 사용 시 db_lock 미적용)
 """
+import json
 import logging
 import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from ..schedule_engine import (
+    SCHEDULE_ENGINE_ORACLE, SCHEDULE_ENGINE_PYTHON, SCHEDULE_ENGINE_VERIFY,
+    fetch_oracle_schedule,
+)
 
 if TYPE_CHECKING:
     from ..data_loader import FarmDataLoader
+    from ..sub_writer import SubWriter
 
 logger = logging.getLogger(__name__)
 
@@ -42,9 +51,17 @@ class BaseProcessor(ABC):
     # 서브클래스에서 정의할 프로세서 이름
     PROC_NAME: str = 'BaseProcessor'
 
+    # 실행 그래프 선언 (processor_graph.ProcessorGraph 선행 관계 계산)
+    # - 'SUB.<GUBUN>': TS_INS_WEEK_SUB 이번 농장 구분별 행, 'WEEK.<그룹>': TS_INS_WEEK 컬럼 그룹
+    # - READS: 다른 프로세서가 이번 실행에서 저장한 결과 중 조회하는 대상 (이전 주차 조회는 제외)
+    # - FarmDataLoader 데이터는 읽기 전용 공유이므로 선언하지 않음
+    READS: Tuple[str, ...] = ()
+    WRITES: Tuple[str, ...] = ()
+
     def __init__(self, conn, master_seq: int, farm_no: int, locale: str = 'KOR',
                  data_loader: Optional['FarmDataLoader'] = None,
-                 db_lock: Optional[threading.Lock] = None):
+                 db_lock: Optional[threading.Lock] = None,
+                 sub_writer: Optional['SubWriter'] = None):
         """
         Args:
             conn: Oracle DB 연결 객체
@@ -53,6 +70,7 @@ class BaseProcessor(ABC):
             locale: 로케일 (KOR, VNM 등)
             data_loader: FarmDataLoader 인스턴스 (사전 로드된 데이터)
             db_lock: DB 작업 동기화용 Lock (병렬 실행 시 필요)
+            sub_writer: TS_INS_WEEK_SUB 일괄 저장 버퍼 (None이면 INSERT 즉시 실행)
         """
         self.conn = conn
         self.master_seq = master_seq
@@ -60,6 +78,7 @@ class BaseProcessor(ABC):
         self.locale = locale
         self.data_loader = data_loader
         self.db_lock = db_lock  # 병렬 실행 시 DB 작업 동기화용
+        self.sub_writer = sub_writer
         self._data: Dict[str, Any] = {}  # 로드된 데이터 캐시
         self.logger = logging.getLogger(f"{__name__}.{self.PROC_NAME}")
 
@@ -87,6 +106,24 @@ class BaseProcessor(ABC):
                 return func()
         return func()
 
+    # 시퀀스는 INSERT 문에서 직접 채번 (NEXTVAL 조회 왕복 제거)
+    SAVE_SUB_SQL = """
+    INSERT INTO TS_INS_WEEK_SUB (
+        SEQ, MASTER_SEQ, FARM_NO, SUB_TYPE, JSON_DATA, INS_DT
+    ) VALUES (
+        SEQ_TS_INS_WEEK_SUB.NEXTVAL, :master_seq, :farm_no, :sub_type, :json_data, SYSDATE
+    )
+    """
+
+    def _sub_params(self, sub_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """save_sub 바인드 변수"""
+        return {
+            'master_seq': self.master_seq,
+            'farm_no': self.farm_no,
+            'sub_type': sub_type,
+            'json_data': json.dumps(data, ensure_ascii=False, default=str),
+        }
+
     def save_sub(self, sub_type: str, data: Dict[str, Any]) -> int:
         """TS_INS_WEEK_SUB 테이블에 데이터 저장
 
@@ -95,43 +132,30 @@ class BaseProcessor(ABC):
             data: JSON으로 저장할 데이터
 
         Returns:
-            생성된 SEQ
+            생성된 SEQ (sub_writer 사용 시 flush 전이므로 0)
         """
-        import json
+        params = self._sub_params(sub_type, data)
+        if self.sub_writer is not None:
+            self.sub_writer.add(self.SAVE_SUB_SQL, params)
+            return 0
 
         def _execute():
             cursor = self.conn.cursor()
             try:
-                # 시퀀스 값 조회
-                cursor.execute("SELECT SEQ_TS_INS_WEEK_SUB.NEXTVAL FROM DUAL")
-                seq = cursor.fetchone()[0]
-
-                # INSERT
-                sql = """
-                INSERT INTO TS_INS_WEEK_SUB (
-                    SEQ, MASTER_SEQ, FARM_NO, SUB_TYPE, JSON_DATA, INS_DT
-                ) VALUES (
-                    :seq, :master_seq, :farm_no, :sub_type, :json_data, SYSDATE
-                )
-                """
-                cursor.execute(sql, {
-                    'seq': seq,
-                    'master_seq': self.master_seq,
-                    'farm_no': self.farm_no,
-                    'sub_type': sub_type,
-                    'json_data': json.dumps(data, ensure_ascii=False, default=str),
-                })
-
+                seq_var = cursor.var(int)
+                cursor.execute(self.SAVE_SUB_SQL.rstrip() + " RETURNING SEQ INTO :seq",
+                               {**params, 'seq': seq_var})
+                value = seq_var.getvalue()
+                seq = value[0] if isinstance(value, list) else value
                 self.logger.debug(f"SUB 저장: {sub_type} (SEQ={seq})")
                 return seq
-
             finally:
                 cursor.close()
 
         return self._with_db_lock(_execute)
 
     def save_subs(self, items: List[Dict[str, Any]]) -> int:
-        """TS_INS_WEEK_SUB 테이블에 여러 데이터 저장
+        """TS_INS_WEEK_SUB 테이블에 여러 데이터 저장 (executemany 1회)
 
         Args:
             items: [{'sub_type': 'TYPE', 'data': {...}}, ...]
@@ -139,11 +163,47 @@ class BaseProcessor(ABC):
         Returns:
             저장된 레코드 수
         """
-        count = 0
-        for item in items:
-            self.save_sub(item['sub_type'], item['data'])
-            count += 1
-        return count
+        if not items:
+            return 0
+        params_list = [self._sub_params(item['sub_type'], item['data']) for item in items]
+        if self.sub_writer is not None:
+            for params in params_list:
+                self.sub_writer.add(self.SAVE_SUB_SQL, params)
+            return len(params_list)
+
+        def _execute():
+            cursor = self.conn.cursor()
+            try:
+                cursor.executemany(self.SAVE_SUB_SQL, params_list)
+                return len(params_list)
+            finally:
+                cursor.close()
+
+        return self._with_db_lock(_execute)
+
+    def insert_sub(self, sql: str, params: Dict[str, Any]) -> int:
+        """TS_INS_WEEK_SUB 단건 INSERT (INSERT ... VALUES)
+
+        sub_writer가 있으면 버퍼에 추가 후 일괄 저장(executemany), 없으면 즉시 실행
+        (버퍼는 INSERT 대상 테이블을 기록하여 해당 테이블을 참조하는 SQL 실행 전 자동 저장)
+
+        Args:
+            sql: INSERT INTO TS_INS_WEEK_SUB ... VALUES (...) 문
+            params: 바인드 변수
+
+        Returns:
+            INSERT 행 수 (1)
+        """
+        if self.sub_writer is not None:
+            self.sub_writer.add(sql, params)
+            return 1
+        return self.execute(sql, params)
+
+    def flush_subs(self) -> int:
+        """sub_writer 미저장 행 저장"""
+        if self.sub_writer is None:
+            return 0
+        return self._with_db_lock(self.sub_writer.flush)
 
     def update_week(self, updates: Dict[str, Any]) -> None:
         """TS_INS_WEEK 테이블 컬럼 업데이트
@@ -179,6 +239,9 @@ class BaseProcessor(ABC):
 
     def fetch_all(self, sql: str, params: Optional[Dict] = None) -> List[tuple]:
         """SELECT 쿼리 실행 후 전체 결과 반환"""
+        if self.sub_writer is not None and self.sub_writer.pending:
+            self._with_db_lock(lambda: self.sub_writer.flush_before(sql))
+
         def _execute():
             cursor = self.conn.cursor()
             try:
@@ -191,6 +254,9 @@ class BaseProcessor(ABC):
 
     def fetch_dict(self, sql: str, params: Optional[Dict] = None) -> List[Dict]:
         """SELECT 쿼리 실행 후 딕셔너리 리스트로 반환"""
+        if self.sub_writer is not None and self.sub_writer.pending:
+            self._with_db_lock(lambda: self.sub_writer.flush_before(sql))
+
         def _execute():
             cursor = self.conn.cursor()
             try:
@@ -204,6 +270,9 @@ class BaseProcessor(ABC):
 
     def fetch_one(self, sql: str, params: Optional[Dict] = None) -> Optional[tuple]:
         """SELECT 쿼리 실행 후 단일 결과 반환"""
+        if self.sub_writer is not None and self.sub_writer.pending:
+            self._with_db_lock(lambda: self.sub_writer.flush_before(sql))
+
         def _execute():
             cursor = self.conn.cursor()
             try:
@@ -216,6 +285,9 @@ class BaseProcessor(ABC):
 
     def execute(self, sql: str, params: Optional[Dict] = None) -> int:
         """INSERT/UPDATE/DELETE 실행 후 영향받은 행 수 반환"""
+        if self.sub_writer is not None and self.sub_writer.pending:
+            self._with_db_lock(lambda: self.sub_writer.flush_before(sql))
+
         def _execute():
             cursor = self.conn.cursor()
             try:
@@ -236,6 +308,47 @@ class BaseProcessor(ABC):
             return self.data_loader.get_data()
         return {}
 
+    def get_schedule_engine(self):
+        """FarmDataLoader 작업예정 엔진 (최초 생성 시 TB_PLAN_MODON 조회는 db_lock 적용)"""
+        return self._with_db_lock(lambda: self.data_loader.get_schedule_engine(self.conn))
+
+    def fetch_schedule(self, job_gubun_cd: str, status_cd: Optional[str],
+                       sdt: str, edt: str, seq_filter: str = '-1') -> List[Dict]:
+        """작업예정 대상 조회 (FN_MD_SCHEDULE_BSE_2020 / Python 엔진)
+
+        FarmDataLoader.schedule_mode에 따라 분기:
+        - oracle: FN_MD_SCHEDULE_BSE_2020 호출
+        - python: ScheduleEngine 계산 (DB 호출 없음)
+        - verify: Oracle 결과 반환 + ScheduleEngine 결과와 비교 (차이는 WARNING 로그)
+
+        Args:
+            job_gubun_cd: 예정작업구분 (150001~150005)
+            status_cd: 모돈상태 필터 (None=전체)
+            sdt: 시작일 (yyyy-MM-dd)
+            edt: 종료일 (yyyy-MM-dd)
+            seq_filter: TB_PLAN_MODON.SEQ 필터 ('-1'=전체, ''=작업없음, '1,2,3'=선택)
+
+        Returns:
+            [{'PIG_NO', 'WK_NM', 'PASS_DT'(yyyy-MM-dd), ...}, ...]
+        """
+        if seq_filter == '':
+            return []
+
+        mode = self.data_loader.schedule_mode if self.data_loader else SCHEDULE_ENGINE_ORACLE
+        if mode == SCHEDULE_ENGINE_PYTHON:
+            engine = self.get_schedule_engine()
+            return engine.schedule(job_gubun_cd, status_cd, sdt, edt, seq_filter)
+
+        rows = self._with_db_lock(lambda: fetch_oracle_schedule(
+            self.conn, self.farm_no, job_gubun_cd, status_cd, sdt, edt, seq_filter))
+        if mode == SCHEDULE_ENGINE_VERIFY:
+            try:
+                engine = self.get_schedule_engine()
+                engine.compare(rows, job_gubun_cd, status_cd, sdt, edt, seq_filter)
+            except Exception as e:
+                self.logger.warning(f"예정 계산 비교 실패: job={job_gubun_cd} - {e}")
+        return rows
+
     def filter_by_period(self, data: List[Dict], date_field: str,
                          dt_from: str, dt_to: str) -> List[Dict]:
         """기간으로 데이터 필터링
@@ -249,6 +362,12 @@ class BaseProcessor(ABC):
         Returns:
             필터링된 데이터 리스트
         """
+        # FarmDataLoader 날짜 정렬 인덱스 사용 (모든 값이 8자리인 경우 비교 결과 동일)
+        if self.data_loader:
+            index = self.data_loader.date_index(data, date_field)
+            if index is not None and index.exact:
+                return index.range(dt_from, dt_to)
+
         return [
             row for row in data
             if row.get(date_field) and dt_from <= str(row[date_field]) <= dt_to
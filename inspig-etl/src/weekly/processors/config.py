@@ -23,6 +23,7 @@ class ConfigProcessor(BaseProcessor):
     """농장 설정값 저장 프로세서"""
 
     PROC_NAME = 'ConfigProcessor'
+    WRITES = ('SUB.CONFIG',)
 
     # 설정 코드 목록 (9개)
     CONFIG_CODES = [
@@ -276,7 +277,7 @@ class ConfigProcessor(BaseProcessor):
         )
         """
 
-        self.execute(sql, {
+        self.insert_sub(sql, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'preg_period': config_values.get('140002', 115),
@@ -47,6 +47,7 @@ class CullingProcessor(BaseProcessor):
     """도태폐사 팝업 프로세서 (v2 - Python 가공)"""
 
     PROC_NAME = 'CullingProcessor'
+    WRITES = ('SUB.DOPE', 'WEEK.CL')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """도태폐사 데이터 추출
@@ -180,7 +181,7 @@ class CullingProcessor(BaseProcessor):
             :val_1, :val_2, :val_3, :val_4
         )
         """
-        self.execute(sql_ins1, {
+        self.insert_sub(sql_ins1, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'cnt_1': week_counts[0], 'cnt_2': week_counts[1],
@@ -207,7 +208,7 @@ class CullingProcessor(BaseProcessor):
             :val_1, :val_2, :val_3, :val_4
         )
         """
-        self.execute(sql_ins2, {
+        self.insert_sub(sql_ins2, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'cnt_1': month_counts[0], 'cnt_2': month_counts[1],
@@ -306,7 +307,7 @@ class CullingProcessor(BaseProcessor):
                 :val_11, :val_12, :val_13, :val_14, :val_15
             )
             """
-            self.execute(sql, params)
+            self.insert_sub(sql, params)
             insert_count += 1
 
         return insert_count
@@ -337,7 +338,7 @@ class CullingProcessor(BaseProcessor):
             :cnt_1, :cnt_2, :cnt_3, :cnt_4, :cnt_5, :cnt_6, :cnt_7
         )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'cnt_1': counts[0], 'cnt_2': counts[1], 'cnt_3': counts[2],
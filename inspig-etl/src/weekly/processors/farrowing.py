@@ -25,6 +25,7 @@ class FarrowingProcessor(BaseProcessor):
     """분만 팝업 프로세서"""
 
     PROC_NAME = 'FarrowingProcessor'
+    WRITES = ('SUB.BM', 'WEEK.BM')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """분만 데이터 추출
@@ -135,21 +136,16 @@ class FarrowingProcessor(BaseProcessor):
         FROM TC_FARM_CONFIG
         WHERE FARM_NO = :farm_no AND CODE = '140002'
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute(sql, {'farm_no': self.farm_no})
-            rows = cursor.fetchall()
+        rows = self.fetch_all(sql, {'farm_no': self.farm_no})
 
-            config = {'preg_period': 115}
+        config = {'preg_period': 115}
 
-            for code, value in rows:
-                if code == '140002':
-                    config['preg_period'] = int(value) if value else 115
+        for code, value in rows:
+            if code == '140002':
+                config['preg_period'] = int(value) if value else 115
 
-            self.logger.info(f"TC_FARM_CONFIG 분만 설정 조회: farm_no={self.farm_no}, config={config}")
-            return config
-        finally:
-            cursor.close()
+        self.logger.info(f"TC_FARM_CONFIG 분만 설정 조회: farm_no={self.farm_no}, config={config}")
+        return config
 
     def _get_plan_from_prev_week(self) -> Optional[tuple]:
         """이전 주차 금주예정에서 분만 예정 조회 (힌트 포함)
@@ -256,15 +252,7 @@ class FarrowingProcessor(BaseProcessor):
             self.logger.info("분만 작업 없음 (seq_filter=''), 카운트 생략")
             return 0
 
-        sql = """
-        SELECT COUNT(*)
-        FROM TABLE(FN_MD_SCHEDULE_BSE_2020(
-            :farm_no, 'JOB-DAJANG', '150002', NULL,
-            :sdt, :edt, NULL, 'ko', 'yyyy-MM-dd', :seq_filter, NULL
-        ))
-        """
-        result = self.fetch_one(sql, {'farm_no': self.farm_no, 'sdt': sdt, 'edt': edt, 'seq_filter': seq_filter})
-        return result[0] if result else 0
+        return len(self.fetch_schedule('150002', None, sdt, edt, seq_filter))
 
     def _count_plan_by_farm(self, dt_from: datetime, dt_to: datetime) -> int:
         """농장 기본값 기준 분만 예정 복수 조회
@@ -465,7 +453,7 @@ class FarrowingProcessor(BaseProcessor):
             :avg_total, :avg_live, :avg_dead, :avg_mummy, :avg_pogae, :avg_sdotae, :avg_yangja
         )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'plan_bm': plan_bm,
@@ -24,6 +24,7 @@ class MatingProcessor(BaseProcessor):
     """교배 팝업 프로세서"""
 
     PROC_NAME = 'MatingProcessor'
+    WRITES = ('SUB.GB', 'WEEK.GB')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """교배 데이터 추출
@@ -142,28 +143,23 @@ class MatingProcessor(BaseProcessor):
         FROM TC_FARM_CONFIG
         WHERE FARM_NO = :farm_no AND CODE IN ('140007', '140008')
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute(sql, {'farm_no': self.farm_no})
-            rows = cursor.fetchall()
+        rows = self.fetch_all(sql, {'farm_no': self.farm_no})
 
-            config = {
-                'avg_return_day': 7,
-                'first_mating_age': 240,
-            }
+        config = {
+            'avg_return_day': 7,
+            'first_mating_age': 240,
+        }
 
-            code_map = {
-                '140007': 'first_mating_age',
-                '140008': 'avg_return_day',
-            }
-            for code, value in rows:
-                if code in code_map:
-                    config[code_map[code]] = int(value) if value else config[code_map[code]]
+        code_map = {
+            '140007': 'first_mating_age',
+            '140008': 'avg_return_day',
+        }
+        for code, value in rows:
+            if code in code_map:
+                config[code_map[code]] = int(value) if value else config[code_map[code]]
 
-            self.logger.info(f"TC_FARM_CONFIG 교배 설정 조회: farm_no={self.farm_no}, config={config}")
-            return config
-        finally:
-            cursor.close()
+        self.logger.info(f"TC_FARM_CONFIG 교배 설정 조회: farm_no={self.farm_no}, config={config}")
+        return config
 
     def _get_plan_from_prev_week(self) -> Optional[tuple]:
         """이전 주차 금주예정에서 교배 예정 조회 (초교배/정상교배 분리 + 힌트)
@@ -300,26 +296,10 @@ class MatingProcessor(BaseProcessor):
             return 0, 0
 
         # 초교배 예정 (후보돈: 010001)
-        sql_hubo = """
-        SELECT COUNT(*)
-        FROM TABLE(FN_MD_SCHEDULE_BSE_2020(
-            :farm_no, 'JOB-DAJANG', '150005', '010001',
-            :sdt, :edt, NULL, 'ko', 'yyyy-MM-dd', :seq_filter, NULL
-        ))
-        """
-        result = self.fetch_one(sql_hubo, {'farm_no': self.farm_no, 'sdt': sdt, 'edt': edt, 'seq_filter': seq_filter})
-        plan_hubo = result[0] if result else 0
+        plan_hubo = len(self.fetch_schedule('150005', '010001', sdt, edt, seq_filter))
 
         # 정상교배 예정 (이유돈: 010005)
-        sql_js = """
-        SELECT COUNT(*)
-        FROM TABLE(FN_MD_SCHEDULE_BSE_2020(
-            :farm_no, 'JOB-DAJANG', '150005', '010005',
-            :sdt, :edt, NULL, 'ko', 'yyyy-MM-dd', :seq_filter, NULL
-        ))
-        """
-        result = self.fetch_one(sql_js, {'farm_no': self.farm_no, 'sdt': sdt, 'edt': edt, 'seq_filter': seq_filter})
-        plan_js = result[0] if result else 0
+        plan_js = len(self.fetch_schedule('150005', '010005', sdt, edt, seq_filter))
 
         return plan_hubo, plan_js
 
@@ -511,7 +491,7 @@ class MatingProcessor(BaseProcessor):
             :first_gb_cnt, :sago_gb_cnt, :js_gb_cnt, :plan_hubo, :plan_js, :acc_gb_cnt
         )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'total_cnt': stats.get('total_cnt', 0),
@@ -625,7 +605,7 @@ class MatingProcessor(BaseProcessor):
         )
         """
 
-        self.execute(insert_sql, {
+        self.insert_sub(insert_sql, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'cnt_1': int(api_data.get('C029') or 0),  # ~3일
@@ -47,6 +47,7 @@ class ModonProcessor(BaseProcessor):
     """모돈현황 팝업 프로세서 (v2 - Python 가공)"""
 
     PROC_NAME = 'ModonProcessor'
+    WRITES = ('SUB.MODON', 'WEEK.MODON')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """모돈현황 데이터 추출
@@ -227,7 +228,7 @@ class ModonProcessor(BaseProcessor):
                 'hubo': 0, 'imsin': 0, 'poyu': 0, 'eumo': 0, 'sago': 0
             })
 
-            self.execute(sql, {
+            self.insert_sub(sql, {
                 'master_seq': self.master_seq,
                 'farm_no': self.farm_no,
                 'sort_no': config['sort_no'],
@@ -299,24 +300,19 @@ class ModonProcessor(BaseProcessor):
           AND FARM_NO = :farm_no
           AND GUBUN = 'MODON'
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute(sql_prev_parity, {
-                'master_seq': prev_master_seq,
-                'farm_no': self.farm_no,
-            })
-            prev_parity_data = {}
-            for row in cursor.fetchall():
-                code_1 = row[0]
-                prev_parity_data[code_1] = {
-                    'hubo': row[1] or 0,
-                    'imsin': row[2] or 0,
-                    'poyu': row[3] or 0,
-                    'eumo': row[4] or 0,
-                    'sago': row[5] or 0,
-                }
-        finally:
-            cursor.close()
+        prev_parity_data = {}
+        for row in self.fetch_all(sql_prev_parity, {
+            'master_seq': prev_master_seq,
+            'farm_no': self.farm_no,
+        }):
+            code_1 = row[0]
+            prev_parity_data[code_1] = {
+                'hubo': row[1] or 0,
+                'imsin': row[2] or 0,
+                'poyu': row[3] or 0,
+                'eumo': row[4] or 0,
+                'sago': row[5] or 0,
+            }
 
         return {
             'master_seq': prev_master_seq,
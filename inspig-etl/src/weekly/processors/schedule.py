@@ -28,6 +28,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from ..schedule_engine import SCHEDULE_ENGINE_PYTHON, parse_seq_filter
 from .base import BaseProcessor
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,8 @@ class ScheduleProcessor(BaseProcessor):
     """금주 예정 팝업 프로세서 (v2 - Oracle Function 호출)"""
 
     PROC_NAME = 'ScheduleProcessor'
+    READS = ('SUB.CONFIG',)
+    WRITES = ('SUB.SCHEDULE', 'WEEK.THIS')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """금주 예정 데이터 추출
@@ -308,40 +311,35 @@ class ScheduleProcessor(BaseProcessor):
         FROM TC_FARM_CONFIG
         WHERE FARM_NO = :farm_no AND CODE IN ('140002', '140003', '140007', '140008')
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute(sql, {'farm_no': self.farm_no})
-            rows = cursor.fetchall()
-
-            # 기본값 설정
-            config = {
-                'avg_return_day': 7,       # 140008
-                'first_mating_age': 240,   # 140007
-                'preg_period': 115,        # 140002
-                'wean_period': 21,         # 140003
-            }
+        rows = self.fetch_all(sql, {'farm_no': self.farm_no})
+
+        # 기본값 설정
+        config = {
+            'avg_return_day': 7,       # 140008
+            'first_mating_age': 240,   # 140007
+            'preg_period': 115,        # 140002
+            'wean_period': 21,         # 140003
+        }
 
-            # 조회 결과로 업데이트
-            code_map = {
-                '140002': 'preg_period',
-                '140003': 'wean_period',
-                '140007': 'first_mating_age',
-                '140008': 'avg_return_day',
-            }
-            for code, value in rows:
-                if code in code_map:
-                    config[code_map[code]] = int(value) if value else config[code_map[code]]
+        # 조회 결과로 업데이트
+        code_map = {
+            '140002': 'preg_period',
+            '140003': 'wean_period',
+            '140007': 'first_mating_age',
+            '140008': 'avg_return_day',
+        }
+        for code, value in rows:
+            if code in code_map:
+                config[code_map[code]] = int(value) if value else config[code_map[code]]
 
-            self.logger.info(f"TC_FARM_CONFIG 조회: farm_no={self.farm_no}, config={config}")
-            return config
-        finally:
-            cursor.close()
+        self.logger.info(f"TC_FARM_CONFIG 조회: farm_no={self.farm_no}, config={config}")
+        return config
 
     def _count_schedule(self, job_gubun_cd: str, status_cd: Optional[str],
                         v_sdt: str, v_edt: str, dates: List[datetime],
                         count_dict: Dict, seq_filter: str = '-1',
                         add_early_to_first: bool = False) -> None:
-        """FN_MD_SCHEDULE_BSE_2020 호출하여 카운트 (모돈 작업설정 기준)
+        """FN_MD_SCHEDULE_BSE_2020 결과로 카운트 (모돈 작업설정 기준, fetch_schedule 사용)
 
         Args:
             job_gubun_cd: 작업구분코드
@@ -358,39 +356,28 @@ class ScheduleProcessor(BaseProcessor):
             self.logger.info(f"작업 없음 (seq_filter=''), 카운트 생략: {job_gubun_cd}")
             return
 
-        sql = """
-        SELECT TO_DATE(PASS_DT, 'YYYY-MM-DD') AS SCH_DT
-        FROM TABLE(FN_MD_SCHEDULE_BSE_2020(
-            :farm_no, 'JOB-DAJANG', :job_gubun_cd, :status_cd,
-            :v_sdt, :v_edt, NULL, 'ko', 'yyyy-MM-dd', :seq_filter, NULL
-        ))
-        """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute(sql, {
-                'farm_no': self.farm_no,
-                'job_gubun_cd': job_gubun_cd,
-                'status_cd': status_cd,
-                'v_sdt': v_sdt,
-                'v_edt': v_edt,
-                'seq_filter': seq_filter,
-            })
+        for row in self.fetch_schedule(job_gubun_cd, status_cd, v_sdt, v_edt, seq_filter):
+            sch_dt = self._parse_pass_dt(row['PASS_DT'])
+            if sch_dt:
+                # Oracle과 동일: 교배예정만 기간 이전 데이터를 첫째 날에 합산
+                if add_early_to_first and sch_dt < dates[0]:
+                    count_dict['sum'] += 1
+                    count_dict['daily'][0] += 1
+                else:
+                    for i, dt in enumerate(dates):
+                        if sch_dt.date() == dt.date():
+                            count_dict['sum'] += 1
+                            count_dict['daily'][i] += 1
+                            break
 
-            for row in cursor.fetchall():
-                sch_dt = row[0]
-                if sch_dt:
-                    # Oracle과 동일: 교배예정만 기간 이전 데이터를 첫째 날에 합산
-                    if add_early_to_first and sch_dt < dates[0]:
-                        count_dict['sum'] += 1
-                        count_dict['daily'][0] += 1
-                    else:
-                        for i, dt in enumerate(dates):
-                            if sch_dt.date() == dt.date():
-                                count_dict['sum'] += 1
-                                count_dict['daily'][i] += 1
-                                break
-        finally:
-            cursor.close()
+    @staticmethod
+    def _parse_pass_dt(pass_dt: Any) -> Optional[datetime]:
+        """FN_MD_SCHEDULE_BSE_2020 PASS_DT (yyyy-MM-dd 문자열) → datetime"""
+        if not pass_dt:
+            return None
+        if isinstance(pass_dt, datetime):
+            return pass_dt
+        return datetime.strptime(str(pass_dt)[:10], '%Y-%m-%d')
 
     def _count_schedule_by_farm(self, schedule_type: str, dates: List[datetime],
                                  count_dict: Dict, config: Dict[str, Any],
@@ -564,50 +551,44 @@ class ScheduleProcessor(BaseProcessor):
         else:
             return
 
-        cursor = self.conn.cursor()
-        try:
-            # schedule_type별 필요한 파라미터만 설정
-            if schedule_type == 'mating':
-                params = {
-                    'farm_no': self.farm_no,
-                    'dt_from': dt_from,
-                    'dt_to': dt_to,
-                    'avg_return_day': farm_config['avg_return_day'],
-                    'first_mating_age': farm_config['first_mating_age'],
-                }
-            elif schedule_type == 'farrowing':
-                params = {
-                    'farm_no': self.farm_no,
-                    'preg_period': farm_config['preg_period'],
-                    'dt_from_str': dt_from.strftime('%Y%m%d'),
-                    'dt_to_str': dt_to.strftime('%Y%m%d'),
-                }
-            elif schedule_type == 'weaning':
-                params = {
-                    'farm_no': self.farm_no,
-                    'wean_period': farm_config['wean_period'],
-                    'dt_from_str': dt_from.strftime('%Y%m%d'),
-                    'dt_to_str': dt_to.strftime('%Y%m%d'),
-                }
-            else:
-                return
-
-            cursor.execute(sql, params)
+        # schedule_type별 필요한 파라미터만 설정
+        if schedule_type == 'mating':
+            params = {
+                'farm_no': self.farm_no,
+                'dt_from': dt_from,
+                'dt_to': dt_to,
+                'avg_return_day': farm_config['avg_return_day'],
+                'first_mating_age': farm_config['first_mating_age'],
+            }
+        elif schedule_type == 'farrowing':
+            params = {
+                'farm_no': self.farm_no,
+                'preg_period': farm_config['preg_period'],
+                'dt_from_str': dt_from.strftime('%Y%m%d'),
+                'dt_to_str': dt_to.strftime('%Y%m%d'),
+            }
+        elif schedule_type == 'weaning':
+            params = {
+                'farm_no': self.farm_no,
+                'wean_period': farm_config['wean_period'],
+                'dt_from_str': dt_from.strftime('%Y%m%d'),
+                'dt_to_str': dt_to.strftime('%Y%m%d'),
+            }
+        else:
+            return
 
-            for row in cursor.fetchall():
-                pass_dt = row[0]
-                if pass_dt:
-                    if add_early_to_first and pass_dt < dt_from:
-                        count_dict['sum'] += 1
-                        count_dict['daily'][0] += 1
-                    else:
-                        for i, dt in enumerate(dates):
-                            if pass_dt.date() == dt.date():
-                                count_dict['sum'] += 1
-                                count_dict['daily'][i] += 1
-                                break
-        finally:
-            cursor.close()
+        for row in self.fetch_all(sql, params):
+            pass_dt = row[0]
+            if pass_dt:
+                if add_early_to_first and pass_dt < dt_from:
+                    count_dict['sum'] += 1
+                    count_dict['daily'][0] += 1
+                else:
+                    for i, dt in enumerate(dates):
+                        if pass_dt.date() == dt.date():
+                            count_dict['sum'] += 1
+                            count_dict['daily'][i] += 1
+                            break
 
     def _get_imsin_check_counts(self, v_sdt: str, v_edt: str, dt_from: datetime,
                                   dates: List[datetime], ins_conf: Dict[str, Dict[str, Any]]) -> Dict[str, Dict]:
@@ -639,33 +620,15 @@ class ScheduleProcessor(BaseProcessor):
                 self.logger.info("임신감정 작업 없음 (seq_filter=''), 카운트 생략")
                 return result
 
-            sql = """
-            SELECT TO_DATE(PASS_DT, 'YYYY-MM-DD') AS SCH_DT
-            FROM TABLE(FN_MD_SCHEDULE_BSE_2020(
-                :farm_no, 'JOB-DAJANG', '150001', NULL,
-                :v_sdt, :v_edt, NULL, 'ko', 'yyyy-MM-dd', :seq_filter, NULL
-            ))
-            """
-            cursor = self.conn.cursor()
-            try:
-                cursor.execute(sql, {
-                    'farm_no': self.farm_no,
-                    'v_sdt': v_sdt,
-                    'v_edt': v_edt,
-                    'seq_filter': seq_filter,
-                })
-
-                for row in cursor.fetchall():
-                    sch_dt = row[0]
-                    if sch_dt:
-                        for i, dt in enumerate(dates):
-                            if sch_dt.date() == dt.date():
-                                # 모돈작업설정은 3w/4w 구분 없이 합산 (3w에 집계)
-                                result['3w']['sum'] += 1
-                                result['3w']['daily'][i] += 1
-                                break
-            finally:
-                cursor.close()
+            for row in self.fetch_schedule('150001', None, v_sdt, v_edt, seq_filter):
+                sch_dt = self._parse_pass_dt(row['PASS_DT'])
+                if sch_dt:
+                    for i, dt in enumerate(dates):
+                        if sch_dt.date() == dt.date():
+                            # 모돈작업설정은 3w/4w 구분 없이 합산 (3w에 집계)
+                            result['3w']['sum'] += 1
+                            result['3w']['daily'][i] += 1
+                            break
         else:
             # 농장기본값: 교배일 + 21일/28일 고정
             sql = """
@@ -681,30 +644,24 @@ class ScheduleProcessor(BaseProcessor):
               AND WK.WK_GUBUN = 'G'
             """
 
-            cursor = self.conn.cursor()
-            try:
-                cursor.execute(sql, {'farm_no': self.farm_no})
-
-                for row in cursor.fetchall():
-                    gb_dt = row[0]
-                    if not gb_dt:
-                        continue
-
-                    # 3주령: 교배일 + 21일 (정확히 21일째)
-                    check_3w = gb_dt + timedelta(days=21)
-                    for i, dt in enumerate(dates):
-                        if check_3w.date() == dt.date():
-                            result['3w']['daily'][i] += 1
-                            break
-
-                    # 4주령: 교배일 + 28일 (정확히 28일째)
-                    check_4w = gb_dt + timedelta(days=28)
-                    for i, dt in enumerate(dates):
-                        if check_4w.date() == dt.date():
-                            result['4w']['daily'][i] += 1
-                            break
-            finally:
-                cursor.close()
+            for row in self.fetch_all(sql, {'farm_no': self.farm_no}):
+                gb_dt = row[0]
+                if not gb_dt:
+                    continue
+
+                # 3주령: 교배일 + 21일 (정확히 21일째)
+                check_3w = gb_dt + timedelta(days=21)
+                for i, dt in enumerate(dates):
+                    if check_3w.date() == dt.date():
+                        result['3w']['daily'][i] += 1
+                        break
+
+                # 4주령: 교배일 + 28일 (정확히 28일째)
+                check_4w = gb_dt + timedelta(days=28)
+                for i, dt in enumerate(dates):
+                    if check_4w.date() == dt.date():
+                        result['4w']['daily'][i] += 1
+                        break
 
             # 합계 계산 (농장기본값만)
             for i in range(7):
@@ -773,7 +730,7 @@ class ScheduleProcessor(BaseProcessor):
             :period_from, :period_to
         )
         """
-        self.execute(sql, {
+        self.insert_sub(sql, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'week_num': week_num,
@@ -829,7 +786,7 @@ class ScheduleProcessor(BaseProcessor):
         """
 
         for sort_no, code_1, daily in cal_data:
-            self.execute(sql, {
+            self.insert_sub(sql, {
                 'master_seq': self.master_seq,
                 'farm_no': self.farm_no,
                 'sort_no': sort_no,
@@ -916,6 +873,10 @@ class ScheduleProcessor(BaseProcessor):
             dt_from: 시작일 (datetime)
             seq_filter: TB_PLAN_MODON.SEQ 필터 ('-1'=전체, '1,2,3'=선택)
         """
+        if self.data_loader and self.data_loader.schedule_mode == SCHEDULE_ENGINE_PYTHON:
+            self._insert_popup_by_job_python(sub_gubun, job_gubun_cd, v_sdt, v_edt, dt_from, seq_filter)
+            return
+
         # seq_filter가 특정 SEQ인 경우 해당 SEQ만 조회
         seq_condition = ""
         if seq_filter != '-1':
@@ -970,6 +931,65 @@ class ScheduleProcessor(BaseProcessor):
             'seq_filter': seq_filter,
         })
 
+    def _insert_popup_by_job_python(self, sub_gubun: str, job_gubun_cd: str,
+                                    v_sdt: str, v_edt: str, dt_from: datetime,
+                                    seq_filter: str = '-1') -> None:
+        """작업유형별 팝업 상세 INSERT - ScheduleEngine 계산 (schedule_engine=python)
+
+        _insert_popup_by_job의 INSERT ... SELECT와 동일한 결과:
+        - TB_PLAN_MODON 작업(WK_NM 순)별 1행, 예정 건수는 WK_NM 기준 집계
+        - D1은 기간 이전 예정일 포함
+        """
+        engine = self.get_schedule_engine()
+        seqs = parse_seq_filter(seq_filter)
+        plans = sorted(
+            (p for p in engine.plans
+             if p.get('JOB_GUBUN_CD') == job_gubun_cd and (seqs is None or int(p['SEQ']) in seqs)),
+            key=lambda p: p.get('WK_NM') or '',
+        )
+        if not plans:
+            return
+
+        # WK_NM별 합계/요일별 건수
+        counts: Dict[str, List[int]] = {}
+        for row in self.fetch_schedule(job_gubun_cd, None, v_sdt, v_edt, seq_filter):
+            sch_dt = self._parse_pass_dt(row['PASS_DT'])
+            if not sch_dt:
+                continue
+            cnt = counts.setdefault(row['WK_NM'], [0] * 8)
+            cnt[0] += 1
+            offset = max((sch_dt.date() - dt_from.date()).days, 0)
+            if offset < 7:
+                cnt[offset + 1] += 1
+
+        sql = """
+        INSERT INTO TS_INS_WEEK_SUB (
+            MASTER_SEQ, FARM_NO, GUBUN, SUB_GUBUN, SORT_NO,
+            STR_1, STR_2, STR_3, STR_4, CNT_1,
+            CNT_2, CNT_3, CNT_4, CNT_5, CNT_6, CNT_7, CNT_8
+        ) VALUES (
+            :master_seq, :farm_no, 'SCHEDULE', :sub_gubun, :sort_no,
+            :str_1, :str_2, :str_3, :str_4, :cnt_1,
+            :cnt_2, :cnt_3, :cnt_4, :cnt_5, :cnt_6, :cnt_7, :cnt_8
+        )
+        """
+        for sort_no, plan in enumerate(plans, start=1):
+            cnt = counts.get(plan.get('WK_NM'), [0] * 8)
+            pass_day = plan.get('PASS_DAY')
+            self.insert_sub(sql, {
+                'master_seq': self.master_seq,
+                'farm_no': self.farm_no,
+                'sub_gubun': sub_gubun,
+                'sort_no': sort_no,
+                'str_1': plan.get('WK_NM'),
+                'str_2': plan.get('STD_CD'),
+                'str_3': plan.get('MODON_STATUS_CD'),
+                'str_4': f"{'' if pass_day is None else pass_day}일",
+                'cnt_1': cnt[0],
+                'cnt_2': cnt[1], 'cnt_3': cnt[2], 'cnt_4': cnt[3], 'cnt_5': cnt[4],
+                'cnt_6': cnt[5], 'cnt_7': cnt[6], 'cnt_8': cnt[7],
+            })
+
     def _insert_mating_farm_popup(self, v_sdt: str, v_edt: str, dt_from: datetime) -> None:
         """교배예정 팝업 상세 INSERT - 농장기본값 (SUB_GUBUN='GB')
 
@@ -1351,7 +1371,7 @@ class ScheduleProcessor(BaseProcessor):
             :mating_method, :farrowing_method, :pregnancy_method, :weaning_method, :vaccine_method
         )
         """
-        self.execute(sql, {
+        self.insert_sub(sql, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'mating_method': ins_conf['mating']['method'],
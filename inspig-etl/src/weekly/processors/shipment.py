@@ -39,6 +39,8 @@ class ShipmentProcessor(BaseProcessor):
     """출하 팝업 프로세서 (v2 - Python 가공)"""
 
     PROC_NAME = 'ShipmentProcessor'
+    READS = ('SUB.CONFIG',)
+    WRITES = ('SUB.SHIP', 'WEEK.SH')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """출하 데이터 추출
@@ -205,7 +207,7 @@ class ShipmentProcessor(BaseProcessor):
             :str_1, :str_2
         )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'cnt_1': ship_cnt,
@@ -277,7 +279,7 @@ class ShipmentProcessor(BaseProcessor):
                 val_1 = None
                 val_2 = None
 
-            self.execute(sql_ins, {
+            self.insert_sub(sql_ins, {
                 'master_seq': self.master_seq,
                 'farm_no': self.farm_no,
                 'sort_no': day_no,
@@ -347,7 +349,7 @@ class ShipmentProcessor(BaseProcessor):
                 :master_seq, :farm_no, 'SHIP', 'SCATTER', 1, :scatter_json
             )
         """
-        self.execute(sql_ins, {
+        self.insert_sub(sql_ins, {
             'master_seq': self.master_seq,
             'farm_no': self.farm_no,
             'scatter_json': scatter_json,
@@ -543,7 +545,7 @@ class ShipmentProcessor(BaseProcessor):
             if len(daily_vals) < 7:
                 daily_vals.extend([None] * (7 - len(daily_vals)))
 
-            self.execute(sql_ins, {
+            self.insert_sub(sql_ins, {
                 'master_seq': self.master_seq,
                 'farm_no': self.farm_no,
                 'sort_no': rn,
@@ -12,21 +12,41 @@ SP_INS_WEEK_EU_POPUP 프로시저 Python 전환
 TS_INS_CONF 설정 지원:
 - method='farm': 농장 기본값 사용 (TC_FARM_CONFIG)
 - method='modon': 모돈 작업설정 사용 (FN_MD_SCHEDULE_BSE_2020)
+
+이유 통계 집계 (config.ini [processing] aggregate_engine, FarmDataLoader.aggregate_mode):
+- oracle: 자돈 이동 전체 이력 WITH절 집계 SQL (기본값)
+- python: FarmDataLoader 모돈별 작업이력/이유/분만/자돈 이동으로 계산 (실패 시 SQL)
+- verify: SQL 집계 결과 사용 + Python 계산과 비교 (차이는 WARNING 로그)
 """
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..columnar import day_to_yyyymmdd, yyyymmdd_to_day
+from ..schedule_engine import SCHEDULE_ENGINE_ORACLE, SCHEDULE_ENGINE_PYTHON, SCHEDULE_ENGINE_VERIFY
 from .base import BaseProcessor
+from .shipment import oracle_round
 
 logger = logging.getLogger(__name__)
 
+# 이유 통계 집계 항목 (_select_stats SELECT 컬럼 순서)
+STATS_FIELDS = (
+    'total_cnt', 'sum_eudusu', 'sum_chongsan', 'sum_silsan', 'sum_pougigan', 'sum_kg',
+    'avg_eudusu', 'avg_pougigan', 'sum_ps_ds', 'sum_bb_ds', 'sum_ji_ds', 'sum_jc_ds', 'sum_pogae',
+)
+
+# 자돈 이동 구분 (TB_MODON_JADON_TRANS.GUBUN_CD): 포유사고/분양/양자전입/양자전출
+TRANS_PS, TRANS_BB, TRANS_JI, TRANS_JC = '160001', '160002', '160003', '160004'
+TRANS_CODES = (TRANS_PS, TRANS_BB, TRANS_JI, TRANS_JC)
+
 
 class WeaningProcessor(BaseProcessor):
     """이유 팝업 프로세서"""
 
     PROC_NAME = 'WeaningProcessor'
+    WRITES = ('SUB.EU', 'WEEK.EU')
 
     def process(self, dt_from: str, dt_to: str, **kwargs) -> Dict[str, Any]:
         """이유 데이터 추출
@@ -137,21 +157,16 @@ class WeaningProcessor(BaseProcessor):
         FROM TC_FARM_CONFIG
         WHERE FARM_NO = :farm_no AND CODE = '140003'
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute(sql, {'farm_no': self.farm_no})
-            rows = cursor.fetchall()
+        rows = self.fetch_all(sql, {'farm_no': self.farm_no})
 
-            config = {'wean_period': 21}
+        config = {'wean_period': 21}
 
-            for code, value in rows:
-                if code == '140003':
-                    config['wean_period'] = int(value) if value else 21
+        for code, value in rows:
+            if code == '140003':
+                config['wean_period'] = int(value) if value else 21
 
-            self.logger.info(f"TC_FARM_CONFIG 이유 설정 조회: farm_no={self.farm_no}, config={config}")
-            return config
-        finally:
-            cursor.close()
+        self.logger.info(f"TC_FARM_CONFIG 이유 설정 조회: farm_no={self.farm_no}, config={config}")
+        return config
 
     def _get_plan_from_prev_week(self) -> Optional[tuple]:
         """이전 주차 금주예정에서 이유 예정 조회 (힌트 포함)
@@ -258,15 +273,7 @@ class WeaningProcessor(BaseProcessor):
             self.logger.info("이유 작업 없음 (seq_filter=''), 카운트 생략")
             return 0
 
-        sql = """
-        SELECT COUNT(*)
-        FROM TABLE(FN_MD_SCHEDULE_BSE_2020(
-            :farm_no, 'JOB-DAJANG', '150003', NULL,
-            :sdt, :edt, NULL, 'ko', 'yyyy-MM-dd', :seq_filter, NULL
-        ))
-        """
-        result = self.fetch_one(sql, {'farm_no': self.farm_no, 'sdt': sdt, 'edt': edt, 'seq_filter': seq_filter})
-        return result[0] if result else 0
+        return len(self.fetch_schedule('150003', None, sdt, edt, seq_filter))
 
     def _count_plan_by_farm(self, dt_from: datetime, dt_to: datetime) -> int:
         """농장 기본값 기준 이유 예정 복수 조회
@@ -338,6 +345,103 @@ class WeaningProcessor(BaseProcessor):
     def _insert_stats(self, dt_from: str, dt_to: str, plan_eu: int, acc_stats: Dict) -> Dict[str, Any]:
         """이유 통계 집계 및 INSERT (자돈 증감 포함)
 
+        집계는 aggregate_mode에 따라 Python 계산(_calculate_stats_python) 또는 SQL(_select_stats)
+        """
+        mode = self.data_loader.aggregate_mode if self.data_loader else SCHEDULE_ENGINE_ORACLE
+        result = None
+        if mode == SCHEDULE_ENGINE_PYTHON:
+            try:
+                result = self._calculate_stats_python(dt_from, dt_to)
+            except Exception as e:
+                self.logger.warning(f"이유 통계 Python 계산 실패, SQL 집계 사용: 농장={self.farm_no} - {e}")
+        if result is None:
+            result = self._select_stats(dt_from, dt_to)
+            if mode == SCHEDULE_ENGINE_VERIFY:
+                self._verify_stats(result, dt_from, dt_to)
+
+        total_cnt = result[0] if result else 0
+        sum_eudusu = result[1] if result else 0
+        sum_chongsan = result[2] if result else 0
+        sum_silsan = result[3] if result else 0
+        sum_pougigan = result[4] if result else 0
+        sum_kg = result[5] if result else 0
+        avg_eudusu = result[6] if result else 0
+        avg_pougigan = result[7] if result else 0
+        sum_ps_ds = result[8] if result else 0
+        sum_bb_ds = result[9] if result else 0
+        sum_ji_ds = result[10] if result else 0
+        sum_jc_ds = result[11] if result else 0
+        sum_pogae = result[12] if result else 0
+
+        # 평균체중 계산 (TOTAL_KG / 총이유두수) - 이유자돈 평균체중
+        avg_kg = round(sum_kg / sum_eudusu, 2) if sum_eudusu > 0 else 0
+
+        # 이유육성율 계산 (이유두수 / 실산 * 100)
+        survival_rate = round(sum_eudusu / sum_silsan * 100, 1) if sum_silsan > 0 else 0
+
+        # 평균 이유두수 증감 계산 (지난주 평균 - 1년 평균)
+        chg_jd = round(avg_eudusu - acc_stats['acc_avg_jd'], 1) if acc_stats['acc_avg_jd'] > 0 else 0
+
+        stats = {
+            'total_cnt': total_cnt,
+            'sum_eudusu': sum_eudusu,
+            'sum_chongsan': sum_chongsan,
+            'sum_silsan': sum_silsan,
+            'sum_pougigan': sum_pougigan,
+            'avg_eudusu': avg_eudusu,
+            'avg_kg': avg_kg,
+            'avg_pougigan': avg_pougigan,
+            'survival_rate': survival_rate,
+            'sum_pogae': sum_pogae,
+            'sum_ps_ds': sum_ps_ds,
+            'sum_bb_ds': sum_bb_ds,
+            'sum_ji_ds': sum_ji_ds,
+            'sum_jc_ds': sum_jc_ds,
+            'chg_jd': chg_jd,
+            'plan_eu': plan_eu,
+        }
+
+        # INSERT
+        sql_ins = """
+        INSERT INTO TS_INS_WEEK_SUB (
+            MASTER_SEQ, FARM_NO, GUBUN, SORT_NO,
+            CNT_1, CNT_2, CNT_3, CNT_4, CNT_5,
+            CNT_6, CNT_7, CNT_8, CNT_9,
+            VAL_1, VAL_2, VAL_3, VAL_4, VAL_5,
+            STR_1
+        ) VALUES (
+            :master_seq, :farm_no, 'EU', 1,
+            :total_cnt, :sum_eudusu, :sum_silsan, :sum_pougigan, :plan_eu,
+            :sum_ps_ds, :sum_bb_ds, :sum_ji_ds, :sum_jc_ds,
+            :avg_eudusu, :avg_kg, :survival_rate, :avg_pougigan, :sum_pogae,
+            TO_CHAR(:sum_chongsan)
+        )
+        """
+        self.insert_sub(sql_ins, {
+            'master_seq': self.master_seq,
+            'farm_no': self.farm_no,
+            'total_cnt': stats.get('total_cnt', 0),
+            'sum_eudusu': stats.get('sum_eudusu', 0),
+            'sum_silsan': stats.get('sum_silsan', 0),
+            'sum_pougigan': stats.get('sum_pougigan', 0),
+            'plan_eu': stats.get('plan_eu', 0),
+            'sum_ps_ds': stats.get('sum_ps_ds', 0),
+            'sum_bb_ds': stats.get('sum_bb_ds', 0),
+            'sum_ji_ds': stats.get('sum_ji_ds', 0),
+            'sum_jc_ds': stats.get('sum_jc_ds', 0),
+            'avg_eudusu': stats.get('avg_eudusu', 0),
+            'avg_kg': stats.get('avg_kg', 0),
+            'survival_rate': stats.get('survival_rate', 0),
+            'avg_pougigan': stats.get('avg_pougigan', 0),
+            'sum_pogae': stats.get('sum_pogae', 0),
+            'sum_chongsan': stats.get('sum_chongsan', 0),
+        })
+
+        return stats
+
+    def _select_stats(self, dt_from: str, dt_to: str) -> Optional[tuple]:
+        """이유 통계 SQL 집계 (STATS_FIELDS 순서)
+
         WITH절로 사전 집계:
         - JADON_TRANS_AGG: 자돈 증감 내역 (SANCHA+WK_DT 기준)
         - JADON_POGAE_AGG: 포유개시용 (BUN_DT 기준)
@@ -453,87 +557,161 @@ class WeaningProcessor(BaseProcessor):
           AND A.WK_DT >= :dt_from
           AND A.WK_DT <= :dt_to
         """
-        result = self.fetch_one(sql, {'farm_no': self.farm_no, 'dt_from': dt_from, 'dt_to': dt_to})
-
-        total_cnt = result[0] if result else 0
-        sum_eudusu = result[1] if result else 0
-        sum_chongsan = result[2] if result else 0
-        sum_silsan = result[3] if result else 0
-        sum_pougigan = result[4] if result else 0
-        sum_kg = result[5] if result else 0
-        avg_eudusu = result[6] if result else 0
-        avg_pougigan = result[7] if result else 0
-        sum_ps_ds = result[8] if result else 0
-        sum_bb_ds = result[9] if result else 0
-        sum_ji_ds = result[10] if result else 0
-        sum_jc_ds = result[11] if result else 0
-        sum_pogae = result[12] if result else 0
+        return self.fetch_one(sql, {'farm_no': self.farm_no, 'dt_from': dt_from, 'dt_to': dt_to})
 
-        # 평균체중 계산 (TOTAL_KG / 총이유두수) - 이유자돈 평균체중
-        avg_kg = round(sum_kg / sum_eudusu, 2) if sum_eudusu > 0 else 0
+    def _calculate_stats_python(self, dt_from: str, dt_to: str) -> Optional[tuple]:
+        """이유 통계 Python 계산 (_select_stats와 같은 조인/집계, STATS_FIELDS 순서)
 
-        # 이유육성율 계산 (이유두수 / 실산 * 100)
-        survival_rate = round(sum_eudusu / sum_silsan * 100, 1) if sum_silsan > 0 else 0
+        기간 내 이유(E) 작업 모돈만 대상으로 모돈별 작업이력 인덱스와 이유/분만/자돈 이동을 1회 순회
+        - D: TB_EU (모돈, 이유일), B: 같은 산차 분만(B) 작업, E: TB_BUNMAN (모돈, 분만일)
+        - 다음 작업: 이유일보다 늦은 첫 작업일 (같은 날이면 작업구분 최소값, SEQ+1 연결인 NEXT_*와 다를 수 있음)
+        - 자돈 증감: 같은 산차 이동 중 분만일 ~ (다음 작업이 교배면 교배일, 다음 작업 없고 대리모 아니면 종료일,
+          그 외 이유일 전날)
+        - 포유개시: 실산 - 포유사고 + 양자전입 - 양자전출 (분만일 기준 이동)
 
-        # 평균 이유두수 증감 계산 (지난주 평균 - 1년 평균)
-        chg_jd = round(avg_eudusu - acc_stats['acc_avg_jd'], 1) if acc_stats['acc_avg_jd'] > 0 else 0
-
-        stats = {
-            'total_cnt': total_cnt,
-            'sum_eudusu': sum_eudusu,
-            'sum_chongsan': sum_chongsan,
-            'sum_silsan': sum_silsan,
-            'sum_pougigan': sum_pougigan,
-            'avg_eudusu': avg_eudusu,
-            'avg_kg': avg_kg,
-            'avg_pougigan': avg_pougigan,
-            'survival_rate': survival_rate,
-            'sum_pogae': sum_pogae,
-            'sum_ps_ds': sum_ps_ds,
-            'sum_bb_ds': sum_bb_ds,
-            'sum_ji_ds': sum_ji_ds,
-            'sum_jc_ds': sum_jc_ds,
-            'chg_jd': chg_jd,
-            'plan_eu': plan_eu,
-        }
+        로드 데이터는 2년 이내 이력이므로 분만/이동이 2년 이전인 이유는 SQL과 다를 수 있음
 
-        # INSERT
-        sql_ins = """
-        INSERT INTO TS_INS_WEEK_SUB (
-            MASTER_SEQ, FARM_NO, GUBUN, SORT_NO,
-            CNT_1, CNT_2, CNT_3, CNT_4, CNT_5,
-            CNT_6, CNT_7, CNT_8, CNT_9,
-            VAL_1, VAL_2, VAL_3, VAL_4, VAL_5,
-            STR_1
-        ) VALUES (
-            :master_seq, :farm_no, 'EU', 1,
-            :total_cnt, :sum_eudusu, :sum_silsan, :sum_pougigan, :plan_eu,
-            :sum_ps_ds, :sum_bb_ds, :sum_ji_ds, :sum_jc_ds,
-            :avg_eudusu, :avg_kg, :survival_rate, :avg_pougigan, :sum_pogae,
-            TO_CHAR(:sum_chongsan)
-        )
+        Returns:
+            집계 튜플 (data_loader 없으면 None → SQL 집계)
         """
-        self.execute(sql_ins, {
-            'master_seq': self.master_seq,
-            'farm_no': self.farm_no,
-            'total_cnt': stats.get('total_cnt', 0),
-            'sum_eudusu': stats.get('sum_eudusu', 0),
-            'sum_silsan': stats.get('sum_silsan', 0),
-            'sum_pougigan': stats.get('sum_pougigan', 0),
-            'plan_eu': stats.get('plan_eu', 0),
-            'sum_ps_ds': stats.get('sum_ps_ds', 0),
-            'sum_bb_ds': stats.get('sum_bb_ds', 0),
-            'sum_ji_ds': stats.get('sum_ji_ds', 0),
-            'sum_jc_ds': stats.get('sum_jc_ds', 0),
-            'avg_eudusu': stats.get('avg_eudusu', 0),
-            'avg_kg': stats.get('avg_kg', 0),
-            'survival_rate': stats.get('survival_rate', 0),
-            'avg_pougigan': stats.get('avg_pougigan', 0),
-            'sum_pogae': stats.get('sum_pogae', 0),
-            'sum_chongsan': stats.get('sum_chongsan', 0),
-        })
+        if not self.data_loader:
+            return None
+        data = self.get_loaded_data()
+
+        a_rows = [wk for wk in self.filter_by_period(data.get('modon_wk', []), 'WK_DT', dt_from, dt_to)
+                  if wk.get('WK_GUBUN') == 'E']
+        pigs = {str(wk.get('MODON_NO')) for wk in a_rows}
+
+        eu_by: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        for eu in self.filter_by_period(data.get('eu', []), 'EU_DT', dt_from, dt_to):
+            eu_by[(str(eu.get('MODON_NO')), eu.get('EU_DT'))].append(eu)
+        bun_by: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        for bun in data.get('bunman', []):
+            if str(bun.get('MODON_NO')) in pigs:
+                bun_by[(str(bun.get('MODON_NO')), bun.get('BUN_DT'))].append(bun)
+        trans_by: Dict[str, List[Dict]] = defaultdict(list)
+        for trans in data.get('jadon_trans', []):
+            if str(trans.get('MODON_NO')) in pigs:
+                trans_by[str(trans.get('MODON_NO'))].append(trans)
+
+        def trans_sum(rows, cond) -> Dict[str, int]:
+            sums = dict.fromkeys(TRANS_CODES, 0)
+            for row in rows:
+                code = row.get('TRANS_GUBUN_CD')
+                if code in sums and cond(row):
+                    sums[code] += row.get('TRANS_CNT') or 0
+            return sums
+
+        def valid_dt(value) -> bool:
+            return value is not None and len(str(value).strip()) == 8
+
+        # JADON_PERIOD_AGG: (모돈, 산차, 이유일) → 분만 작업별 자돈 증감 (같은 키의 이유 작업 합산)
+        period_agg: Dict[Tuple[str, Any, str], List[Dict[str, int]]] = {}
+        births: Dict[Tuple[str, Any], List[Dict]] = {}
+        for a in a_rows:
+            pig, sancha, eu_dt = str(a.get('MODON_NO')), a.get('SANCHA'), a.get('WK_DT')
+            wks = self.data_loader.get_wk_by_modon(pig)
+            if (pig, sancha) not in births:
+                births[(pig, sancha)] = [wk for wk in wks if wk.get('WK_GUBUN') == 'B'
+                                         and sancha is not None and wk.get('SANCHA') == sancha]
+            b_rows = births[(pig, sancha)]
+
+            # NEXT_WK: 이유일 이후 첫 작업
+            next_dt, next_gubun = None, None
+            for wk in wks:
+                wk_dt = wk.get('WK_DT')
+                if wk_dt is None or not wk_dt > eu_dt:
+                    continue
+                gubun = wk.get('WK_GUBUN')
+                if next_dt is None or wk_dt < next_dt:
+                    next_dt, next_gubun = wk_dt, gubun
+                elif wk_dt == next_dt and gubun is not None and (next_gubun is None or gubun < next_gubun):
+                    next_gubun = gubun
+
+            if next_gubun == 'G':
+                end_dt = next_dt
+            elif next_dt is None and (a.get('DAERI_YN') or 'N') == 'N':
+                end_dt = dt_to
+            elif not valid_dt(eu_dt):
+                end_dt = dt_to
+            else:
+                end_dt = day_to_yyyymmdd(yyyymmdd_to_day(eu_dt) - 1)
+
+            key = (pig, sancha, eu_dt)
+            agg = period_agg.setdefault(key, [dict.fromkeys(TRANS_CODES, 0) for _ in b_rows])
+            for sums, b in zip(agg, b_rows):
+                window = trans_sum(
+                    trans_by[pig],
+                    lambda t, bm_dt=b.get('WK_DT'): (t.get('SANCHA') == sancha and t.get('TRANS_DT') is not None
+                                                    and bm_dt is not None and bm_dt <= t['TRANS_DT'] <= end_dt))
+                for code in TRANS_CODES:
+                    sums[code] += window[code]
+
+        # 메인 집계: 이유 작업 × TB_EU × 분만 작업 × TB_BUNMAN × 자돈 증감(분만 작업별)
+        total = dict.fromkeys(STATS_FIELDS, 0)
+        pougigan_cnt = 0
+        pogae_cache: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for a in a_rows:
+            pig, sancha, eu_dt = str(a.get('MODON_NO')), a.get('SANCHA'), a.get('WK_DT')
+            eus = eu_by.get((pig, eu_dt), [])
+            agg = period_agg[(pig, sancha, eu_dt)]
+            for b in births[(pig, sancha)]:
+                bm_dt = b.get('WK_DT')
+                if (pig, bm_dt) not in pogae_cache:
+                    pogae_cache[(pig, bm_dt)] = trans_sum(trans_by[pig], lambda t: t.get('BUN_DT') == bm_dt)
+                pogae = pogae_cache[(pig, bm_dt)]
+                days = None
+                if valid_dt(eu_dt) and valid_dt(bm_dt):
+                    days = yyyymmdd_to_day(eu_dt) - yyyymmdd_to_day(bm_dt)
+                for bun in bun_by.get((pig, bm_dt), []):
+                    silsan = bun.get('SILSAN') or 0
+                    for eu in eus:
+                        for sums in agg:
+                            total['total_cnt'] += 1
+                            total['sum_eudusu'] += eu.get('EU_CNT') or 0
+                            total['sum_chongsan'] += silsan + (bun.get('SASAN') or 0) + (bun.get('MUMMY') or 0)
+                            total['sum_silsan'] += silsan
+                            total['sum_kg'] += eu.get('EU_WT') or 0
+                            if days is not None:
+                                total['sum_pougigan'] += days
+                                pougigan_cnt += 1
+                            total['sum_ps_ds'] += sums[TRANS_PS]
+                            total['sum_bb_ds'] += sums[TRANS_BB]
+                            total['sum_ji_ds'] += sums[TRANS_JI]
+                            total['sum_jc_ds'] += sums[TRANS_JC]
+                            total['sum_pogae'] += silsan - pogae[TRANS_PS] + pogae[TRANS_JI] - pogae[TRANS_JC]
+
+        if total['total_cnt']:
+            total['avg_eudusu'] = oracle_round(total['sum_eudusu'] / total['total_cnt'], 1)
+        if pougigan_cnt:
+            total['avg_pougigan'] = oracle_round(total['sum_pougigan'] / pougigan_cnt, 1)
+        return tuple(total[field] for field in STATS_FIELDS)
+
+    def _verify_stats(self, sql_result: Optional[tuple], dt_from: str, dt_to: str) -> List[str]:
+        """SQL 집계 결과와 Python 계산 비교
 
-        return stats
+        Returns:
+            불일치 내역 리스트 (빈 리스트면 일치)
+        """
+        try:
+            py_result = self._calculate_stats_python(dt_from, dt_to)
+        except Exception as e:
+            self.logger.warning(f"이유 통계 계산 비교 실패: 농장={self.farm_no} - {e}")
+            return [str(e)]
+        if py_result is None:
+            return []
+
+        diffs = []
+        sql_values = sql_result or (0,) * len(STATS_FIELDS)
+        for field, sql_value, py_value in zip(STATS_FIELDS, sql_values, py_result):
+            if abs((sql_value or 0) - (py_value or 0)) > 1e-6:
+                diffs.append(f"{field}: SQL {sql_value} != Python {py_value}")
+
+        if diffs:
+            self.logger.warning(f"이유 통계 계산 불일치: 농장={self.farm_no}, 기간={dt_from}~{dt_to}, {diffs}")
+        else:
+            self.logger.debug(f"이유 통계 계산 일치: 농장={self.farm_no}")
+        return diffs
 
     def _update_week(self, stats: Dict[str, Any], acc_stats: Dict[str, Any]) -> None:
         """TS_INS_WEEK 이유 관련 컬럼 업데이트"""
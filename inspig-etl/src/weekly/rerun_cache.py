@@ -0,0 +1,150 @@
+"""
+농장 데이터 재실행 캐시
+- 수동 재생성(/api/run-farm → run_single_farm, --manual)과 --test --init-week 재실행은
+  같은 농장/주차를 매번 처음부터 FarmDataLoader로 다시 로드
+- FarmDataLoader 로드/가공 결과를 (농장, 기간, 기준일) 단위로 저장하고,
+  원본 테이블 변경 지문(건수/MAX(SEQ)/최종 수정일)이 같으면 로드를 생략
+- 데이터 수정 후 재실행하면 지문이 바뀌므로 새로 로드 (TTL 경과 항목도 새로 로드)
+
+저장소는 ResponseCache(SQLite, TTL, 크기 제한)를 그대로 사용하고 값만 pickle로 직렬화
+(로드 결과에 ColumnarTable/행 공유 참조가 있어 JSON 불가)
+"""
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import zlib
+from typing import Any, Dict, Optional
+
+from ..common import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# 캐시 형식 버전 (FarmDataLoader 조회/가공 결과 구조 변경 시 증가)
+RERUN_CACHE_VERSION = 1
+
+# 변경 지문 대상 테이블: (테이블, MAX(SEQ) 사용, 감사 컬럼(LOG_INS_DT/LOG_UPT_DT) 사용)
+FINGERPRINT_TABLES = (
+    ('TB_MODON', False, True),
+    ('TB_MODON_WK', True, True),
+    ('TB_BUNMAN', False, True),
+    ('TB_EU', False, True),
+    ('TB_SAGO', False, True),
+    ('TB_MODON_JADON_TRANS', True, True),
+    ('TB_GYOBAE', False, True),
+    ('TM_LPD_DATA', False, False),
+    ('TM_ETC_TRADE', True, True),
+    ('TA_FARM', False, True),
+    ('TC_FARM_CONFIG', False, True),
+)
+
+_caches: Dict[tuple, 'RerunCache'] = {}
+_caches_lock = threading.Lock()
+
+
+def open_rerun_cache(path: str, ttl_minutes: int = 120, max_mb: int = 500) -> 'RerunCache':
+    """프로세스별 공유 재실행 캐시 (경로당 1개, 워커 스레드 공유)"""
+    key = (os.getpid(), str(path))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = RerunCache(path, ttl_seconds=ttl_minutes * 60, max_bytes=max_mb * 1024 * 1024)
+            _caches[key] = cache
+        return cache
+
+
+def _fingerprint_sql() -> str:
+    """테이블별 (건수, MAX(SEQ), 최종 수정일) 1회 조회 SQL"""
+    parts = []
+    for table, use_seq, use_audit in FINGERPRINT_TABLES:
+        max_seq = 'MAX(SEQ)' if use_seq else 'NULL'
+        max_dt = ("TO_CHAR(MAX(NVL(LOG_UPT_DT, LOG_INS_DT)), 'YYYYMMDDHH24MISS')"
+                  if use_audit else 'NULL')
+        parts.append(
+            f"SELECT '{table}' AS TBL, COUNT(*) AS CNT, {max_seq} AS MAX_SEQ, {max_dt} AS MAX_DT "
+            f"FROM {table} WHERE FARM_NO = :farm_no"
+        )
+    return '\nUNION ALL '.join(parts)
+
+
+def farm_fingerprint(conn, farm_no: int) -> str:
+    """농장 원본 테이블 변경 지문
+
+    USE_YN 조건 없이 농장 전체 행 기준 (삭제/사용중지도 건수 또는 수정일에 반영)
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(_fingerprint_sql(), {'farm_no': farm_no})
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    digest = hashlib.sha1(repr(sorted(tuple(row) for row in rows)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class RerunCache(ResponseCache):
+    """FarmDataLoader 로드 결과 캐시 (SQLite)
+
+    사용 예:
+        cache = RerunCache('./cache/farm_rerun.sqlite', ttl_seconds=7200)
+        data_loader = FarmDataLoader(conn, farm_no, dt_from, dt_to)
+        load_with_cache(cache, data_loader)
+    """
+
+    @staticmethod
+    def make_loader_key(data_loader) -> str:
+        """캐시 키: 농장/기간/기준일/로케일/컬럼형 여부"""
+        return ResponseCache.make_key(
+            f"farm_data_v{RERUN_CACHE_VERSION}",
+            data_loader.farm_no,
+            f"{data_loader.dt_from}-{data_loader.dt_to}-{data_loader.base_date}"
+            f"-{data_loader.locale}-{'C' if data_loader.columnar else 'R'}",
+        )
+
+    def _encode(self, value: Any) -> bytes:
+        return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _decode(self, blob: bytes) -> Any:
+        return pickle.loads(zlib.decompress(blob))
+
+
+def load_with_cache(cache: Optional[RerunCache], data_loader):
+    """재실행 캐시를 거쳐 FarmDataLoader 로드
+
+    지문은 로드 전에 조회 (로드 중 변경된 데이터는 다음 실행에서 지문 불일치로 다시 로드)
+    캐시 오류 시 일반 로드로 처리
+
+    Args:
+        cache: RerunCache (None이면 일반 로드)
+        data_loader: 로드 전 FarmDataLoader
+
+    Returns:
+        로드 완료된 data_loader
+    """
+    if cache is None:
+        data_loader.load()
+        return data_loader
+
+    farm_no = data_loader.farm_no
+    key = None
+    fingerprint = None
+    try:
+        key = cache.make_loader_key(data_loader)
+        fingerprint = farm_fingerprint(data_loader.conn, farm_no)
+        entry = cache.get(key)
+        if entry is not None and entry.get('fingerprint') == fingerprint:
+            data_loader.restore_state(entry['state'])
+            logger.info(f"재실행 캐시 사용 (로드 생략): 농장={farm_no}")
+            return data_loader
+    except Exception as e:
+        logger.warning(f"재실행 캐시 조회 실패, 일반 로드: 농장={farm_no} ({e})")
+
+    data_loader.load()
+
+    if fingerprint is not None:
+        try:
+            cache.put(key, {'fingerprint': fingerprint, 'state': data_loader.export_state()})
+        except Exception as e:
+            logger.warning(f"재실행 캐시 저장 실패: 농장={farm_no} ({e})")
+    return data_loader
@@ -0,0 +1,374 @@
+"""
+모돈 작업예정 계산 엔진
+- FN_MD_SCHEDULE_BSE_2020 (Pipelined Table Function) Python 구현
+- FarmDataLoader에 로드된 모돈/작업이력 + TB_PLAN_MODON(농장당 1회 조회)으로 계산
+- 프로세서의 예정 카운트(교배/분만/이유/임신감정/백신)마다 발생하던 함수 호출 제거
+
+계산 규칙 (inspig-docs/db/sql/00_SQL_GUIDE.md 8장, db/ref/03.function.md):
+- 대상 모돈: 재적 모돈 (OUT_DT = 9999-12-31)
+- 모돈 상태: SF_GET_MODONGB_STATUS 결과 (FarmDataLoader CALC_STATUS_CD)
+- 예정작업별 대상 상태 (JOB_TARGET_STATUS)
+- TB_PLAN_MODON 조인: MODON_STATUS_CD = 모돈상태 또는 '019999'(전체)
+- 예정일(PASS_DT) = 기준작업(STD_CD)일 + PASS_DAY
+- 예정일 범위: SDT ~ EDT (BF_PASS_YN='Y'이면 SDT 이전 경과분 포함)
+
+엔진 모드 (config.ini [processing] schedule_engine):
+- oracle: FN_MD_SCHEDULE_BSE_2020 호출 (기본값)
+- python: Python 엔진 사용 (DB 호출 없음)
+- verify: Oracle 결과 사용 + Python 결과와 비교하여 차이 로그 (schedule_verify_sample % 농장만)
+"""
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .columnar import day_to_yyyymmdd, yyyymmdd_to_day
+
+logger = logging.getLogger(__name__)
+
+
+# 엔진 모드
+SCHEDULE_ENGINE_ORACLE = 'oracle'
+SCHEDULE_ENGINE_PYTHON = 'python'
+SCHEDULE_ENGINE_VERIFY = 'verify'
+SCHEDULE_ENGINE_MODES = (SCHEDULE_ENGINE_ORACLE, SCHEDULE_ENGINE_PYTHON, SCHEDULE_ENGINE_VERIFY)
+
+# 재적 모돈 OUT_DT
+OUT_DT_ALIVE = '99991231'
+
+# 전체 모돈상태 (TB_PLAN_MODON.MODON_STATUS_CD)
+STATUS_ALL = '019999'
+
+# 예정작업(JOB_GUBUN_CD)별 대상 모돈상태 (None=전체)
+JOB_TARGET_STATUS: Dict[str, Optional[Tuple[str, ...]]] = {
+    '150005': ('010001', '010005', '010006', '010007'),  # 교배: 후보/이유/재발/유산
+    '150002': ('010002',),                               # 분만: 임신
+    '150003': ('010003', '010004'),                      # 이유: 포유/대리모
+    '150001': ('010002',),                               # 임신감정: 임신
+    '150004': None,                                      # 백신: 전체
+}
+
+# 기준작업코드(STD_CD)
+STD_BIRTH = '020001'    # 출생: BIRTH_DT
+STD_IN = '020002'       # 전입: IN_DT
+STD_ALL = '029999'      # 전체: 마지막 작업일
+
+# 기준작업코드 → 작업구분 (마지막 해당 작업일 기준)
+STD_WK_GUBUN = {
+    '020003': 'G',  # 교배
+    '020004': 'B',  # 분만
+    '020005': 'E',  # 이유
+    '020007': 'F',  # 사고
+}
+
+PLAN_MODON_SQL = """
+SELECT SEQ, JOB_GUBUN_CD, WK_NM, STD_CD, MODON_STATUS_CD, PASS_DAY,
+       NVL(BF_PASS_YN, 'N') AS BF_PASS_YN, S_SANCHA, E_SANCHA, HCODE
+FROM TB_PLAN_MODON
+WHERE FARM_NO = :farm_no
+  AND USE_YN = 'Y'
+ORDER BY JOB_GUBUN_CD, SEQ
+"""
+
+ORACLE_SCHEDULE_SQL = """
+SELECT PIG_NO, WK_NM, PASS_DT
+FROM TABLE(FN_MD_SCHEDULE_BSE_2020(
+    :farm_no, 'JOB-DAJANG', :job_gubun_cd, :status_cd,
+    :sdt, :edt, NULL, 'ko', 'yyyy-MM-dd', :seq_filter, NULL
+))
+"""
+
+
+def fetch_oracle_schedule(conn, farm_no: int, job_gubun_cd: str, status_cd: Optional[str],
+                          sdt: str, edt: str, seq_filter: str = '-1') -> List[Dict[str, Any]]:
+    """FN_MD_SCHEDULE_BSE_2020 호출
+
+    Args:
+        conn: Oracle DB 연결 객체
+        farm_no: 농장 번호
+        job_gubun_cd: 예정작업구분 (150001~150005)
+        status_cd: 모돈상태 필터 (None=전체)
+        sdt: 시작일 (yyyy-MM-dd)
+        edt: 종료일 (yyyy-MM-dd)
+        seq_filter: TB_PLAN_MODON.SEQ 필터 ('-1'=전체, '1,2,3'=선택)
+
+    Returns:
+        [{'PIG_NO', 'WK_NM', 'PASS_DT'(yyyy-MM-dd)}, ...]
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(ORACLE_SCHEDULE_SQL, {
+            'farm_no': farm_no,
+            'job_gubun_cd': job_gubun_cd,
+            'status_cd': status_cd,
+            'sdt': sdt,
+            'edt': edt,
+            'seq_filter': seq_filter,
+        })
+        return [
+            {'PIG_NO': row[0], 'WK_NM': row[1], 'PASS_DT': row[2]}
+            for row in cursor.fetchall()
+        ]
+    finally:
+        cursor.close()
+
+
+def resolve_engine_mode(mode: str, farm_no: int, verify_sample: int = 100,
+                        setting: str = 'schedule_engine') -> str:
+    """농장별 엔진 모드 결정
+
+    verify 모드는 FARM_NO % 100 < verify_sample 인 농장만 비교 (나머지는 oracle)
+    aggregate_engine(프로세서 SQL 집계 Python 계산)도 같은 모드 값 사용
+
+    Args:
+        mode: 설정 모드 (oracle/python/verify)
+        farm_no: 농장 번호
+        verify_sample: verify 대상 농장 비율 (%, 0~100)
+        setting: 설정 키 이름 (로그용)
+
+    Returns:
+        농장에 적용할 모드
+    """
+    if mode not in SCHEDULE_ENGINE_MODES:
+        logger.warning(f"알 수 없는 {setting} 설정: {mode}, oracle 사용")
+        return SCHEDULE_ENGINE_ORACLE
+    if mode == SCHEDULE_ENGINE_VERIFY and int(farm_no) % 100 >= verify_sample:
+        return SCHEDULE_ENGINE_ORACLE
+    return mode
+
+
+def parse_seq_filter(seq_filter: str) -> Optional[set]:
+    """SEQ 필터 문자열 → SEQ 집합 (None=전체, 빈 집합=작업 없음)"""
+    if seq_filter == '-1':
+        return None
+    return {int(s) for s in seq_filter.split(',') if s.strip()}
+
+
+def _to_day(value: Any) -> Optional[int]:
+    """YYYYMMDD / yyyy-MM-dd 문자열 → 일련번호"""
+    if not value:
+        return None
+    return yyyymmdd_to_day(str(value).replace('-', '')[:8])
+
+
+class ScheduleEngine:
+    """모돈 작업예정 계산 엔진 (농장 단위)
+
+    사용 예:
+        engine = ScheduleEngine.from_db(conn, data_loader)
+        rows = engine.schedule('150002', None, '2025-01-06', '2025-01-12')
+        diff = engine.verify(conn, '150002', None, '2025-01-06', '2025-01-12')
+    """
+
+    def __init__(self, data_loader, plans: List[Dict[str, Any]]):
+        """
+        Args:
+            data_loader: 로드 완료된 FarmDataLoader
+            plans: TB_PLAN_MODON 행 리스트 (USE_YN='Y')
+        """
+        self.data_loader = data_loader
+        self.farm_no = data_loader.farm_no
+        self.plans = plans
+        self.logger = logging.getLogger(f"{__name__}.Farm{self.farm_no}")
+        # 상태코드별 재적 모돈 기준정보 (최초 조회 시 생성)
+        self._base_by_status: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        # verify 모드 차이 누적 [(job_gubun_cd, status_cd, diff), ...]
+        self.diffs: List[Tuple[str, Optional[str], Dict[str, Any]]] = []
+
+    @classmethod
+    def from_db(cls, conn, data_loader) -> 'ScheduleEngine':
+        """TB_PLAN_MODON 조회 후 엔진 생성"""
+        cursor = conn.cursor()
+        try:
+            cursor.execute(PLAN_MODON_SQL, {'farm_no': data_loader.farm_no})
+            columns = [col[0] for col in cursor.description]
+            plans = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+        return cls(data_loader, plans)
+
+    def _build_base(self) -> Dict[str, List[Dict[str, Any]]]:
+        """재적 모돈별 기준일 정보 생성 (상태코드별 그룹)
+
+        마지막 작업: 기준일 이전 작업 중 WK_DT DESC, SEQ DESC 첫 행
+        (FN_MD_SCHEDULE_BSE_2020 MODON_BASE의 ROW_NUMBER 정렬과 동일)
+        """
+        loader = self.data_loader
+        base_date = loader.base_date
+        calc_status = loader.get_data().get('modon_calc_status', {})
+
+        by_status: Dict[str, List[Dict[str, Any]]] = {}
+        day_of: Dict[str, Optional[int]] = {}  # 작업일 → 일련번호 (고유 날짜당 1회 변환)
+        for modon_no, modon in loader.get_modon_dict().items():
+            if modon.get('OUT_DT') != OUT_DT_ALIVE:
+                continue
+
+            last_key = None
+            last_days: Dict[str, int] = {}
+            for wk in loader.get_wk_by_modon(modon_no):
+                wk_dt = wk.get('WK_DT')
+                if not wk_dt or wk_dt > base_date or wk.get('WK_GUBUN') == 'Z':
+                    continue
+                day = day_of.get(wk_dt)
+                if day is None:
+                    day = day_of[wk_dt] = _to_day(wk_dt)
+                    if day is None:
+                        continue
+                key = (day, wk.get('SEQ') or 0)
+                if last_key is None or key > last_key:
+                    last_key = key
+                gubun = wk.get('WK_GUBUN')
+                if day > last_days.get(gubun, 0):
+                    last_days[gubun] = day
+
+            status = calc_status.get(modon_no) or modon.get('CALC_STATUS_CD') or ''
+            by_status.setdefault(status, []).append({
+                'PIG_NO': modon.get('MODON_NO'),
+                'SANCHA': modon.get('SANCHA'),
+                'DAERI_YN': modon.get('DAERI_YN'),
+                'BIRTH_DAY': _to_day(modon.get('BIRTH_DT')),
+                'IN_DAY': _to_day(modon.get('IN_DT')),
+                'LAST_DAY': last_key[0] if last_key else None,
+                'GUBUN_DAYS': last_days,
+            })
+        return by_status
+
+    @staticmethod
+    def _std_day(base: Dict[str, Any], std_cd: str) -> Optional[int]:
+        """기준작업(STD_CD)일 (일련번호)"""
+        if std_cd == STD_BIRTH:
+            return base['BIRTH_DAY']
+        if std_cd == STD_IN:
+            return base['IN_DAY']
+        if std_cd == STD_ALL:
+            return base['LAST_DAY']
+        gubun = STD_WK_GUBUN.get(std_cd)
+        if gubun is None:
+            return None
+        return base['GUBUN_DAYS'].get(gubun)
+
+    def schedule(self, job_gubun_cd: str, status_cd: Optional[str],
+                 sdt: str, edt: str, seq_filter: str = '-1') -> List[Dict[str, Any]]:
+        """예정 대상 모돈 조회 (FN_MD_SCHEDULE_BSE_2020 대응)
+
+        Args:
+            job_gubun_cd: 예정작업구분 (150001~150005)
+            status_cd: 모돈상태 필터 (None=전체)
+            sdt: 시작일 (yyyy-MM-dd)
+            edt: 종료일 (yyyy-MM-dd)
+            seq_filter: TB_PLAN_MODON.SEQ 필터 ('-1'=전체, ''=작업없음, '1,2,3'=선택)
+
+        Returns:
+            [{'PIG_NO', 'SEQ', 'WK_NM', 'PASS_DAY', 'PASS_DT'(yyyy-MM-dd), 'SANCHA', 'DAERI_YN', 'HCODE'}, ...]
+        """
+        if seq_filter == '':
+            return []
+        if self._base_by_status is None:
+            self._base_by_status = self._build_base()
+
+        seqs = parse_seq_filter(seq_filter)
+        sdt_day = _to_day(sdt)
+        edt_day = _to_day(edt)
+
+        targets = JOB_TARGET_STATUS.get(job_gubun_cd)
+        statuses = list(self._base_by_status) if targets is None else list(targets)
+        if status_cd:
+            statuses = [s for s in statuses if s == status_cd]
+
+        result = []
+        day_str: Dict[int, str] = {}
+        for plan in self.plans:
+            if plan.get('JOB_GUBUN_CD') != job_gubun_cd:
+                continue
+            if seqs is not None and int(plan['SEQ']) not in seqs:
+                continue
+
+            plan_status = plan.get('MODON_STATUS_CD')
+            pass_day = int(plan.get('PASS_DAY') or 0)
+            bf_pass = plan.get('BF_PASS_YN') == 'Y'
+            s_sancha = plan.get('S_SANCHA')
+            e_sancha = plan.get('E_SANCHA')
+
+            for status in statuses:
+                if plan_status != STATUS_ALL and plan_status != status:
+                    continue
+                for base in self._base_by_status.get(status, ()):
+                    sancha = base['SANCHA']
+                    if s_sancha is not None and (sancha is None or sancha < s_sancha):
+                        continue
+                    if e_sancha is not None and (sancha is None or sancha > e_sancha):
+                        continue
+
+                    std_day = self._std_day(base, plan.get('STD_CD'))
+                    if std_day is None:
+                        continue
+                    day = std_day + pass_day
+                    if day > edt_day or (day < sdt_day and not bf_pass):
+                        continue
+
+                    pass_dt = day_str.get(day)
+                    if pass_dt is None:
+                        ymd = day_to_yyyymmdd(day)
+                        pass_dt = f"{ymd[:4]}-{ymd[4:6]}-{ymd[6:8]}"
+                        day_str[day] = pass_dt
+
+                    result.append({
+                        'PIG_NO': base['PIG_NO'],
+                        'SEQ': plan['SEQ'],
+                        'WK_NM': plan.get('WK_NM'),
+                        'PASS_DAY': pass_day,
+                        'PASS_DT': pass_dt,
+                        'SANCHA': sancha,
+                        'DAERI_YN': base['DAERI_YN'],
+                        'HCODE': plan.get('HCODE'),
+                    })
+        return result
+
+    def count(self, job_gubun_cd: str, status_cd: Optional[str],
+              sdt: str, edt: str, seq_filter: str = '-1') -> int:
+        """예정 대상 건수 (SELECT COUNT(*) FROM TABLE(FN_MD_SCHEDULE_BSE_2020(...)) 대응)"""
+        return len(self.schedule(job_gubun_cd, status_cd, sdt, edt, seq_filter))
+
+    def compare(self, oracle_rows: List[Dict[str, Any]], job_gubun_cd: str,
+                status_cd: Optional[str], sdt: str, edt: str,
+                seq_filter: str = '-1') -> Dict[str, Any]:
+        """Oracle 함수 결과와 Python 결과 비교
+
+        비교 키: (PIG_NO, WK_NM, PASS_DT)
+
+        Returns:
+            {'oracle': N, 'python': N, 'only_oracle': [...], 'only_python': [...]}
+        """
+        def keys(rows):
+            return Counter(
+                (str(r.get('PIG_NO')), r.get('WK_NM') or '', str(r.get('PASS_DT') or '')[:10])
+                for r in rows
+            )
+
+        py_keys = keys(self.schedule(job_gubun_cd, status_cd, sdt, edt, seq_filter))
+        ora_keys = keys(oracle_rows)
+        only_oracle = sorted((ora_keys - py_keys).elements())
+        only_python = sorted((py_keys - ora_keys).elements())
+
+        diff = {
+            'oracle': sum(ora_keys.values()),
+            'python': sum(py_keys.values()),
+            'only_oracle': only_oracle,
+            'only_python': only_python,
+        }
+        if only_oracle or only_python:
+            self.diffs.append((job_gubun_cd, status_cd, diff))
+            self.logger.warning(
+                f"예정 계산 불일치: job={job_gubun_cd}, status={status_cd}, seq={seq_filter}, "
+                f"oracle={diff['oracle']}, python={diff['python']}, "
+                f"oracle만={only_oracle[:5]}, python만={only_python[:5]}"
+            )
+        else:
+            self.logger.debug(f"예정 계산 일치: job={job_gubun_cd}, status={status_cd}, {diff['oracle']}건")
+        return diff
+
+    def verify(self, conn, job_gubun_cd: str, status_cd: Optional[str],
+               sdt: str, edt: str, seq_filter: str = '-1') -> Dict[str, Any]:
+        """Oracle 함수를 호출하여 Python 결과와 비교"""
+        oracle_rows = fetch_oracle_schedule(conn, self.farm_no, job_gubun_cd, status_cd,
+                                            sdt, edt, seq_filter)
+        return self.compare(oracle_rows, job_gubun_cd, status_cd, sdt, edt, seq_filter)
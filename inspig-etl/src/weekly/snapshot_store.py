@@ -0,0 +1,238 @@
+"""
+농장 이력 스냅샷 저장소 (증분 로드)
+- FarmDataLoader의 2년치 이력 테이블(TB_MODON_WK, TB_BUNMAN, TB_EU, TB_SAGO,
+  TB_MODON_JADON_TRANS, TB_GYOBAE) 로드 결과를 농장/테이블 단위로 로컬 SQLite에 보관
+- 다음 실행에서는 LOG_INS_DT/LOG_UPT_DT가 워터마크 이후인 행만 조회하여 스냅샷에 병합
+  (USE_YN='N'으로 바뀐 행은 제거, 2년 기간을 벗어난 행은 제거)
+- 전체 재조회 조건: 스냅샷 없음, 버전 변경, 기간 시작일이 이전보다 앞당겨짐(과거 주차 재실행),
+  마지막 전체 조회 후 full_refresh_days 경과 (물리 삭제/감사 컬럼 누락 행 보정)
+
+워터마크는 조회 시작 시점의 Oracle SYSDATE, 다음 조회는 overlap_minutes만큼 겹쳐서 조회
+(조회 중 커밋된 트랜잭션 누락 방지)
+"""
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 형식 버전 (이력 테이블 조회 SQL 컬럼 변경 시 증가 → 전체 재조회)
+SNAPSHOT_VERSION = 1
+
+# 워터마크 겹침 조회 시간 (분)
+SNAPSHOT_OVERLAP_MINUTES = 10
+
+# 증분 로드 대상 테이블
+# key: 행 식별 컬럼 (테이블 PK에서 FARM_NO 제외), date: 2년 기간 필터 컬럼, order: 조회 SQL ORDER BY
+# seq_key: 모돈 내 작업 순번 (작업일/구분 수정으로 PK가 바뀐 이전 행 제거용)
+SNAPSHOT_TABLES: Dict[str, Dict[str, Any]] = {
+    'modon_wk': {'key': ('PIG_NO', 'WK_DT', 'WK_GUBUN'), 'date': 'WK_DT', 'order': ('PIG_NO', 'SEQ'),
+                 'seq_key': ('PIG_NO', 'SEQ'), 'links': True},
+    'bunman': {'key': ('MODON_NO', 'BUN_DT'), 'date': 'BUN_DT', 'order': ('MODON_NO', 'BUN_DT')},
+    'eu': {'key': ('MODON_NO', 'EU_DT'), 'date': 'EU_DT', 'order': ('MODON_NO', 'EU_DT')},
+    'sago': {'key': ('MODON_NO', 'SAGO_DT'), 'date': 'SAGO_DT', 'order': ('MODON_NO', 'SAGO_DT')},
+    'jadon_trans': {'key': ('MODON_NO', 'SEQ'), 'date': 'TRANS_DT', 'order': ('MODON_NO', 'TRANS_DT', 'SEQ')},
+    'gb': {'key': ('MODON_NO', 'GB_DT'), 'date': 'GB_DT', 'order': ('MODON_NO', 'GB_DT')},
+}
+
+# TB_MODON_WK 이전/다음 작업 컬럼 (SEQ ± 1 조인 결과)
+_LINK_FIELDS = ('SEQ', 'WK_DT', 'WK_GUBUN', 'SANCHA', 'GYOBAE_CNT')
+
+_stores: Dict[tuple, 'SnapshotStore'] = {}
+_stores_lock = threading.Lock()
+
+
+def open_snapshot_store(path: str, full_refresh_days: int = 28) -> 'SnapshotStore':
+    """프로세스별 공유 스냅샷 저장소 (경로당 1개, 워커 스레드 공유)"""
+    key = (os.getpid(), str(path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = SnapshotStore(path, full_refresh_days=full_refresh_days)
+            _stores[key] = store
+        return store
+
+
+def _key_func(columns):
+    return lambda row: tuple(row.get(c) for c in columns)
+
+
+def _sort_func(columns):
+    # Oracle ORDER BY ASC와 동일하게 NULL은 뒤로
+    return lambda row: tuple((row.get(c) is None, row.get(c) if row.get(c) is not None else 0) for c in columns)
+
+
+def _in_window(row: Dict[str, Any], date_field: str, window_from: str) -> bool:
+    return str(row.get(date_field) or '')[:8] > window_from
+
+
+def _relink_modon_wk(rows: List[Dict[str, Any]], delta: List[Dict[str, Any]], window_from: str) -> None:
+    """변경된 모돈의 PREV_*/NEXT_* (SEQ ± 1) 재계산
+
+    이웃 행이 스냅샷(기간 내 사용 행)에 있으면 그 값으로, 기간 내였는데 없어졌으면 NULL,
+    기간 밖 이웃은 기존 값 유지 (조회 SQL과 동일하게 기간 밖 이전 작업도 연결)
+    """
+    touched = {row.get('PIG_NO') for row in delta}
+    by_pig: Dict[Any, Dict[Any, Dict[str, Any]]] = {}
+    for row in rows:
+        if row.get('PIG_NO') in touched:
+            by_pig.setdefault(row.get('PIG_NO'), {})[row.get('SEQ')] = row
+
+    for seq_map in by_pig.values():
+        for seq, row in seq_map.items():
+            if seq is None:
+                continue
+            for prefix, neighbor_seq in (('PREV_', seq - 1), ('NEXT_', seq + 1)):
+                neighbor = seq_map.get(neighbor_seq)
+                if neighbor is not None:
+                    for field in _LINK_FIELDS:
+                        row[prefix + field] = neighbor.get(field)
+                elif str(row.get(prefix + 'WK_DT') or '')[:8] > window_from:
+                    for field in _LINK_FIELDS:
+                        row[prefix + field] = None
+
+
+def merge_snapshot(key: str, rows: List[Dict[str, Any]], delta: List[Dict[str, Any]],
+                   window_from: str) -> List[Dict[str, Any]]:
+    """스냅샷 행 + 변경 행 병합
+
+    Args:
+        key: SNAPSHOT_TABLES 키
+        rows: 이전 스냅샷 행
+        delta: 워터마크 이후 변경 행 (USE_YN 무관)
+        window_from: 2년 기간 시작일 (이 날짜 초과만 유지)
+
+    Returns:
+        조회 SQL 전체 조회 결과와 같은 행 리스트 (ORDER BY 순)
+    """
+    spec = SNAPSHOT_TABLES[key]
+    key_of = _key_func(spec['key'])
+
+    index = {key_of(row): row for row in rows}
+    if spec.get('seq_key'):
+        seq_of = _key_func(spec['seq_key'])
+        changed = {seq_of(row) for row in delta}
+        index = {k: row for k, row in index.items() if seq_of(row) not in changed}
+    for row in delta:
+        row_key = key_of(row)
+        index.pop(row_key, None)
+        if row.get('USE_YN') == 'Y':
+            index[row_key] = row
+
+    merged = [row for row in index.values() if _in_window(row, spec['date'], window_from)]
+    if spec.get('links') and delta:
+        _relink_modon_wk(merged, delta, window_from)
+    merged.sort(key=_sort_func(spec['order']))
+    return merged
+
+
+class SnapshotStore:
+    """농장/테이블 단위 이력 스냅샷 (SQLite)
+
+    사용 예:
+        store = SnapshotStore('./cache/farm_snapshot.sqlite', full_refresh_days=28)
+        state = store.get(farm_no, 'modon_wk')
+        since = store.delta_since(state, window_from, db_now)   # None이면 전체 조회
+        ...
+        store.put(farm_no, 'modon_wk', rows, db_now, full_at, window_from)
+    """
+
+    def __init__(self, path: str, full_refresh_days: int = 28,
+                 overlap_minutes: int = SNAPSHOT_OVERLAP_MINUTES):
+        """
+        Args:
+            path: SQLite 파일 경로 (디렉토리 없으면 생성)
+            full_refresh_days: 전체 재조회 주기 (일)
+            overlap_minutes: 워터마크 겹침 조회 시간 (분)
+        """
+        self.path = Path(path)
+        self.full_refresh_days = full_refresh_days
+        self.overlap_minutes = overlap_minutes
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 프로세스 모드 워커가 같은 파일을 쓰므로 잠금 대기 허용
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS FARM_SNAPSHOT (
+                FARM_NO      INTEGER NOT NULL,
+                TABLE_KEY    TEXT NOT NULL,
+                VERSION      INTEGER NOT NULL,
+                WINDOW_FROM  TEXT NOT NULL,
+                WATERMARK    TEXT NOT NULL,
+                FULL_AT      TEXT NOT NULL,
+                ROW_CNT      INTEGER NOT NULL,
+                ROWS_DATA    BLOB NOT NULL,
+                PRIMARY KEY (FARM_NO, TABLE_KEY)
+            )
+        """)
+
+    def get(self, farm_no: int, key: str) -> Optional[Dict[str, Any]]:
+        """스냅샷 조회
+
+        Returns:
+            {'version', 'window_from', 'watermark', 'full_at', 'rows'} 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT VERSION, WINDOW_FROM, WATERMARK, FULL_AT, ROWS_DATA FROM FARM_SNAPSHOT "
+                "WHERE FARM_NO = ? AND TABLE_KEY = ?",
+                (int(farm_no), key),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return {
+                'version': row[0],
+                'window_from': row[1],
+                'watermark': datetime.fromisoformat(row[2]),
+                'full_at': datetime.fromisoformat(row[3]),
+                'rows': pickle.loads(zlib.decompress(row[4])),
+            }
+        except (zlib.error, pickle.UnpicklingError, ValueError, EOFError) as e:
+            logger.warning(f"스냅샷 손상, 전체 조회: 농장={farm_no}, {key} ({e})")
+            return None
+
+    def delta_since(self, state: Optional[Dict[str, Any]], window_from: str, now: datetime) -> Optional[datetime]:
+        """증분 조회 시작 시각 결정
+
+        Args:
+            state: get() 결과
+            window_from: 이번 조회 2년 기간 시작일
+            now: 이번 조회 시작 시각 (Oracle SYSDATE)
+
+        Returns:
+            증분 조회 기준 시각, 전체 조회가 필요하면 None
+        """
+        if state is None or state['version'] != SNAPSHOT_VERSION:
+            return None
+        if window_from < state['window_from']:
+            return None
+        if now - state['full_at'] >= timedelta(days=self.full_refresh_days):
+            return None
+        return state['watermark'] - timedelta(minutes=self.overlap_minutes)
+
+    def put(self, farm_no: int, key: str, rows: List[Dict[str, Any]],
+            watermark: datetime, full_at: datetime, window_from: str) -> None:
+        """스냅샷 저장 (농장/테이블 단위 교체)"""
+        blob = zlib.compress(pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO FARM_SNAPSHOT "
+                "(FARM_NO, TABLE_KEY, VERSION, WINDOW_FROM, WATERMARK, FULL_AT, ROW_CNT, ROWS_DATA) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (int(farm_no), key, SNAPSHOT_VERSION, window_from,
+                 watermark.isoformat(), full_at.isoformat(), len(rows), blob),
+            )
+
+    def close(self) -> None:
+        """저장소 연결 종료"""
+        with self._lock:
+            self._conn.close()
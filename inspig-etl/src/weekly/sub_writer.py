@@ -0,0 +1,181 @@
+"""
+TS_INS_WEEK_SUB 일괄 저장 버퍼
+- 프로세서의 단건 INSERT INTO TS_INS_WEEK_SUB ... VALUES 를 모아서 executemany로 저장
+- 농장당 수백 회의 INSERT 왕복을 SQL 종류별 배열 DML 몇 회로 축소
+
+flush 시점 (config.ini [processing] sub_flush):
+- processor: 프로세서 종료 시마다 flush (기본값)
+- farm: 농장 처리 종료(COMPLETE 업데이트 직전) 시 1회 flush
+
+공통:
+- 미저장 행의 INSERT 대상 테이블(TS_INS_WEEK_SUB)을 조회/삭제/INSERT ... SELECT 하는 SQL 실행 전에는 자동 flush
+  (BaseProcessor.execute/fetch_* 에서 호출) → 실행 순서/결과 동일
+  테이블은 식별자 단위로 비교 (TS_INS_WEEK_SUB_BAK 등 다른 테이블, 주석/문자열 리터럴 안의 이름은 제외)
+- 저장 순서 유지: 연속된 동일 SQL 단위로 executemany
+- farm 모드 flush 오류 시 농장 처리 오류 (AsyncFarmProcessor.fail에서 롤백 → 일부 executemany만 반영된 상태로 커밋 안됨)
+"""
+import logging
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# flush 시점
+SUB_FLUSH_PROCESSOR = 'processor'
+SUB_FLUSH_FARM = 'farm'
+
+# executemany 1회 최대 행 수
+SUB_BATCH_SIZE = 500
+
+# 자동 flush 대상 테이블 (INSERT 대상 테이블을 알 수 없는 SQL의 기본값)
+SUB_TABLE = 'TS_INS_WEEK_SUB'
+
+# INSERT INTO [스키마.]테이블
+_INSERT_TABLE_RE = re.compile(r'^\s*INSERT\s+INTO\s+(?:"?[\w$#]+"?\s*\.\s*)?"?([\w$#]+)"?', re.IGNORECASE)
+# 주석(--, /* */), 문자열 리터럴 (식별자 추출 전 제거)
+_NON_CODE_RE = re.compile(r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'", re.DOTALL)
+# Oracle 식별자 (영문/_ 시작, 영숫자/_/$/#)
+_IDENT_RE = re.compile(r'[A-Za-z_][\w$#]*')
+
+
+def insert_table(sql: str) -> str:
+    """INSERT 문의 대상 테이블명 (대문자, 스키마 제외 / 해석 불가 시 SUB_TABLE)"""
+    match = _INSERT_TABLE_RE.match(sql)
+    return match.group(1).upper() if match else SUB_TABLE
+
+
+@lru_cache(maxsize=1024)
+def referenced_names(sql: str) -> FrozenSet[str]:
+    """SQL이 참조하는 식별자 집합 (대문자, 주석/문자열 리터럴 제외)
+
+    프로세서 SQL은 같은 문장이 반복 실행되므로 문장 단위로 캐시
+    """
+    return frozenset(name.upper() for name in _IDENT_RE.findall(_NON_CODE_RE.sub(' ', sql)))
+
+
+def _input_sizes(params_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """첫 행 값이 None인 바인드 변수의 타입 지정 (cx_Oracle executemany 타입 추론 보정)
+
+    cx_Oracle은 첫 행 값으로 바인드 타입을 결정하므로 첫 행이 None이고
+    이후 행이 숫자인 경우 오류가 발생할 수 있음
+    """
+    sizes: Dict[str, Any] = {}
+    first = params_list[0]
+    for key, value in first.items():
+        if value is not None:
+            continue
+        for params in params_list:
+            v = params.get(key)
+            if v is None:
+                continue
+            if isinstance(v, str):
+                sizes[key] = max(len(p.get(key) or '') for p in params_list) or 1
+            elif isinstance(v, (int, float, datetime)):
+                sizes[key] = type(v)
+            break
+    return sizes
+
+
+class SubWriter:
+    """TS_INS_WEEK_SUB INSERT 버퍼 (농장 단위)
+
+    사용 예:
+        writer = SubWriter(conn, flush_mode='farm')
+        processor = MatingProcessor(conn, master_seq, farm_no, data_loader=loader, sub_writer=writer)
+        processor.process(dt_from, dt_to)
+        writer.flush()
+    """
+
+    def __init__(self, conn, flush_mode: str = SUB_FLUSH_PROCESSOR,
+                 batch_size: int = SUB_BATCH_SIZE):
+        """
+        Args:
+            conn: Oracle DB 연결 객체
+            flush_mode: flush 시점 (processor/farm)
+            batch_size: executemany 1회 최대 행 수
+        """
+        self.conn = conn
+        self.flush_mode = flush_mode if flush_mode in (SUB_FLUSH_PROCESSOR, SUB_FLUSH_FARM) else SUB_FLUSH_PROCESSOR
+        self.batch_size = max(1, batch_size)
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        # 미저장 행의 INSERT 대상 테이블 (flush_before 비교용)
+        self._tables: Set[str] = set()
+        # 통계 (로그용)
+        self.row_count = 0
+        self.call_count = 0
+
+    @property
+    def pending(self) -> int:
+        """미저장 행 수"""
+        return len(self._pending)
+
+    def add(self, sql: str, params: Dict[str, Any]) -> None:
+        """INSERT 1건 추가 (flush 시 저장)"""
+        self._pending.append((sql, dict(params)))
+        self._tables.add(insert_table(sql))
+
+    def flush_before(self, sql: str) -> None:
+        """미저장 행의 대상 테이블을 참조하는 SQL 실행 전 미저장 행 flush"""
+        if self._pending and not self._tables.isdisjoint(referenced_names(sql)):
+            self.flush()
+
+    def flush(self) -> int:
+        """미저장 행 저장 (연속된 동일 SQL 단위 executemany)
+
+        Returns:
+            저장된 행 수
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, []
+        self._tables = set()
+        saved = 0
+        cursor = self.conn.cursor()
+        try:
+            i = 0
+            while i < len(pending):
+                sql = pending[i][0]
+                j = i
+                while j < len(pending) and pending[j][0] == sql:
+                    j += 1
+                for start in range(i, j, self.batch_size):
+                    params_list = [p for _, p in pending[start:min(j, start + self.batch_size)]]
+                    sizes = _input_sizes(params_list)
+                    if sizes:
+                        cursor.setinputsizes(**sizes)
+                    cursor.executemany(sql, params_list)
+                    saved += len(params_list)
+                    self.call_count += 1
+                i = j
+        finally:
+            cursor.close()
+
+        self.row_count += saved
+        logger.debug(f"SUB 일괄 저장: {saved}건")
+        return saved
+
+    def absorb(self, other: 'SubWriter') -> int:
+        """다른 버퍼의 미저장 행을 뒤에 추가 (프로세서 동시 실행 후 선언 순서대로 병합)
+
+        Returns:
+            추가된 행 수
+        """
+        count = len(other._pending)
+        self._pending.extend(other._pending)
+        self._tables |= other._tables
+        other._pending = []
+        other._tables = set()
+        self.row_count += other.row_count
+        self.call_count += other.call_count
+        other.row_count = other.call_count = 0
+        return count
+
+    def discard(self) -> int:
+        """미저장 행 폐기 (오류 처리 시)"""
+        count = len(self._pending)
+        self._pending = []
+        self._tables = set()
+        return count
@@ -0,0 +1,313 @@
+"""
+농장 처리 성능 지표 (telemetry)
+- 농장별: 연결 대기 시간, 데이터 로드(테이블별 시간/건수), 프로세서별 SQL/Python 시간, 저장 행 수
+- SQL 시간은 농장 연결을 감싼 TimedConnection에서 execute/executemany/fetch* 시간을 합산
+  (프로세서가 직접 연 cursor, SubWriter, 작업예정 함수 호출 포함)
+- 프로세서별 SQL 지표는 실행 스레드의 프로세서 구간(mark ~ add_processor)에만 합산
+  (processor_workers > 1 동시 실행 시에도 다른 프로세서 SQL이 섞이지 않음)
+- Python 시간 = 프로세서 전체 시간 - SQL 시간 (동시 실행 시 db_lock 대기 포함)
+- 결과는 실행(마스터)별 JSON Lines 파일에 농장당 1줄로 저장 → summarize()로 느린 농장/프로세서 순위 출력
+
+config.ini [processing] telemetry = Y 또는 run_etl.py --profile 시 사용
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# 저장(DML) 행 수 집계 대상 SQL
+_WRITE_KEYWORDS = ('INSERT', 'UPDATE', 'DELETE', 'MERGE')
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+class SqlStats:
+    """SQL 누적 지표 (연결 전체 또는 프로세서 구간)"""
+
+    def __init__(self):
+        self.sql_ms = 0.0
+        self.sql_cnt = 0
+        self.rows_written = 0
+
+
+class SqlScope(threading.local):
+    """스레드별 현재 프로세서 구간 지표 (없으면 None)"""
+    stats = None
+
+
+class _StatsGroup:
+    """연결 전체 지표 + 현재 스레드 프로세서 구간 지표에 같은 값 합산"""
+
+    def __init__(self, stats: SqlStats, scope: SqlScope):
+        self._stats = stats
+        self._scope = scope
+
+    def _targets(self):
+        current = self._scope.stats
+        return (self._stats,) if current is None else (self._stats, current)
+
+    def add(self, sql_ms: float = 0.0, sql_cnt: int = 0, rows_written: int = 0) -> None:
+        for stats in self._targets():
+            stats.sql_ms += sql_ms
+            stats.sql_cnt += sql_cnt
+            stats.rows_written += rows_written
+
+
+class TimedCursor:
+    """cursor 래퍼 (실행/조회 시간, DML 행 수 집계)"""
+
+    def __init__(self, cursor, stats: _StatsGroup):
+        self._cursor = cursor
+        self._stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def _timed(self, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._stats.add(sql_ms=_elapsed_ms(start))
+
+    def _count_written(self, sql: str) -> None:
+        if sql.lstrip().upper().startswith(_WRITE_KEYWORDS):
+            self._stats.add(rows_written=max(self._cursor.rowcount or 0, 0))
+
+    def execute(self, sql, *args, **kwargs):
+        self._stats.add(sql_cnt=1)
+        result = self._timed(self._cursor.execute, sql, *args, **kwargs)
+        self._count_written(sql)
+        return result
+
+    def executemany(self, sql, *args, **kwargs):
+        self._stats.add(sql_cnt=1)
+        result = self._timed(self._cursor.executemany, sql, *args, **kwargs)
+        self._count_written(sql)
+        return result
+
+    def callfunc(self, *args, **kwargs):
+        self._stats.add(sql_cnt=1)
+        return self._timed(self._cursor.callfunc, *args, **kwargs)
+
+    def callproc(self, *args, **kwargs):
+        self._stats.add(sql_cnt=1)
+        return self._timed(self._cursor.callproc, *args, **kwargs)
+
+    def fetchone(self):
+        return self._timed(self._cursor.fetchone)
+
+    def fetchmany(self, *args, **kwargs):
+        return self._timed(self._cursor.fetchmany, *args, **kwargs)
+
+    def fetchall(self):
+        return self._timed(self._cursor.fetchall)
+
+
+class TimedConnection:
+    """연결 래퍼 (cursor를 TimedCursor로 반환, commit 시간 포함)"""
+
+    def __init__(self, conn, stats: SqlStats, scope: SqlScope):
+        self._conn = conn
+        self._stats = _StatsGroup(stats, scope)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return TimedCursor(self._conn.cursor(*args, **kwargs), self._stats)
+
+    def commit(self):
+        start = time.perf_counter()
+        try:
+            return self._conn.commit()
+        finally:
+            self._stats.add(sql_ms=_elapsed_ms(start))
+
+
+class FarmTelemetry:
+    """농장 1개 처리 지표
+
+    사용 예:
+        telemetry = FarmTelemetry(farm_no, conn_wait_ms=12.3)
+        conn = telemetry.wrap(conn)
+        mark = telemetry.mark()
+        ... 프로세서 실행 ...
+        telemetry.add_processor('mating', elapsed_ms, mark)
+    """
+
+    def __init__(self, farm_no: int, conn_wait_ms: float = 0.0):
+        self.farm_no = farm_no
+        self.conn_wait_ms = conn_wait_ms
+        self.sql = SqlStats()
+        self._scope = SqlScope()
+        self.load_ms = 0.0
+        self.load_source = 'direct'
+        self.load_tables: Dict[str, Dict[str, Any]] = {}
+        self.processors: List[Dict[str, Any]] = []
+        self.complete_ms = 0.0
+
+    def wrap(self, conn) -> TimedConnection:
+        """SQL 시간 집계 연결 래퍼"""
+        return TimedConnection(conn, self.sql, self._scope)
+
+    def mark(self) -> SqlStats:
+        """프로세서 구간 시작 (현재 스레드의 이후 SQL을 반환 지표에 합산)"""
+        self._scope.stats = SqlStats()
+        return self._scope.stats
+
+    def record_load(self, elapsed_ms: float, load_stats: Dict[str, Dict[str, Any]], source: str) -> None:
+        """데이터 로드 지표 (source: direct/preloaded/rerun_cache)"""
+        self.load_ms = elapsed_ms
+        self.load_source = source
+        self.load_tables = dict(load_stats)
+
+    def add_processor(self, name: str, elapsed_ms: float, mark: SqlStats, status: str = 'success') -> None:
+        """프로세서 지표 (mark 구간 SQL 합계) + 구간 종료"""
+        if self._scope.stats is mark:
+            self._scope.stats = None
+        sql_ms, sql_cnt, rows = mark.sql_ms, mark.sql_cnt, mark.rows_written
+        self.processors.append({
+            'name': name,
+            'status': status,
+            'total_ms': round(elapsed_ms, 1),
+            'sql_ms': round(sql_ms, 1),
+            'python_ms': round(max(elapsed_ms - sql_ms, 0.0), 1),
+            'sql_cnt': sql_cnt,
+            'rows_written': rows,
+        })
+
+    def to_dict(self, total_ms: float) -> Dict[str, Any]:
+        """결과 딕셔너리 (프로세스 모드에서 부모로 전달 가능)"""
+        return {
+            'total_ms': round(total_ms, 1),
+            'conn_wait_ms': round(self.conn_wait_ms, 1),
+            'load_ms': round(self.load_ms, 1),
+            'load_source': self.load_source,
+            'load_tables': self.load_tables,
+            'processors': self.processors,
+            'complete_ms': round(self.complete_ms, 1),
+            'sql_ms': round(self.sql.sql_ms, 1),
+            'sql_cnt': self.sql.sql_cnt,
+            'rows_written': self.sql.rows_written,
+        }
+
+
+class TelemetryWriter:
+    """실행별 JSON Lines 저장 (농장당 1줄, 스레드 공유 가능)"""
+
+    def __init__(self, directory: str, run_name: str):
+        """
+        Args:
+            directory: 저장 디렉토리 (없으면 생성)
+            run_name: 파일명 접두어 (예: weekly_2025W51_1234)
+        """
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.path = str(Path(directory) / f"{run_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}.jsonl")
+        self._lock = threading.Lock()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self.count = 0
+
+    def write(self, result: Dict[str, Any], **context) -> None:
+        """농장 결과 1줄 저장 (telemetry 없는 결과는 상태/오류만 기록)"""
+        record = {
+            **context,
+            'farm_no': result.get('farm_no'),
+            'status': result.get('status'),
+            'worker_pid': result.get('worker_pid', os.getpid()),
+            **result.get('telemetry', {'total_ms': round(result.get('total_elapsed_ms', 0.0), 1)}),
+        }
+        if result.get('error'):
+            record['error'] = result['error']
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_records(paths: Iterable[str]) -> List[Dict[str, Any]]:
+    """JSON Lines 파일 읽기 (손상된 줄은 무시)"""
+    records = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def summarize(records: List[Dict[str, Any]], top: int = 10) -> str:
+    """느린 농장/프로세서/로드 테이블 순위 요약 (run_etl.py --profile 출력용)
+
+    Args:
+        records: read_records() 결과
+        top: 농장 순위 출력 수
+    """
+    if not records:
+        return "성능 지표 없음"
+
+    lines = []
+    total_ms = sum(r.get('total_ms', 0) for r in records)
+    sql_ms = sum(r.get('sql_ms', 0) for r in records)
+    wait_ms = sum(r.get('conn_wait_ms', 0) for r in records)
+    load_ms = sum(r.get('load_ms', 0) for r in records)
+    lines.append(f"농장 {len(records)}개, 농장 처리 합계 {total_ms / 1000:,.1f}s "
+                 f"(로드 {load_ms / 1000:,.1f}s, SQL {sql_ms / 1000:,.1f}s, 연결 대기 {wait_ms / 1000:,.1f}s, "
+                 f"저장 {sum(r.get('rows_written', 0) for r in records):,}행)")
+
+    lines.append(f"\n[느린 농장 상위 {top}]")
+    lines.append(f"{'농장':>8} {'전체ms':>10} {'로드ms':>10} {'SQLms':>10} {'대기ms':>8} {'저장행':>8}  상태")
+    for r in sorted(records, key=lambda x: x.get('total_ms', 0), reverse=True)[:top]:
+        lines.append(f"{r.get('farm_no', ''):>8} {r.get('total_ms', 0):>10,.0f} {r.get('load_ms', 0):>10,.0f} "
+                     f"{r.get('sql_ms', 0):>10,.0f} {r.get('conn_wait_ms', 0):>8,.0f} "
+                     f"{r.get('rows_written', 0):>8,}  {r.get('status', '')}")
+
+    procs: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for r in records:
+        for p in r.get('processors', []):
+            agg = procs[p['name']]
+            agg['cnt'] += 1
+            agg['total_ms'] += p.get('total_ms', 0)
+            agg['sql_ms'] += p.get('sql_ms', 0)
+            agg['python_ms'] += p.get('python_ms', 0)
+            agg['max_ms'] = max(agg['max_ms'], p.get('total_ms', 0))
+            agg['rows'] += p.get('rows_written', 0)
+    if procs:
+        lines.append("\n[프로세서별 합계]")
+        lines.append(f"{'프로세서':<12} {'합계ms':>10} {'SQLms':>10} {'Pythonms':>10} {'평균ms':>8} {'최대ms':>8} {'저장행':>8}")
+        for name, agg in sorted(procs.items(), key=lambda x: x[1]['total_ms'], reverse=True):
+            lines.append(f"{name:<12} {agg['total_ms']:>10,.0f} {agg['sql_ms']:>10,.0f} {agg['python_ms']:>10,.0f} "
+                         f"{agg['total_ms'] / agg['cnt']:>8,.0f} {agg['max_ms']:>8,.0f} {int(agg['rows']):>8,}")
+
+    tables: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for r in records:
+        for name, stat in r.get('load_tables', {}).items():
+            tables[name]['ms'] += stat.get('ms', 0)
+            tables[name]['rows'] += stat.get('rows', 0)
+    if tables:
+        lines.append("\n[로드 테이블별 합계]")
+        lines.append(f"{'테이블':<16} {'합계ms':>10} {'건수':>12}")
+        for name, stat in sorted(tables.items(), key=lambda x: x[1]['ms'], reverse=True):
+            lines.append(f"{name:<16} {stat['ms']:>10,.0f} {int(stat['rows']):>12,}")
+
+    return '\n'.join(lines)
@@ -0,0 +1,297 @@
+"""
+농장 처리 워커 (스레드/프로세스)
+- thread: ThreadPoolExecutor, 부모 프로세스의 연결 풀 공유 (기본)
+- process: ProcessPoolExecutor, 워커 프로세스별 Oracle 연결 풀 보유
+  → FarmDataLoader 후처리/작업예정 계산/프로세서 집계 등 CPU 작업이 GIL 없이 코어별 병렬 실행
+
+프로세스 모드:
+- spawn 방식으로 워커 생성 (부모의 Oracle 연결/풀을 fork로 복제하지 않음)
+- 워커는 설정 파일(config.ini)을 직접 로드하여 연결 풀 생성 (initializer)
+- 농장 묶음 단위로 작업 전달, 결과/처리 지표(dict)만 부모로 반환
+"""
+import atexit
+import logging
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..common import Config, Database
+from .capture import FarmCapture, RecordingConnection, new_capture
+from .rerun_cache import RerunCache, open_rerun_cache
+from .schedule_engine import SCHEDULE_ENGINE_ORACLE, resolve_engine_mode
+from .snapshot_store import SnapshotStore, open_snapshot_store
+from .sub_writer import SUB_FLUSH_PROCESSOR
+from .telemetry import FarmTelemetry
+
+logger = logging.getLogger(__name__)
+
+# 농장 처리 워커 모드
+WORKER_MODE_THREAD = 'thread'
+WORKER_MODE_PROCESS = 'process'
+WORKER_MODES = (WORKER_MODE_THREAD, WORKER_MODE_PROCESS)
+
+# 워커 프로세스 전역 상태 (initializer에서 설정)
+_worker_db: Optional[Database] = None
+_worker_options: Dict[str, Any] = {}
+
+
+def farm_options(processing: Dict[str, Any]) -> Dict[str, Any]:
+    """농장 처리 옵션 추출 (워커 프로세스로 전달 가능한 dict)
+
+    Args:
+        processing: Config.processing
+
+    Returns:
+        {'columnar', 'schedule_engine', 'schedule_verify_sample', 'aggregate_engine', 'aggregate_verify_sample',
+         'sub_flush', 'processor_workers', 'bulk_load_size',
+         'snapshot', 'snapshot_path', 'snapshot_full_days',
+         'rerun_cache', 'rerun_cache_path', 'rerun_cache_ttl_minutes', 'rerun_cache_max_mb', 'telemetry',
+         'capture', 'capture_path', 'capture_farms'}
+        rerun_cache는 설정 사용 여부이며, 실제 적용은 호출측에서 재실행 여부로 결정
+        capture_farms는 농장번호 리스트 (빈 리스트=전체 농장)
+    """
+    return {
+        'columnar': processing.get('columnar_load', 'N') == 'Y',
+        'schedule_engine': processing.get('schedule_engine', SCHEDULE_ENGINE_ORACLE),
+        'schedule_verify_sample': processing.get('schedule_verify_sample', 100),
+        'aggregate_engine': processing.get('aggregate_engine', SCHEDULE_ENGINE_ORACLE),
+        'aggregate_verify_sample': processing.get('aggregate_verify_sample', 100),
+        'sub_flush': processing.get('sub_flush', SUB_FLUSH_PROCESSOR),
+        'processor_workers': processing.get('max_processor_workers', 1),
+        'bulk_load_size': processing.get('bulk_load_size', 0),
+        'snapshot': processing.get('snapshot', 'N') == 'Y',
+        'snapshot_path': processing.get('snapshot_path', './cache/farm_snapshot.sqlite'),
+        'snapshot_full_days': processing.get('snapshot_full_days', 28),
+        'rerun_cache': processing.get('rerun_cache', 'N') == 'Y',
+        'rerun_cache_path': processing.get('rerun_cache_path', './cache/farm_rerun.sqlite'),
+        'rerun_cache_ttl_minutes': processing.get('rerun_cache_ttl_minutes', 120),
+        'rerun_cache_max_mb': processing.get('rerun_cache_max_mb', 500),
+        'telemetry': processing.get('telemetry', 'N') == 'Y',
+        'capture': processing.get('capture', 'N') == 'Y',
+        'capture_path': processing.get('capture_path', './capture'),
+        'capture_farms': [int(f) for f in str(processing.get('capture_farms', '')).split(',') if f.strip()],
+    }
+
+
+def snapshot_store(options: Dict[str, Any]) -> Optional[SnapshotStore]:
+    """이력 스냅샷 저장소 (snapshot=N 이거나 열기 실패 시 None → 전체 조회)"""
+    if not options.get('snapshot'):
+        return None
+    try:
+        return open_snapshot_store(options['snapshot_path'], options['snapshot_full_days'])
+    except Exception as e:
+        logger.warning(f"스냅샷 저장소 사용 불가, 전체 조회: {e}")
+        return None
+
+
+def rerun_cache(options: Dict[str, Any]) -> Optional[RerunCache]:
+    """농장 데이터 재실행 캐시 (rerun_cache=False 이거나 열기 실패 시 None → 일반 로드)"""
+    if not options.get('rerun_cache'):
+        return None
+    try:
+        return open_rerun_cache(options['rerun_cache_path'], options['rerun_cache_ttl_minutes'],
+                                options['rerun_cache_max_mb'])
+    except Exception as e:
+        logger.warning(f"재실행 캐시 사용 불가, 일반 로드: {e}")
+        return None
+
+
+def wants_capture(options: Dict[str, Any], farm_no: int) -> bool:
+    """농장 SQL 기록 대상 여부 (capture=Y 이고 capture_farms가 비었거나 포함)"""
+    if not options.get('capture'):
+        return False
+    farms = options.get('capture_farms') or []
+    return not farms or farm_no in farms
+
+
+def save_capture(capture: FarmCapture, options: Dict[str, Any]) -> None:
+    """기록 파일 저장 (실패해도 농장 처리 결과에는 영향 없음)"""
+    try:
+        capture.save(options['capture_path'])
+    except Exception as e:
+        logger.warning(f"농장 {capture.header['farm_no']} 실행 기록 저장 실패: {e}")
+
+
+def resolve_farm_workers(worker_mode: str, max_farm_workers: int) -> int:
+    """농장 병렬 처리 수 결정 (process 모드에서 0 이하면 CPU 코어 수)"""
+    if worker_mode == WORKER_MODE_PROCESS and max_farm_workers <= 0:
+        return os.cpu_count() or 1
+    return max(1, max_farm_workers)
+
+
+def process_farm(pool_db: Database, master_seq: int, farm: Dict[str, Any],
+                 dt_from: str, dt_to: str, national_price: int,
+                 options: Dict[str, Any], data_loader=None) -> Dict[str, Any]:
+    """단일 농장 처리 (풀에서 독립 연결 획득)
+
+    Args:
+        pool_db: 연결 풀 Database
+        master_seq: 마스터 시퀀스
+        farm: 농장 정보 ({'FARM_NO', 'LOCALE', ...})
+        dt_from: 시작일
+        dt_to: 종료일
+        national_price: 전국 탕박 평균 단가
+        options: farm_options() 결과
+        data_loader: 사전 로드된 FarmDataLoader (None이면 직접 로드)
+
+    Returns:
+        AsyncFarmProcessor.process() 결과 (오류 시 status='error')
+    """
+    from .async_processor import AsyncFarmProcessor
+
+    farm_no = farm['FARM_NO']
+    locale = farm.get('LOCALE', 'KOR')
+    schedule_mode = resolve_engine_mode(options['schedule_engine'], farm_no, options['schedule_verify_sample'])
+    aggregate_mode = resolve_engine_mode(options['aggregate_engine'], farm_no, options['aggregate_verify_sample'],
+                                         setting='aggregate_engine')
+
+    # SQL 기록 시 로드 SQL까지 기록되도록 사전 로드/스냅샷/재실행 캐시 미사용 (직접 로드)
+    capture = None
+    if wants_capture(options, farm_no):
+        capture = new_capture(farm_no, master_seq, locale, dt_from, dt_to, national_price,
+                              options['columnar'], schedule_mode, options['sub_flush'],
+                              options.get('processor_workers', 1), aggregate_mode)
+
+    try:
+        wait_start = time.perf_counter()
+        with pool_db.get_connection() as farm_conn:
+            telemetry = None
+            if options.get('telemetry'):
+                telemetry = FarmTelemetry(farm_no, conn_wait_ms=(time.perf_counter() - wait_start) * 1000)
+            processor = AsyncFarmProcessor(
+                farm_conn if capture is None else RecordingConnection(farm_conn, capture),
+                master_seq,
+                farm_no,
+                locale,
+                data_loader=data_loader if capture is None else None,
+                columnar=options['columnar'],
+                schedule_mode=schedule_mode,
+                sub_flush=options['sub_flush'],
+                snapshot=snapshot_store(options) if capture is None else None,
+                rerun_cache=rerun_cache(options) if capture is None else None,
+                telemetry=telemetry,
+                processor_workers=options.get('processor_workers', 1),
+                aggregate_mode=aggregate_mode,
+            )
+            result = processor.process(dt_from, dt_to, national_price=national_price)
+            farm_conn.commit()
+            if capture is not None:
+                capture.header['status'] = result.get('status')
+                save_capture(capture, options)
+            return result
+    except Exception as e:
+        logger.error(f"농장 {farm_no} 처리 오류: {e}", exc_info=True)
+        return {
+            'farm_no': farm_no,
+            'status': 'error',
+            'error': str(e),
+        }
+
+
+def bulk_load_farms(pool_db: Database, farms: List[Dict[str, Any]], dt_from: str, dt_to: str,
+                    columnar: bool = False) -> Dict[int, Any]:
+    """농장 묶음 일괄 로드 (FarmDataBulkLoader)
+
+    실패 시 빈 dict 반환 → 농장별 개별 로드로 처리
+
+    Returns:
+        {farm_no: FarmDataLoader}
+    """
+    from .data_loader import FarmDataBulkLoader
+
+    try:
+        with pool_db.get_connection() as bulk_conn:
+            bulk_loader = FarmDataBulkLoader(bulk_conn, farms, dt_from, dt_to,
+                                             chunk_size=len(farms), columnar=columnar)
+            return bulk_loader.load()
+    except Exception as e:
+        logger.warning(f"다농장 일괄 로드 실패, 농장별 개별 로드로 진행: {e}", exc_info=True)
+        return {}
+
+
+# ============================================================================
+# 프로세스 모드
+# ============================================================================
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    """워커 프로세스 초기화: 프로세스 전용 연결 풀 생성
+
+    워커는 한 번에 농장 1개를 처리하므로 연결 2개(농장 처리 + 일괄 로드)면 충분
+    """
+    global _worker_db, _worker_options
+
+    _worker_options = options
+    _worker_db = Database(Config(), use_pool=True, pool_min=1, pool_max=2)
+    atexit.register(_worker_db.close)
+
+
+def _process_farm_batch(master_seq: int, farms: List[Dict[str, Any]],
+                        dt_from: str, dt_to: str, national_price: int) -> List[Dict[str, Any]]:
+    """워커 프로세스: 농장 묶음 처리
+
+    bulk_load_size > 0 이면 묶음을 일괄 로드 후 농장별 처리
+
+    Returns:
+        농장별 결과 리스트 (worker_pid 포함)
+    """
+    options = _worker_options
+    preloaded = {}
+    if options['bulk_load_size'] > 0 and len(farms) > 1:
+        preloaded = bulk_load_farms(_worker_db, farms, dt_from, dt_to, options['columnar'])
+
+    pid = os.getpid()
+    results = []
+    for farm in farms:
+        result = process_farm(_worker_db, master_seq, farm, dt_from, dt_to, national_price,
+                              options, data_loader=preloaded.pop(farm['FARM_NO'], None))
+        result['worker_pid'] = pid
+        results.append(result)
+    return results
+
+
+def split_farm_batches(farms: List[Dict[str, Any]], workers: int, bulk_load_size: int) -> List[List[Dict[str, Any]]]:
+    """프로세스 모드 작업 단위 분할
+
+    - 일괄 로드 미사용: 농장 1개씩 (처리 시간 편차가 커도 워커 간 균등 분배)
+    - 일괄 로드 사용: bulk_load_size 묶음을 워커 수로 다시 나눔 (묶음 1개가 워커 1개를 독점하지 않도록)
+
+    Returns:
+        [[farm, ...], ...]
+    """
+    if bulk_load_size <= 0:
+        return [[farm] for farm in farms]
+
+    batches = []
+    for i in range(0, len(farms), bulk_load_size):
+        chunk = farms[i:i + bulk_load_size]
+        size = max(1, math.ceil(len(chunk) / workers))
+        batches.extend(chunk[j:j + size] for j in range(0, len(chunk), size))
+    return batches
+
+
+def create_process_pool(workers: int, options: Dict[str, Any]) -> ProcessPoolExecutor:
+    """농장 처리 프로세스 풀 생성 (spawn)
+
+    Args:
+        workers: 워커 프로세스 수
+        options: farm_options() 결과
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(options,),
+    )
+
+
+def submit_farm_batch(executor: ProcessPoolExecutor, master_seq: int, farms: List[Dict[str, Any]],
+                      dt_from: str, dt_to: str, national_price: int):
+    """농장 묶음 작업 제출
+
+    Returns:
+        Future (결과: 농장별 결과 리스트)
+    """
+    return executor.submit(_process_farm_batch, master_seq, farms, dt_from, dt_to, national_price)
@@ -0,0 +1,10 @@
+"""
+pytest 공통 설정
+- inspig-etl 루트를 import 경로에 추가 (src 패키지 import)
+
+실행: inspig-etl 디렉토리에서 python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
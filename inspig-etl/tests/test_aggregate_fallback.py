@@ -0,0 +1,38 @@
+"""
+SQL 집계 Python 계산 (aggregate_engine = python) 실패 시 SQL 조회 대체
+- Python 계산 예외는 WARNING 로그 후 SQL 집계 결과로 저장 (프로세서 오류 아님)
+"""
+import logging
+
+import pytest
+
+from src.benchmark.fake_db import FakeConnection
+from src.benchmark.synthetic import SyntheticFarm
+from src.weekly.async_processor import AsyncFarmProcessor, ProcessorType
+from src.weekly.processors.alert import AlertProcessor
+from src.weekly.processors.weaning import WeaningProcessor
+from src.weekly.schedule_engine import SCHEDULE_ENGINE_PYTHON
+
+from .test_processor_graph import DT_FROM, DT_TO
+
+
+@pytest.mark.parametrize('processor_cls, method, proc_type', [
+    (AlertProcessor, '_calculate_alert_python', ProcessorType.ALERT),
+    (WeaningProcessor, '_calculate_stats_python', ProcessorType.WEANING),
+])
+def test_python_failure_falls_back_to_sql(monkeypatch, caplog, processor_cls, method, proc_type):
+    def broken(self, *args):
+        raise KeyError('MODON_NO')
+
+    monkeypatch.setattr(processor_cls, method, broken)
+    farm = SyntheticFarm.generate(900900, 200, DT_FROM, DT_TO, seed=2)
+    with caplog.at_level(logging.WARNING):
+        result = AsyncFarmProcessor(
+            FakeConnection(farm), 1, farm.farm_no,
+            schedule_mode=SCHEDULE_ENGINE_PYTHON, aggregate_mode=SCHEDULE_ENGINE_PYTHON,
+        ).process(DT_FROM, DT_TO, national_price=5200)
+
+    assert result['status'] == 'success'
+    [target] = [p for p in result['processor_results'] if p['processor_type'] == proc_type.value]
+    assert target['status'] == 'success'
+    assert any('SQL 집계 사용' in record.getMessage() for record in caplog.records)
@@ -0,0 +1,78 @@
+"""
+컬럼형 로드(columnar_load = Y) 결과 비교
+- 커서에서 직접 생성한 ColumnarTable / 다농장 일괄 로드 분할(take) 결과가 행 딕셔너리 로드와 동일
+- 프로세서 저장 결과(DML)가 행 딕셔너리 로드와 동일
+"""
+from collections import Counter
+
+import pytest
+
+from src.benchmark.fake_db import FakeConnection
+from src.benchmark.synthetic import SyntheticFarm
+from src.weekly.async_processor import AsyncFarmProcessor
+from src.weekly.columnar import ColumnarTable
+from src.weekly.data_loader import COLUMNAR_KEYS, FarmDataBulkLoader, FarmDataLoader
+from src.weekly.schedule_engine import SCHEDULE_ENGINE_PYTHON
+
+from .test_processor_graph import DT_FROM, DT_TO, RecordingConnection
+
+
+@pytest.fixture(scope='module')
+def farm() -> SyntheticFarm:
+    return SyntheticFarm.generate(900600, 500, DT_FROM, DT_TO, seed=11)
+
+
+def _load(farm: SyntheticFarm, columnar: bool) -> FarmDataLoader:
+    loader = FarmDataLoader(FakeConnection(farm), farm.farm_no, DT_FROM, DT_TO, columnar=columnar)
+    loader.load()
+    return loader
+
+
+def _assert_same_data(loader: FarmDataLoader, expected: FarmDataLoader) -> None:
+    for key in COLUMNAR_KEYS:
+        table = loader._data[key]
+        assert isinstance(table, ColumnarTable), key
+        assert table.to_dicts() == expected._data[key], key
+
+    # 모돈 인덱스 (행 뷰 조회 대신 컬럼 배열로 생성)
+    assert loader._modon_gb_dates == expected._modon_gb_dates
+    assert loader._modon_last_bun_dt == expected._modon_last_bun_dt
+    assert ({k: v[0] for k, v in loader._modon_last_eu.items()}
+            == {k: v[0] for k, v in expected._modon_last_eu.items()})
+    assert ({k: wk['SEQ'] for k, wk in loader._modon_last_wk.items()}
+            == {k: wk['SEQ'] for k, wk in expected._modon_last_wk.items()})
+    assert ({k: [wk['SEQ'] for wk in rows] for k, rows in loader._modon_wk_index.items()}
+            == {k: [wk['SEQ'] for wk in rows] for k, rows in expected._modon_wk_index.items()})
+
+
+def test_columnar_load_matches_rows(farm):
+    loader = _load(farm, columnar=True)
+    expected = _load(farm, columnar=False)
+    _assert_same_data(loader, expected)
+    for key in COLUMNAR_KEYS:
+        assert loader.load_stats[key]['rows'] == expected.load_stats[key]['rows'], key
+
+    # 반복/인덱스 조회는 같은 행 뷰 객체 (dict 행과 동일)
+    table = loader._data['modon_wk']
+    assert next(iter(table)) is table[0]
+    assert loader._modon_wk_index[str(table[0]['MODON_NO'])][0] is table[0]
+
+
+def test_bulk_columnar_load_matches_rows(farm):
+    bulk = FarmDataBulkLoader(FakeConnection(farm), [{'FARM_NO': farm.farm_no, 'LOCALE': 'KOR'}],
+                              DT_FROM, DT_TO, columnar=True)
+    _assert_same_data(bulk.load()[farm.farm_no], _load(farm, columnar=False))
+
+
+def test_columnar_processors_match_rows(farm):
+    logs = []
+    for columnar in (False, True):
+        conn = RecordingConnection(farm)
+        result = AsyncFarmProcessor(
+            conn, 1, farm.farm_no,
+            schedule_mode=SCHEDULE_ENGINE_PYTHON, aggregate_mode=SCHEDULE_ENGINE_PYTHON,
+            columnar=columnar,
+        ).process(DT_FROM, DT_TO, national_price=5200)
+        assert result['status'] == 'success'
+        logs.append(Counter(conn.log))
+    assert logs[0] == logs[1]
@@ -0,0 +1,47 @@
+"""
+날짜 정렬 인덱스 캐시 (FarmDataLoader.date_index)
+- 로드 테이블(_data 값)만 캐시, 프로세서 가공 리스트는 전체 스캔
+- 인덱스 기간 조회 결과는 전체 스캔과 동일
+"""
+from src.weekly.data_loader import DATE_INDEX_MIN_ROWS, FarmDataLoader
+
+DT_FROM = '20251215'
+DT_TO = '20251221'
+
+
+def _rows(count: int):
+    return [{'SEQ': i, 'SAGO_DT': f'202512{i % 28 + 1:02d}'} for i in range(count)]
+
+
+def _loader() -> FarmDataLoader:
+    loader = FarmDataLoader(None, 1, DT_FROM, DT_TO)
+    loader._data['sago'] = _rows(DATE_INDEX_MIN_ROWS * 2)
+    loader._loaded = True
+    return loader
+
+
+def test_index_cached_for_loaded_table_only():
+    loader = _loader()
+    table = loader._data['sago']
+
+    index = loader.date_index(table, 'SAGO_DT')
+    assert index is not None and loader.date_index(table, 'SAGO_DT') is index
+
+    # 가공 리스트 (같은 행, 다른 리스트) → 캐시 없음
+    assert loader.date_index(list(table), 'SAGO_DT') is None
+    assert loader.date_index(_rows(DATE_INDEX_MIN_ROWS * 2), 'SAGO_DT') is None
+    assert list(loader._date_indexes) == [('sago', 'SAGO_DT')]
+
+    # 테이블 교체 시 재생성 (이전 테이블 참조 해제)
+    loader._data['sago'] = _rows(DATE_INDEX_MIN_ROWS * 3)
+    rebuilt = loader.date_index(loader._data['sago'], 'SAGO_DT')
+    assert rebuilt is not index and rebuilt.data is loader._data['sago']
+    assert len(loader._date_indexes) == 1
+
+
+def test_filter_by_period_matches_scan():
+    loader = _loader()
+    table = loader._data['sago']
+    expected = [row for row in table if DT_FROM <= row['SAGO_DT'] <= DT_TO]
+    assert loader.filter_by_period(table, 'SAGO_DT') == expected
+    assert loader.filter_by_period(list(table), 'SAGO_DT') == expected
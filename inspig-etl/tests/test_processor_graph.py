@@ -0,0 +1,113 @@
+"""
+프로세서 실행 그래프 동시 실행 결과 비교
+- 같은 가상 농장을 processor_workers=1(순차)과 4(동시)로 처리하여 저장 결과 비교
+- TS_INS_WEEK_SUB: 저장 행 집합 동일 + GUBUN별 저장 순서 동일
+  (GUBUN 간 저장 순서는 실행 순서에 따라 다를 수 있음, 조회는 GUBUN/SUB_GUBUN/SORT_NO 정렬)
+- 성능 지표: 프로세서별 SQL 수/저장 행 수가 순차 실행과 동일 (겹쳐 실행된 프로세서 SQL 미포함)
+"""
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from src.benchmark.fake_db import FakeConnection
+from src.benchmark.synthetic import SyntheticFarm
+from src.weekly.async_processor import AsyncFarmProcessor
+from src.weekly.schedule_engine import SCHEDULE_ENGINE_ORACLE, SCHEDULE_ENGINE_PYTHON
+from src.weekly.sub_writer import SUB_FLUSH_FARM, SUB_FLUSH_PROCESSOR
+from src.weekly.telemetry import FarmTelemetry
+
+DT_FROM = '20251215'
+DT_TO = '20251221'
+
+_LITERAL_RE = re.compile(r"'([A-Z_]+)'")
+
+
+class RecordingConnection(FakeConnection):
+    """DML을 실행 순서대로 기록하는 가상 연결"""
+
+    def __init__(self, farm: SyntheticFarm):
+        super().__init__(farm)
+        self.log: List[Tuple[str, Tuple]] = []
+
+    def record_write(self, sql: str, params_list: List[Dict[str, Any]]) -> int:
+        normalized = ' '.join(sql.split())
+        for params in params_list:
+            # 공유 토큰은 실행마다 다른 난수 값
+            values = tuple(sorted((k, '' if k == 'share_token' else str(v)) for k, v in params.items()))
+            self.log.append((normalized, values))
+        return super().record_write(sql, params_list)
+
+
+def _sub_gubun(entry: Tuple[str, Tuple]) -> str:
+    """TS_INS_WEEK_SUB DML의 GUBUN (바인드 변수 또는 첫 문자열 리터럴)"""
+    sql, params = entry
+    gubun = dict(params).get('gubun')
+    if gubun:
+        return gubun
+    literals = _LITERAL_RE.findall(sql)
+    return literals[0] if literals else ''
+
+
+@pytest.fixture(scope='module')
+def farm() -> SyntheticFarm:
+    return SyntheticFarm.generate(900500, 500, DT_FROM, DT_TO, seed=7)
+
+
+def _run(farm: SyntheticFarm, workers: int, sub_flush: str, mode: str) -> RecordingConnection:
+    conn = RecordingConnection(farm)
+    result = AsyncFarmProcessor(
+        conn, 1, farm.farm_no,
+        schedule_mode=mode, aggregate_mode=mode,
+        sub_flush=sub_flush, processor_workers=workers,
+    ).process(DT_FROM, DT_TO, national_price=5200)
+    assert result['status'] == 'success'
+    assert all(p['status'] == 'success' for p in result['processor_results'])
+    return conn
+
+
+@pytest.mark.parametrize('sub_flush', [SUB_FLUSH_PROCESSOR, SUB_FLUSH_FARM, 'off'])
+@pytest.mark.parametrize('mode', [SCHEDULE_ENGINE_ORACLE, SCHEDULE_ENGINE_PYTHON])
+def test_concurrent_matches_sequential(farm, sub_flush, mode):
+    sequential = _run(farm, 1, sub_flush, mode)
+    sub_sequential = [e for e in sequential.log if ' TS_INS_WEEK_SUB ' in f" {e[0].split('(')[0]} "]
+    assert sub_sequential
+
+    for _ in range(3):
+        concurrent = _run(farm, 4, sub_flush, mode)
+        # 전체 DML 집합 동일 (TS_INS_WEEK UPDATE, 작업 로그 포함)
+        assert Counter(concurrent.log) == Counter(sequential.log)
+        assert concurrent.writes == sequential.writes
+
+        # TS_INS_WEEK_SUB GUBUN별 저장 순서 동일
+        sub_concurrent = [e for e in concurrent.log if ' TS_INS_WEEK_SUB ' in f" {e[0].split('(')[0]} "]
+        for gubun in {_sub_gubun(e) for e in sub_sequential}:
+            assert ([e for e in sub_concurrent if _sub_gubun(e) == gubun]
+                    == [e for e in sub_sequential if _sub_gubun(e) == gubun]), gubun
+
+
+@pytest.mark.parametrize('mode', [SCHEDULE_ENGINE_ORACLE, SCHEDULE_ENGINE_PYTHON])
+def test_concurrent_telemetry_per_processor(farm, mode):
+    def processor_sql(workers: int) -> Dict[str, Tuple[int, int]]:
+        telemetry = FarmTelemetry(farm.farm_no)
+        result = AsyncFarmProcessor(
+            RecordingConnection(farm), 1, farm.farm_no,
+            schedule_mode=mode, aggregate_mode=mode,
+            sub_flush='off', processor_workers=workers, telemetry=telemetry,
+        ).process(DT_FROM, DT_TO, national_price=5200)
+        assert result['status'] == 'success'
+        procs = result['telemetry']['processors']
+        assert sum(p['sql_cnt'] for p in procs) <= telemetry.sql.sql_cnt
+        return {p['name']: (p['sql_cnt'], p['rows_written']) for p in procs}
+
+    sequential = processor_sql(1)
+    assert any(cnt for cnt, _ in sequential.values())
+    concurrent = [processor_sql(workers) for workers in (2, 4, 4, 4)]
+    assert all(result == concurrent[0] for result in concurrent)
+    if mode == SCHEDULE_ENGINE_ORACLE:
+        assert concurrent[0] == sequential
+    else:
+        # 작업예정 엔진은 동시 실행 전 생성(prepare_shared) → 첫 사용 프로세서(mating)의 엔진 조회 제외
+        assert {k: v for k, v in concurrent[0].items() if k != 'mating'} == \
+            {k: v for k, v in sequential.items() if k != 'mating'}
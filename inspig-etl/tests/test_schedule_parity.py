@@ -0,0 +1,80 @@
+"""
+예정 정보 계산 비교 (_build_schedule vs _build_schedule_loop)
+- NumPy datetime64 배열 연산 / NumPy 미설치 일련번호 연산 모두 행 단위 원본 구현과 동일
+"""
+import pytest
+
+from src.benchmark.fake_db import FakeConnection
+from src.benchmark.synthetic import SyntheticFarm
+from src.weekly import data_loader
+from src.weekly.data_loader import (
+    STATUS_EUMO, STATUS_HUBO, STATUS_IMSIN, STATUS_POYU, FarmDataLoader,
+)
+
+DT_FROM = '20251229'
+DT_TO = '20260104'  # 금주: 2026-01-05 ~ 2026-01-11
+
+# (상태, 기준일) - 금주 경계/월말/연말/잘못된 날짜 포함
+EDGE_CASES = [
+    (STATUS_EUMO, '20251231'),       # +5 = 01-05 (금주 첫날)
+    (STATUS_EUMO, '20260106'),       # +5 = 01-11 (금주 마지막날)
+    (STATUS_EUMO, '20260107'),       # +5 = 01-12 (범위 밖)
+    (STATUS_EUMO, '202512311530'),   # 앞 8자리만 사용
+    (STATUS_IMSIN, '20251211'),      # +25 = 01-05
+    (STATUS_IMSIN, '20251217'),      # +25 = 01-11
+    (STATUS_IMSIN, '20250913'),      # +114 = 01-05
+    (STATUS_IMSIN, '20250919'),      # +114 = 01-11
+    (STATUS_IMSIN, '20250230'),      # 없는 날짜
+    (STATUS_IMSIN, '20251141'),      # 없는 날짜 (월 일수 초과를 다음 달로 넘기면 +25 = 01-05)
+    (STATUS_IMSIN, '2025121'),       # 8자리 미만
+    (STATUS_IMSIN, 'ABCDEFGH'),
+    (STATUS_IMSIN, ''),
+    (STATUS_POYU, '20251214'),       # +25 = 01-08
+    (STATUS_POYU, '20251218'),       # +25 = 01-12 (범위 밖)
+    (STATUS_POYU, None),
+    (STATUS_HUBO, '20251231'),       # 대상 상태 아님
+]
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def engine(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(data_loader, 'HAS_NUMPY', False)
+    return request.param
+
+
+def _edge_loader() -> FarmDataLoader:
+    loader = FarmDataLoader(None, 1, DT_FROM, DT_TO)
+    modons = []
+    for i, (status, base_dt) in enumerate(EDGE_CASES):
+        modon_no = str(1000 + i)
+        modon = {'MODON_NO': modon_no, 'CALC_STATUS_CD': status,
+                 'CALC_LAST_GB_DT': '', 'LAST_GB_DT': None, 'LAST_BUN_DT': None}
+        if status == STATUS_EUMO:
+            loader._modon_last_eu[modon_no] = (base_dt, {})
+        elif status == STATUS_IMSIN:
+            # 계산된 교배일 우선, 없으면 LAST_GB_DT
+            modon['CALC_LAST_GB_DT' if i % 2 else 'LAST_GB_DT'] = base_dt
+        elif status == STATUS_POYU:
+            modon['LAST_BUN_DT'] = base_dt
+        modons.append(modon)
+    loader._data['modon'] = modons
+    loader._loaded = True
+    return loader
+
+
+def test_edge_cases_match_loop(engine):
+    loader = _edge_loader()
+    schedule = loader._build_schedule()
+    assert schedule == loader._build_schedule_loop()
+    assert [len(schedule[k]) for k in ('mating', 'check', 'farrowing', 'weaning')] == [3, 2, 2, 1]
+
+
+def test_synthetic_farm_matches_loop(engine):
+    farm = SyntheticFarm.generate(900700, 2000, DT_FROM, DT_TO, seed=5)
+    loader = FarmDataLoader(FakeConnection(farm), farm.farm_no, DT_FROM, DT_TO)
+    loader.load()
+    assert sum(len(loader._data['schedule'][k]) for k in ('mating', 'check', 'farrowing')) > 0
+    assert loader.verify_schedule_parity() == []
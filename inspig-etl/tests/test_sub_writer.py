@@ -0,0 +1,101 @@
+"""
+TS_INS_WEEK_SUB 일괄 저장 버퍼
+- 자동 flush 대상 SQL 판단 (식별자 단위 테이블명 비교)
+- sub_flush=farm 일괄 저장 도중 오류 시 일부 SUB가 커밋되지 않음 (롤백 후 ERROR 커밋)
+"""
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from src.benchmark.fake_db import FakeConnection
+from src.benchmark.synthetic import SyntheticFarm
+from src.weekly.async_processor import AsyncFarmProcessor
+from src.weekly.schedule_engine import SCHEDULE_ENGINE_PYTHON
+from src.weekly.sub_writer import SUB_FLUSH_FARM, SubWriter
+
+from .test_processor_graph import DT_FROM, DT_TO
+
+SUB_INSERT = "INSERT INTO TS_INS_WEEK_SUB (MASTER_SEQ, GUBUN) VALUES (:master_seq, :gubun)"
+
+
+@pytest.mark.parametrize('sql, expected', [
+    ("SELECT CNT_1 FROM TS_INS_WEEK_SUB WHERE GUBUN = 'A'", True),
+    ("delete from ts_ins_week_sub where master_seq = :m", True),
+    ("UPDATE PKSU.TS_INS_WEEK_SUB SET CNT_1 = 0", True),
+    ('SELECT * FROM "TS_INS_WEEK_SUB"', True),
+    ("INSERT INTO TS_INS_WEEK_SUB (GUBUN) SELECT GUBUN FROM TS_INS_WEEK_SUB_BAK", True),
+    ("SELECT * FROM TS_INS_WEEK_SUB_BAK", False),
+    ("SELECT * FROM TS_INS_WEEK WHERE STATUS_CD = 'TS_INS_WEEK_SUB'", False),
+    ("SELECT 1 FROM DUAL -- TS_INS_WEEK_SUB", False),
+    ("SELECT /* TS_INS_WEEK_SUB */ 1 FROM DUAL", False),
+])
+def test_flush_before_matches_table_name(sql, expected):
+    conn = FakeConnection(SyntheticFarm.generate(900800, 10, DT_FROM, DT_TO, seed=1))
+    writer = SubWriter(conn)
+    writer.add(SUB_INSERT, {'master_seq': 1, 'gubun': 'A'})
+    writer.flush_before(sql)
+    assert (writer.pending == 0) is expected
+
+
+def test_flush_before_without_pending_rows():
+    conn = FakeConnection(SyntheticFarm.generate(900800, 10, DT_FROM, DT_TO, seed=1))
+    writer = SubWriter(conn)
+    writer.flush_before("SELECT * FROM TS_INS_WEEK_SUB")
+    assert writer.call_count == 0
+
+
+class TransactionalConnection(FakeConnection):
+    """커밋된 DML만 기록하는 가상 연결 (rollback 시 미커밋 DML 폐기)
+
+    fail_sub_at 설정 시 이후 N번째 TS_INS_WEEK_SUB INSERT 실행에서 오류 발생
+    """
+
+    def __init__(self, farm: SyntheticFarm):
+        super().__init__(farm)
+        self.committed: List[Tuple[str, Dict[str, Any]]] = []
+        self._uncommitted: List[Tuple[str, Dict[str, Any]]] = []
+        self.fail_sub_at = 0
+
+    def record_write(self, sql: str, params_list: List[Dict[str, Any]]) -> int:
+        normalized = ' '.join(sql.split())
+        if self.fail_sub_at and normalized.startswith('INSERT INTO TS_INS_WEEK_SUB'):
+            self.fail_sub_at -= 1
+            if not self.fail_sub_at:
+                raise RuntimeError('ORA-01438: value larger than specified precision')
+        self._uncommitted.extend((normalized, params) for params in params_list)
+        return super().record_write(sql, params_list)
+
+    def commit(self) -> None:
+        self.committed.extend(self._uncommitted)
+        self._uncommitted = []
+        super().commit()
+
+    def rollback(self) -> None:
+        self._uncommitted = []
+
+
+def test_farm_flush_error_commits_no_partial_sub():
+    farm = SyntheticFarm.generate(900810, 500, DT_FROM, DT_TO, seed=3)
+    conn = TransactionalConnection(farm)
+    processor = AsyncFarmProcessor(
+        conn, 1, farm.farm_no,
+        schedule_mode=SCHEDULE_ENGINE_PYTHON, aggregate_mode=SCHEDULE_ENGINE_PYTHON,
+        sub_flush=SUB_FLUSH_FARM,
+    )
+
+    # 농장 일괄 저장(complete)에서 오류 - 처리 중 자동 flush로 이미 실행된 SUB INSERT도 커밋되면 안 됨
+    complete = processor.complete
+
+    def failing_complete(sub_writer):
+        assert sub_writer.pending and sub_writer.call_count
+        conn.fail_sub_at = 1
+        complete(sub_writer)
+
+    processor.complete = failing_complete
+    result = processor.process(DT_FROM, DT_TO, national_price=5200)
+
+    assert result['status'] == 'error'
+    assert conn.fail_sub_at == 0
+    assert not any(sql.startswith('INSERT INTO TS_INS_WEEK_SUB') for sql, _ in conn.committed)
+    assert [sql.split(' ')[0] for sql, _ in conn.committed] == ['DELETE', 'UPDATE', 'INSERT']
+    assert conn.committed[1][1]['status'] == 'ERROR'